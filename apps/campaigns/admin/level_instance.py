@@ -5,6 +5,7 @@ from dal import autocomplete
 
 from apps.core.admin import BaseAdmin
 
+from .. import services
 from ..models import LevelInstance
 
 
@@ -57,3 +58,13 @@ class LevelInstanceAdmin(BaseAdmin):
             },
         ),
     )
+
+    def save_model(self, request, obj, form, change):
+        """Keep inventory of instance's level in sync."""
+        super().save_model(request, obj, form, change)
+        services.refresh_level_inventories(level_ids=[obj.level_id])
+
+    def delete_model(self, request, obj):
+        """Keep inventory of deleted instance's level in sync."""
+        super().delete_model(request, obj)
+        services.refresh_level_inventories(level_ids=[obj.level_id])
@@ -21,6 +21,7 @@ from apps.core.api.serializers import (
 from apps.core.exceptions import NonFieldValidationError
 from apps.users.models import User
 
+from .... import services
 from ....constants import UserCampaignRole
 from ....models import Team, UserCampaign
 from ....tasks import send_volunteers_invitation_emails
@@ -374,3 +375,8 @@ class UserCampaignAssignTeamSerializer(OpenApiSerializer):
         if error_messages:
             raise NonFieldValidationError(error_messages)
         UserCampaign.objects.bulk_update(users, fields=("team",))
+        # Bulk update doesn't send `post_save`, so standings are invalidated
+        # here
+        services.invalidate_leaderboard_cache(
+            campaign_ids={user.campaign_id for user in users},
+        )
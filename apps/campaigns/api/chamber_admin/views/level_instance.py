@@ -10,7 +10,9 @@ from apps.core.api.permissions import (
     IsCampaignRenewal,
 )
 from apps.core.api.views import ChamberBaseViewSet
+from apps.members import services as members_services
 
+from .... import services
 from ....models import LevelInstance
 from ...permissions import IsLevelInstanceEditable
 from .. import serializers
@@ -55,6 +57,12 @@ class LevelInstanceViewSet(
         contract = level_instance.contract
         if contract.levels.filter(declined_at__isnull=True).count() == 0:
             contract.decline()
+        services.refresh_level_inventories(
+            level_ids=[level_instance.level_id],
+        )
+        members_services.sync_contracts_revenue_entries(
+            contract_ids=[contract.id],
+        )
         return response.Response(status=status.HTTP_200_OK)
 
     def get_queryset(self):
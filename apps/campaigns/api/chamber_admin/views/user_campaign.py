@@ -4,6 +4,13 @@ from django.db.models.functions import Coalesce
 from rest_framework import mixins, response, status
 from rest_framework.decorators import action
 
+from libs.api.filter_backends import CustomDjangoFilterBackend
+from libs.api.pagination import KeysetPagination
+from libs.open_api.filters import (
+    OrderingFilterBackend,
+    TrigramSearchFilterBackend,
+)
+
 from apps.campaigns.tasks import send_volunteers_invitation_emails
 from apps.core.api.mixins import UpdateModelWithoutPatchMixin
 from apps.core.api.permissions import AllowChamberAdmin, IsCampaignInProgress
@@ -51,6 +58,11 @@ class UserCampaignViewSet(
         "roles": StringOptionSerializer,
         "default": serializers.UserCampaignUpdateSerializer,
     }
+    filter_backends = (
+        CustomDjangoFilterBackend,
+        OrderingFilterBackend,
+        TrigramSearchFilterBackend,
+    )
     search_fields = (
         "first_name",
         "last_name",
@@ -61,6 +73,7 @@ class UserCampaignViewSet(
         "role_order",
     )
     filterset_class = UserCampaignFilter
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """Return volunteers of current campaign."""
@@ -1,7 +1,8 @@
 from django.db import models
 
-from rest_framework import mixins
+from rest_framework import mixins, response
 
+from .... import services
 from ....constants import UserCampaignRole
 from ....models import Team, UserCampaign
 from .. import serializers
@@ -27,6 +28,34 @@ class LeaderBoardViewSetMixin(mixins.ListModelMixin):
         qs = qs.filter(campaign_id=campaign.id)
         return qs
 
+    def list(self, request, *args, **kwargs):
+        """Return standings from campaign's leaderboard cache.
+
+        Standings only change when contracts' revenue changes, so computed
+        response is cached until campaign's leaderboard is invalidated.
+
+        """
+        campaign = getattr(request, "campaign", None)
+        if getattr(self, "swagger_fake_view", False) or not campaign:
+            return super().list(request, *args, **kwargs)
+        result = services.get_cached_leaderboard(
+            campaign_id=campaign.id,
+            key=services.get_leaderboard_cache_key(
+                campaign_id=campaign.id,
+                url=request.build_absolute_uri(request.path),
+                params=request.query_params,
+            ),
+            compute=lambda: super(LeaderBoardViewSetMixin, self).list(
+                request,
+                *args,
+                **kwargs,
+            ).data,
+        )
+        return response.Response(
+            result.data,
+            headers={"X-Leaderboard-Cache": result.status},
+        )
+
     def get_revenue_range_filter(self):
         """Return the time range for filtering revenue."""
         if getattr(self, "swagger_fake_view", False):
@@ -43,16 +72,70 @@ class VolunteerStandingBaseViewSet(LeaderBoardViewSetMixin):
     """Provide logic for Volunteer Standing API."""
 
     serializer_class = serializers.UserCampaignStandingSerializer
+    # Query params which don't narrow the list down, so ranking board may
+    # serve it
+    ranking_query_params = frozenset(
+        (
+            "ordering",
+            "limit",
+            "offset",
+            "revenue_from",
+            "revenue_to",
+        ),
+    )
 
     def get_queryset(self):
-        """Annotate information about volunteer's generated revenue."""
-        qs = super().get_queryset()
+        """Annotate information about volunteer's generated revenue.
+
+        Only volunteers who can sell contracts are listed, same as ones of
+        campaign's ranking boards.
+
+        """
+        qs = super().get_queryset().can_sell_contract()
         revenue_from, revenue_to = self.get_revenue_range_filter()
-        qs = qs.with_total_revenue().with_week_revenue(
+        return qs.with_revenue_summary(
             revenue_from=revenue_from,
             revenue_to=revenue_to,
-        ).with_total_cash_revenue().with_total_trade_revenue()
-        return qs
+        )
+
+    def paginate_queryset(self, queryset):
+        """Paginate volunteers ordered by ranking board if it's warm.
+
+        Ordering by `total_revenue` or `week_revenue` of a rally week is
+        served by campaign's ranking board, so revenue is only calculated
+        for the volunteers of requested page. Board lists all campaign's
+        volunteers, so searched or filtered list is ordered by database.
+
+        """
+        board = self.get_ranking_board()
+        if not board:
+            return super().paginate_queryset(queryset)
+        ordering = self.request.query_params["ordering"]
+        return super().paginate_queryset(
+            services.RankedUserCampaigns(
+                queryset=queryset,
+                campaign_id=self.request.campaign.id,
+                board=board,
+                descending=ordering.startswith("-"),
+            ),
+        )
+
+    def get_ranking_board(self) -> str | None:
+        """Return warm ranking board matching requested ordering."""
+        campaign = getattr(self.request, "campaign", None)
+        ordering = self.request.query_params.get("ordering", "").lstrip("-")
+        if not campaign or ordering not in ("total_revenue", "week_revenue"):
+            return None
+        if not self.ranking_query_params.issuperset(
+            self.request.query_params,
+        ):
+            return None
+        board = services.TOTAL_BOARD
+        if ordering == "week_revenue":
+            board = services.get_week_board(*self.get_revenue_range_filter())
+        if not services.is_ranking_warm(campaign.id, board):
+            return None
+        return board
 
 
 # pylint: disable=no-member
@@ -72,11 +155,9 @@ class LeadershipStandingBaseViewSet(LeaderBoardViewSetMixin):
         )
         qs = qs.filter(role=teams_managing_role)
         revenue_from, revenue_to = self.get_revenue_range_filter()
-        return (
-            qs
-            .with_managed_teams_week_revenue(revenue_from, revenue_to)
-            .with_managed_teams_total_revenue()
-            .with_managed_team_total_cash_revenue()
+        return qs.with_managed_teams_revenue_summary(
+            revenue_from=revenue_from,
+            revenue_to=revenue_to,
         )
 
 
@@ -101,12 +182,12 @@ class TeamStandingBaseViewSet(LeaderBoardViewSetMixin):
         )
         qs = qs.filter(role=teams_managing_role)
         revenue_from, revenue_to = self.get_revenue_range_filter()
-        return qs.with_managed_teams_total_revenue().prefetch_related(
+        return qs.with_managed_teams_revenue_summary().prefetch_related(
             models.Prefetch(
                 "managed_teams",
-                queryset=Team.objects.all().with_week_revenue(
+                queryset=Team.objects.all().with_revenue_summary(
                     revenue_from=revenue_from,
                     revenue_to=revenue_to,
-                ).with_total_cash_revenue().with_total_revenue(),
+                ),
             ),
         )
@@ -1 +1,2 @@
 from .campaign import CampaignSerializer
+from .leaderboard import LeaderboardCacheStatsSerializer
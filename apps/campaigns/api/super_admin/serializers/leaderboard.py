@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+from libs.open_api.serializers import OpenApiSerializer
+
+
+class LeaderboardCacheStatsSerializer(OpenApiSerializer):
+    """Represent hit/miss counters of leaderboard cache."""
+
+    hits = serializers.IntegerField()
+    misses = serializers.IntegerField()
+    stale = serializers.IntegerField()
@@ -1,8 +1,10 @@
-from rest_framework import mixins
+from rest_framework import mixins, response
+from rest_framework.decorators import action
 
 from apps.core.api.mixins import UpdateModelWithoutPatchMixin
 from apps.core.api.views import AdminBaseViewSet
 
+from .... import services
 from ....models import Campaign
 from ...common.serializers import CampaignDetailSerializer
 from .. import serializers
@@ -29,5 +31,20 @@ class CampaignViewSet(
     )
     serializers_map = {
         "update": CampaignDetailSerializer,
+        "get_leaderboard_cache_stats": (
+            serializers.LeaderboardCacheStatsSerializer
+        ),
         "default": serializers.CampaignSerializer,
     }
+
+    @action(
+        methods=("get",),
+        detail=False,
+        url_path="leaderboard-cache-stats",
+    )
+    def get_leaderboard_cache_stats(self, request, *args, **kwargs):
+        """Return hit/miss counters of leaderboard cache."""
+        serializer = self.get_serializer(
+            services.get_leaderboard_cache_stats(),
+        )
+        return response.Response(serializer.data)
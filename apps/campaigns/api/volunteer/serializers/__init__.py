@@ -1,4 +1,5 @@
 from .campaign import DashboardStatsSerializer
 from .level import RemainingSponsorshipSerializer
+from .level_hold import LevelHoldSerializer
 from .level_instance import RecentlySoldLevelInstanceSerializer
 from .user_campaign import ProfileSerializer, SuperAdminProfileSerializer
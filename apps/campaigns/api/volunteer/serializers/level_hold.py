@@ -0,0 +1,102 @@
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers
+
+from apps.core.api.serializers import (
+    CurrentUserCampaignDefault,
+    ModelBaseSerializer,
+)
+from apps.members.constants import ContractStatus
+from apps.members.models import Contract
+
+from .... import services
+from ....models import Level, LevelHold
+
+
+class LevelHoldSerializer(ModelBaseSerializer):
+    """Represent instances of level held for contract's form."""
+
+    level = serializers.PrimaryKeyRelatedField(queryset=Level.objects.all())
+    contract = serializers.PrimaryKeyRelatedField(
+        queryset=Contract.objects.filter(status=ContractStatus.DRAFT),
+        required=False,
+        allow_null=True,
+    )
+    user_campaign = serializers.HiddenField(
+        default=CurrentUserCampaignDefault(),
+    )
+
+    class Meta:
+        model = LevelHold
+        fields = (
+            "id",
+            "level",
+            "contract",
+            "token",
+            "quantity",
+            "expires_at",
+            "user_campaign",
+        )
+        read_only_fields = (
+            "expires_at",
+        )
+        extra_kwargs = {
+            "quantity": {
+                "min_value": 1,
+                "max_value": services.MAX_LEVEL_HOLD_QUANTITY,
+            },
+        }
+
+    def validate(self, attrs: dict) -> dict:
+        """Ensure level and contract belong to current campaign.
+
+        Volunteer can't hold more than `MAX_HELD_INSTANCES_COUNT` instances
+        at once, and form's holds can't be added after `LEVEL_HOLD_MAX_AGE`.
+
+        """
+        attrs = super().validate(attrs)
+        campaign_id = self._request.campaign.id
+        if attrs["level"].product.category.campaign_id != campaign_id:
+            raise serializers.ValidationError({"level": _("Invalid level")})
+        contract = attrs.get("contract")
+        if contract and contract.created_by_id != attrs["user_campaign"].id:
+            raise serializers.ValidationError(
+                {"contract": _("Invalid contract")},
+            )
+        user_campaign = attrs["user_campaign"]
+        held_count = services.get_held_instances_count(user_campaign)
+        if (
+            held_count + attrs.get("quantity", 1)
+            > services.MAX_HELD_INSTANCES_COUNT
+        ):
+            raise serializers.ValidationError(
+                {"quantity": _("Too many instances are held")},
+            )
+        started_at = services.get_level_hold_started_at(
+            LevelHold.objects.filter(
+                token=attrs["token"],
+                user_campaign=user_campaign,
+            ),
+        )
+        if (
+            started_at
+            and started_at + services.LEVEL_HOLD_MAX_AGE <= timezone.now()
+        ):
+            raise serializers.ValidationError(
+                {"token": _("Form has expired, please reload it")},
+            )
+        return attrs
+
+    def create(self, validated_data: dict) -> LevelHold:
+        """Hold instances of level if they are available."""
+        contract = validated_data.pop("contract", None)
+        hold = services.hold_level_instances(
+            contract_id=getattr(contract, "id", None),
+            **validated_data,
+        )
+        if not hold:
+            raise serializers.ValidationError(
+                {"level": _("This product is out of stock")},
+            )
+        return hold
@@ -31,6 +31,11 @@ router.register(
     views.RemainingSponsorshipViewSet,
     basename="remaining-sponsorship",
 )
+router.register(
+    "level-holds",
+    views.LevelHoldViewSet,
+    basename="level-hold",
+)
 router.register(
     "users",
     views.UserCampaignViewSet,
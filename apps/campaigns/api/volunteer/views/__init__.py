@@ -5,5 +5,6 @@ from .leaderboard import (
     VolunteerStandingViewSet,
 )
 from .level import RemainingSponsorshipViewSet
+from .level_hold import LevelHoldViewSet
 from .level_instance import RecentlySoldLevelInstanceViewSet
 from .user_campaign import ProfileViewSet, UserCampaignViewSet
@@ -0,0 +1,42 @@
+from rest_framework import mixins
+
+from apps.core.api.views import VolunteerBaseViewSet
+
+from .... import services
+from ....models import LevelHold
+from .. import serializers
+
+
+class LevelHoldViewSet(
+    mixins.CreateModelMixin,
+    mixins.DestroyModelMixin,
+    VolunteerBaseViewSet,
+):
+    """Provide viewset for volunteer to hold levels in contract's form.
+
+    Hold is created when level is added to the form and deleted when it's
+    removed, so its instances are available for other contracts again.
+
+    """
+
+    queryset = LevelHold.objects.all()
+    serializer_class = serializers.LevelHoldSerializer
+    search_fields = ()
+    ordering_fields = ()
+
+    def get_queryset(self):
+        """Return holds of current user within campaign."""
+        qs = super().get_queryset()
+        campaign = getattr(self.request, "campaign", None)
+        if not campaign:
+            return qs.none()
+        return qs.filter(
+            user_campaign__campaign_id=campaign.id,
+            user_campaign__user=self.request.user,
+        )
+
+    def perform_destroy(self, instance: LevelHold):
+        """Return held instances to available ones."""
+        services.release_level_holds(
+            LevelHold.objects.filter(id=instance.id),
+        )
@@ -3,6 +3,12 @@ from django.shortcuts import get_object_or_404
 
 from rest_framework import mixins
 
+from libs.api.filter_backends import CustomDjangoFilterBackend
+from libs.open_api.filters import (
+    OrderingFilterBackend,
+    TrigramSearchFilterBackend,
+)
+
 from apps.core.api.mixins import UpdateModelWithoutPatchMixin
 from apps.core.api.permissions import AllowAllRoles, AllowChamberUser
 from apps.core.api.views import VolunteerBaseViewSet
@@ -25,6 +31,11 @@ class UserCampaignViewSet(
         deactivated_at__isnull=True,
     )
     serializer_class = UserCampaignCompactSerializer
+    filter_backends = (
+        CustomDjangoFilterBackend,
+        OrderingFilterBackend,
+        TrigramSearchFilterBackend,
+    )
     search_fields = (
         "first_name",
         "last_name",
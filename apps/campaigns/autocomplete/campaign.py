@@ -1,5 +1,7 @@
 from django.db.models.functions import Collate
 
+from libs.search import search_by_trigrams
+
 from apps.core.autocomplete import AutocompleteView
 
 from ..models import Campaign
@@ -14,9 +16,11 @@ class CampaignAutocompleteView(AutocompleteView):
         """Return filtered queryset."""
         qs = super().get_queryset()
         if self.q:
-            qs = qs.annotate(
-                name_deterministic=Collate("name", "und-x-icu"),
-            ).filter(name_deterministic__icontains=self.q)
+            qs = search_by_trigrams(
+                qs.annotate(name_deterministic=Collate("name", "und-x-icu")),
+                fields=("name_deterministic",),
+                terms=(self.q,),
+            )
         return qs
 
     def get_search_fields(self):
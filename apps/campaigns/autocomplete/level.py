@@ -1,3 +1,5 @@
+from libs.search import search_by_trigrams
+
 from apps.core.autocomplete import AutocompleteView
 
 from ..models import Level
@@ -12,5 +14,9 @@ class LevelAutocompleteView(AutocompleteView):
         """Return filtered queryset."""
         qs = super().get_queryset()
         if self.q:
-            qs = qs.filter(name__icontains=self.q)
+            qs = search_by_trigrams(qs, fields=("name",), terms=(self.q,))
         return qs
+
+    def get_search_fields(self):
+        """Skip default search field."""
+        return []
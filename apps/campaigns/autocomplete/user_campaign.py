@@ -1,4 +1,4 @@
-from django.db.models import Q
+from libs.search import search_by_trigrams
 
 from apps.core.autocomplete import AutocompleteView
 
@@ -14,9 +14,10 @@ class UserCampaignAutocompleteView(AutocompleteView):
         """Return filtered queryset."""
         qs = super().get_queryset()
         if self.q:
-            qs = qs.filter(
-                Q(first_name__icontains=self.q)
-                | Q(last_name__icontains=self.q),
+            qs = search_by_trigrams(
+                qs,
+                fields=("first_name", "last_name"),
+                terms=(self.q,),
             )
         return qs
 
@@ -1,5 +1,11 @@
+import functools
+import operator
+import threading
+from collections import OrderedDict, abc
 from typing import TYPE_CHECKING, Type
 
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Model, QuerySet
 from django.template import engines
 from django.utils.timezone import now
 from django.utils.translation import gettext as _
@@ -9,12 +15,60 @@ from apps.campaigns.utils import get_chamber_url
 
 django_engine = engines["django"]
 
+NOTE_TEMPLATES_CACHE_SIZE = 256
+
 if TYPE_CHECKING:
     from apps.campaigns.models import Note
     from apps.incentives.models import Reward
     from apps.members.models import Contract, Invoice
 
 
+class NoteTemplateCache:
+    """Keep compiled templates of notes with LRU eviction.
+
+    Templates are keyed by note's id and modification time, so an edited
+    note gets compiled again, while its outdated template is evicted as
+    least recently used.
+
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.templates = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, note: "Note"):
+        """Return compiled template of note's body."""
+        if note.pk is None:
+            return django_engine.from_string(note.body)
+        key = (note.pk, note.modified)
+        with self.lock:
+            if key in self.templates:
+                self.templates.move_to_end(key)
+                return self.templates[key]
+        template = django_engine.from_string(note.body)
+        with self.lock:
+            self.templates[key] = template
+            self.templates.move_to_end(key)
+            while len(self.templates) > self.maxsize:
+                self.templates.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        """Remove all compiled templates."""
+        with self.lock:
+            self.templates.clear()
+
+
+note_templates_cache = NoteTemplateCache(maxsize=NOTE_TEMPLATES_CACHE_SIZE)
+
+
+@functools.cache
+def get_invoice_table_template():
+    """Return template of invoice's table with purchased levels."""
+    return django_engine.get_template("members/invoice_table.html")
+
+
 class BaseNoteContextManager:
     """Base class for note context managers."""
 
@@ -30,10 +84,57 @@ class BaseNoteContextManager:
     }
     context_vars = {}
     default_template_path = "notes/default.html"
+    # Name of kwarg with object which note is rendered for
+    object_kwarg = None
+    # Relations of the object used by context
+    object_related_fields = ()
+    # Path to id of object's campaign, required with `object_kwarg`
+    object_campaign_path = None
 
     def __init__(self, note, **kwargs) -> None:
         self.note: "Note" = note
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Ensure context managers of objects know objects' campaigns."""
+        super().__init_subclass__(**kwargs)
+        if cls.object_kwarg and not cls.object_campaign_path:
+            raise ImproperlyConfigured(
+                f"{cls.__name__} must define `object_campaign_path`",
+            )
+
+    @classmethod
+    def with_context_relations(cls, queryset: QuerySet) -> QuerySet:
+        """Select objects' relations used by context in the same query."""
+        return queryset.select_related(*cls.object_related_fields)
+
+    @classmethod
+    def get_object_campaign_id(cls, obj: Model) -> int:
+        """Return id of campaign which object belongs to."""
+        return operator.attrgetter(cls.object_campaign_path)(obj)
+
+    @classmethod
+    def render_many(
+        cls,
+        notes: abc.Iterable["Note"],
+        objects: abc.Iterable[Model],
+    ) -> list[str]:
+        """Render notes of objects' campaigns for each object.
+
+        If objects are a queryset, their relations used by context are
+        fetched with it.
+
+        """
+        if isinstance(objects, QuerySet):
+            objects = cls.with_context_relations(objects)
+        campaign_notes = {note.campaign_id: note for note in notes}
+        return [
+            cls(
+                campaign_notes[cls.get_object_campaign_id(obj)],
+                **{cls.object_kwarg: obj},
+            ).render_template()
+            for obj in objects
+        ]
+
     @classmethod
     def get_default_template(cls) -> str:
         """Return default template string if exist."""
@@ -70,8 +171,8 @@ class BaseNoteContextManager:
         return self.get_base_context()
 
     def get_template(self):
-        """Return template from note's body."""
-        return django_engine.from_string(self.note.body)
+        """Return compiled template from note's body."""
+        return note_templates_cache.get(self.note)
 
     def render_template(self):
         """Render template with values."""
@@ -87,6 +188,9 @@ class ContractContextManger(BaseNoteContextManager):
         "VOLUNTEER_NAME": _("Volunteer's name."),
     }
     default_template_path = "members/contract_note.html"
+    object_kwarg = "contract"
+    object_related_fields = ("campaign__chamber", "created_by")
+    object_campaign_path = "campaign_id"
 
     def __init__(self, note, **kwargs) -> None:
         super().__init__(note, **kwargs)
@@ -126,6 +230,9 @@ class InvoiceContextManager(BaseNoteContextManager):
         "MEMBER_ZIP": _("Member Zip"),
     }
     default_template_path = "members/invoice_note.html"
+    object_kwarg = "invoice"
+    object_related_fields = ("contract__member",)
+    object_campaign_path = "contract.campaign_id"
 
     def __init__(self, note, **kwargs) -> None:
         super().__init__(note, **kwargs)
@@ -135,25 +242,26 @@ class InvoiceContextManager(BaseNoteContextManager):
         """Invoice table."""
         data = {
             "created_date": self.invoice.created.date().strftime("%m/%d/%Y"),
-            "levels": self.invoice.contract.levels.all(),
+            "levels": self.invoice.contract.levels.select_related(
+                "level__product__category",
+            ),
         }
-        return django_engine.get_template(
-            "members/invoice_table.html",
-        ).render(data)
+        return get_invoice_table_template().render(data)
 
     def get_context(self):
+        member = self.invoice.contract.member
         context = {
             "INVOICE_NUMBER": self.invoice.pk,
             "INVOICE_NAME": self.invoice.name,
             "INVOICE_DETAIL": self.get_invoice_detail(),
-            "MEMBER_PK": self.invoice.contract.member.pk,
-            "MEMBER_NAME": self.invoice.contract.member.name,
-            "MEMBER_FIRST_NAME": self.invoice.contract.member.first_name,
-            "MEMBER_LAST_NAME": self.invoice.contract.member.last_name,
-            "MEMBER_ADDRESS": self.invoice.contract.member.address,
-            "MEMBER_CITY": self.invoice.contract.member.city,
-            "MEMBER_STATE": self.invoice.contract.member.state,
-            "MEMBER_ZIP": self.invoice.contract.member.zipcode,
+            "MEMBER_PK": member.pk,
+            "MEMBER_NAME": member.name,
+            "MEMBER_FIRST_NAME": member.first_name,
+            "MEMBER_LAST_NAME": member.last_name,
+            "MEMBER_ADDRESS": member.address,
+            "MEMBER_CITY": member.city,
+            "MEMBER_STATE": member.state,
+            "MEMBER_ZIP": member.zipcode,
         }
         base_context = super().get_context()
         return context | base_context
@@ -169,6 +277,9 @@ class RewardContextManager(BaseNoteContextManager):
         "INCENTIVE_VALUE": _("Incentive Value"),
     }
     default_template_path = "incentives/reward_note.html"
+    object_kwarg = "reward"
+    object_related_fields = ("incentive__campaign__chamber", "user_campaign")
+    object_campaign_path = "incentive.campaign_id"
 
     def __init__(self, note, **kwargs):
         super().__init__(note, **kwargs)
@@ -0,0 +1,152 @@
+import re
+from collections import abc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.core.services import QueriesRecorder
+from apps.members.models import Contract
+from apps.reports.services import get_sale_report
+
+from ...models import Campaign, UserCampaign
+from ...services.dashboard import get_campaign_total
+
+INDEX_SUITE = (
+    "contract_campaign_status_idx",
+    "contract_approved_idx",
+    "credit_info_user_campaign_idx",
+    "revenue_entry_user_idx",
+    "level_instance_contract_idx",
+    "level_instance_level_idx",
+    "user_campaign_campaign_idx",
+    "reward_user_campaign_paid_idx",
+)
+PAGE_SIZE = 25
+
+
+def replay_leaderboard(campaign: Campaign) -> None:
+    """Run query of volunteers' standings page."""
+    list(
+        UserCampaign.objects.filter(
+            campaign_id=campaign.id,
+        ).with_revenue_summary().order_by("-total_revenue", "id")[:PAGE_SIZE],
+    )
+
+
+def replay_dashboard(campaign: Campaign) -> None:
+    """Run queries refreshing dashboard snapshots."""
+    get_campaign_total(campaign.id)
+    list(
+        UserCampaign.objects.filter(
+            campaign_id=campaign.id,
+        ).with_total_revenue().values_list("id", "total_revenue"),
+    )
+
+
+def replay_sale_report(campaign: Campaign) -> None:
+    """Run query of sale report and its statistics."""
+    get_sale_report(campaign.id)
+
+
+def replay_contract_list(campaign: Campaign) -> None:
+    """Run queries of chamber admin's contracts page."""
+    contracts = Contract.objects.filter(
+        campaign_id=campaign.id,
+    ).with_level_count().with_total_cost()
+    contracts.count()
+    list(contracts.order_by("-total_cost", "id")[:PAGE_SIZE])
+
+
+WORKLOADS: dict[str, abc.Callable[[Campaign], None]] = {
+    "leaderboard": replay_leaderboard,
+    "dashboard": replay_dashboard,
+    "sale_report": replay_sale_report,
+    "contract_list": replay_contract_list,
+}
+
+
+class Command(BaseCommand):
+    """Print plans of contract and revenue hot path queries."""
+
+    help = (
+        "Replay leaderboard, dashboard, sale report and contract list "
+        "queries of a campaign and print their EXPLAIN ANALYZE. With "
+        "--compare queries are also replayed without the index suite, "
+        "which is dropped in a rolled back transaction: it locks tables "
+        "meanwhile, so compare on a copy of production database"
+    )
+
+    def add_arguments(self, parser):
+        """Add campaign, workloads and comparison flag."""
+        parser.add_argument("campaign_id", type=int)
+        parser.add_argument(
+            "--workload",
+            dest="workloads",
+            action="append",
+            choices=tuple(WORKLOADS),
+            help="Workloads to replay, all by default",
+        )
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Replay queries without index suite first",
+        )
+
+    def handle(self, *args, campaign_id, workloads, compare, **options):
+        """Explain queries of each workload before and after indexing."""
+        if connection.vendor != "postgresql":
+            raise CommandError("EXPLAIN ANALYZE requires PostgreSQL")
+        campaign = Campaign.objects.filter(id=campaign_id).first()
+        if not campaign:
+            raise CommandError(f"Campaign {campaign_id} doesn't exist")
+        workloads = workloads or tuple(WORKLOADS)
+
+        timings_before = {}
+        if compare:
+            with transaction.atomic(), connection.cursor() as cursor:
+                for index in INDEX_SUITE:
+                    index_name = connection.ops.quote_name(index)
+                    cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                timings_before = self.explain(campaign, workloads, "before")
+                transaction.set_rollback(True)
+        timings_after = self.explain(campaign, workloads, "after")
+
+        self.stdout.write("== Execution time, ms")
+        for workload in workloads:
+            before = timings_before.get(workload)
+            self.stdout.write(
+                f"{workload}: "
+                + (f"{before:.2f} -> " if before is not None else "")
+                + f"{timings_after[workload]:.2f}",
+            )
+
+    def explain(
+        self,
+        campaign: Campaign,
+        workloads: abc.Iterable[str],
+        label: str,
+    ) -> dict[str, float]:
+        """Print plans of workloads' queries and return their total time."""
+        timings = {}
+        for workload in workloads:
+            recorder = QueriesRecorder()
+            with connection.execute_wrapper(recorder):
+                WORKLOADS[workload](campaign)
+            timings[workload] = 0.0
+            for sql, params in recorder.queries:
+                if not sql.lstrip().upper().startswith("SELECT"):
+                    continue
+                with connection.cursor() as cursor:
+                    cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+                    plan = "\n".join(row[0] for row in cursor.fetchall())
+                timings[workload] += _get_execution_time(plan)
+                self.stdout.write(f"== {workload} ({label})")
+                self.stdout.write(sql)
+                self.stdout.write(plan)
+        return timings
+
+
+def _get_execution_time(plan: str) -> float:
+    """Return execution time of explained query in milliseconds."""
+    match = re.search(r"Execution Time: ([\d.]+) ms", plan)
+    return float(match.group(1)) if match else 0.0
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Campaign
+from ...services import rebuild_ranking
+
+
+class Command(BaseCommand):
+    """Reconstruct campaigns' ranking boards from revenue ledger."""
+
+    help = "Reconstruct campaigns' ranking boards from revenue ledger"
+
+    def add_arguments(self, parser):
+        """Add optional list of campaigns to rebuild."""
+        parser.add_argument(
+            "campaign_ids",
+            nargs="*",
+            type=int,
+            help="Campaigns to rebuild, live ones by default",
+        )
+
+    def handle(self, *args, campaign_ids, **options):
+        """Rebuild ranking boards of each campaign."""
+        campaigns = Campaign.objects.all()
+        if campaign_ids:
+            campaigns = campaigns.filter(id__in=campaign_ids)
+        else:
+            campaigns = campaigns.filter(status=Campaign.STATUSES.LIVE)
+        for campaign in campaigns:
+            rebuild_ranking(campaign)
+            self.stdout.write(f"Rebuilt ranking of campaign {campaign.id}")
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.10 on 2026-10-17 12:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0054_usercampaign_mobile_phone_usercampaign_work_phone'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignDashboardSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('campaign_total', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Campaign total')),
+                ('campaign', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_snapshot', to='campaigns.campaign', verbose_name='Campaign')),
+            ],
+            options={
+                'verbose_name': 'Campaign Dashboard Snapshot',
+                'verbose_name_plural': 'Campaign Dashboard Snapshots',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserCampaignDashboardSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('total_raised', models.DecimalField(decimal_places=16, max_digits=31, verbose_name='Total raised')),
+                ('next_incentive_threshold', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True, verbose_name='Next incentive threshold')),
+                ('trip_incentive_threshold', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True, verbose_name='Trip incentive threshold')),
+                ('campaign_snapshot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_campaign_snapshots', to='campaigns.campaigndashboardsnapshot', verbose_name='Campaign snapshot')),
+                ('user_campaign', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_snapshot', to='campaigns.usercampaign', verbose_name='User campaign')),
+            ],
+            options={
+                'verbose_name': 'User Campaign Dashboard Snapshot',
+                'verbose_name_plural': 'User Campaign Dashboard Snapshots',
+            },
+        ),
+    ]
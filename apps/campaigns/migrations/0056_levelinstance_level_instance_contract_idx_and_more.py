@@ -0,0 +1,28 @@
+# Generated by Django 4.2.10 on 2026-10-17 23:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('campaigns', '0055_dashboard_snapshots'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='levelinstance',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('declined_at__isnull', True)), fields=['contract'], include=('cost',), name='level_instance_contract_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='levelinstance',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('declined_at__isnull', True)), fields=['level', 'contract'], include=('cost',), name='level_instance_level_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='usercampaign',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['campaign', 'role', 'user'], name='user_campaign_campaign_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.10 on 2026-10-17 23:35
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('campaigns', '0056_levelinstance_level_instance_contract_idx_and_more'),
+        ('chambers', '0022_storedmember_stored_member_search_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='level',
+            index=GinIndex(condition=models.Q(('deleted_at__isnull', True)), fields=['name'], name='level_search_idx', opclasses=('gin_trgm_ops',)),
+        ),
+        AddIndexConcurrently(
+            model_name='usercampaign',
+            index=GinIndex(condition=models.Q(('deleted_at__isnull', True)), fields=['first_name', 'last_name'], name='user_campaign_search_idx', opclasses=('gin_trgm_ops', 'gin_trgm_ops')),
+        ),
+    ]
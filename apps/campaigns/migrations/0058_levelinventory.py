@@ -0,0 +1,84 @@
+# Generated by Django 4.2.10 on 2026-10-17 23:50
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+BATCH_SIZE = 2000
+
+
+def _count(instances):
+    """Return subquery counting instances of level."""
+    return Coalesce(
+        models.Subquery(
+            instances.order_by().values("level_id").annotate(
+                count=models.Count("id"),
+            ).values("count"),
+        ),
+        0,
+    )
+
+
+def populate_level_inventories(apps, schema_editor):
+    """Count instances of existing levels."""
+    Level = apps.get_model("campaigns.Level")
+    LevelInstance = apps.get_model("campaigns.LevelInstance")
+    LevelInventory = apps.get_model("campaigns.LevelInventory")
+    instances = LevelInstance.objects.filter(
+        level_id=models.OuterRef("id"),
+        deleted_at__isnull=True,
+        declined_at__isnull=True,
+        contract__isnull=False,
+        contract__deleted_at__isnull=True,
+    )
+    levels = Level.objects.annotate(
+        sold=_count(instances.filter(contract__status="approved")),
+        reserved=_count(
+            instances.filter(
+                contract__status__in=("draft", "sent", "signed"),
+            ),
+        ),
+    ).values_list("id", "amount", "sold", "reserved").order_by("id")
+    inventories = []
+    for level_id, amount, sold, reserved in levels.iterator(
+        chunk_size=BATCH_SIZE,
+    ):
+        inventories.append(
+            LevelInventory(
+                level_id=level_id,
+                sold=sold,
+                reserved=reserved,
+                available=amount - sold - reserved,
+            ),
+        )
+        if len(inventories) == BATCH_SIZE:
+            LevelInventory.objects.bulk_create(inventories)
+            inventories = []
+    LevelInventory.objects.bulk_create(inventories)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0057_level_level_search_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LevelInventory',
+            fields=[
+                ('level', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='inventory', serialize=False, to='campaigns.level', verbose_name='Level')),
+                ('sold', models.IntegerField(default=0, verbose_name='Sold')),
+                ('reserved', models.IntegerField(default=0, verbose_name='Reserved')),
+                ('available', models.IntegerField(default=0, verbose_name='Available')),
+            ],
+            options={
+                'verbose_name': 'Level Inventory',
+                'verbose_name_plural': 'Level Inventories',
+            },
+        ),
+        migrations.RunPython(
+            populate_level_inventories,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
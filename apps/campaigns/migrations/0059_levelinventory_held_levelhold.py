@@ -0,0 +1,39 @@
+# Generated by Django 4.2.10 on 2026-10-18 00:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0030_contract_contract_campaign_status_idx_and_more'),
+        ('campaigns', '0058_levelinventory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='levelinventory',
+            name='held',
+            field=models.IntegerField(default=0, verbose_name='Held'),
+        ),
+        migrations.CreateModel(
+            name='LevelHold',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('token', models.UUIDField(db_index=True, verbose_name='Token')),
+                ('quantity', models.PositiveIntegerField(default=1, verbose_name='Quantity')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='Expires at')),
+                ('contract', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='level_holds', to='members.contract', verbose_name='Contract')),
+                ('level', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='holds', to='campaigns.level', verbose_name='Level')),
+                ('user_campaign', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='level_holds', to='campaigns.usercampaign', verbose_name='User campaign')),
+            ],
+            options={
+                'verbose_name': 'Level Hold',
+                'verbose_name_plural': 'Level Holds',
+            },
+        ),
+    ]
@@ -1,7 +1,13 @@
 # pylint: disable=cyclic-import
 from .campaign import Campaign
+from .dashboard_snapshot import (
+    CampaignDashboardSnapshot,
+    UserCampaignDashboardSnapshot,
+)
 from .level import Level
+from .level_hold import LevelHold
 from .level_instance import LevelInstance
+from .level_inventory import LevelInventory
 from .note import Note
 from .product import Product
 from .product_attachment import ProductAttachment
@@ -0,0 +1,87 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_extensions.db.models import TimeStampedModel
+
+
+class CampaignDashboardSnapshot(TimeStampedModel):
+    """Represent precomputed campaign's data of VS dashboard.
+
+    Attributes:
+        - campaign: campaign of the dashboard
+        - campaign_total: cost of campaign's approved level instances
+
+    """
+
+    campaign = models.OneToOneField(
+        to="campaigns.Campaign",
+        verbose_name=_("Campaign"),
+        on_delete=models.CASCADE,
+        related_name="dashboard_snapshot",
+    )
+    campaign_total = models.DecimalField(
+        verbose_name=_("Campaign total"),
+        max_digits=15,
+        decimal_places=2,
+    )
+
+    class Meta:
+        verbose_name = _("Campaign Dashboard Snapshot")
+        verbose_name_plural = _("Campaign Dashboard Snapshots")
+
+    def __str__(self) -> str:
+        return f"{self.campaign}: {self.campaign_total}"
+
+
+class UserCampaignDashboardSnapshot(TimeStampedModel):
+    """Represent precomputed volunteer's data of VS dashboard.
+
+    Attributes:
+        - user_campaign: volunteer of the dashboard
+        - campaign_snapshot: snapshot of volunteer's campaign
+        - total_raised: volunteer's total revenue
+        - next_incentive_threshold: threshold of the closest not reached
+        incentive, if any
+        - trip_incentive_threshold: threshold of the closest not reached trip
+        incentive, if any
+
+    """
+
+    user_campaign = models.OneToOneField(
+        to="campaigns.UserCampaign",
+        verbose_name=_("User campaign"),
+        on_delete=models.CASCADE,
+        related_name="dashboard_snapshot",
+    )
+    campaign_snapshot = models.ForeignKey(
+        to="campaigns.CampaignDashboardSnapshot",
+        verbose_name=_("Campaign snapshot"),
+        on_delete=models.CASCADE,
+        related_name="user_campaign_snapshots",
+    )
+    total_raised = models.DecimalField(
+        verbose_name=_("Total raised"),
+        max_digits=31,
+        decimal_places=16,
+    )
+    next_incentive_threshold = models.DecimalField(
+        verbose_name=_("Next incentive threshold"),
+        max_digits=15,
+        decimal_places=2,
+        null=True,
+        blank=True,
+    )
+    trip_incentive_threshold = models.DecimalField(
+        verbose_name=_("Trip incentive threshold"),
+        max_digits=15,
+        decimal_places=2,
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _("User Campaign Dashboard Snapshot")
+        verbose_name_plural = _("User Campaign Dashboard Snapshots")
+
+    def __str__(self) -> str:
+        return f"{self.user_campaign}: {self.total_raised}"
@@ -1,5 +1,6 @@
 import typing
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -90,6 +91,14 @@ class Level(OrderedModel, BaseModel):
     class Meta(OrderedModel.Meta):
         verbose_name = _("Level")
         verbose_name_plural = _("Levels")
+        indexes = (
+            GinIndex(
+                fields=("name",),
+                opclasses=("gin_trgm_ops",),
+                condition=models.Q(deleted_at__isnull=True),
+                name="level_search_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return self.name
@@ -0,0 +1,63 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_extensions.db.models import TimeStampedModel
+
+
+class LevelHold(TimeStampedModel):
+    """Represent instances of level held for contract's form.
+
+    Held instances aren't available for other contracts until the form is
+    submitted, the contract is declined or the hold expires.
+
+    Attributes:
+        - level: held level
+        - user_campaign: volunteer filling the form
+        - contract: edited contract, empty for a new one
+        - token: token of the form, which is submitted with contract
+        - quantity: number of held instances
+        - expires_at: time when instances are returned to available ones
+
+    """
+
+    level = models.ForeignKey(
+        to="campaigns.Level",
+        verbose_name=_("Level"),
+        on_delete=models.CASCADE,
+        related_name="holds",
+    )
+    user_campaign = models.ForeignKey(
+        to="campaigns.UserCampaign",
+        verbose_name=_("User campaign"),
+        on_delete=models.SET_NULL,
+        related_name="level_holds",
+        null=True,
+        blank=True,
+    )
+    contract = models.ForeignKey(
+        to="members.Contract",
+        verbose_name=_("Contract"),
+        on_delete=models.SET_NULL,
+        related_name="level_holds",
+        null=True,
+        blank=True,
+    )
+    token = models.UUIDField(
+        verbose_name=_("Token"),
+        db_index=True,
+    )
+    quantity = models.PositiveIntegerField(
+        verbose_name=_("Quantity"),
+        default=1,
+    )
+    expires_at = models.DateTimeField(
+        verbose_name=_("Expires at"),
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = _("Level Hold")
+        verbose_name_plural = _("Level Holds")
+
+    def __str__(self) -> str:
+        return f"{self.level_id}: {self.quantity}"
@@ -51,6 +51,26 @@ class LevelInstance(BaseModel):
     class Meta:
         verbose_name = _("Level Instance")
         verbose_name_plural = _("Level Instances")
+        indexes = (
+            models.Index(
+                fields=("contract",),
+                include=("cost",),
+                condition=models.Q(
+                    deleted_at__isnull=True,
+                    declined_at__isnull=True,
+                ),
+                name="level_instance_contract_idx",
+            ),
+            models.Index(
+                fields=("level", "contract"),
+                include=("cost",),
+                condition=models.Q(
+                    deleted_at__isnull=True,
+                    declined_at__isnull=True,
+                ),
+                name="level_instance_level_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return f"{self.contract} - {self.level}: {self.cost}"
@@ -0,0 +1,51 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class LevelInventory(models.Model):
+    """Represent counters of level's instances.
+
+    Counters are stored apart from level, so saving level doesn't overwrite
+    them. They are changed by conditional updates when levels are attached
+    to contracts and recounted when contracts change state.
+
+    Attributes:
+        - level: level of the inventory
+        - sold: number of instances of approved contracts
+        - reserved: number of instances of contracts not approved yet
+        - held: number of instances held for contracts' forms
+        - available: number of instances which can be attached to contracts,
+        negative for unlimited levels
+
+    """
+
+    level = models.OneToOneField(
+        to="campaigns.Level",
+        verbose_name=_("Level"),
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="inventory",
+    )
+    sold = models.IntegerField(
+        verbose_name=_("Sold"),
+        default=0,
+    )
+    reserved = models.IntegerField(
+        verbose_name=_("Reserved"),
+        default=0,
+    )
+    held = models.IntegerField(
+        verbose_name=_("Held"),
+        default=0,
+    )
+    available = models.IntegerField(
+        verbose_name=_("Available"),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("Level Inventory")
+        verbose_name_plural = _("Level Inventories")
+
+    def __str__(self) -> str:
+        return f"{self.level_id}: {self.available}"
@@ -2,6 +2,7 @@ import typing
 
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField, CIEmailField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
@@ -18,6 +19,7 @@ from safedelete.managers import (
 
 from apps.core.constants import MAX_PHONE_NUMBER_LENGTH, MAX_ZIP_CODE_LENGTH
 from apps.core.models import BaseModel
+from apps.users import services as users_services
 
 from .. import constants
 from ..querysets import UserCampaignQuerySet
@@ -201,6 +203,19 @@ class UserCampaign(BaseModel):
     class Meta:
         verbose_name = _("User Campaign")
         verbose_name_plural = _("User Campaigns")
+        indexes = (
+            models.Index(
+                fields=("campaign", "role", "user"),
+                condition=models.Q(deleted_at__isnull=True),
+                name="user_campaign_campaign_idx",
+            ),
+            GinIndex(
+                fields=("first_name", "last_name"),
+                opclasses=("gin_trgm_ops",) * 2,
+                condition=models.Q(deleted_at__isnull=True),
+                name="user_campaign_search_idx",
+            ),
+        )
 
     def __str__(self):
         return f"{self.full_name} ({self.email}) ({self.id})"
@@ -282,9 +297,11 @@ class UserCampaign(BaseModel):
         """Set user campaign deactivation time."""
         self.deactivated_at = timezone.now()
         self.save(update_fields=["deactivated_at"])
-        AuthToken.objects.filter(
-            user=self.user,
-        ).update(expiry=self.deactivated_at)
+        auth_tokens = AuthToken.objects.filter(user=self.user)
+        auth_tokens.update(expiry=self.deactivated_at)
+        users_services.invalidate_auth_tokens_cache(
+            digests=auth_tokens.values_list("digest", flat=True),
+        )
 
     def activate(self):
         """Activate user in case it was deactivated."""
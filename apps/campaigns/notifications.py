@@ -16,9 +16,16 @@ class VolunteerInvitationEmailNotification(DefaultEmailNotification):
     subject = _("Welcome new volunteer")
     template = "campaigns/emails/volunteer_invitation.html"
 
-    def __init__(self, volunteer: User, campaign, **template_context):
+    def __init__(
+        self,
+        volunteer: User,
+        campaign,
+        chamber_admin: User | None = None,
+        **template_context,
+    ):
         super().__init__(**template_context)
         self.campaign = campaign
+        self.chamber_admin = chamber_admin
         self.volunteer = volunteer
         self.chamber = self.volunteer.chamber
         self.volunteer_registration_url = (
@@ -32,7 +39,7 @@ class VolunteerInvitationEmailNotification(DefaultEmailNotification):
     def get_template_context(self) -> dict:
         """Provide additional context about current volunteer."""
         ctx = super().get_template_context()
-        chamber_admin: User = self.chamber.users.filter(
+        chamber_admin: User = self.chamber_admin or self.chamber.users.filter(
             role=User.ROLES.CHAMBER_ADMIN,
         ).first()
         ctx.update(
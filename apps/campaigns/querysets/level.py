@@ -1,13 +1,9 @@
-from decimal import Decimal
-
 from django.db import models
 from django.db.models import F, functions
 
 from ordered_model.models import OrderedModelQuerySet
 from safedelete.queryset import SafeDeleteQueryset
 
-from apps.members.constants import ContractStatus
-
 
 class LevelQuerySet(SafeDeleteQueryset, OrderedModelQuerySet):
     """Provide custom queryset methods for Level."""
@@ -21,20 +17,18 @@ class LevelQuerySet(SafeDeleteQueryset, OrderedModelQuerySet):
         """Annotate the number of sold instances.
 
         Sold instances are instances that meet following conditions:
-            - attached to a contract
+            - attached to an approved contract
             - not declined
             - not soft-deleted
 
+        The number is read from level's inventory instead of counting
+        instances.
+
         """
         return self.annotate(
-            sold_instances_count=models.Count(
-                "instances",
-                filter=models.Q(
-                    instances__deleted_at__isnull=True,
-                    instances__declined_at__isnull=True,
-                    instances__contract_id__isnull=False,
-                    instances__contract__status=ContractStatus.APPROVED,
-                ),
+            sold_instances_count=functions.Coalesce(
+                F("inventory__sold"),
+                0,
             ),
         )
 
@@ -58,61 +52,27 @@ class LevelQuerySet(SafeDeleteQueryset, OrderedModelQuerySet):
         )
 
     def with_available_amount(self):
-        """Annotate the number of instances attachable to create contracts."""
-        return self.with_sold_instances_count().annotate(
-            available_amount=(
-                models.F("amount") - models.F("sold_instances_count")
-            ),
-        )
-
-    def with_sold_value(self):
-        """Annotate the total value of sold instances.
+        """Annotate the number of instances attachable to create contracts.
 
-        Sold instances are instances that meet following conditions:
-            - attached to an approved contract
-            - not declined
-            - not soft-deleted
+        Instances attached to contracts which aren't approved yet are
+        reserved and instances held for contracts' forms are held, so they
+        aren't available. Levels without inventory have no instances attached
+        or held.
 
         """
         return self.annotate(
-            sold_value=functions.Coalesce(
-                models.Sum(
-                    "instances__cost",
-                    filter=models.Q(
-                        instances__deleted_at__isnull=True,
-                        instances__declined_at__isnull=True,
-                        instances__contract_id__isnull=False,
-                        instances__contract__status=ContractStatus.APPROVED,
-                    ),
-                ),
-                Decimal(0),
+            available_amount=functions.Coalesce(
+                F("inventory__available"),
+                F("amount"),
             ),
         )
 
-    def with_sale_report_data(self):
-        """Annotate data for sale report."""
-        return (
-            self
-            .with_total_instances_count()
-            .with_sold_instances_count()
-            .with_sold_value()
-            .with_remaining_instances_count()
-            .annotate(
-                remaining_value=models.ExpressionWrapper(
-                    F("remaining_instances_count") * F("cost"),
-                    output_field=models.DecimalField(
-                        max_digits=15,
-                        decimal_places=2,
-                    ),
-                ),
-            )
-        )
-
     def with_is_available(self):
         """Annotate is_available field to indicate instance's attachable."""
         return self.with_available_amount().annotate(
             is_available=models.Case(
-                models.When(available_amount=0, then=False),
-                default=True,
+                models.When(amount__lt=0, then=True),
+                models.When(available_amount__gt=0, then=True),
+                default=False,
             ),
         )
@@ -7,7 +7,7 @@ from django.db.models.functions import Coalesce
 
 from safedelete.queryset import SafeDeleteQueryset
 
-from apps.members.constants import ContractStatus, ContractType
+from apps.members.constants import ContractType
 from apps.users.constants import UserRole
 
 from ..constants import UserCampaignRole
@@ -39,37 +39,37 @@ class UserCampaignQuerySet(SafeDeleteQueryset):
         """Exclude users who can not sell contract."""
         return self.with_can_sell_contract().filter(can_sell_contract=True)
 
+    # pylint: disable=invalid-name
     def _get_revenue_expr(
         self,
         revenue_from: dt.datetime | None = None,
         revenue_to: dt.datetime | None = None,
         contract_type: str | None = None,
     ):
-        """Return the expression to calculate volunteer's generated revenue."""
+        """Return the expression to calculate volunteer's generated revenue.
+
+        Revenue is summed from volunteer's entries of the revenue ledger,
+        which is maintained by contracts' services.
+
+        """
+        RevenueEntry = self.model._meta.get_field(
+            "revenue_entries",
+        ).related_model
         from_filter = (
-            Q(contracts_credit_info__contract__approved_at__gte=revenue_from)
-            if revenue_from else Q()
-        )
-        to_filter = (
-            Q(contracts_credit_info__contract__approved_at__lte=revenue_to)
-            if revenue_to else Q()
+            Q(approved_at__gte=revenue_from) if revenue_from else Q()
         )
+        to_filter = Q(approved_at__lte=revenue_to) if revenue_to else Q()
         contract_type_filter = (
-            Q(contracts_credit_info__contract__type=contract_type)
-            if contract_type else Q()
+            Q(contract_type=contract_type) if contract_type else Q()
         )
-        filters = Q(
-            contracts_credit_info__contract__status=ContractStatus.APPROVED,
-            contracts_credit_info__contract__deleted_at__isnull=True,
-            contracts_credit_info__contract__levels__declined_at__isnull=True,
-            contracts_credit_info__contract__levels__deleted_at__isnull=True,
-        ) & from_filter & to_filter & contract_type_filter
-        return Sum(
-            (
-                F("contracts_credit_info__contract__levels__cost")
-                * F("contracts_credit_info__portion")
-            ),
-            filter=filters,
+        return Subquery(
+            RevenueEntry.objects.filter(
+                from_filter & to_filter & contract_type_filter,
+                campaign_id=OuterRef("campaign_id"),
+                user_campaign_id=OuterRef("pk"),
+            ).values("user_campaign").annotate(
+                revenue=Sum("amount"),
+            ).values("revenue"),
         )
 
     def with_total_revenue(self):
@@ -116,73 +116,40 @@ class UserCampaignQuerySet(SafeDeleteQueryset):
             ),
         )
 
-    def _get_managed_teams_revenue_expr(
+    def with_revenue_summary(
         self,
         revenue_from: dt.datetime | None = None,
         revenue_to: dt.datetime | None = None,
-        contract_type: str | None = None,
     ):
-        """Return the expr to calculate volunteer's managed teams revenue."""
-        contracts_path = (
-            "managed_teams__members__contracts_credit_info__contract"
-        )
-        from_filter = (
-            Q(**{f"{contracts_path}__approved_at__gte": revenue_from})
-            if revenue_from else Q()
-        )
-        to_filter = (
-            Q(**{f"{contracts_path}__approved_at__lte": revenue_to})
-            if revenue_to else Q()
-        )
-        contract_type_filter = (
-            Q(**{f"{contracts_path}__type": contract_type})
-            if contract_type else Q()
-        )
-        return Sum(
-            F(f"{contracts_path}__levels__cost")
-            * F("managed_teams__members__contracts_credit_info__portion"),
-            filter=Q(
-                **{
-                    f"{contracts_path}__status": ContractStatus.APPROVED,
-                    f"{contracts_path}__levels__declined_at__isnull": True,
-                    f"{contracts_path}__levels__deleted_at__isnull": True,
-                },
-            ) & from_filter & to_filter & contract_type_filter,
-        )
+        """Annotate volunteer's total, window, cash and trade revenue.
+
+        Unlike chaining `with_total_revenue`, `with_week_revenue` and others,
+        all values are computed in one pass over volunteer's ledger entries.
 
-    def with_managed_teams_total_revenue(self):
-        """Annotate user's managed teams' total generated revenue."""
+        """
         return self.annotate(
-            total_revenue=Coalesce(
-                self._get_managed_teams_revenue_expr(),
-                decimal.Decimal(0),
+            **get_revenue_summary_annotations(
+                entries_path="revenue_entries",
+                revenue_from=revenue_from,
+                revenue_to=revenue_to,
             ),
         )
 
-    def with_managed_teams_week_revenue(
+    def with_managed_teams_revenue_summary(
         self,
-        revenue_from: dt.datetime,
-        revenue_to: dt.datetime,
+        revenue_from: dt.datetime | None = None,
+        revenue_to: dt.datetime | None = None,
     ):
-        """Annotate user's managed teams' week generated revenue."""
-        return self.annotate(
-            week_revenue=Coalesce(
-                self._get_managed_teams_revenue_expr(
-                    revenue_from=revenue_from,
-                    revenue_to=revenue_to,
-                ),
-                decimal.Decimal(0),
-            ),
-        )
-
-    def with_managed_team_total_cash_revenue(self):
-        """Annotate user's managed teams' total generated cash revenue."""
+        """Annotate revenue summary of user's managed teams' members."""
         return self.annotate(
-            total_cash_revenue=Coalesce(
-                self._get_managed_teams_revenue_expr(
-                    contract_type=ContractType.CASH,
+            **get_revenue_summary_annotations(
+                entries_path="managed_teams__members__revenue_entries",
+                revenue_from=revenue_from,
+                revenue_to=revenue_to,
+                entries_filter=Q(
+                    managed_teams__deleted_at__isnull=True,
+                    managed_teams__members__deleted_at__isnull=True,
                 ),
-                decimal.Decimal(0),
             ),
         )
 
@@ -208,3 +175,49 @@ class UserCampaignQuerySet(SafeDeleteQueryset):
                 ).values("paid_amount"),
             ),
         )
+
+
+def get_revenue_summary_annotations(
+    entries_path: str,
+    revenue_from: dt.datetime | None = None,
+    revenue_to: dt.datetime | None = None,
+    entries_filter: Q | None = None,
+) -> dict[str, Coalesce]:
+    """Return annotations summing revenue ledger entries in a single pass.
+
+    All annotations aggregate the same join to ledger entries reached by
+    `entries_path`, so the query groups entries once and evaluates filtered
+    sums on it instead of joining entries separately for each value.
+
+    Annotated values:
+        - total_revenue: sum of all entries
+        - week_revenue: sum of entries approved within the time range
+        - total_cash_revenue: sum of cash contracts' entries
+        - total_trade_revenue: sum of trade contracts' entries
+
+    """
+    entries_filter = entries_filter or Q()
+    approved_at_path = f"{entries_path}__approved_at"
+    window_filter = Q()
+    if revenue_from:
+        window_filter &= Q(**{f"{approved_at_path}__gte": revenue_from})
+    if revenue_to:
+        window_filter &= Q(**{f"{approved_at_path}__lte": revenue_to})
+    amount_path = f"{entries_path}__amount"
+    filters = {
+        "total_revenue": entries_filter,
+        "week_revenue": entries_filter & window_filter,
+        "total_cash_revenue": entries_filter & Q(
+            **{f"{entries_path}__contract_type": ContractType.CASH},
+        ),
+        "total_trade_revenue": entries_filter & Q(
+            **{f"{entries_path}__contract_type": ContractType.TRADE},
+        ),
+    }
+    return {
+        name: Coalesce(
+            Sum(amount_path, filter=revenue_filter or None),
+            decimal.Decimal(0),
+        )
+        for name, revenue_filter in filters.items()
+    }
@@ -4,6 +4,43 @@ from .campaign import (
     get_inventory_stats,
     get_vs_dashboard_data,
 )
+from .campaign_context import (
+    CampaignContext,
+    UserCampaignInfo,
+    get_campaign_context,
+    get_chamber_newest_campaign_id,
+    get_user_campaign_info,
+    invalidate_campaign_context,
+    invalidate_chamber_newest_campaign,
+    invalidate_user_campaign_context,
+)
+from .dashboard import (
+    get_campaign_dashboard_snapshot,
+    get_user_campaign_dashboard_snapshot,
+    refresh_dashboard_snapshots,
+    refresh_dashboard_snapshots_thresholds,
+)
+from .inventory import (
+    LEVEL_HOLD_MAX_AGE,
+    MAX_HELD_INSTANCES_COUNT,
+    MAX_LEVEL_HOLD_QUANTITY,
+    get_held_instances_count,
+    get_level_hold_started_at,
+    hold_level_instances,
+    refresh_campaign_level_inventories,
+    refresh_contracts_level_inventories,
+    refresh_level_inventories,
+    release_expired_level_holds,
+    release_level_holds,
+    release_level_instances,
+    reserve_level_instances,
+)
+from .leaderboard import (
+    get_cached_leaderboard,
+    get_leaderboard_cache_key,
+    get_leaderboard_cache_stats,
+    invalidate_leaderboard_cache,
+)
 from .level import duplicate_level
 from .product import duplicate_product
 from .product_category import (
@@ -11,4 +48,19 @@ from .product_category import (
     duplicate_category,
     get_product_category_stats,
 )
+from .ranking import (
+    TOTAL_BOARD,
+    RankedUserCampaigns,
+    add_to_ranking,
+    get_ranked_user_campaigns,
+    get_ranking_slice,
+    get_top_volunteers,
+    get_volunteer_neighbours,
+    get_volunteer_rank,
+    get_week_board,
+    is_ranking_warm,
+    rebuild_ranking,
+    remove_from_ranking,
+    update_ranking,
+)
 from .user_campaign import create_default_user_campaign, delete_user_campaign
@@ -1,77 +1,72 @@
 from decimal import Decimal
 
-from django.db import models
-from django.db.models.functions import Coalesce
-
 from apps.campaigns import models as campaigns_models
-from apps.incentives.constants import IncentiveType
-from apps.incentives.models import Incentive
-from apps.members.constants import ContractStatus
 from apps.users.models import User
 
 from ..models import Campaign, Level
+from .dashboard import (
+    get_campaign_dashboard_snapshot,
+    get_campaign_total,
+    get_user_campaign_dashboard_snapshot,
+)
 
 
 def get_vs_dashboard_data(
     campaign: campaigns_models.Campaign,
     user: User,
 ) -> dict:
-    """Return VS campaign dashboard data."""
-    dashboard_data = {}
-    dashboard_data.update(_get_vs_dashboard_campaign_data(campaign))
-    if user.role == User.ROLES.SUPER_ADMIN:
-        dashboard_data.update(_get_vs_dashboard_super_admin_fake_data())
-    else:
-        dashboard_data.update(_get_vs_dashboard_personal_data(campaign, user))
-
-    return dashboard_data
-
+    """Return VS campaign dashboard data.
 
-def _get_vs_dashboard_campaign_data(campaign: campaigns_models.Campaign):
-    """Return campaign's data in VS dashboard."""
-    campaign_revenue = campaigns_models.LevelInstance.objects.filter(
-        contract__campaign_id=campaign.id,
-        contract__status=ContractStatus.APPROVED,
-        declined_at__isnull=True,
-    ).aggregate(
-        revenue=Coalesce(models.Sum(models.F("cost")), Decimal(0)),
-    )["revenue"]
+    Data is read from dashboard snapshots, which are built on first access
+    and refreshed when campaign's revenue or incentives change.
 
+    """
+    if user.role == User.ROLES.SUPER_ADMIN:
+        campaign_snapshot = get_campaign_dashboard_snapshot(campaign.id)
+        return {
+            "campaign_goal": campaign.goal,
+            "campaign_total": campaign_snapshot.campaign_total,
+            **_get_vs_dashboard_super_admin_fake_data(),
+        }
+    snapshot = get_user_campaign_dashboard_snapshot(campaign.id, user.id)
+    if not snapshot:
+        return {
+            "campaign_goal": campaign.goal,
+            "campaign_total": get_campaign_total(campaign.id),
+            **_get_vs_dashboard_personal_data(
+                personal_revenue=Decimal(0),
+                personal_goal=None,
+                next_threshold=None,
+                trip_threshold=None,
+            ),
+        }
     return {
         "campaign_goal": campaign.goal,
-        "campaign_total": campaign_revenue,
+        "campaign_total": snapshot.campaign_snapshot.campaign_total,
+        **_get_vs_dashboard_personal_data(
+            personal_revenue=snapshot.total_raised,
+            personal_goal=snapshot.user_campaign.sales_goal,
+            next_threshold=snapshot.next_incentive_threshold,
+            trip_threshold=snapshot.trip_incentive_threshold,
+        ),
     }
 
 
 def _get_vs_dashboard_personal_data(
-    campaign: campaigns_models.Campaign,
-    user: User,
+    personal_revenue: Decimal,
+    personal_goal: Decimal | None,
+    next_threshold: Decimal | None,
+    trip_threshold: Decimal | None,
 ):
     """Return personal data in VS dashboard."""
-    campaign_user = campaigns_models.UserCampaign.objects.filter(
-        campaign_id=campaign.id,
-        user_id=user.id,
-    ).all().with_total_revenue().first()
-    personal_revenue = campaign_user.total_revenue
-    next_incentive = Incentive.objects.filter(
-        campaign_id=campaign.id,
-        threshold__gt=personal_revenue,
-    ).order_by("threshold").first()
-    trip_incentive = Incentive.objects.filter(
-        campaign_id=campaign.id,
-        type=IncentiveType.TRIP,
-        threshold__gt=personal_revenue,
-    ).order_by("threshold").first()
-    next_threshold = (
-        next_incentive.threshold if next_incentive else personal_revenue
-    )
-    trip_threshold = (
-        trip_incentive.threshold if trip_incentive else personal_revenue
-    )
+    if next_threshold is None:
+        next_threshold = personal_revenue
+    if trip_threshold is None:
+        trip_threshold = personal_revenue
 
     return {
         "total_raised": personal_revenue,
-        "personal_goal": campaign_user.sales_goal if campaign_user else None,
+        "personal_goal": personal_goal,
         "next_incentive_threshold": next_threshold,
         "remaining_to_next_incentive": next_threshold - personal_revenue,
         "trip_incentive_threshold": trip_threshold,
@@ -0,0 +1,157 @@
+import typing
+from collections import abc
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models import Campaign, UserCampaign
+
+CAMPAIGN_CONTEXT_CACHE_TIMEOUT = 60 * 60
+
+
+class UserCampaignInfo(typing.NamedTuple):
+    """Represent user's participation in campaign."""
+
+    id: int
+    role: str
+
+
+def get_campaign(campaign_id: int) -> Campaign | None:
+    """Return campaign by id, cached until it's changed."""
+    key = f"campaign_context:campaign:{campaign_id}"
+    campaign = cache.get(key)
+    if campaign is None:
+        campaign = Campaign.objects.filter(id=campaign_id).first()
+        if campaign:
+            cache.set(key, campaign, timeout=CAMPAIGN_CONTEXT_CACHE_TIMEOUT)
+    return campaign
+
+
+def get_chamber_newest_campaign_id(chamber_id: int) -> int | None:
+    """Return id of chamber's newest campaign, cached until it's changed."""
+    key = f"campaign_context:chamber:{chamber_id}:newest"
+    campaign_id = cache.get(key)
+    if campaign_id is None:
+        campaign_id = Campaign.objects.filter(
+            chamber_id=chamber_id,
+        ).order_by("-id").values_list("id", flat=True).first()
+        if campaign_id:
+            cache.set(
+                key,
+                campaign_id,
+                timeout=CAMPAIGN_CONTEXT_CACHE_TIMEOUT,
+            )
+    return campaign_id
+
+
+def get_user_campaign_info(
+    user_id: int,
+    campaign_id: int,
+) -> UserCampaignInfo | None:
+    """Return user's participation in campaign, cached until it's changed.
+
+    Missing participation is not cached, so user campaigns created in bulk
+    don't need invalidation.
+
+    """
+    key = f"campaign_context:user_campaign:{user_id}:{campaign_id}"
+    info = cache.get(key)
+    if info is None:
+        user_campaign = UserCampaign.objects.filter(
+            user_id=user_id,
+            campaign_id=campaign_id,
+        ).order_by("id").values_list("id", "role").first()
+        if user_campaign:
+            info = UserCampaignInfo(*user_campaign)
+            cache.set(key, info, timeout=CAMPAIGN_CONTEXT_CACHE_TIMEOUT)
+    return info
+
+
+def invalidate_campaign_context(campaign: Campaign) -> None:
+    """Drop cached campaign and newest campaign of its chamber."""
+    _delete_cached([
+        f"campaign_context:campaign:{campaign.id}",
+        f"campaign_context:chamber:{campaign.chamber_id}:newest",
+    ])
+
+
+def invalidate_chamber_newest_campaign(chamber_id: int) -> None:
+    """Drop cached newest campaign of chamber."""
+    _delete_cached([f"campaign_context:chamber:{chamber_id}:newest"])
+
+
+def invalidate_user_campaign_context(user_campaign: UserCampaign) -> None:
+    """Drop cached user's participation in campaign."""
+    _delete_cached([
+        f"campaign_context:user_campaign:{user_campaign.user_id}:"
+        f"{user_campaign.campaign_id}",
+    ])
+
+
+class CampaignContext:
+    """Resolve campaign context of a request.
+
+    Lookups are cached across requests and memoized within request, so the
+    same campaign or role is not requested twice while permissions are
+    checked.
+
+    """
+
+    def __init__(self):
+        self.memo: dict[tuple, typing.Any] = {}
+
+    def get_campaign(self, campaign_id: int) -> Campaign | None:
+        """Return campaign by id."""
+        return self._memoize(("campaign", campaign_id), get_campaign)
+
+    def get_chamber_newest_campaign(self, chamber_id: int) -> Campaign | None:
+        """Return chamber's newest campaign."""
+        campaign_id = self._memoize(
+            ("chamber", chamber_id),
+            get_chamber_newest_campaign_id,
+        )
+        return self.get_campaign(campaign_id) if campaign_id else None
+
+    def get_user_campaign_info(
+        self,
+        user_id: int,
+        campaign_id: int,
+    ) -> UserCampaignInfo | None:
+        """Return user's participation in campaign."""
+        return self._memoize(
+            ("user_campaign", user_id, campaign_id),
+            get_user_campaign_info,
+        )
+
+    def _memoize(
+        self,
+        key: tuple,
+        lookup: abc.Callable[..., typing.Any],
+    ) -> typing.Any:
+        """Return memoized result of lookup called with key's arguments."""
+        if key not in self.memo:
+            self.memo[key] = lookup(*key[1:])
+        return self.memo[key]
+
+
+def get_campaign_context(request) -> CampaignContext:
+    """Return campaign context of request, creating it on first access.
+
+    Context is stored on Django's request, so it's shared with DRF's request
+    wrapping it.
+
+    """
+    request = getattr(request, "_request", request)
+    if not hasattr(request, "campaign_context"):
+        request.campaign_context = CampaignContext()
+    return request.campaign_context
+
+
+def _delete_cached(keys: list[str]) -> None:
+    """Delete cached values now and after transaction commit.
+
+    Concurrent requests may cache old values until changes are committed.
+
+    """
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,201 @@
+import bisect
+from collections import abc
+from decimal import Decimal
+
+from django.db import models
+from django.db.models.functions import Coalesce
+
+from apps.incentives.constants import IncentiveType
+from apps.incentives.models import Incentive
+from apps.members.constants import ContractStatus
+
+from ..models import (
+    CampaignDashboardSnapshot,
+    LevelInstance,
+    UserCampaign,
+    UserCampaignDashboardSnapshot,
+)
+
+SNAPSHOT_UPDATE_FIELDS = (
+    "total_raised",
+    "next_incentive_threshold",
+    "trip_incentive_threshold",
+    "modified",
+)
+
+
+def get_campaign_total(campaign_id: int) -> Decimal:
+    """Return cost of campaign's approved level instances."""
+    return LevelInstance.objects.filter(
+        contract__campaign_id=campaign_id,
+        contract__status=ContractStatus.APPROVED,
+        declined_at__isnull=True,
+    ).aggregate(
+        revenue=Coalesce(models.Sum(models.F("cost")), Decimal(0)),
+    )["revenue"]
+
+
+def get_campaign_dashboard_snapshot(
+    campaign_id: int,
+) -> CampaignDashboardSnapshot:
+    """Return campaign's dashboard snapshot, building it if missing."""
+    snapshot = CampaignDashboardSnapshot.objects.filter(
+        campaign_id=campaign_id,
+    ).first()
+    return snapshot or refresh_campaign_dashboard_snapshot(campaign_id)
+
+
+def get_user_campaign_dashboard_snapshot(
+    campaign_id: int,
+    user_id: int,
+) -> UserCampaignDashboardSnapshot | None:
+    """Return volunteer's dashboard snapshot, building it if missing.
+
+    Return `None` if user doesn't participate in the campaign.
+
+    """
+    snapshot_filter = models.Q(
+        user_campaign__campaign_id=campaign_id,
+        user_campaign__user_id=user_id,
+        user_campaign__deleted_at__isnull=True,
+    )
+    snapshot = UserCampaignDashboardSnapshot.objects.filter(
+        snapshot_filter,
+    ).select_related("user_campaign", "campaign_snapshot").first()
+    if snapshot:
+        return snapshot
+    user_campaign_id = UserCampaign.objects.filter(
+        campaign_id=campaign_id,
+        user_id=user_id,
+    ).values_list("id", flat=True).first()
+    if not user_campaign_id:
+        return None
+    refresh_user_campaign_dashboard_snapshots(
+        campaign_id=campaign_id,
+        user_campaign_ids=[user_campaign_id],
+    )
+    return UserCampaignDashboardSnapshot.objects.filter(
+        snapshot_filter,
+    ).select_related("user_campaign", "campaign_snapshot").first()
+
+
+def refresh_campaign_dashboard_snapshot(
+    campaign_id: int,
+) -> CampaignDashboardSnapshot:
+    """Recompute campaign's total of dashboard snapshot."""
+    snapshot, _ = CampaignDashboardSnapshot.objects.update_or_create(
+        campaign_id=campaign_id,
+        defaults={"campaign_total": get_campaign_total(campaign_id)},
+    )
+    return snapshot
+
+
+def refresh_user_campaign_dashboard_snapshots(
+    campaign_id: int,
+    user_campaign_ids: abc.Collection[int],
+) -> list[UserCampaignDashboardSnapshot]:
+    """Recompute revenue and incentive thresholds of volunteers' snapshots."""
+    campaign_snapshot = get_campaign_dashboard_snapshot(campaign_id)
+    thresholds = _get_incentive_thresholds(campaign_id)
+    user_campaigns = UserCampaign.objects.filter(
+        campaign_id=campaign_id,
+        id__in=user_campaign_ids,
+    ).with_total_revenue().values_list("id", "total_revenue")
+    snapshots = [
+        _set_thresholds(
+            UserCampaignDashboardSnapshot(
+                user_campaign_id=user_campaign_id,
+                campaign_snapshot=campaign_snapshot,
+                total_raised=total_revenue,
+            ),
+            thresholds,
+        )
+        for user_campaign_id, total_revenue in user_campaigns
+    ]
+    return UserCampaignDashboardSnapshot.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=("user_campaign",),
+        update_fields=SNAPSHOT_UPDATE_FIELDS,
+    )
+
+
+def refresh_dashboard_snapshots(
+    campaign_ids: abc.Collection[int],
+    user_campaign_ids: abc.Collection[int],
+) -> None:
+    """Refresh existing snapshots after campaigns' revenue changed.
+
+    Campaigns whose dashboard wasn't opened yet are skipped, their snapshots
+    are built on first access.
+
+    """
+    for snapshot in CampaignDashboardSnapshot.objects.filter(
+        campaign_id__in=campaign_ids,
+    ):
+        refresh_campaign_dashboard_snapshot(snapshot.campaign_id)
+        refresh_user_campaign_dashboard_snapshots(
+            campaign_id=snapshot.campaign_id,
+            user_campaign_ids=snapshot.user_campaign_snapshots.filter(
+                user_campaign_id__in=user_campaign_ids,
+            ).values_list("user_campaign_id", flat=True),
+        )
+
+
+def refresh_dashboard_snapshots_thresholds(campaign_id: int) -> None:
+    """Recompute incentive thresholds of campaign's volunteers' snapshots."""
+    thresholds = _get_incentive_thresholds(campaign_id)
+    snapshots = [
+        _set_thresholds(snapshot, thresholds)
+        for snapshot in UserCampaignDashboardSnapshot.objects.filter(
+            campaign_snapshot__campaign_id=campaign_id,
+        )
+    ]
+    UserCampaignDashboardSnapshot.objects.bulk_update(
+        snapshots,
+        fields=("next_incentive_threshold", "trip_incentive_threshold"),
+        batch_size=1000,
+    )
+
+
+def _get_incentive_thresholds(
+    campaign_id: int,
+) -> tuple[list[Decimal], list[Decimal]]:
+    """Return sorted thresholds of campaign's incentives and trips."""
+    incentives = Incentive.objects.filter(
+        campaign_id=campaign_id,
+    ).values_list("threshold", "type")
+    return (
+        sorted(threshold for threshold, _ in incentives),
+        sorted(
+            threshold
+            for threshold, incentive_type in incentives
+            if incentive_type == IncentiveType.TRIP
+        ),
+    )
+
+
+def _set_thresholds(
+    snapshot: UserCampaignDashboardSnapshot,
+    thresholds: tuple[list[Decimal], list[Decimal]],
+) -> UserCampaignDashboardSnapshot:
+    """Set closest not reached thresholds of snapshot's volunteer."""
+    next_thresholds, trip_thresholds = thresholds
+    snapshot.next_incentive_threshold = _find_next_threshold(
+        next_thresholds,
+        snapshot.total_raised,
+    )
+    snapshot.trip_incentive_threshold = _find_next_threshold(
+        trip_thresholds,
+        snapshot.total_raised,
+    )
+    return snapshot
+
+
+def _find_next_threshold(
+    thresholds: list[Decimal],
+    revenue: Decimal,
+) -> Decimal | None:
+    """Return the lowest threshold which is greater than revenue."""
+    index = bisect.bisect_right(thresholds, revenue)
+    return thresholds[index] if index < len(thresholds) else None
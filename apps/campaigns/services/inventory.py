@@ -0,0 +1,274 @@
+import datetime
+import uuid
+from collections import abc, defaultdict
+
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.members.constants import ContractStatus
+
+from ..models import (
+    Level,
+    LevelHold,
+    LevelInstance,
+    LevelInventory,
+    UserCampaign,
+)
+
+LEVEL_HOLD_TIMEOUT = datetime.timedelta(minutes=15)
+# Form's holds aren't prolonged beyond this age, so they can't block level
+# forever
+LEVEL_HOLD_MAX_AGE = datetime.timedelta(hours=1)
+MAX_LEVEL_HOLD_QUANTITY = 10
+MAX_HELD_INSTANCES_COUNT = 30
+
+
+def refresh_level_inventories(level_ids: abc.Iterable[int]) -> None:
+    """Recount inventories of levels from their instances and holds.
+
+    Inventories are locked in order of levels, so concurrent recounts and
+    reservations of the same levels wait for each other instead of
+    deadlocking.
+
+    """
+    level_ids = sorted(set(level_ids))
+    if not level_ids:
+        return
+    with transaction.atomic():
+        LevelInventory.objects.bulk_create(
+            [LevelInventory(level_id=level_id) for level_id in level_ids],
+            ignore_conflicts=True,
+        )
+        list(
+            LevelInventory.objects.select_for_update().filter(
+                level_id__in=level_ids,
+            ).order_by("level_id").values_list("level_id", flat=True),
+        )
+        instances = LevelInstance.objects.filter(
+            level_id=models.OuterRef("level_id"),
+            declined_at__isnull=True,
+            contract__isnull=False,
+            contract__deleted_at__isnull=True,
+        )
+        sold = _count(
+            instances.filter(contract__status=ContractStatus.APPROVED),
+        )
+        reserved = _count(
+            instances.filter(
+                contract__status__in=(
+                    ContractStatus.DRAFT,
+                    ContractStatus.SENT,
+                    ContractStatus.SIGNED,
+                ),
+            ),
+        )
+        held = Coalesce(
+            models.Subquery(
+                LevelHold.objects.filter(
+                    level_id=models.OuterRef("level_id"),
+                ).order_by().values("level_id").annotate(
+                    total=models.Sum("quantity"),
+                ).values("total"),
+            ),
+            0,
+        )
+        amount = models.Subquery(
+            Level.all_objects.filter(
+                id=models.OuterRef("level_id"),
+            ).values("amount"),
+        )
+        LevelInventory.objects.filter(level_id__in=level_ids).update(
+            sold=sold,
+            reserved=reserved,
+            held=held,
+            available=amount - sold - reserved - held,
+        )
+
+
+def refresh_contracts_level_inventories(
+    contract_ids: abc.Collection[int],
+) -> None:
+    """Recount inventories of levels attached to contracts."""
+    if not contract_ids:
+        return
+    refresh_level_inventories(
+        LevelInstance.all_objects.filter(
+            contract_id__in=contract_ids,
+        ).values_list("level_id", flat=True).distinct(),
+    )
+
+
+def refresh_campaign_level_inventories(campaign_id: int) -> None:
+    """Recount inventories of campaign's levels."""
+    refresh_level_inventories(
+        Level.objects.filter(
+            product__category__campaign_id=campaign_id,
+        ).values_list("id", flat=True),
+    )
+
+
+def reserve_level_instances(
+    level: Level,
+    count: int,
+    is_sold: bool = False,
+) -> bool:
+    """Move `count` available instances of level to reserved or sold ones.
+
+    Return `False` if level doesn't have enough available instances.
+
+    """
+    return _take_level_instances(
+        level=level,
+        count=count,
+        counter="sold" if is_sold else "reserved",
+    )
+
+
+def release_level_instances(
+    level_id: int,
+    count: int,
+    is_sold: bool = False,
+) -> None:
+    """Move `count` reserved or sold instances of level to available ones."""
+    _return_level_instances(
+        level_id=level_id,
+        count=count,
+        counter="sold" if is_sold else "reserved",
+    )
+
+
+def hold_level_instances(
+    level: Level,
+    token: uuid.UUID,
+    quantity: int = 1,
+    user_campaign: UserCampaign | None = None,
+    contract_id: int | None = None,
+) -> LevelHold | None:
+    """Hold available instances of level for contract's form.
+
+    Volunteer's holds of the same form are prolonged, so they expire
+    together after the form is left, but not later than `LEVEL_HOLD_MAX_AGE`
+    after the form's first hold. Return `None` if level doesn't have enough
+    available instances.
+
+    """
+    form_holds = LevelHold.objects.filter(
+        token=token,
+        user_campaign=user_campaign,
+    )
+    now = timezone.now()
+    expires_at = min(
+        now + LEVEL_HOLD_TIMEOUT,
+        (get_level_hold_started_at(form_holds) or now) + LEVEL_HOLD_MAX_AGE,
+    )
+    with transaction.atomic():
+        is_held = _take_level_instances(
+            level=level,
+            count=quantity,
+            counter="held",
+        )
+        if not is_held:
+            return None
+        form_holds.update(expires_at=expires_at)
+        return LevelHold.objects.create(
+            level=level,
+            token=token,
+            quantity=quantity,
+            user_campaign=user_campaign,
+            contract_id=contract_id,
+            expires_at=expires_at,
+        )
+
+
+def get_level_hold_started_at(
+    holds: models.QuerySet[LevelHold],
+) -> datetime.datetime | None:
+    """Return creation time of the earliest of holds."""
+    return holds.aggregate(started_at=models.Min("created"))["started_at"]
+
+
+def get_held_instances_count(user_campaign: UserCampaign) -> int:
+    """Return number of instances held by volunteer, which aren't expired."""
+    return LevelHold.objects.filter(
+        user_campaign=user_campaign,
+        expires_at__gt=timezone.now(),
+    ).aggregate(
+        count=Coalesce(models.Sum("quantity"), 0),
+    )["count"]
+
+
+def release_level_holds(holds: models.QuerySet[LevelHold]) -> None:
+    """Delete holds and return their instances to available ones.
+
+    Holds are locked before deletion, so concurrent releases of the same
+    hold return its instances once.
+
+    """
+    with transaction.atomic():
+        released = defaultdict(int)
+        hold_ids = []
+        for hold_id, level_id, quantity in holds.select_for_update().order_by(
+            "id",
+        ).values_list("id", "level_id", "quantity"):
+            hold_ids.append(hold_id)
+            released[level_id] += quantity
+        if not hold_ids:
+            return
+        LevelHold.objects.filter(id__in=hold_ids).delete()
+        for level_id, quantity in sorted(released.items()):
+            _return_level_instances(
+                level_id=level_id,
+                count=quantity,
+                counter="held",
+            )
+
+
+def release_expired_level_holds() -> None:
+    """Return instances of expired holds to available ones."""
+    release_level_holds(
+        LevelHold.objects.filter(expires_at__lte=timezone.now()),
+    )
+
+
+def _take_level_instances(level: Level, count: int, counter: str) -> bool:
+    """Move `count` available instances of level to counter.
+
+    Available instances are decremented by a single conditional update, so
+    concurrent reservations can't oversell level without locking its
+    instances. Return `False` if level doesn't have enough instances.
+
+    """
+    inventories = LevelInventory.objects.filter(level_id=level.id)
+    if level.amount >= 0:
+        inventories = inventories.filter(available__gte=count)
+    changes = {
+        "available": models.F("available") - count,
+        counter: models.F(counter) + count,
+    }
+    if inventories.update(**changes):
+        return True
+    if LevelInventory.objects.filter(level_id=level.id).exists():
+        return False
+    refresh_level_inventories([level.id])
+    return bool(inventories.update(**changes))
+
+
+def _return_level_instances(level_id: int, count: int, counter: str) -> None:
+    """Move `count` instances of level from counter to available ones."""
+    LevelInventory.objects.filter(level_id=level_id).update(
+        available=models.F("available") + count,
+        **{counter: models.F(counter) - count},
+    )
+
+
+def _count(instances: models.QuerySet) -> Coalesce:
+    """Return subquery counting instances of level."""
+    return Coalesce(
+        models.Subquery(
+            instances.order_by().values("level_id").annotate(
+                count=models.Count("id"),
+            ).values("count"),
+        ),
+        0,
+    )
@@ -0,0 +1,112 @@
+import hashlib
+import typing
+from collections import abc
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+
+LEADERBOARD_CACHE_TIMEOUT = 60 * 60
+LEADERBOARD_REVALIDATION_LOCK_TIMEOUT = 30
+LEADERBOARD_CACHE_STATS = ("hits", "misses", "stale")
+
+
+class LeaderboardCacheResult(typing.NamedTuple):
+    """Represent data returned by leaderboard cache and its freshness."""
+
+    data: typing.Any
+    status: str
+
+
+def get_leaderboard_version(campaign_id: int) -> int:
+    """Return current version of campaign's leaderboard."""
+    return cache.get_or_set(
+        f"leaderboard:{campaign_id}:version",
+        1,
+        timeout=None,
+    )
+
+
+def invalidate_leaderboard_cache(campaign_ids: abc.Iterable[int]) -> None:
+    """Mark cached standings of campaigns as stale.
+
+    Cached entries are not deleted: each of them stores the version it was
+    computed for, so bumping campaign's version makes all of them stale at
+    once. Stale entries are still served while one request recomputes them.
+
+    """
+    for campaign_id in set(campaign_ids):
+        key = f"leaderboard:{campaign_id}:version"
+        if not cache.add(key, 2, timeout=None):
+            cache.incr(key)
+
+
+def get_leaderboard_cache_key(
+    campaign_id: int,
+    url: str,
+    params: abc.Mapping[str, str],
+) -> str:
+    """Return key of standings computed for request's URL and query params.
+
+    Params include revenue window, ordering and pagination, which all change
+    the computed response, and URL is a part of pagination links.
+
+    """
+    request_hash = hashlib.md5(
+        f"{url}?{urlencode(sorted(params.items()))}".encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f"leaderboard:{campaign_id}:{request_hash}"
+
+
+def get_cached_leaderboard(
+    campaign_id: int,
+    key: str,
+    compute: abc.Callable[[], typing.Any],
+) -> LeaderboardCacheResult:
+    """Return cached standings, computing them on miss.
+
+    If cached standings are stale, only the request which acquires the
+    revalidation lock recomputes them, other ones get stale data meanwhile.
+
+    """
+    version = get_leaderboard_version(campaign_id)
+    entry = cache.get(key)
+    if entry and entry["version"] == version:
+        _increment_stat("hits")
+        return LeaderboardCacheResult(data=entry["data"], status="hit")
+    if entry and not cache.add(
+        f"{key}:lock",
+        1,
+        timeout=LEADERBOARD_REVALIDATION_LOCK_TIMEOUT,
+    ):
+        _increment_stat("stale")
+        return LeaderboardCacheResult(data=entry["data"], status="stale")
+    _increment_stat("misses")
+    try:
+        data = compute()
+        cache.set(
+            key,
+            {"version": version, "data": data},
+            timeout=LEADERBOARD_CACHE_TIMEOUT,
+        )
+    finally:
+        cache.delete(f"{key}:lock")
+    return LeaderboardCacheResult(data=data, status="miss")
+
+
+def get_leaderboard_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters of leaderboard cache."""
+    stats = cache.get_many(
+        [f"leaderboard:stats:{stat}" for stat in LEADERBOARD_CACHE_STATS],
+    )
+    return {
+        stat: stats.get(f"leaderboard:stats:{stat}", 0)
+        for stat in LEADERBOARD_CACHE_STATS
+    }
+
+
+def _increment_stat(stat: str) -> None:
+    """Increment leaderboard cache counter."""
+    key = f"leaderboard:stats:{stat}"
+    if not cache.add(key, 1, timeout=None):
+        cache.incr(key)
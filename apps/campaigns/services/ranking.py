@@ -0,0 +1,340 @@
+import datetime as dt
+import typing
+from collections import abc, defaultdict
+
+from django.core.cache import cache
+from django.db.models import QuerySet, Sum
+from django.utils import timezone
+
+from django_redis import get_redis_connection
+
+from apps.incentives.services.reward_services import get_rally_session_weeks
+from apps.members.constants import ContractType
+from apps.members.models import RevenueEntry
+
+from ..models import Campaign, UserCampaign
+
+TOTAL_BOARD = "total"
+CONTRACT_TYPE_BOARDS = {
+    ContractType.CASH: "cash",
+    ContractType.TRADE: "trade",
+}
+
+
+def get_week_board(revenue_from: dt.datetime, revenue_to: dt.datetime) -> str:
+    """Return name of ranking board of a rally week."""
+    return f"week:{revenue_from.timestamp()}:{revenue_to.timestamp()}"
+
+
+def is_ranking_warm(campaign_id: int, board: str = TOTAL_BOARD) -> bool:
+    """Check if campaign's ranking board is built."""
+    redis = _get_redis()
+    if not redis or not redis.exists(_get_key(campaign_id, "warm")):
+        return False
+    return bool(redis.exists(_get_key(campaign_id, board)))
+
+
+def rebuild_ranking(campaign: Campaign) -> None:
+    """Reconstruct all ranking boards of campaign from revenue ledger."""
+    redis = _get_redis()
+    if not redis:
+        return
+    summaries = get_ranked_user_campaigns(
+        campaign.id,
+    ).with_revenue_summary().values_list(
+        "id",
+        "total_revenue",
+        "total_cash_revenue",
+        "total_trade_revenue",
+    )
+    boards = defaultdict(dict)
+    for user_campaign_id, total, cash, trade in summaries:
+        boards[TOTAL_BOARD][user_campaign_id] = float(total)
+        boards[CONTRACT_TYPE_BOARDS[ContractType.CASH]][user_campaign_id] = (
+            float(cash)
+        )
+        boards[CONTRACT_TYPE_BOARDS[ContractType.TRADE]][user_campaign_id] = (
+            float(trade)
+        )
+    for week in get_rally_session_weeks(campaign, timezone.now().date()):
+        boards[get_week_board(*week)] = _get_week_scores(campaign.id, week)
+
+    pipeline = redis.pipeline()
+    pipeline.delete(
+        *(
+            _get_key(campaign.id, board.decode())
+            for board in redis.smembers(_get_key(campaign.id, "boards"))
+        ),
+        _get_key(campaign.id, "boards"),
+    )
+    for board, scores in boards.items():
+        if scores:
+            pipeline.zadd(_get_key(campaign.id, board), scores)
+        pipeline.sadd(_get_key(campaign.id, "boards"), board)
+    pipeline.set(_get_key(campaign.id, "warm"), 1)
+    pipeline.execute()
+
+
+def update_ranking(entries: abc.Iterable[RevenueEntry]) -> None:
+    """Increment scores of warm campaigns' boards by new ledger entries.
+
+    A rally week board which does not exist yet is built from the ledger,
+    that already includes new entries.
+
+    """
+    redis = _get_redis()
+    if not redis:
+        return
+    campaign_entries = defaultdict(list)
+    for entry in entries:
+        campaign_entries[entry.campaign_id].append(entry)
+    campaigns = Campaign.objects.filter(
+        id__in=[
+            campaign_id
+            for campaign_id in campaign_entries
+            if redis.exists(_get_key(campaign_id, "warm"))
+        ],
+    )
+    for campaign in campaigns:
+        weeks = get_rally_session_weeks(campaign, timezone.now().date())
+        built_weeks = set()
+        pipeline = redis.pipeline()
+        for entry in campaign_entries[campaign.id]:
+            amount = float(entry.amount)
+            for board in (
+                TOTAL_BOARD,
+                CONTRACT_TYPE_BOARDS[entry.contract_type],
+            ):
+                pipeline.zincrby(
+                    _get_key(campaign.id, board),
+                    amount,
+                    entry.user_campaign_id,
+                )
+            week = _find_week(weeks, entry.approved_at)
+            if not week or week in built_weeks:
+                continue
+            week_key = _get_key(campaign.id, get_week_board(*week))
+            if redis.exists(week_key):
+                pipeline.zincrby(week_key, amount, entry.user_campaign_id)
+            else:
+                _build_week_board(campaign.id, week)
+                built_weeks.add(week)
+        pipeline.execute()
+
+
+def add_to_ranking(user_campaign: UserCampaign) -> None:
+    """Add volunteer without revenue to campaign's ranking boards.
+
+    Volunteer who can't sell contracts isn't listed in standings, so they
+    are removed from boards instead, as their role may have been changed.
+
+    """
+    redis = _get_redis()
+    if not redis or not redis.exists(
+        _get_key(user_campaign.campaign_id, "warm"),
+    ):
+        return
+    if not get_ranked_user_campaigns(user_campaign.campaign_id).filter(
+        id=user_campaign.id,
+    ).exists():
+        remove_from_ranking(user_campaign)
+        return
+    pipeline = redis.pipeline()
+    for board in redis.smembers(_get_key(user_campaign.campaign_id, "boards")):
+        pipeline.zadd(
+            _get_key(user_campaign.campaign_id, board.decode()),
+            {user_campaign.id: 0},
+            nx=True,
+        )
+    pipeline.execute()
+
+
+def remove_from_ranking(user_campaign: UserCampaign) -> None:
+    """Remove volunteer from campaign's ranking boards."""
+    redis = _get_redis()
+    if not redis:
+        return
+    pipeline = redis.pipeline()
+    for board in redis.smembers(_get_key(user_campaign.campaign_id, "boards")):
+        pipeline.zrem(
+            _get_key(user_campaign.campaign_id, board.decode()),
+            user_campaign.id,
+        )
+    pipeline.execute()
+
+
+def get_ranked_user_campaigns(campaign_id: int) -> QuerySet[UserCampaign]:
+    """Return volunteers of campaign listed in standings and its boards."""
+    return UserCampaign.objects.filter(
+        campaign_id=campaign_id,
+    ).can_sell_contract()
+
+
+def get_volunteer_rank(
+    campaign_id: int,
+    user_campaign_id: int,
+    board: str = TOTAL_BOARD,
+) -> int | None:
+    """Return 1-based rank of volunteer in descending ranking board."""
+    redis = _get_redis()
+    if not redis:
+        return None
+    rank = redis.zrevrank(_get_key(campaign_id, board), user_campaign_id)
+    return None if rank is None else rank + 1
+
+
+def get_top_volunteers(
+    campaign_id: int,
+    count: int,
+    board: str = TOTAL_BOARD,
+) -> list[tuple[int, float]]:
+    """Return ids and scores of volunteers with the highest scores."""
+    return get_ranking_slice(campaign_id, board, start=0, stop=count)
+
+
+def get_volunteer_neighbours(
+    campaign_id: int,
+    user_campaign_id: int,
+    board: str = TOTAL_BOARD,
+    count: int = 5,
+) -> list[tuple[int, float]]:
+    """Return volunteer and `count` volunteers ranked above and below."""
+    rank = get_volunteer_rank(campaign_id, user_campaign_id, board)
+    if rank is None:
+        return []
+    return get_ranking_slice(
+        campaign_id,
+        board,
+        start=max(rank - 1 - count, 0),
+        stop=rank + count,
+    )
+
+
+def get_ranking_slice(
+    campaign_id: int,
+    board: str,
+    start: int,
+    stop: int,
+    descending: bool = True,
+) -> list[tuple[int, float]]:
+    """Return ids and scores of volunteers ranked in [start, stop)."""
+    redis = _get_redis()
+    if not redis or stop <= start:
+        return []
+    ranking = redis.zrange(
+        _get_key(campaign_id, board),
+        start,
+        stop - 1,
+        desc=descending,
+        withscores=True,
+    )
+    return [
+        (int(user_campaign_id), score)
+        for user_campaign_id, score in ranking
+    ]
+
+
+class RankedUserCampaigns(abc.Sequence):
+    """Represent volunteers ordered by ranking board.
+
+    Supports `len()` and slicing, so it can be paginated instead of
+    queryset: ranking board defines the order, while only volunteers of
+    the requested slice are fetched from the queryset.
+
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        campaign_id: int,
+        board: str,
+        descending: bool = True,
+    ):
+        self.queryset = queryset
+        self.campaign_id = campaign_id
+        self.board = board
+        self.descending = descending
+
+    def __len__(self) -> int:
+        return _get_redis().zcard(_get_key(self.campaign_id, self.board))
+
+    def __getitem__(self, index: typing.Any) -> list[UserCampaign]:
+        if not isinstance(index, slice) or index.step:
+            raise TypeError("Only slices without step are supported")
+        start, stop, _ = index.indices(len(self))
+        user_campaign_ids = [
+            user_campaign_id
+            for user_campaign_id, _ in get_ranking_slice(
+                self.campaign_id,
+                self.board,
+                start=start,
+                stop=stop,
+                descending=self.descending,
+            )
+        ]
+        user_campaigns = self.queryset.in_bulk(user_campaign_ids)
+        return [
+            user_campaigns[user_campaign_id]
+            for user_campaign_id in user_campaign_ids
+            if user_campaign_id in user_campaigns
+        ]
+
+
+def _build_week_board(
+    campaign_id: int,
+    week: tuple[dt.datetime, dt.datetime],
+) -> None:
+    """Build ranking board of a rally week from revenue ledger."""
+    key = _get_key(campaign_id, get_week_board(*week))
+    scores = _get_week_scores(campaign_id, week)
+    pipeline = _get_redis().pipeline()
+    pipeline.delete(key)
+    if scores:
+        pipeline.zadd(key, scores)
+    pipeline.sadd(_get_key(campaign_id, "boards"), get_week_board(*week))
+    pipeline.execute()
+
+
+def _get_week_scores(
+    campaign_id: int,
+    week: tuple[dt.datetime, dt.datetime],
+) -> dict[int, float]:
+    """Return revenue of campaign's volunteers during a rally week."""
+    scores = dict.fromkeys(
+        get_ranked_user_campaigns(campaign_id).values_list("id", flat=True),
+        0.0,
+    )
+    week_revenue = RevenueEntry.objects.filter(
+        campaign_id=campaign_id,
+        user_campaign_id__in=scores.keys(),
+        approved_at__range=week,
+    ).values("user_campaign_id").annotate(revenue=Sum("amount"))
+    for revenue in week_revenue:
+        scores[revenue["user_campaign_id"]] = float(revenue["revenue"])
+    return scores
+
+
+def _find_week(
+    weeks: list[tuple[dt.datetime, dt.datetime]],
+    date: dt.datetime | None,
+) -> tuple[dt.datetime, dt.datetime] | None:
+    """Return rally week which includes date."""
+    if not date:
+        return None
+    for week in weeks:
+        if week[0] <= date <= week[1]:
+            return week
+    return None
+
+
+def _get_key(campaign_id: int, name: str) -> str:
+    """Return redis key of campaign's ranking data."""
+    return cache.make_key(f"ranking:{campaign_id}:{name}")
+
+
+def _get_redis():
+    """Return redis connection, or `None` if cache doesn't use redis."""
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
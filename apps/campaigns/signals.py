@@ -1,8 +1,11 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from apps.incentives.models import Incentive
+from apps.members.signals import revenue_changed
+
 from . import services
-from .models import Campaign
+from .models import Campaign, Level, Team, UserCampaign
 
 
 @receiver(post_save, sender=Campaign)
@@ -16,3 +19,69 @@ def campaign_post_save(
         return
     services.create_default_product_categories(campaign=instance)
     services.create_default_user_campaign(campaign=instance)
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def campaign_changed(instance: Campaign, **kwargs):
+    """Drop cached context of changed campaign."""
+    services.invalidate_campaign_context(campaign=instance)
+
+
+@receiver(post_save, sender=Level)
+def level_post_save(instance: Level, **kwargs):
+    """Recount inventory of level, since its amount may be changed."""
+    services.refresh_level_inventories(level_ids=[instance.id])
+
+
+@receiver(post_save, sender=UserCampaign)
+@receiver(post_delete, sender=UserCampaign)
+def user_campaign_changed(instance: UserCampaign, **kwargs):
+    """Drop cached participation of changed user campaign."""
+    services.invalidate_user_campaign_context(user_campaign=instance)
+
+
+@receiver(revenue_changed)
+def revenue_changed_handler(campaign_ids, entries, **kwargs):
+    """Update standings of campaigns whose revenue changed."""
+    services.invalidate_leaderboard_cache(campaign_ids=campaign_ids)
+    services.update_ranking(entries=entries)
+    services.refresh_dashboard_snapshots(
+        campaign_ids=campaign_ids,
+        user_campaign_ids={entry.user_campaign_id for entry in entries},
+    )
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=UserCampaign)
+@receiver(post_delete, sender=UserCampaign)
+def leaderboard_member_changed(instance: Team | UserCampaign, **kwargs):
+    """Invalidate standings when campaign's volunteers or teams change."""
+    services.invalidate_leaderboard_cache(
+        campaign_ids=[instance.campaign_id],
+    )
+
+
+@receiver(post_save, sender=UserCampaign)
+def user_campaign_ranking_post_save(instance: UserCampaign, **kwargs):
+    """Keep campaign's ranking boards in sync with its volunteers."""
+    if instance.deleted_at:
+        services.remove_from_ranking(user_campaign=instance)
+    else:
+        services.add_to_ranking(user_campaign=instance)
+
+
+@receiver(post_delete, sender=UserCampaign)
+def user_campaign_ranking_post_delete(instance: UserCampaign, **kwargs):
+    """Remove deleted volunteer from campaign's ranking boards."""
+    services.remove_from_ranking(user_campaign=instance)
+
+
+@receiver(post_save, sender=Incentive)
+@receiver(post_delete, sender=Incentive)
+def incentive_changed(instance: Incentive, **kwargs):
+    """Refresh thresholds of campaign's dashboard snapshots."""
+    services.refresh_dashboard_snapshots_thresholds(
+        campaign_id=instance.campaign_id,
+    )
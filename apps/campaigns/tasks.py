@@ -8,25 +8,53 @@ from config.celery import app
 
 from apps.campaigns.context_managers import get_context_manager
 from apps.members.models import Contract
+from apps.users.models import User
 
+from . import services
 from .constants import NoteType
-from .models import Campaign, LevelInstance, Note, Product, UserCampaign
+from .models import Campaign, Level, LevelInstance, Note, Product, UserCampaign
 from .notifications import VolunteerInvitationEmailNotification
 
 
 @app.task
-def send_volunteers_invitation_emails(user_campaign_ids: list[int]):
-    """Send invitation emails to volunteers."""
+def send_volunteers_invitation_emails(
+    user_campaign_ids: list[int],
+) -> list[bool]:
+    """Send invitation emails to volunteers in one batch.
+
+    Return whether each volunteer's email was sent.
+
+    """
     user_campaigns = UserCampaign.objects.filter(
         id__in=user_campaign_ids,
     ).select_related("user__chamber", "campaign")
+    chamber_admins = {}
+    for chamber_admin in User.objects.filter(
+        chamber_id__in={
+            user_campaign.user.chamber_id for user_campaign in user_campaigns
+        },
+        role=User.ROLES.CHAMBER_ADMIN,
+    ).order_by("-id"):
+        chamber_admins[chamber_admin.chamber_id] = chamber_admin
+
+    return VolunteerInvitationEmailNotification.send_many(
+        [
+            VolunteerInvitationEmailNotification(
+                volunteer=user_campaign.user,
+                campaign=user_campaign.campaign,
+                chamber_admin=chamber_admins.get(
+                    user_campaign.user.chamber_id,
+                ),
+            )
+            for user_campaign in user_campaigns
+        ],
+    )
 
-    for user_campaign in user_campaigns:
-        invitation_email = VolunteerInvitationEmailNotification(
-            volunteer=user_campaign.user,
-            campaign=user_campaign.campaign,
-        )
-        invitation_email.send()
+
+@app.task
+def release_expired_level_holds() -> None:
+    """Return instances of expired level holds to available ones."""
+    services.release_expired_level_holds()
 
 
 @receiver(models.signals.post_save, sender=Campaign)
@@ -63,6 +91,11 @@ def update_products_without_renew_included(
         level__product_id=instance.id,
         contract__status=Contract.STATUSES.DRAFT,
     ).delete(force_policy=HARD_DELETE)
+    services.refresh_level_inventories(
+        level_ids=Level.objects.filter(
+            product_id=instance.id,
+        ).values_list("id", flat=True),
+    )
     Contract.objects.filter(
         campaign_id=campaign.id,
         levels__isnull=True,
@@ -70,3 +70,15 @@ def test_campaign_update_api_non_admin_user(
     )
     response = api_client.put(url, data={"name": "New name"})
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_leaderboard_cache_stats_api(
+    super_admin: User,
+    api_client: APIClient,
+) -> None:
+    """Ensure that super admin user can see leaderboard cache counters."""
+    api_client.force_authenticate(super_admin)
+    url = reverse_lazy("v1:super-admin:campaign-leaderboard-cache-stats")
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"hits": 0, "misses": 0, "stale": 0}
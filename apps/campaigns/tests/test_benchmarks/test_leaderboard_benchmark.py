@@ -0,0 +1,189 @@
+import datetime
+import os
+import time
+from decimal import Decimal
+
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+import pytest
+
+from apps.chambers.factories import ChamberFactory
+from apps.members.constants import ContractStatus, ContractType
+from apps.members.models import Contract, ContractCreditInfo, Member
+from apps.members.services import sync_campaign_revenue_entries
+from apps.users.factories import UserFactory
+from apps.users.models import User
+
+from ... import factories as campaign_factories
+from ...constants import UserCampaignRole
+from ...models import Campaign, LevelInstance, UserCampaign
+
+VOLUNTEERS_COUNT = 500
+CONTRACTS_COUNT = 20_000
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"),
+    reason="Set RUN_BENCHMARKS=1 to run benchmarks",
+)
+
+
+@pytest.fixture
+def seeded_campaign() -> Campaign:
+    """Return campaign with 500 volunteers and 20k approved contracts."""
+    chamber = ChamberFactory()
+    campaign = campaign_factories.CampaignFactory(
+        chamber=chamber,
+        status=Campaign.STATUSES.LIVE,
+    )
+    level = campaign_factories.LevelFactory(
+        product__category__campaign=campaign,
+        cost=100,
+    )
+    users = User.objects.bulk_create(
+        UserFactory.build_batch(
+            VOLUNTEERS_COUNT,
+            avatar=None,
+            chamber=chamber,
+            role=User.ROLES.VOLUNTEER,
+        ),
+    )
+    user_campaigns = UserCampaign.objects.bulk_create(
+        UserCampaign(
+            campaign=campaign,
+            user=user,
+            role=UserCampaignRole.VOLUNTEER,
+            first_name=user.first_name[:30],
+            last_name=user.last_name[:30],
+            email=user.email,
+        )
+        for user in users
+    )
+    members = Member.objects.bulk_create(
+        Member(name=f"Member {index}") for index in range(CONTRACTS_COUNT)
+    )
+    now = timezone.now()
+    contracts = Contract.objects.bulk_create(
+        Contract(
+            name=f"Contract {index}",
+            campaign=campaign,
+            member=member,
+            created_by=user_campaigns[index % VOLUNTEERS_COUNT],
+            status=ContractStatus.APPROVED,
+            type=(
+                ContractType.CASH if index % 3 else ContractType.TRADE
+            ),
+            approved_at=now - datetime.timedelta(hours=index % 720),
+        )
+        for index, member in enumerate(members)
+    )
+    LevelInstance.objects.bulk_create(
+        LevelInstance(level=level, contract=contract, cost=level.cost)
+        for contract in contracts
+    )
+    ContractCreditInfo.objects.bulk_create(
+        ContractCreditInfo(
+            contract=contract,
+            user_campaign=user_campaigns[index % VOLUNTEERS_COUNT],
+            portion=Decimal(1),
+        )
+        for index, contract in enumerate(contracts)
+    )
+    sync_campaign_revenue_entries(campaign_id=campaign.id)
+    return campaign
+
+
+def _measure(queryset) -> tuple[float, dict[int, tuple]]:
+    """Return evaluation time of leaderboard queryset and its values."""
+    started_at = time.perf_counter()
+    values = {
+        row["id"]: (
+            row["total_revenue"],
+            row["week_revenue"],
+            row["total_cash_revenue"],
+            row["total_trade_revenue"],
+        )
+        for row in queryset.values(
+            "id",
+            "total_revenue",
+            "week_revenue",
+            "total_cash_revenue",
+            "total_trade_revenue",
+        )
+    }
+    return time.perf_counter() - started_at, values
+
+
+def _get_join_revenue_expr(
+    revenue_from: datetime.datetime | None = None,
+    revenue_to: datetime.datetime | None = None,
+    contract_type: str | None = None,
+) -> Coalesce:
+    """Return revenue expression of leaderboard before revenue ledger.
+
+    Revenue was summed up over join of volunteer's credit infos, contracts
+    and their level instances.
+
+    """
+    contract_path = "contracts_credit_info__contract"
+    filters = Q(
+        **{
+            f"{contract_path}__status": ContractStatus.APPROVED,
+            f"{contract_path}__deleted_at__isnull": True,
+            f"{contract_path}__levels__declined_at__isnull": True,
+            f"{contract_path}__levels__deleted_at__isnull": True,
+        },
+    )
+    if revenue_from:
+        filters &= Q(**{f"{contract_path}__approved_at__gte": revenue_from})
+    if revenue_to:
+        filters &= Q(**{f"{contract_path}__approved_at__lte": revenue_to})
+    if contract_type:
+        filters &= Q(**{f"{contract_path}__type": contract_type})
+    return Coalesce(
+        Sum(
+            F(f"{contract_path}__levels__cost")
+            * F("contracts_credit_info__portion"),
+            filter=filters,
+        ),
+        Decimal(0),
+    )
+
+
+def test_leaderboard_single_pass_aggregation(
+    seeded_campaign: Campaign,
+    record_property,
+):
+    """Compare single-pass aggregation with join-based leaderboard query."""
+    revenue_to = timezone.now()
+    revenue_from = revenue_to - datetime.timedelta(days=7)
+    queryset = UserCampaign.objects.filter(
+        campaign=seeded_campaign,
+        role=UserCampaignRole.VOLUNTEER,
+    )
+    join_time, join_values = _measure(
+        queryset.annotate(
+            total_revenue=_get_join_revenue_expr(),
+            week_revenue=_get_join_revenue_expr(
+                revenue_from=revenue_from,
+                revenue_to=revenue_to,
+            ),
+            total_cash_revenue=_get_join_revenue_expr(
+                contract_type=ContractType.CASH,
+            ),
+            total_trade_revenue=_get_join_revenue_expr(
+                contract_type=ContractType.TRADE,
+            ),
+        ),
+    )
+    summary_time, summary_values = _measure(
+        queryset.with_revenue_summary(
+            revenue_from=revenue_from,
+            revenue_to=revenue_to,
+        ),
+    )
+    record_property("join_time", join_time)
+    record_property("single_pass_time", summary_time)
+    assert len(summary_values) == VOLUNTEERS_COUNT
+    assert summary_values == join_values
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from django.template import TemplateSyntaxError
+
 import pytest
 
 from apps.campaigns.constants import NoteType
@@ -7,17 +9,21 @@ from apps.campaigns.context_managers import (
     ContractContextManger,
     InvoiceContextManager,
     RewardContextManager,
+    note_templates_cache,
 )
 from apps.campaigns.factories.level_instance import LevelInstanceFactory
 from apps.campaigns.models.note import Note
 from apps.incentives.factories import IncentiveFactory, RewardFactory
 from apps.members.factories.contract import ContractFactory
 from apps.members.factories.invoice import InvoiceFactory
+from apps.members.models import Invoice
+from apps.members.notifications import InvoiceEmailNotification
+from apps.members.tasks import send_invoice_emails
 
 if TYPE_CHECKING:
     from apps.campaigns.models import Campaign
     from apps.incentives.models import Reward
-    from apps.members.models import Contract, Invoice
+    from apps.members.models import Contract
 
 
 @pytest.fixture
@@ -93,3 +99,93 @@ def test_reward_note_render(
     )
     rendered_template = reward_context_manger.render_template()
     assert rendered_template != ""
+
+
+def test_invoice_note_render_many(
+    campaign: "Campaign",
+    contract: "Contract",
+    django_assert_max_num_queries,
+):
+    """Ensure invoices are rendered with note compiled once."""
+    InvoiceFactory.create_batch(size=3, contract=contract)
+    note = Note.objects.select_related("campaign__chamber").get(
+        campaign=campaign,
+        type=NoteType.INVOICE_NOTE.value,
+    )
+    note.body = "{{ INVOICE_NUMBER }} {{ MEMBER_PK }}"
+    note.save()
+    note_templates_cache.clear()
+    invoices = Invoice.objects.filter(contract=contract).order_by("pk")
+    # One query for invoices and one per invoice's levels table
+    with django_assert_max_num_queries(4):
+        rendered_templates = InvoiceContextManager.render_many(
+            notes=[note],
+            objects=invoices,
+        )
+    assert rendered_templates == [
+        f"{invoice.pk} {contract.member_id}" for invoice in invoices
+    ]
+    assert len(note_templates_cache.templates) == 1
+
+    note.body = "Invoice {{ INVOICE_NUMBER }}"
+    note.save()
+    assert InvoiceContextManager.render_many(
+        notes=[note],
+        objects=invoices,
+    ) == [f"Invoice {invoice.pk}" for invoice in invoices]
+
+
+def test_send_invoice_emails_renders_notes_in_batch(
+    campaign: "Campaign",
+    contract: "Contract",
+    mailoutbox,
+    django_assert_max_num_queries,
+):
+    """Ensure batch of invoice emails is sent with rendered notes."""
+    invoices = InvoiceFactory.create_batch(size=3, contract=contract)
+    note = Note.objects.get(
+        campaign=campaign,
+        type=NoteType.INVOICE_NOTE.value,
+    )
+    note.body = "Invoice #{{ INVOICE_NUMBER }}"
+    note.save()
+    note_templates_cache.clear()
+
+    # Queries for invoices, notes and one per invoice's levels table
+    with django_assert_max_num_queries(len(invoices) + 2):
+        results = send_invoice_emails([invoice.pk for invoice in invoices])
+
+    assert results == [True] * len(invoices)
+    assert len(note_templates_cache.templates) == 1
+    html_messages = [mail.alternatives[0][0] for mail in mailoutbox]
+    assert all(
+        any(f"Invoice #{invoice.pk}" in html for html in html_messages)
+        for invoice in invoices
+    )
+
+
+def test_send_invoice_emails_skips_failed_rendering(
+    contract: "Contract",
+    mailoutbox,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Ensure email failed to render doesn't stop sending the batch."""
+    invoices = InvoiceFactory.create_batch(size=3, contract=contract)
+    prepare_mail = InvoiceEmailNotification.prepare_mail
+
+    def prepare_broken_mail(notification, connection=None):
+        """Fail to render email of the first invoice."""
+        if notification.invoice.pk == invoices[0].pk:
+            raise TemplateSyntaxError("Broken template")
+        return prepare_mail(notification, connection=connection)
+
+    monkeypatch.setattr(
+        InvoiceEmailNotification,
+        "prepare_mail",
+        prepare_broken_mail,
+    )
+
+    results = send_invoice_emails([invoice.pk for invoice in invoices])
+
+    assert sorted(results) == [False, True, True]
+    assert len(mailoutbox) == 2
@@ -0,0 +1,71 @@
+import pytest
+
+from apps.campaigns import services
+from apps.campaigns.constants import UserCampaignRole
+from apps.campaigns.factories import CampaignFactory, UserCampaignFactory
+from apps.chambers.models import Chamber
+
+
+def test_chamber_newest_campaign_is_cached_until_campaign_is_created(
+    chamber: Chamber,
+    django_assert_num_queries,
+) -> None:
+    """Ensure newest campaign is cached and invalidated on save."""
+    campaign = CampaignFactory(chamber=chamber)
+    assert services.get_chamber_newest_campaign_id(chamber.id) == campaign.id
+
+    with django_assert_num_queries(0):
+        assert services.get_chamber_newest_campaign_id(
+            chamber.id,
+        ) == campaign.id
+
+    new_campaign = CampaignFactory(chamber=chamber)
+    assert services.get_chamber_newest_campaign_id(
+        chamber.id,
+    ) == new_campaign.id
+
+
+def test_user_campaign_info_is_cached_until_user_campaign_is_saved(
+    chamber: Chamber,
+    django_assert_num_queries,
+) -> None:
+    """Ensure user's role in campaign is cached and invalidated on save."""
+    user_campaign = UserCampaignFactory(
+        campaign__chamber=chamber,
+        role=UserCampaignRole.VOLUNTEER,
+    )
+    info = services.get_user_campaign_info(
+        user_campaign.user_id,
+        user_campaign.campaign_id,
+    )
+    assert info == (user_campaign.id, UserCampaignRole.VOLUNTEER)
+
+    with django_assert_num_queries(0):
+        assert services.get_user_campaign_info(
+            user_campaign.user_id,
+            user_campaign.campaign_id,
+        ) == info
+
+    user_campaign.role = UserCampaignRole.CHAMBER_CHAIR
+    user_campaign.save()
+    assert services.get_user_campaign_info(
+        user_campaign.user_id,
+        user_campaign.campaign_id,
+    ).role == UserCampaignRole.CHAMBER_CHAIR
+
+
+def test_campaign_context_memoizes_lookups(
+    chamber: Chamber,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure context looks up the same campaign once."""
+    campaign = CampaignFactory(chamber=chamber)
+    context = services.CampaignContext()
+    assert context.get_chamber_newest_campaign(chamber.id) == campaign
+
+    monkeypatch.setattr(
+        services.campaign_context,
+        "get_campaign",
+        pytest.fail,
+    )
+    assert context.get_chamber_newest_campaign(chamber.id) == campaign
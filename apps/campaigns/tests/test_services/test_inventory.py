@@ -0,0 +1,83 @@
+import datetime
+import uuid
+
+from django.utils import timezone
+
+from apps.campaigns import services
+from apps.campaigns.factories import LevelFactory, LevelInstanceFactory
+from apps.campaigns.models import Level, LevelHold, LevelInventory
+from apps.members.constants import ContractStatus
+
+
+def test_reserve_level_instances_does_not_oversell() -> None:
+    """Ensure only available instances of level can be reserved."""
+    level = LevelFactory(amount=2)
+
+    assert services.reserve_level_instances(level=level, count=2)
+    assert not services.reserve_level_instances(level=level, count=1)
+    inventory = LevelInventory.objects.get(level=level)
+    assert (inventory.reserved, inventory.available) == (2, 0)
+
+    services.release_level_instances(level_id=level.id, count=1)
+    assert services.reserve_level_instances(level=level, count=1)
+
+
+def test_refresh_level_inventories() -> None:
+    """Ensure inventory counts sold and reserved instances of level."""
+    level = LevelFactory(amount=5)
+    LevelInstanceFactory(level=level, contract__status=ContractStatus.APPROVED)
+    LevelInstanceFactory(level=level, contract__status=ContractStatus.DRAFT)
+    LevelInstanceFactory(
+        level=level,
+        contract__status=ContractStatus.DRAFT,
+        declined_at=timezone.now(),
+    )
+    LevelInstanceFactory(level=level, contract=None)
+
+    services.refresh_level_inventories(level_ids=[level.id])
+
+    level = (
+        Level.objects.with_remaining_instances_count()
+        .with_is_available()
+        .get(id=level.id)
+    )
+    assert level.sold_instances_count == 1
+    assert level.remaining_instances_count == 4
+    assert level.available_amount == 3
+    assert level.is_available
+
+
+def test_level_holds_are_released_when_expired() -> None:
+    """Ensure held instances are available again after hold expires."""
+    level = LevelFactory(amount=1)
+    token = uuid.uuid4()
+
+    hold = services.hold_level_instances(level=level, token=token)
+    assert hold
+    assert not services.hold_level_instances(level=level, token=uuid.uuid4())
+    assert not services.reserve_level_instances(level=level, count=1)
+
+    services.release_expired_level_holds()
+    assert LevelHold.objects.filter(id=hold.id).exists()
+
+    LevelHold.objects.filter(id=hold.id).update(expires_at=timezone.now())
+    services.release_expired_level_holds()
+    assert not LevelHold.objects.filter(id=hold.id).exists()
+    assert services.reserve_level_instances(level=level, count=1)
+
+
+def test_level_holds_are_prolonged_up_to_max_age() -> None:
+    """Ensure form's holds aren't prolonged beyond their max age."""
+    level = LevelFactory(amount=2)
+    token = uuid.uuid4()
+    first_hold = services.hold_level_instances(level=level, token=token)
+    started_at = timezone.now() - services.LEVEL_HOLD_MAX_AGE + (
+        datetime.timedelta(minutes=1)
+    )
+    LevelHold.objects.filter(id=first_hold.id).update(created=started_at)
+
+    hold = services.hold_level_instances(level=level, token=token)
+
+    assert hold.expires_at == started_at + services.LEVEL_HOLD_MAX_AGE
+    first_hold.refresh_from_db()
+    assert first_hold.expires_at == hold.expires_at
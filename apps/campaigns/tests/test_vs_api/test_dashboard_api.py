@@ -6,11 +6,18 @@ from rest_framework.test import APIClient
 import pytest
 
 from apps.campaigns.factories import LevelInstanceFactory, UserCampaignFactory
-from apps.campaigns.models import Campaign, LevelInstance, UserCampaign
+from apps.campaigns.models import (
+    Campaign,
+    LevelInstance,
+    UserCampaign,
+    UserCampaignDashboardSnapshot,
+)
 from apps.incentives.factories import IncentiveFactory
 from apps.incentives.models import Incentive
+from apps.members import services as members_services
 from apps.members.factories import ContractFactory
 from apps.members.models import Contract, ContractCreditInfo
+from apps.members.services import sync_contracts_revenue_entries
 from apps.users.models import User
 
 
@@ -42,10 +49,12 @@ def approved_contract(
 @pytest.fixture
 def sold_levels(approved_contract: Contract) -> list[LevelInstance]:
     """Return level instances attached to approved contracts."""
-    return LevelInstanceFactory.create_batch(
+    level_instances = LevelInstanceFactory.create_batch(
         size=5,
         contract=approved_contract,
     )
+    sync_contracts_revenue_entries(contract_ids=[approved_contract.id])
+    return level_instances
 
 
 @pytest.fixture
@@ -126,3 +135,39 @@ def test_campaign_vs_dashboard_recently_sold_api(
     response = api_client.get(reverse_lazy("v1:volunteer:recently-sold-list"))
     assert response.status_code == status.HTTP_200_OK
     assert response.data["count"] == len(sold_levels)
+
+
+# pylint: disable=too-many-arguments
+def test_campaign_vs_dashboard_snapshot_refresh(
+    volunteer: User,
+    api_client: APIClient,
+    approved_contract: Contract,
+    active_campaign: Campaign,
+    campaign_user: UserCampaign,
+    next_incentive: Incentive,
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Ensure dashboard snapshot is refreshed on revenue/incentive changes."""
+    api_client.force_authenticate(volunteer)
+    url = reverse_lazy("v1:volunteer:dashboard-get-stats")
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert UserCampaignDashboardSnapshot.objects.filter(
+        user_campaign=campaign_user,
+    ).exists()
+    total_raised = response.data["total_raised"]
+    assert response.data["next_incentive_threshold"] == (
+        next_incentive.threshold
+    )
+
+    next_incentive.threshold = total_raised * 3
+    next_incentive.save()
+    response = api_client.get(url)
+    assert response.data["remaining_to_next_incentive"] == total_raised * 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        members_services.decline_contract(approved_contract)
+    response = api_client.get(url)
+    assert response.data["campaign_total"] == 0
+    assert response.data["total_raised"] == 0
+    assert response.data["remaining_to_next_incentive"] == total_raised * 3
@@ -10,11 +10,14 @@ from rest_framework import status
 import pytest
 
 from apps.chambers.factories import ChamberFactory
-from apps.core.test_utils import TestLevelData
+from apps.core.test_utils import CAAPIClient, TestLevelData
+from apps.members import services as members_services
+from apps.members.models import Contract
 from apps.users.factories import UserFactory
 from apps.users.models import User
 
 from ... import factories as campaign_factories
+from ... import services
 from ...constants import UserCampaignRole
 from ...models import Campaign, UserCampaign
 
@@ -235,3 +238,188 @@ def test_get_leadership_standings_api(leaderboard_test_data, api_client):
             },
         ),
     ]
+
+
+def test_leadership_standings_cache_api(
+    leaderboard_test_data,
+    api_client,
+    django_capture_on_commit_callbacks,
+):
+    """Ensure standings are cached until campaign's revenue changes."""
+    volunteer = User.objects.filter(
+        role=User.ROLES.VOLUNTEER,
+        chamber=leaderboard_test_data["chamber"],
+    ).first()
+    api_client.force_authenticate(volunteer)
+    url = reverse_lazy("v1:volunteer:leadership-standing-list")
+    params = {
+        "revenue_from": timezone.now() - datetime.timedelta(days=3),
+        "revenue_to": timezone.now() + datetime.timedelta(days=4),
+        "ordering": "-week_revenue",
+    }
+    response = api_client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response["X-Leaderboard-Cache"] == "miss"
+    response = api_client.get(url, data=params)
+    assert response["X-Leaderboard-Cache"] == "hit"
+    assert response.data["results"][1]["total_revenue"] == Decimal(200)
+
+    contract = Contract.objects.get(
+        levels__level__in=leaderboard_test_data["product_2_levels"],
+        status=Contract.STATUSES.APPROVED,
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        members_services.decline_contract(contract)
+    response = api_client.get(url, data=params)
+    assert response["X-Leaderboard-Cache"] == "miss"
+    assert response.data["results"][1]["total_revenue"] == Decimal(0)
+    assert services.get_leaderboard_cache_stats() == {
+        "hits": 1,
+        "misses": 2,
+        "stale": 0,
+    }
+
+
+def test_team_standings_cache_after_assign_team_api(
+    leaderboard_test_data,
+    api_client,
+):
+    """Ensure cached team standings change after volunteers change team."""
+    campaign = leaderboard_test_data["campaign"]
+    team_1 = leaderboard_test_data["team_1"]
+    team_2 = leaderboard_test_data["team_2"]
+    volunteer = User.objects.filter(
+        role=User.ROLES.VOLUNTEER,
+        chamber=leaderboard_test_data["chamber"],
+    ).first()
+    api_client.force_authenticate(volunteer)
+    url = reverse_lazy("v1:volunteer:team-standing-list")
+    params = {
+        "revenue_from": timezone.now() - datetime.timedelta(days=3),
+        "revenue_to": timezone.now() + datetime.timedelta(days=4),
+        "ordering": "-total_revenue",
+    }
+    api_client.get(url, data=params)
+    response = api_client.get(url, data=params)
+    assert response["X-Leaderboard-Cache"] == "hit"
+    assert response.data["results"][0]["managed_teams"][0][
+        "total_revenue"
+    ] == Decimal(800)
+
+    chamber_admin_client = CAAPIClient()
+    chamber_admin_client.force_authenticate(
+        UserFactory(
+            role=User.ROLES.CHAMBER_ADMIN,
+            chamber=leaderboard_test_data["chamber"],
+        ),
+    )
+    chamber_admin_client.select_campaign(campaign)
+    response = chamber_admin_client.put(
+        reverse_lazy("v1:chamber:user-campaign-assign-team"),
+        data={
+            "ids": list(
+                UserCampaign.objects.filter(team=team_2).values_list(
+                    "id",
+                    flat=True,
+                ),
+            ),
+            "team": team_1.id,
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+
+    response = api_client.get(url, data=params)
+    assert response["X-Leaderboard-Cache"] == "miss"
+    assert response.data["results"][0]["managed_teams"][0][
+        "total_revenue"
+    ] == Decimal(1000)
+
+
+@pytest.mark.usefixtures("redis_cache")
+def test_volunteer_standings_ranking_api(
+    leaderboard_test_data,
+    api_client,
+    django_capture_on_commit_callbacks,
+):
+    """Ensure warm ranking board serves same standings as database."""
+    campaign = leaderboard_test_data["campaign"]
+    volunteer = User.objects.filter(
+        role=User.ROLES.VOLUNTEER,
+        chamber=leaderboard_test_data["chamber"],
+    ).first()
+    api_client.force_authenticate(volunteer)
+    url = reverse_lazy("v1:volunteer:volunteer-standing-list")
+    params = {
+        "revenue_from": timezone.now() - datetime.timedelta(days=3),
+        "revenue_to": timezone.now() + datetime.timedelta(days=4),
+        "ordering": "-total_revenue",
+        "limit": 3,
+    }
+    expected_response = api_client.get(url, data=params)
+    assert expected_response.status_code == status.HTTP_200_OK
+
+    services.rebuild_ranking(campaign)
+    assert services.is_ranking_warm(campaign.id)
+    services.invalidate_leaderboard_cache(campaign_ids=[campaign.id])
+    response = api_client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["count"] == expected_response.data["count"]
+    assert [
+        volunteer["total_revenue"] for volunteer in response.data["results"]
+    ] == [
+        volunteer["total_revenue"]
+        for volunteer in expected_response.data["results"]
+    ]
+    top_volunteer_id = response.data["results"][0]["id"]
+    assert services.get_volunteer_rank(campaign.id, top_volunteer_id) == 1
+
+    contract = Contract.objects.filter(
+        credits_info__user_campaign_id=top_volunteer_id,
+        levels__declined_at__isnull=True,
+        status=Contract.STATUSES.APPROVED,
+    ).first()
+    with django_capture_on_commit_callbacks(execute=True):
+        members_services.decline_contract(contract)
+    assert services.get_top_volunteers(campaign.id, count=1) == [
+        (
+            top_volunteer_id,
+            float(response.data["results"][0]["total_revenue"] - 100),
+        ),
+    ]
+
+
+@pytest.mark.usefixtures("redis_cache")
+def test_volunteer_standings_ranking_lists_sellers_api(
+    leaderboard_test_data,
+    api_client,
+):
+    """Ensure ranking board only has volunteers listed in standings."""
+    campaign = leaderboard_test_data["campaign"]
+    volunteer = User.objects.filter(
+        role=User.ROLES.VOLUNTEER,
+        chamber=leaderboard_test_data["chamber"],
+    ).first()
+    api_client.force_authenticate(volunteer)
+    services.rebuild_ranking(campaign)
+    chamber_chair = campaign_factories.UserCampaignFactory(
+        campaign=campaign,
+        team=None,
+        role=UserCampaignRole.CHAMBER_CHAIR,
+    )
+    url = reverse_lazy("v1:volunteer:volunteer-standing-list")
+    params = {
+        "revenue_from": timezone.now() - datetime.timedelta(days=3),
+        "revenue_to": timezone.now() + datetime.timedelta(days=4),
+        "ordering": "-total_revenue",
+        "limit": 3,
+    }
+
+    assert services.get_volunteer_rank(campaign.id, chamber_chair.id) is None
+    response = api_client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["count"] == (
+        services.get_ranked_user_campaigns(campaign.id).count()
+    )
+    assert chamber_chair.id not in [
+        volunteer["id"] for volunteer in response.data["results"]
+    ]
@@ -0,0 +1,103 @@
+import uuid
+
+from django.urls import reverse_lazy
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.campaigns import services
+from apps.campaigns.factories import (
+    LevelFactory,
+    ProductCategoryFactory,
+    ProductFactory,
+    UserCampaignFactory,
+)
+from apps.campaigns.models import Campaign, LevelHold, LevelInventory
+from apps.users.models import User
+
+
+def test_hold_level_api(
+    active_campaign: Campaign,
+    volunteer: User,
+    api_client: APIClient,
+) -> None:
+    """Ensure volunteer can hold available level and release it."""
+    UserCampaignFactory(user=volunteer, campaign=active_campaign)
+    level = LevelFactory(
+        amount=1,
+        product=ProductFactory(
+            category=ProductCategoryFactory(campaign=active_campaign),
+        ),
+    )
+    api_client.force_authenticate(volunteer)
+    url = reverse_lazy("v1:volunteer:level-hold-list")
+
+    response = api_client.post(
+        url,
+        data={"level": level.id, "token": str(uuid.uuid4())},
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    assert LevelInventory.objects.get(level=level).available == 0
+
+    response = api_client.post(
+        url,
+        data={"level": level.id, "token": str(uuid.uuid4())},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    hold = LevelHold.objects.get(level=level)
+    response = api_client.delete(
+        reverse_lazy("v1:volunteer:level-hold-detail", kwargs={"pk": hold.pk}),
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert LevelInventory.objects.get(level=level).available == 1
+
+
+def test_hold_level_api_limits_held_instances(
+    active_campaign: Campaign,
+    volunteer: User,
+    api_client: APIClient,
+) -> None:
+    """Ensure volunteer can't hold too many instances of levels."""
+    user_campaign = UserCampaignFactory(
+        user=volunteer,
+        campaign=active_campaign,
+    )
+    level = LevelFactory(
+        amount=-1,
+        product=ProductFactory(
+            category=ProductCategoryFactory(campaign=active_campaign),
+        ),
+    )
+    api_client.force_authenticate(volunteer)
+    url = reverse_lazy("v1:volunteer:level-hold-list")
+
+    response = api_client.post(
+        url,
+        data={
+            "level": level.id,
+            "token": str(uuid.uuid4()),
+            "quantity": services.MAX_LEVEL_HOLD_QUANTITY + 1,
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    token = uuid.uuid4()
+    holds_count = (
+        services.MAX_HELD_INSTANCES_COUNT // services.MAX_LEVEL_HOLD_QUANTITY
+    )
+    for _ in range(holds_count):
+        services.hold_level_instances(
+            level=level,
+            token=token,
+            quantity=services.MAX_LEVEL_HOLD_QUANTITY,
+            user_campaign=user_campaign,
+        )
+    response = api_client.post(
+        url,
+        data={"level": level.id, "token": str(token)},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert LevelHold.objects.filter(
+        user_campaign=user_campaign,
+    ).count() == holds_count
@@ -1,3 +1,4 @@
+from .campaign_renewal_job import CampaignRenewalJobAdmin
 from .chamber import ChamberAdmin
 from .chamber_branding import ChamberBrandingAdmin
 from .members import StoredMemberAdmin
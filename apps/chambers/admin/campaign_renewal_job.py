@@ -0,0 +1,78 @@
+from django.contrib import admin
+
+from apps.core.admin import BaseAdmin
+
+from ..models import CampaignRenewalJob
+
+
+@admin.register(CampaignRenewalJob)
+class CampaignRenewalJobAdmin(BaseAdmin):
+    """Admin interface for campaign renewal jobs."""
+
+    list_display = (
+        "id",
+        "__str__",
+        "chamber",
+        "status",
+    )
+    list_select_related = (
+        "chamber",
+        "previous_campaign",
+        "campaign",
+    )
+    fieldsets = (
+        (
+            None, {
+                "fields": (
+                    "chamber",
+                    "previous_campaign",
+                    "campaign",
+                    "job_kwargs",
+                    "task_id",
+                    "status",
+                    "completed_steps",
+                    "traceback",
+                    "error_message",
+                    "result",
+                ),
+            },
+        ),
+    )
+    readonly_fields = (
+        "chamber",
+        "previous_campaign",
+        "campaign",
+        "job_kwargs",
+        "task_id",
+        "status",
+        "completed_steps",
+        "traceback",
+        "error_message",
+        "result",
+    )
+    actions = ("resume_renewal",)
+
+    @admin.action(description="Resume failed renewals")
+    def resume_renewal(self, request, queryset):
+        """Resume failed renewals from their incomplete steps."""
+        jobs = queryset.filter(
+            status=CampaignRenewalJob.RenewalStatus.RENEWAL_ERROR,
+        )
+        for job in jobs:
+            job.resume_renewal()
+        self.message_user(request, f"Resumed {len(jobs)} renewal jobs")
+
+    # pylint: disable=unused-argument
+    def has_add_permission(self, request, *args, **kwargs):
+        """Disable creation, jobs are started via API."""
+        return False
+
+    # pylint: disable=unused-argument
+    def has_change_permission(self, request, *args, **kwargs):
+        """Disable editing."""
+        return False
+
+    # pylint: disable=unused-argument
+    def has_delete_permission(self, request, *args, **kwargs):
+        """Disable deletion."""
+        return False
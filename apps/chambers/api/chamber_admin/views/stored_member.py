@@ -5,6 +5,13 @@ from rest_framework.decorators import action
 
 from import_export_extensions.api.views import ImportJobViewSet
 
+from libs.api.filter_backends import CustomDjangoFilterBackend
+from libs.api.pagination import KeysetPagination
+from libs.open_api.filters import (
+    OrderingFilterBackend,
+    TrigramSearchFilterBackend,
+)
+
 from apps.core.api.mixins import UpdateModelWithoutPatchMixin
 from apps.core.api.permissions import AllowChamberAdmin
 from apps.core.api.views import ChamberBaseViewSet
@@ -27,9 +34,15 @@ class StoredMemberViewSet(
 
     queryset = StoredMember.objects.all()
     serializer_class = StoredMemberSerializer
+    pagination_class = KeysetPagination
     ordering_fields = (
         "name",
     )
+    filter_backends = (
+        CustomDjangoFilterBackend,
+        OrderingFilterBackend,
+        TrigramSearchFilterBackend,
+    )
     search_fields = (
         "name",
         "contact_first_name",
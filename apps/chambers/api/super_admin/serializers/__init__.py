@@ -9,3 +9,4 @@ from .chamber import (
     ChamberUpdateSerializer,
     ListChamberSerializer,
 )
+from .renewal_job import CampaignRenewalJobSerializer
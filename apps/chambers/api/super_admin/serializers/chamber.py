@@ -299,10 +299,12 @@ class ChamberCampaignRenewSASerializer(OpenApiSerializer):
     users = serializers.BooleanField(write_only=True)
     contracts = serializers.BooleanField(write_only=True)
     renew_campaign_id = serializers.IntegerField(read_only=True)
+    renewal_job_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         fields = tuple(choice[0] for choice in ChamberRenewConfig.choices) + (
             "name",
             "year",
             "renew_campaign_id",
+            "renewal_job_id",
         )
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+from apps.core.api.serializers import ModelBaseSerializer
+
+from ....models import CampaignRenewalJob
+
+
+class CampaignRenewalJobSerializer(ModelBaseSerializer):
+    """Represent progress of campaign renewal job."""
+
+    progress = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = CampaignRenewalJob
+        fields = (
+            "id",
+            "campaign",
+            "status",
+            "completed_steps",
+            "progress",
+            "result",
+            "error_message",
+            "created",
+            "modified",
+        )
+        read_only_fields = fields
@@ -3,6 +3,7 @@ from datetime import datetime
 from django.core import exceptions
 from django.db import models
 from django.db.models.functions import Collate, Random
+from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import mixins, status
@@ -42,6 +43,7 @@ class ChamberViewSet(
         "get_statistics": serializers.ChamberStatisticsSerializer,
         "get_renew_config": serializers.ChamberRenewConfigSerializer,
         "renew_campaign": serializers.ChamberCampaignRenewSASerializer,
+        "get_renewal_job": serializers.CampaignRenewalJobSerializer,
         "default": serializers.ListChamberSerializer,
     }
     ordering_fields = ("sales", "nickname")
@@ -160,7 +162,12 @@ class ChamberViewSet(
 
     @action(methods=("post",), detail=True, url_path="renew-campaign")
     def renew_campaign(self, request, *args, **kwargs) -> Response:
-        """Renew chamber campaign with selected choices."""
+        """Renew chamber campaign with selected choices.
+
+        Only renewed campaign is created during request, its data are copied
+        by renewal job, which progress is available by returned job id.
+
+        """
         chamber = self.get_object()
         if not chamber.can_renew_campaign:
             error_msg = _(
@@ -173,11 +180,30 @@ class ChamberViewSet(
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         try:
-            new_campaign_id = services.renew_chamber_campaign(
+            renewal_job = services.start_campaign_renewal(
                 chamber,
                 serializer.validated_data,
+                created_by=request.user,
             )
         except exceptions.ValidationError as exc:
             raise NonFieldValidationError(exc.messages) from exc
-        response_data = {"renew_campaign_id": new_campaign_id}
-        return Response(data=response_data)
+        response_data = {
+            "renew_campaign_id": renewal_job.campaign_id,
+            "renewal_job_id": renewal_job.id,
+        }
+        return Response(data=response_data, status=status.HTTP_202_ACCEPTED)
+
+    @action(
+        methods=("get",),
+        detail=True,
+        url_path=r"renewal-jobs/(?P<job_id>\d+)",
+    )
+    def get_renewal_job(self, request, job_id, *args, **kwargs) -> Response:
+        """Return progress of chamber's campaign renewal job."""
+        chamber = self.get_object()
+        renewal_job = get_object_or_404(
+            chamber.campaign_renewal_jobs.all(),
+            pk=job_id,
+        )
+        serializer = self.get_serializer(renewal_job)
+        return Response(data=serializer.data)
@@ -1,5 +1,12 @@
 from rest_framework import mixins
 
+from libs.api.filter_backends import CustomDjangoFilterBackend
+from libs.api.pagination import KeysetPagination
+from libs.open_api.filters import (
+    OrderingFilterBackend,
+    TrigramSearchFilterBackend,
+)
+
 from apps.core.api.permissions import AllowAllRoles
 from apps.core.api.views import VolunteerBaseViewSet
 
@@ -16,12 +23,18 @@ class StoredMemberViewSet(
 
     queryset = StoredMember.objects.all()
     serializer_class = StoredMemberSerializer
+    pagination_class = KeysetPagination
     permissions_map = {
         "default": (AllowAllRoles,),
     }
     ordering_fields = (
         "name",
     )
+    filter_backends = (
+        CustomDjangoFilterBackend,
+        OrderingFilterBackend,
+        TrigramSearchFilterBackend,
+    )
     search_fields = (
         "name",
         "contact_first_name",
@@ -12,3 +12,11 @@ class ChamberRenewConfig(TextChoices):
     INCENTIVES = "incentives", _("Incentive Schedule")
     USERS = "users", _("User Setup")
     CONTRACTS = "contracts", _("Contracts")
+
+
+class CampaignRenewalStep(TextChoices):
+    """Represent steps of campaign renewal job in order of execution."""
+
+    INVENTORY = "inventory", _("Inventory")
+    INCENTIVES = "incentives", _("Incentive Schedule")
+    USERS = "users", _("Users and Contracts")
@@ -0,0 +1,95 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+import tablib
+
+from apps.core.services import QueriesCounter
+
+from ...resources import SUPPORTED_FORMATS_MAP, StoredMemberImportResource
+
+
+class Command(BaseCommand):
+    """Measure import of generated stored members file."""
+
+    help = (
+        "Import generated stored members file into chamber and report "
+        "timings and number of queries. Imported data is rolled back"
+    )
+
+    def add_arguments(self, parser):
+        """Add chamber, size and format of generated file."""
+        parser.add_argument("chamber_id", type=int)
+        parser.add_argument("--rows", type=int, default=50_000)
+        parser.add_argument(
+            "--format",
+            dest="extension",
+            choices=("csv", "xlsx"),
+            default="csv",
+        )
+
+    def handle(self, *args, chamber_id, rows, extension, **options):
+        """Generate file, parse and import it."""
+        file_format = SUPPORTED_FORMATS_MAP[extension]()
+        export_data = file_format.export_data(self.generate_dataset(rows))
+        resource = StoredMemberImportResource(chamber_id=chamber_id)
+
+        started_at = time.perf_counter()
+        dataset = file_format.create_dataset(export_data)
+        parsed_at = time.perf_counter()
+        counter = QueriesCounter()
+        with transaction.atomic(), connection.execute_wrapper(counter):
+            result = resource.import_data(dataset, use_transactions=True)
+            transaction.set_rollback(True)
+        imported_at = time.perf_counter()
+
+        self.stdout.write(f"Rows: {rows} ({extension})")
+        self.stdout.write(f"Parsing: {parsed_at - started_at:.2f}s")
+        self.stdout.write(f"Import: {imported_at - parsed_at:.2f}s")
+        self.stdout.write(f"Queries: {counter.count}")
+        self.stdout.write(
+            f"Rows with errors: {len(result.invalid_rows)} invalid, "
+            f"{len(result.row_errors())} failed",
+        )
+
+    @staticmethod
+    def generate_dataset(rows: int) -> tablib.Dataset:
+        """Generate stored members with contacts.
+
+        Every tenth row repeats the previous member with another contact.
+
+        """
+        dataset = tablib.Dataset(
+            headers=(
+                "Company Name",
+                "Company Address",
+                "City",
+                "State",
+                "Zip",
+                "Company Phone Number",
+                "Contact First Name",
+                "Contact Last Name",
+                "Contact Email",
+                "Contact Work Phone",
+                "Contact Mobile Phone",
+            ),
+        )
+        for index in range(rows):
+            member = index - 1 if index % 10 == 9 else index
+            dataset.append(
+                (
+                    f"Company {member}",
+                    f"{member} Main Street",
+                    "Springfield",
+                    "CA",
+                    f"{member % 100_000:05}",
+                    "5555555555",
+                    f"First {index}",
+                    f"Last {index}",
+                    f"contact{index}@example.com",
+                    "5555555555",
+                    "5555555555",
+                ),
+            )
+        return dataset
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.10 on 2026-10-17 15:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('campaigns', '0055_dashboard_snapshots'),
+        ('chambers', '0020_alter_storedmember_zip'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignRenewalJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('deleted_at', models.DateTimeField(db_index=True, editable=False, null=True)),
+                ('deleted_by_cascade', models.BooleanField(default=False, editable=False)),
+                ('job_kwargs', models.JSONField(default=dict, help_text='Renewal config. Should look like {"inventory": true, "incentives": true, "users": true, "contracts": false}', verbose_name='Job kwargs')),
+                ('completed_steps', models.JSONField(default=list, help_text='Renewal steps which are already committed', verbose_name='Completed steps')),
+                ('checkpoint', models.JSONField(default=dict, help_text='Data of completed steps required by next steps', verbose_name='Checkpoint')),
+                ('traceback', models.TextField(blank=True, default=str, help_text='Python traceback in case of renewal error', verbose_name='Traceback')),
+                ('error_message', models.CharField(blank=True, default=str, help_text='Python error message in case of renewal error', max_length=128, verbose_name='Error message')),
+                ('status', models.CharField(choices=[('CREATED', 'Created'), ('CONFIRMED', 'Renewal confirmed'), ('RENEWING', 'Renewing'), ('RENEWED', 'Renewed'), ('RENEWAL_ERROR', 'Renewal error')], default='CREATED', max_length=20, verbose_name='Job Status')),
+                ('result', models.JSONField(default=dict, help_text='Number of renewed objects per instance.', verbose_name='Job result')),
+                ('task_id', models.CharField(default=str, help_text='Celery task ID that start renewal', max_length=36, verbose_name='Task ID')),
+                ('campaign', models.ForeignKey(help_text='Renewed campaign which data are copied to', on_delete=django.db.models.deletion.CASCADE, related_name='renewal_jobs', to='campaigns.campaign', verbose_name='Campaign')),
+                ('chamber', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='campaign_renewal_jobs', to='chambers.chamber', verbose_name='Chamber')),
+                ('created_by', models.ForeignKey(editable=False, help_text='User which started job', null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created by')),
+                ('previous_campaign', models.ForeignKey(help_text='Campaign which data are copied from', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='campaigns.campaign', verbose_name='Previous campaign')),
+            ],
+            options={
+                'verbose_name': 'Campaign Renewal Job',
+                'verbose_name_plural': 'Campaign Renewal Jobs',
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.10 on 2026-10-17 23:35
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    TrigramExtension,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('chambers', '0021_campaignrenewaljob'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='storedmember',
+            index=GinIndex(condition=models.Q(('deleted_at__isnull', True)), fields=['name', 'contact_first_name', 'contact_last_name', 'contact_email', 'address'], name='stored_member_search_idx', opclasses=('gin_trgm_ops', 'gin_trgm_ops', 'gin_trgm_ops', 'gin_trgm_ops', 'gin_trgm_ops')),
+        ),
+    ]
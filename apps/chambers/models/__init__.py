@@ -1,3 +1,4 @@
+from .campaign_renewal_job import CampaignRenewalJob
 from .chamber import Chamber
 from .chamber_branding import ChamberBranding
 from .members import StoredMember
@@ -0,0 +1,212 @@
+import traceback
+import uuid
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils.translation import gettext_lazy as _
+
+from apps.chambers.constants import CampaignRenewalStep
+from apps.core.models import BaseModel
+
+
+# pylint: disable=attribute-defined-outside-init,broad-exception-caught
+class CampaignRenewalJob(BaseModel):
+    """Store information on job copying data of renewed campaign.
+
+    Renewal is split into steps, each of them is committed in a separate
+    transaction along with data required by next steps. If worker dies or
+    a step fails, restarted job continues from the first incomplete step.
+
+    """
+
+    class RenewalStatus(models.TextChoices):
+        """RenewalJob possible statuses.
+
+        * CREATED:
+            renewal job is just created
+        * CONFIRMED
+            renewal confirmed but not started yet
+        * RENEWING:
+            renewal job started
+        * RENEWED:
+            all data copied to renewed campaign w/o errors
+        * RENEWAL_ERROR:
+            unknown error during renewal
+
+        State diagrams::
+            .save()
+               |
+            CREATED
+               |
+            CONFIRMED
+               |
+            .renew_campaign()
+               |
+            RENEWING - RENEWAL_ERROR
+               |            |
+               |      .resume_renewal()
+               |            |
+            RENEWED     CONFIRMED
+
+        """
+
+        CREATED = "CREATED", _("Created")
+        CONFIRMED = "CONFIRMED", _("Renewal confirmed")
+        RENEWING = "RENEWING", _("Renewing")
+        RENEWED = "RENEWED", _("Renewed")
+        RENEWAL_ERROR = "RENEWAL_ERROR", _("Renewal error")
+
+    chamber = models.ForeignKey(
+        to="chambers.Chamber",
+        verbose_name=_("Chamber"),
+        related_name="campaign_renewal_jobs",
+        on_delete=models.CASCADE,
+    )
+    previous_campaign = models.ForeignKey(
+        to="campaigns.Campaign",
+        verbose_name=_("Previous campaign"),
+        help_text=_("Campaign which data are copied from"),
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    campaign = models.ForeignKey(
+        to="campaigns.Campaign",
+        verbose_name=_("Campaign"),
+        help_text=_("Renewed campaign which data are copied to"),
+        related_name="renewal_jobs",
+        on_delete=models.CASCADE,
+    )
+    job_kwargs = models.JSONField(
+        default=dict,
+        verbose_name=_("Job kwargs"),
+        help_text=_(
+            "Renewal config. Should look like "
+            "{\"inventory\": true, \"incentives\": true, "
+            "\"users\": true, \"contracts\": false}",
+        ),
+    )
+    completed_steps = models.JSONField(
+        default=list,
+        verbose_name=_("Completed steps"),
+        help_text=_("Renewal steps which are already committed"),
+    )
+    checkpoint = models.JSONField(
+        default=dict,
+        verbose_name=_("Checkpoint"),
+        help_text=_("Data of completed steps required by next steps"),
+    )
+    traceback = models.TextField(
+        blank=True,
+        default=str,
+        verbose_name=_("Traceback"),
+        help_text=_("Python traceback in case of renewal error"),
+    )
+    error_message = models.CharField(
+        max_length=128,
+        blank=True,
+        default=str,
+        verbose_name=_("Error message"),
+        help_text=_("Python error message in case of renewal error"),
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=RenewalStatus.choices,
+        default=RenewalStatus.CREATED,
+        verbose_name=_("Job Status"),
+    )
+    created_by = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        editable=False,
+        null=True,
+        on_delete=models.SET_NULL,
+        verbose_name=_("Created by"),
+        help_text=_("User which started job"),
+    )
+    result = models.JSONField(
+        default=dict,
+        verbose_name=_("Job result"),
+        help_text=_("Number of renewed objects per instance."),
+    )
+    task_id = models.CharField(
+        max_length=36,
+        default=str,
+        verbose_name=_("Task ID"),
+        help_text=_("Celery task ID that start renewal"),
+    )
+
+    class Meta:
+        verbose_name = _("Campaign Renewal Job")
+        verbose_name_plural = _("Campaign Renewal Jobs")
+
+    def __str__(self) -> str:
+        return f"Renewal of {self.previous_campaign} to {self.campaign}"
+
+    @property
+    def progress(self) -> int:
+        """Return percent of completed renewal steps."""
+        return len(self.completed_steps) * 100 // len(CampaignRenewalStep)
+
+    def save(self, *args, **kwargs):
+        """Trigger renewal execution."""
+        is_created = self._state.adding
+        super().save(*args, **kwargs)
+        if not is_created:
+            return
+        self.task_id = str(uuid.uuid4())
+        self.save(update_fields=["task_id"])
+        transaction.on_commit(self._start_renewal)
+
+    def _start_renewal(self):
+        """Start async celery task."""
+        from ..tasks import renew_campaign
+        self.status = self.RenewalStatus.CONFIRMED
+        self.save(update_fields=["status"])
+        renew_campaign.apply_async(
+            kwargs={"job_id": self.pk},
+            task_id=self.task_id,
+        )
+
+    def resume_renewal(self):
+        """Restart failed renewal from the first incomplete step."""
+        if self.status != self.RenewalStatus.RENEWAL_ERROR:
+            raise ValueError(
+                f"CampaignRenewalJob with id {self.id} has incorrect status: "
+                f"`{self.status}`. Expected status: "
+                f"`{self.RenewalStatus.RENEWAL_ERROR}`",
+            )
+        self.task_id = str(uuid.uuid4())
+        self.traceback = ""
+        self.error_message = ""
+        self.save(update_fields=["task_id", "traceback", "error_message"])
+        transaction.on_commit(self._start_renewal)
+
+    def renew_campaign(self):
+        """Run renewal steps which are not completed yet."""
+        from ..services import RENEWAL_STEPS, get_renewed_campaign_counts
+        if self.status == self.RenewalStatus.RENEWED:
+            return
+        self.status = self.RenewalStatus.RENEWING
+        self.save(update_fields=["status"])
+
+        try:
+            for step in CampaignRenewalStep:
+                if step in self.completed_steps:
+                    continue
+                with transaction.atomic():
+                    RENEWAL_STEPS[step](self)
+                    self.completed_steps.append(step)
+                    self.save(update_fields=["completed_steps", "checkpoint"])
+            self.result = get_renewed_campaign_counts(self.campaign_id)
+            self.status = self.RenewalStatus.RENEWED
+            self.save(update_fields=["result", "status"])
+        except Exception as error:
+            self.traceback = traceback.format_exc()
+            self.error_message = str(error)[:128]
+            self.status = self.RenewalStatus.RENEWAL_ERROR
+            self.save(
+                update_fields=[
+                    "traceback",
+                    "error_message",
+                    "status",
+                ],
+            )
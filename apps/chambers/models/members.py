@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import RegexValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -87,6 +88,20 @@ class StoredMember(BaseModel):
     class Meta:
         verbose_name = _("Stored Member")
         verbose_name_plural = _("Stored Members")
+        indexes = (
+            GinIndex(
+                fields=(
+                    "name",
+                    "contact_first_name",
+                    "contact_last_name",
+                    "contact_email",
+                    "address",
+                ),
+                opclasses=("gin_trgm_ops",) * 5,
+                condition=models.Q(deleted_at__isnull=True),
+                name="stored_member_search_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return f"Stored Member for {self.chamber.name} - {self.name}"
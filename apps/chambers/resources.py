@@ -1,3 +1,6 @@
+from django.utils import timezone
+
+from celery import current_task
 from import_export import widgets
 from import_export.formats import base_formats
 from import_export.resources import ModelResource
@@ -5,14 +8,17 @@ from import_export.results import RowResult
 from import_export_extensions.fields import Field
 from import_export_extensions.resources import CeleryResourceMixin
 
-from apps.chambers.models import StoredMember
+from apps.chambers.models import StoredMember, StoredMemberContact
 from apps.core.import_export import formats as custom_formats
 from apps.core.import_export import widgets as custom_widgets
 
-from .services import add_stored_member_contact
+from .services import (
+    STORED_MEMBERS_IMPORT_BATCH_SIZE,
+    bulk_add_stored_member_contacts,
+)
 
 SUPPORTED_IMPORT_FORMATS = [
-    base_formats.CSV,
+    custom_formats.CSV,
     custom_formats.XLSX,
     base_formats.XLS,
 ]
@@ -88,7 +94,14 @@ class StoredMemberResource(ModelResource):
 
 
 class StoredMemberImportResource(CeleryResourceMixin, StoredMemberResource):
-    """Import stored member data."""
+    """Import stored member data.
+
+    Members are saved in batches of `STORED_MEMBERS_IMPORT_BATCH_SIZE` rows.
+    Chamber's members and their contacts are loaded once before import, so
+    rows are matched to them without queries. Rows are still validated one
+    by one, so validation errors are reported per row.
+
+    """
 
     SUPPORTED_FORMATS = SUPPORTED_IMPORT_FORMATS
 
@@ -102,15 +115,12 @@ class StoredMemberImportResource(CeleryResourceMixin, StoredMemberResource):
 
     def get_instance(self, instance_loader, row) -> StoredMember | None:
         """Search for member if exists."""
-        try:
-            name_field = self.fields["name"]
-            name = name_field.clean(row)
-            return self.get_queryset().get(
-                name=name,
-                chamber_id=self.chamber_id,
+        name = self.fields["name"].clean(row)
+        if name in self.duplicated_names:
+            raise self.Meta.model.MultipleObjectsReturned(
+                f"Chamber has several members named {name}",
             )
-        except self.Meta.model.DoesNotExist:
-            return None
+        return self.members_by_name.get(name)
 
     class Meta:
         model = StoredMember
@@ -139,30 +149,148 @@ class StoredMemberImportResource(CeleryResourceMixin, StoredMemberResource):
             "contact_email",
         )
         store_instance = True
+        use_bulk = True
+        batch_size = STORED_MEMBERS_IMPORT_BATCH_SIZE
+
+    def before_import(self, dataset, using_transactions, dry_run, **kwargs):
+        """Load chamber's members and their contacts."""
+        self.members_by_name = {}
+        self.duplicated_names = set()
+        for member in self.get_queryset().filter(chamber_id=self.chamber_id):
+            if member.name in self.members_by_name:
+                self.duplicated_names.add(member.name)
+            self.members_by_name[member.name] = member
+        self.contacts_by_email = {
+            (contact.stored_member_id, contact.email): contact
+            for contact in StoredMemberContact.objects.filter(
+                stored_member__chamber_id=self.chamber_id,
+                stored_member__deleted_at__isnull=True,
+            )
+        }
+        self.pending_contacts = []
+        return super().before_import(
+            dataset,
+            using_transactions,
+            dry_run,
+            **kwargs,
+        )
+
+    def initialize_task_state(self, state, queryset):
+        """Remember number of rows to report progress."""
+        self.processed_rows = 0
+        self.total_rows = len(queryset)
+        super().initialize_task_state(state, queryset)
 
-    def skip_row(self, instance, original, row, import_validation_errors=None):
-        """Skip empty rows.
+    def update_task_state(self, state):
+        """Report import progress once per batch of rows.
 
-        Excel files sometimes contain many empty rows, which causes errors
-        during import because empty cells are treated as None.
+        Default implementation fetches and updates task's state for each row.
 
         """
-        if not any(row.values()):
-            return True
-        return super().skip_row(
-            instance,
-            original,
-            row,
-            import_validation_errors,
+        self.processed_rows += 1
+        if (
+            not current_task
+            or current_task.request.called_directly
+            or (
+                self.processed_rows % self._meta.batch_size
+                and self.processed_rows < self.total_rows
+            )
+        ):
+            return
+        self._update_current_task_state(
+            state=state,
+            meta={"current": self.processed_rows, "total": self.total_rows},
+        )
+
+    def get_bulk_update_fields(self):
+        """Update modification time of members."""
+        return [*super().get_bulk_update_fields(), "modified"]
+
+    def save_instance(
+        self,
+        instance,
+        is_create,
+        using_transactions=True,
+        dry_run=False,
+    ):
+        """Remember new members, so next rows with their names update them.
+
+        If member is not created yet, it's already updated by the row and will
+        be saved with the batch.
+
+        """
+        if not is_create and instance.pk is None:
+            return
+        instance.modified = timezone.now()
+        super().save_instance(instance, is_create, using_transactions, dry_run)
+        self.members_by_name[instance.name] = instance
+
+    def bulk_create(
+        self,
+        using_transactions,
+        dry_run,
+        raise_errors,
+        batch_size=None,
+        result=None,
+    ):
+        """Save contacts of created members."""
+        super().bulk_create(
+            using_transactions,
+            dry_run,
+            raise_errors,
+            batch_size,
+            result,
+        )
+        self.save_contacts(using_transactions, dry_run, raise_errors, result)
+
+    def bulk_update(
+        self,
+        using_transactions,
+        dry_run,
+        raise_errors,
+        batch_size=None,
+        result=None,
+    ):
+        """Save contacts of updated members."""
+        super().bulk_update(
+            using_transactions,
+            dry_run,
+            raise_errors,
+            batch_size,
+            result,
         )
+        self.save_contacts(using_transactions, dry_run, raise_errors, result)
+
+    def save_contacts(self, using_transactions, dry_run, raise_errors, result):
+        """Save collected contacts of members which are already saved.
+
+        Contacts of members waiting for the next batch are kept.
+
+        """
+        if not using_transactions and dry_run:
+            return
+        contacts_info = {}
+        pending_contacts = []
+        for member, contact_info in self.pending_contacts:
+            if member.pk is None:
+                pending_contacts.append((member, contact_info))
+                continue
+            contacts_info[(member.pk, contact_info["email"])] = contact_info
+        self.pending_contacts = pending_contacts
+        try:
+            bulk_add_stored_member_contacts(
+                contacts_info,
+                self.contacts_by_email,
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.handle_import_error(result, error, raise_errors)
 
     # pylint: disable=no-member
     def before_import_row(self, row, row_number=None, **kwargs):
         """Check if required fields don't have values.
 
         Only raise error if number of missing fields is different from number
-        of row's fields, because if all fields are missing, it should be
-        handled by `skip_row`.
+        of row's fields, because empty rows are skipped by `import_row`.
 
         """
         # TODO: Find solution to skip empty rows in excel files
@@ -195,8 +323,10 @@ class StoredMemberImportResource(CeleryResourceMixin, StoredMemberResource):
     ):
         """Skip importing for empty rows.
 
-        Need a custom here because the super `import_row` only calls the
-        `skip_row` method if there is any error in the import progress.
+        Excel files sometimes contain many empty rows, whose cells are
+        treated as None. They are skipped before instance is loaded, so they
+        don't raise errors or get into the batch. Validation error of other
+        rows is added to row's errors, so the row is reported as invalid.
 
         """
         if not any(row.values()):
@@ -215,7 +345,7 @@ class StoredMemberImportResource(CeleryResourceMixin, StoredMemberResource):
         return result
 
     def after_import_row(self, row, row_result, row_number=None, **kwargs):
-        """Add member's contact after importing it."""
+        """Collect member's contact to save it with the batch."""
         contact_email = self.fields["contact_email"].clean(row)
         if contact_email:
             contact_info = {
@@ -225,10 +355,7 @@ class StoredMemberImportResource(CeleryResourceMixin, StoredMemberResource):
                 "work_phone": self.fields["contact_work_phone"].clean(row),
                 "mobile_phone": self.fields["contact_mobile_phone"].clean(row),
             }
-            add_stored_member_contact(
-                stored_member=row_result.instance,
-                contact_info=contact_info,
-            )
+            self.pending_contacts.append((row_result.instance, contact_info))
         return super().after_import_row(row, row_result, row_number, **kwargs)
 
 
@@ -1,8 +1,9 @@
 # pylint: disable=too-many-locals,cyclic-import
+import itertools
 import typing
-from collections import defaultdict
+from collections import abc, defaultdict
 
-from django.db.models import F, Prefetch
+from django.db.models import Prefetch, QuerySet
 from django.utils import timezone
 
 from apps.campaigns import services as campaigns_services
@@ -16,7 +17,14 @@ from apps.campaigns.models import (
     Team,
     UserCampaign,
 )
-from apps.chambers.models import Chamber, StoredMember, StoredMemberContact
+from apps.chambers import sql_renewal
+from apps.chambers.constants import CampaignRenewalStep, ChamberRenewConfig
+from apps.chambers.models import (
+    CampaignRenewalJob,
+    Chamber,
+    StoredMember,
+    StoredMemberContact,
+)
 from apps.incentives.models import Incentive, IncentiveQualifier
 from apps.members import models as members_models
 from apps.timelines import services as timelines_services
@@ -24,6 +32,11 @@ from apps.timelines.constants import TimelineTypeChoice
 from apps.timelines.models import Timeline, TimelineCategory, TimelineType
 from apps.users.models import User
 
+RENEWAL_CATEGORIES_CHUNK_SIZE = 10
+RENEWAL_USERS_CHUNK_SIZE = 200
+RENEWAL_BATCH_SIZE = 1000
+STORED_MEMBERS_IMPORT_BATCH_SIZE = 1000
+
 
 def update_renewal_contract_names(contracts: list) -> list:
     """Update contracts' name during campaign renewal process."""
@@ -42,13 +55,31 @@ def update_renewal_contract_names(contracts: list) -> list:
     return contracts
 
 
-# pylint: disable=unnecessary-comprehension
+def iterate_in_chunks(
+    queryset: QuerySet,
+    chunk_size: int,
+) -> abc.Iterator[list]:
+    """Iterate over queryset's objects in lists of `chunk_size` objects.
+
+    Prefetched relations are fetched for each chunk separately, so only one
+    chunk of objects is kept in memory.
+
+    """
+    objects = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(itertools.islice(objects, chunk_size)):
+        yield chunk
+
+
 def renew_campaign_inventory(
     campaign_id: int,
     new_campaign: Campaign,
     **kwargs,
-) -> dict[LevelInstance, int]:
-    """Renew products and product categories for new campaign."""
+) -> dict[int, int]:
+    """Renew products and product categories for new campaign.
+
+    Return map of renewed level instances' ids to their old contracts' ids.
+
+    """
     instances_prefetch = Prefetch(
         "instances",
         queryset=LevelInstance.objects.filter(
@@ -73,48 +104,63 @@ def renew_campaign_inventory(
     )
     categories = ProductCategory.objects.filter(
         campaign_id=campaign_id,
-    ).prefetch_related(products_prefetch)
-    renew_categories = []
-    renew_products = []
-    renew_product_attachments = []
-    renew_levels = []
-    renew_instances = []
-    old_contract_ids = []
-    for category in categories:
-        products = category.products.all()
-        new_category = category.renew(campaign=new_campaign)
-        renew_categories.append(new_category)
-        for product in products:
-            levels = product.levels.all()
-            product_attachments = product.attachments.all()
-            new_product = product.renew(category=new_category)
-            renew_products.append(new_product)
-            renew_product_attachments.extend(
-                attachment.renew(new_product)
-                for attachment in product_attachments
-            )
-            for level in levels:
-                instances = (
-                    level.instances.all() if kwargs.get("contracts") else []
-                )
-                old_contract_ids.extend(
-                    instance.contract_id for instance in instances
-                )
-                new_level = level.renew(product=new_product)
-                renew_levels.append(new_level)
-                renew_instances.extend(
-                    instance.renew(level=new_level) for instance in instances
+    ).prefetch_related(products_prefetch).order_by("id")
+    instances_map = {}
+    for categories_chunk in iterate_in_chunks(
+        categories,
+        RENEWAL_CATEGORIES_CHUNK_SIZE,
+    ):
+        renew_categories = []
+        renew_products = []
+        renew_product_attachments = []
+        renew_levels = []
+        renew_instances = []
+        old_contract_ids = []
+        for category in categories_chunk:
+            products = category.products.all()
+            new_category = category.renew(campaign=new_campaign)
+            renew_categories.append(new_category)
+            for product in products:
+                levels = product.levels.all()
+                product_attachments = product.attachments.all()
+                new_product = product.renew(category=new_category)
+                renew_products.append(new_product)
+                renew_product_attachments.extend(
+                    attachment.renew(new_product)
+                    for attachment in product_attachments
                 )
-    ProductCategory.objects.bulk_create(renew_categories)
-    Product.objects.bulk_create(renew_products)
-    ProductAttachment.objects.bulk_create(renew_product_attachments)
-    Level.objects.bulk_create(renew_levels)
-    if renew_instances:
-        LevelInstance.objects.bulk_create(renew_instances)
-    instances_map = {
-        instance: contract_id
-        for instance, contract_id in zip(renew_instances, old_contract_ids)
-    }
+                for level in levels:
+                    instances = (
+                        level.instances.all()
+                        if kwargs.get("contracts") else []
+                    )
+                    old_contract_ids.extend(
+                        instance.contract_id for instance in instances
+                    )
+                    new_level = level.renew(product=new_product)
+                    renew_levels.append(new_level)
+                    renew_instances.extend(
+                        instance.renew(level=new_level)
+                        for instance in instances
+                    )
+        ProductCategory.objects.bulk_create(renew_categories)
+        Product.objects.bulk_create(
+            renew_products,
+            batch_size=RENEWAL_BATCH_SIZE,
+        )
+        ProductAttachment.objects.bulk_create(
+            renew_product_attachments,
+            batch_size=RENEWAL_BATCH_SIZE,
+        )
+        Level.objects.bulk_create(renew_levels, batch_size=RENEWAL_BATCH_SIZE)
+        LevelInstance.objects.bulk_create(
+            renew_instances,
+            batch_size=RENEWAL_BATCH_SIZE,
+        )
+        instances_map.update(
+            (instance.id, contract_id)
+            for instance, contract_id in zip(renew_instances, old_contract_ids)
+        )
     return instances_map
 
 
@@ -142,10 +188,15 @@ def renew_campaign_incentives(campaign_id: int, new_campaign: Campaign):
 def renew_campaign_users_and_contracts(
     campaign_id: int,
     new_campaign: Campaign,
-    instances_map: dict[LevelInstance, int],
+    instances_map: dict[int, int],
     **kwargs,
 ):
-    """Renew users for new campaign, clone contracts if it is selected."""
+    """Renew users for new campaign, clone contracts if it is selected.
+
+    `instances_map` maps renewed level instances' ids to their old
+    contracts' ids, renewed instances are assigned to renewed contracts.
+
+    """
     credits_info_prefetch = Prefetch(
         "credits_info",
         queryset=members_models.ContractCreditInfo.objects.all(),
@@ -161,111 +212,230 @@ def renew_campaign_users_and_contracts(
         ).prefetch_related(
             instances_prefetch,
             credits_info_prefetch,
-        ).select_related("member"),
-    )
-    users_prefetch = Prefetch(
-        "members",
-        queryset=UserCampaign.objects.prefetch_related(contracts_prefetch),
+        ).select_related("member").order_by("id"),
     )
-    teams = Team.objects.filter(campaign_id=campaign_id).prefetch_related(
-        users_prefetch,
-    ).annotate(old_id=F("id"))
-    users = UserCampaign.objects.filter(
-        campaign_id=campaign_id,
-    ).prefetch_related(contracts_prefetch).annotate(old_team_id=F("team_id"))
+    teams = list(Team.objects.filter(campaign_id=campaign_id))
+    old_team_ids = [team.id for team in teams]
     renew_teams = [team.renew(campaign=new_campaign) for team in teams]
     Team.objects.bulk_create(renew_teams)
-    renew_users = []
-    renew_contracts = []
-    renew_members = []
-    old_contract_ids = []
-    renew_credits_info = []
-    renew_instances = list(instance for instance in instances_map.keys())
     teams_map = {
-        team.old_id: new_team.id for team, new_team in zip(teams, renew_teams)
+        old_team_id: new_team.id
+        for old_team_id, new_team in zip(old_team_ids, renew_teams)
     }
-    for user in users:
-        contracts = (
-            user.created_contracts.all() if kwargs.get("contracts") else []
-        )
-        new_user = user.renew(campaign=new_campaign)
-        renew_users.append(new_user)
-        old_contract_ids.extend(contract.id for contract in contracts)
-        for contract in contracts:
-            credits_info = contract.credits_info.all()
-            new_member = contract.member.renew()
-            new_contract = contract.renew(
-                campaign=new_campaign,
-                user=new_user,
-                member=new_member,
+    users = UserCampaign.objects.filter(
+        campaign_id=campaign_id,
+    ).order_by("id")
+    if kwargs.get("contracts"):
+        users = users.prefetch_related(contracts_prefetch)
+    contracts_map = {}
+    for users_chunk in iterate_in_chunks(users, RENEWAL_USERS_CHUNK_SIZE):
+        renew_users = []
+        renew_contracts = []
+        renew_members = []
+        old_contract_ids = []
+        renew_credits_info = []
+        for user in users_chunk:
+            contracts = (
+                user.created_contracts.all() if kwargs.get("contracts") else []
             )
-            renew_members.append(new_member)
-            renew_contracts.append(new_contract)
-            renew_credits_info.extend(
-                credit.renew(contract=new_contract, user_campaign=new_user)
-                for credit in credits_info
+            old_team_id = user.team_id
+            new_user = user.renew(campaign=new_campaign)
+            new_user.team_id = teams_map.get(old_team_id)
+            renew_users.append(new_user)
+            old_contract_ids.extend(contract.id for contract in contracts)
+            for contract in contracts:
+                credits_info = contract.credits_info.all()
+                new_member = contract.member.renew()
+                new_contract = contract.renew(
+                    campaign=new_campaign,
+                    user=new_user,
+                    member=new_member,
+                )
+                renew_members.append(new_member)
+                renew_contracts.append(new_contract)
+                renew_credits_info.extend(
+                    credit.renew(contract=new_contract, user_campaign=new_user)
+                    for credit in credits_info
+                )
+        UserCampaign.objects.bulk_create(renew_users)
+        members_models.Member.objects.bulk_create(
+            renew_members,
+            batch_size=RENEWAL_BATCH_SIZE,
+        )
+        members_models.Contract.objects.bulk_create(
+            renew_contracts,
+            batch_size=RENEWAL_BATCH_SIZE,
+        )
+        members_models.ContractCreditInfo.objects.bulk_create(
+            renew_credits_info,
+            batch_size=RENEWAL_BATCH_SIZE,
+        )
+        contracts_map.update(
+            (old_contract_id, renew_contract.id)
+            for old_contract_id, renew_contract
+            in zip(old_contract_ids, renew_contracts)
+        )
+    rename_renewed_contracts(new_campaign)
+    LevelInstance.objects.bulk_update(
+        [
+            LevelInstance(
+                id=instance_id,
+                contract_id=contracts_map[old_contract_id],
             )
-    UserCampaign.objects.bulk_create(renew_users)
-    members_models.Member.objects.bulk_create(renew_members)
-    if renew_contracts:
-        sorted_contracts = update_renewal_contract_names(renew_contracts)
-        members_models.Contract.objects.bulk_create(sorted_contracts)
-    members_models.ContractCreditInfo.objects.bulk_create(renew_credits_info)
-    contracts_map = {
-        old_contract_id: renew_contract.id
-        for old_contract_id, renew_contract
-        in zip(old_contract_ids, renew_contracts)
-    }
-    for instance in renew_instances:
-        try:
-            old_contract_id = instances_map[instance]
-            instance.contract_id = contracts_map[old_contract_id]
-        except KeyError:
-            pass
-    users_teams_map = {
-        renew_user: user.old_team_id
-        for renew_user, user in zip(renew_users, users)
-    }
-    for user in renew_users:
-        try:
-            old_team_id = users_teams_map[user]
-            user.team_id = teams_map[old_team_id]
-        except KeyError:
-            pass
-    UserCampaign.objects.bulk_update(renew_users, fields=["team_id"])
-    LevelInstance.objects.bulk_update(renew_instances, fields=["contract_id"])
+            for instance_id, old_contract_id in instances_map.items()
+            if old_contract_id in contracts_map
+        ],
+        fields=["contract_id"],
+        batch_size=RENEWAL_BATCH_SIZE,
+    )
     members_models.Contract.objects.filter(
         campaign_id=new_campaign.id,
         levels__isnull=True,
     ).delete()
 
 
-def renew_chamber_campaign(chamber: Chamber, validated_data: dict) -> int:
-    """Implement logic to renew campaign and return new campaign's id."""
+def rename_renewed_contracts(new_campaign: Campaign) -> None:
+    """Add version numbers to duplicated names of renewed contracts."""
+    contracts = members_models.Contract.objects.filter(
+        campaign_id=new_campaign.id,
+    ).only("id", "name", "status", "signed_at").order_by("id")
+    members_models.Contract.objects.bulk_update(
+        update_renewal_contract_names(list(contracts)),
+        fields=["name", "signed_at"],
+        batch_size=RENEWAL_BATCH_SIZE,
+    )
+
+
+def start_campaign_renewal(
+    chamber: Chamber,
+    validated_data: dict,
+    created_by: User | None = None,
+) -> CampaignRenewalJob:
+    """Create renewed campaign and start job copying its data."""
     campaign = campaigns_services.get_chamber_newest_campaign(chamber)
     campaign_id = campaign.id
     campaign.renew(name=validated_data["name"], year=validated_data["year"])
-    instances_map = {}
-    if validated_data.get("inventory"):
+    return CampaignRenewalJob.objects.create(
+        chamber=chamber,
+        previous_campaign_id=campaign_id,
+        campaign=campaign,
+        job_kwargs={
+            config: validated_data.get(config, False)
+            for config in ChamberRenewConfig.values
+        },
+        created_by=created_by,
+    )
+
+
+def _uses_sql_renewal(job: CampaignRenewalJob) -> bool:
+    """Check if job renews campaign with set-based SQL statements.
+
+    Python renewal is used as fallback for databases other than PostgreSQL.
+    Choice is saved in checkpoint, so resumed job keeps using the same
+    renewal path.
+
+    """
+    return job.checkpoint.setdefault(
+        "sql_renewal",
+        sql_renewal.is_sql_renewal_supported(),
+    )
+
+
+def _renew_inventory(job: CampaignRenewalJob) -> None:
+    """Copy inventory of renewal job's campaign if it is selected."""
+    if not job.job_kwargs.get("inventory"):
+        campaigns_services.create_default_product_categories(
+            campaign=job.campaign,
+        )
+        return
+    if _uses_sql_renewal(job):
+        instances_map = sql_renewal.renew_campaign_inventory(
+            job.previous_campaign_id,
+            job.campaign_id,
+            **job.job_kwargs,
+        )
+    else:
         instances_map = renew_campaign_inventory(
-            campaign_id,
-            campaign,
-            **validated_data,
+            job.previous_campaign_id,
+            job.campaign,
+            **job.job_kwargs,
+        )
+    # Renewed instances aren't attached to contracts until users step, so
+    # previous contracts stay intact if it fails
+    job.checkpoint["instances_map"] = instances_map
+
+
+def _renew_incentives(job: CampaignRenewalJob) -> None:
+    """Copy incentives of renewal job's campaign if they are selected."""
+    if job.job_kwargs.get("incentives"):
+        renew_campaign_incentives(job.previous_campaign_id, job.campaign)
+
+
+def _renew_users(job: CampaignRenewalJob) -> None:
+    """Copy users and contracts of renewal job's campaign if selected.
+
+    Inventories of campaign's levels are recounted afterwards, since
+    instances are copied in bulk.
+
+    """
+    # JSON keys of saved checkpoint are strings
+    instances_map = {
+        int(instance_id): contract_id
+        for instance_id, contract_id
+        in job.checkpoint.get("instances_map", {}).items()
+    }
+    if not job.job_kwargs.get("users"):
+        campaigns_services.create_default_user_campaign(campaign=job.campaign)
+    elif _uses_sql_renewal(job):
+        sql_renewal.renew_campaign_users_and_contracts(
+            job.previous_campaign_id,
+            job.campaign_id,
+            instances_map,
+            **job.job_kwargs,
         )
     else:
-        campaigns_services.create_default_product_categories(campaign=campaign)
-    if validated_data.get("incentives"):
-        renew_campaign_incentives(campaign_id, campaign)
-    if validated_data.get("users"):
         renew_campaign_users_and_contracts(
-            campaign_id,
-            campaign,
+            job.previous_campaign_id,
+            job.campaign,
             instances_map,
-            **validated_data,
+            **job.job_kwargs,
         )
-    else:
-        campaigns_services.create_default_user_campaign(campaign=campaign)
-    return campaign.id
+    campaigns_services.refresh_campaign_level_inventories(job.campaign_id)
+
+
+RENEWAL_STEPS: dict[str, abc.Callable[[CampaignRenewalJob], None]] = {
+    CampaignRenewalStep.INVENTORY: _renew_inventory,
+    CampaignRenewalStep.INCENTIVES: _renew_incentives,
+    CampaignRenewalStep.USERS: _renew_users,
+}
+
+
+def get_renewed_campaign_counts(campaign_id: int) -> dict[str, int]:
+    """Return number of renewed campaign's objects per instance."""
+    return {
+        "product_categories": ProductCategory.objects.filter(
+            campaign_id=campaign_id,
+        ).count(),
+        "products": Product.objects.filter(
+            category__campaign_id=campaign_id,
+        ).count(),
+        "levels": Level.objects.filter(
+            product__category__campaign_id=campaign_id,
+        ).count(),
+        "level_instances": LevelInstance.objects.filter(
+            level__product__category__campaign_id=campaign_id,
+        ).count(),
+        "incentives": Incentive.objects.filter(
+            campaign_id=campaign_id,
+        ).count(),
+        "teams": Team.objects.filter(campaign_id=campaign_id).count(),
+        "user_campaigns": UserCampaign.objects.filter(
+            campaign_id=campaign_id,
+        ).count(),
+        "contracts": members_models.Contract.objects.filter(
+            campaign_id=campaign_id,
+        ).count(),
+    }
 
 
 class StoredMemberContactInfo(typing.TypedDict):
@@ -290,6 +460,45 @@ def add_stored_member_contact(
     )
 
 
+def bulk_add_stored_member_contacts(
+    contacts_info: abc.Mapping[tuple[int, str], StoredMemberContactInfo],
+    existing_contacts: dict[tuple[int, str], StoredMemberContact],
+) -> None:
+    """Add contacts of stored members in bulk, update existing ones.
+
+    Both mappings are keyed by stored member id and contact email. Created
+    contacts are added to `existing_contacts`, so it can be reused for next
+    batches.
+
+    """
+    new_contacts = []
+    updated_contacts = []
+    now = timezone.now()
+    for key, contact_info in contacts_info.items():
+        contact = existing_contacts.get(key)
+        if contact is None:
+            contact = StoredMemberContact(
+                stored_member_id=key[0],
+                **contact_info,
+            )
+            existing_contacts[key] = contact
+            new_contacts.append(contact)
+            continue
+        for field, value in contact_info.items():
+            setattr(contact, field, value)
+        contact.modified = now
+        updated_contacts.append(contact)
+    StoredMemberContact.objects.bulk_create(
+        new_contacts,
+        batch_size=STORED_MEMBERS_IMPORT_BATCH_SIZE,
+    )
+    StoredMemberContact.objects.bulk_update(
+        updated_contacts,
+        fields=(*StoredMemberContactInfo.__annotations__, "modified"),
+        batch_size=STORED_MEMBERS_IMPORT_BATCH_SIZE,
+    )
+
+
 def generate_default_timelines(chamber: Chamber) -> None:
     """Generate default timelines for new created chamber."""
     category_map = dict(TimelineCategory.objects.values_list("name", "id"))
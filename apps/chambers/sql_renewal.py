@@ -0,0 +1,423 @@
+"""Set-based campaign renewal.
+
+Each renewal step is performed by a few `INSERT ... SELECT` statements
+instead of loading previous campaign's objects into Python, so renewal runs
+in constant memory regardless of campaign's size.
+
+Ids of copies are allocated from table's sequence before copying and stored
+in a temporary table, which maps ids of copied rows to ids of their copies.
+Copies of related rows look up their new foreign keys in it.
+
+"""
+import contextlib
+from collections import abc
+
+from django.db import connection, transaction
+from django.db.models import Model
+
+from apps.campaigns.models import (
+    Campaign,
+    Level,
+    LevelInstance,
+    Product,
+    ProductAttachment,
+    ProductCategory,
+    Team,
+    UserCampaign,
+)
+from apps.members import models as members_models
+from apps.members.constants import ContractStatus
+
+ID_MAP_TABLE = "renewal_id_map"
+
+
+def is_sql_renewal_supported() -> bool:
+    """Check if database supports set-based renewal."""
+    return connection.vendor == "postgresql"
+
+
+def renew_campaign_inventory(
+    campaign_id: int,
+    new_campaign_id: int,
+    **kwargs,
+) -> dict[int, int]:
+    """Copy product categories, products and levels to new campaign.
+
+    If contracts are renewed, level instances are copied too, without
+    contracts. Return map of copied level instances' ids to their previous
+    contracts' ids, so instances are assigned to renewed contracts later.
+
+    """
+    params = {"campaign_id": campaign_id, "new_campaign_id": new_campaign_id}
+    with _id_map() as cursor:
+        _copy_rows(
+            cursor,
+            ProductCategory,
+            source_where="src.campaign_id = %(campaign_id)s",
+            values={"campaign_id": "%(new_campaign_id)s"},
+            params=params,
+        )
+        _copy_rows(
+            cursor,
+            Product,
+            source_where=_is_copied(ProductCategory, "src.category_id"),
+            values={
+                "category_id": _new_id(ProductCategory, "src.category_id"),
+            },
+        )
+        _copy_rows(
+            cursor,
+            ProductAttachment,
+            source_where=_is_copied(Product, "src.product_id"),
+            values={"product_id": _new_id(Product, "src.product_id")},
+        )
+        _copy_rows(
+            cursor,
+            Level,
+            source_where=_is_copied(Product, "src.product_id"),
+            values={"product_id": _new_id(Product, "src.product_id")},
+        )
+        if not kwargs.get("contracts"):
+            return {}
+        _copy_rows(
+            cursor,
+            LevelInstance,
+            source_from=(
+                f"{_table(LevelInstance)} src "
+                f"JOIN {_table(Level)} level ON level.id = src.level_id "
+                f"JOIN {_table(Product)} product "
+                "ON product.id = level.product_id"
+            ),
+            source_where=(
+                f"{_is_copied(Level, 'src.level_id')} "
+                "AND src.declined_at IS NULL "
+                "AND product.is_included_in_renewal"
+            ),
+            values={
+                "level_id": _new_id(Level, "src.level_id"),
+                "contract_id": "NULL",
+                "declined_at": "NULL",
+            },
+        )
+        cursor.execute(
+            f"SELECT id_map.new_id, instance.contract_id "
+            f"FROM {ID_MAP_TABLE} id_map "
+            f"JOIN {_table(LevelInstance)} instance "
+            "ON instance.id = id_map.old_id "
+            "WHERE id_map.kind = %(kind)s "
+            "AND instance.contract_id IS NOT NULL",
+            {"kind": _get_kind(LevelInstance)},
+        )
+        return dict(cursor.fetchall())
+
+
+def renew_campaign_users_and_contracts(
+    campaign_id: int,
+    new_campaign_id: int,
+    instances_map: abc.Mapping[int, int],
+    **kwargs,
+) -> None:
+    """Copy teams and users to new campaign, with contracts if selected.
+
+    `instances_map` maps renewed level instances' ids to their previous
+    contracts' ids, renewed instances are assigned to copies of these
+    contracts. Contracts without level instances are deleted.
+
+    """
+    params = {"campaign_id": campaign_id, "new_campaign_id": new_campaign_id}
+    with _id_map() as cursor:
+        _copy_rows(
+            cursor,
+            Team,
+            source_where="src.campaign_id = %(campaign_id)s",
+            values={"campaign_id": "%(new_campaign_id)s"},
+            params=params,
+        )
+        _copy_rows(
+            cursor,
+            UserCampaign,
+            source_where="src.campaign_id = %(campaign_id)s",
+            values={
+                "campaign_id": "%(new_campaign_id)s",
+                "team_id": _new_id(Team, "src.team_id"),
+            },
+            params=params,
+        )
+        if not kwargs.get("contracts"):
+            return
+        _copy_contracts(cursor, new_campaign_id)
+        cursor.execute(
+            f"UPDATE {_table(LevelInstance)} instance "
+            "SET contract_id = id_map.new_id "
+            "FROM unnest("
+            "%(instance_ids)s::integer[], %(contract_ids)s::integer[]"
+            ") renewed (instance_id, contract_id) "
+            f"JOIN {ID_MAP_TABLE} id_map "
+            "ON id_map.kind = %(kind)s "
+            "AND id_map.old_id = renewed.contract_id "
+            "WHERE instance.id = renewed.instance_id",
+            {
+                "instance_ids": list(instances_map.keys()),
+                "contract_ids": list(instances_map.values()),
+                "kind": _get_kind(members_models.Contract),
+            },
+        )
+    _rename_renewed_contracts(new_campaign_id)
+    members_models.Contract.objects.filter(
+        campaign_id=new_campaign_id,
+        levels__isnull=True,
+    ).delete()
+
+
+def _copy_contracts(cursor, new_campaign_id: int) -> None:
+    """Copy not declined contracts of copied users with their members.
+
+    Each contract gets its own copy of member, like in Python renewal.
+
+    """
+    contract_kind = _get_kind(members_models.Contract)
+    _allocate_ids(
+        cursor,
+        members_models.Contract,
+        source_from=f"{_table(members_models.Contract)} src",
+        source_where=(
+            "src.deleted_at IS NULL "
+            f"AND {_is_copied(UserCampaign, 'src.created_by_id')} "
+            "AND src.status <> %(declined)s"
+        ),
+        order_by="src.created_by_id, src.id",
+        params={"declined": ContractStatus.DECLINED},
+    )
+    member_kind = _allocate_ids(
+        cursor,
+        members_models.Member,
+        source_from=f"{ID_MAP_TABLE} src",
+        source_where=f"src.kind = '{contract_kind}'",
+        order_by="src.new_id",
+        source_id="src.old_id",
+        kind="contract_member",
+    )
+    _insert_copies(
+        cursor,
+        members_models.Member,
+        kind=member_kind,
+        source_from=(
+            f"JOIN {_table(members_models.Contract)} contract "
+            "ON contract.id = id_map.old_id "
+            f"JOIN {_table(members_models.Member)} src "
+            "ON src.id = contract.member_id"
+        ),
+    )
+    _insert_copies(
+        cursor,
+        members_models.Contract,
+        source_from=(
+            f"JOIN {_table(members_models.Contract)} src "
+            "ON src.id = id_map.old_id "
+            f"JOIN {_table(members_models.Member)} member "
+            "ON member.id = src.member_id "
+            f"JOIN {_table(Campaign)} campaign "
+            "ON campaign.id = %(new_campaign_id)s"
+        ),
+        values={
+            "name": "CONCAT(member.name, ' - Renewal ', campaign.year)",
+            "campaign_id": "campaign.id",
+            "status": "%(draft)s",
+            "created_by_id": _new_id(UserCampaign, "src.created_by_id"),
+            "member_id": (
+                f"(SELECT new_id FROM {ID_MAP_TABLE} "
+                f"WHERE kind = '{member_kind}' AND old_id = src.id)"
+            ),
+            "approved_at": "NULL",
+            "signature": "''",
+            "token": "gen_random_uuid()",
+            "is_renewed": "TRUE",
+        },
+        params={
+            "new_campaign_id": new_campaign_id,
+            "draft": ContractStatus.DRAFT,
+        },
+    )
+    _copy_rows(
+        cursor,
+        members_models.ContractCreditInfo,
+        source_from=(
+            f"{_table(members_models.ContractCreditInfo)} src "
+            f"JOIN {_table(members_models.Contract)} contract "
+            "ON contract.id = src.contract_id"
+        ),
+        source_where=_is_copied(members_models.Contract, "src.contract_id"),
+        values={
+            "contract_id": _new_id(members_models.Contract, "src.contract_id"),
+            "user_campaign_id": _new_id(
+                UserCampaign,
+                "contract.created_by_id",
+            ),
+        },
+    )
+
+
+def _rename_renewed_contracts(new_campaign_id: int) -> None:
+    """Add version numbers to duplicated names of renewed contracts.
+
+    Same as `update_renewal_contract_names`, contracts with the same name
+    are numbered in order of their signing.
+
+    """
+    contracts_table = _table(members_models.Contract)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {contracts_table} contract "
+            "SET name = CASE WHEN ranked.position > 1 "
+            "THEN CONCAT(contract.name, ' ', ranked.position - 1) "
+            "ELSE contract.name END, "
+            "signed_at = NULL "
+            "FROM ("
+            "SELECT id, ROW_NUMBER() OVER ("
+            "PARTITION BY name ORDER BY COALESCE(signed_at, NOW()), id"
+            f") AS position FROM {contracts_table} "
+            "WHERE campaign_id = %(campaign_id)s AND deleted_at IS NULL"
+            ") ranked "
+            "WHERE contract.id = ranked.id",
+            {"campaign_id": new_campaign_id},
+        )
+
+
+def _copy_rows(
+    cursor,
+    model: type[Model],
+    source_where: str,
+    values: abc.Mapping[str, str] | None = None,
+    params: abc.Mapping | None = None,
+    source_from: str | None = None,
+) -> None:
+    """Copy model's rows matching `source_where` condition.
+
+    Source row is available as `src` in condition and in `values`, which
+    are SQL expressions of columns which differ from source row.
+
+    """
+    table = _table(model)
+    if _is_soft_deletable(model):
+        source_where = f"src.deleted_at IS NULL AND ({source_where})"
+    _allocate_ids(
+        cursor,
+        model,
+        source_from=source_from or f"{table} src",
+        source_where=source_where,
+        params=params,
+    )
+    _insert_copies(
+        cursor,
+        model,
+        source_from=f"JOIN {table} src ON src.id = id_map.old_id",
+        values=values,
+        params=params,
+    )
+
+
+def _allocate_ids(
+    cursor,
+    model: type[Model],
+    source_from: str,
+    source_where: str,
+    order_by: str = "src.id",
+    params: abc.Mapping | None = None,
+    source_id: str = "src.id",
+    kind: str | None = None,
+) -> str:
+    """Map ids of source rows to new ids from model's sequence.
+
+    Return kind of mapped ids.
+
+    """
+    kind = kind or _get_kind(model)
+    cursor.execute(
+        f"INSERT INTO {ID_MAP_TABLE} (kind, old_id, new_id) "
+        "SELECT %(kind)s, source.id, "
+        "nextval(pg_get_serial_sequence(%(table)s, 'id')) "
+        f"FROM (SELECT {source_id} AS id FROM {source_from} "
+        f"WHERE {source_where} ORDER BY {order_by}) source",
+        {**(params or {}), "kind": kind, "table": model._meta.db_table},
+    )
+    return kind
+
+
+def _insert_copies(
+    cursor,
+    model: type[Model],
+    source_from: str,
+    values: abc.Mapping[str, str] | None = None,
+    params: abc.Mapping | None = None,
+    kind: str | None = None,
+) -> None:
+    """Insert copies of source rows with allocated ids."""
+    values = {"created": "NOW()", "modified": "NOW()", **(values or {})}
+    fields = [
+        field for field in model._meta.concrete_fields
+        if not field.primary_key
+    ]
+    columns = ", ".join(_quote(field.column) for field in fields)
+    expressions = ", ".join(
+        values.get(field.column, f"src.{_quote(field.column)}")
+        for field in fields
+    )
+    cursor.execute(
+        f"INSERT INTO {_table(model)} (id, {columns}) "
+        f"SELECT id_map.new_id, {expressions} "
+        f"FROM {ID_MAP_TABLE} id_map {source_from} "
+        "WHERE id_map.kind = %(kind)s",
+        {**(params or {}), "kind": kind or _get_kind(model)},
+    )
+
+
+@contextlib.contextmanager
+def _id_map() -> abc.Iterator:
+    """Provide cursor with temporary table mapping ids of copied rows."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {ID_MAP_TABLE} ("
+            "kind varchar(64) NOT NULL, "
+            "old_id integer NOT NULL, "
+            "new_id integer NOT NULL, "
+            "PRIMARY KEY (kind, old_id)"
+            ")",
+        )
+        yield cursor
+        cursor.execute(f"DROP TABLE {ID_MAP_TABLE}")
+
+
+def _new_id(model: type[Model], column: str) -> str:
+    """Return SQL expression of copy's id of row referenced by column."""
+    return (
+        f"(SELECT new_id FROM {ID_MAP_TABLE} "
+        f"WHERE kind = '{_get_kind(model)}' AND old_id = {column})"
+    )
+
+
+def _is_copied(model: type[Model], column: str) -> str:
+    """Return SQL condition that row referenced by column is copied."""
+    return (
+        f"{column} IN (SELECT old_id FROM {ID_MAP_TABLE} "
+        f"WHERE kind = '{_get_kind(model)}')"
+    )
+
+
+def _get_kind(model: type[Model]) -> str:
+    """Return kind of model's ids in temporary table."""
+    return model._meta.label_lower
+
+
+def _is_soft_deletable(model: type[Model]) -> bool:
+    """Check if model's deleted rows are marked by `deleted_at`."""
+    return any(field.name == "deleted_at" for field in model._meta.fields)
+
+
+def _table(model: type[Model]) -> str:
+    """Return quoted name of model's table."""
+    return _quote(model._meta.db_table)
+
+
+def _quote(name: str) -> str:
+    """Quote name of table or column."""
+    return connection.ops.quote_name(name)
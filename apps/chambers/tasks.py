@@ -0,0 +1,18 @@
+from config.celery import app
+
+from .models import CampaignRenewalJob
+
+
+@app.task(
+    track_started=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def renew_campaign(job_id):
+    """Call renew campaign on campaign renewal job instance.
+
+    Task is acknowledged after finishing, so if worker dies it is delivered
+    again and job resumes from its first incomplete step.
+
+    """
+    CampaignRenewalJob.objects.get(id=job_id).renew_campaign()
@@ -23,7 +23,8 @@ from apps.campaigns.models import (
     UserCampaign,
 )
 from apps.chambers import factories
-from apps.chambers.models import Chamber, ChamberBranding
+from apps.chambers.constants import CampaignRenewalStep
+from apps.chambers.models import CampaignRenewalJob, Chamber, ChamberBranding
 from apps.incentives.models import Incentive, IncentiveQualifier
 from apps.members.models import Contract
 from apps.users.constants import UserRole
@@ -46,6 +47,7 @@ renew_chamber_campaign_url = partial(
     get_chamber_url,
     action_name="renew-campaign",
 )
+renewal_job_url = partial(get_chamber_url, action_name="get-renewal-job")
 
 
 @pytest.fixture
@@ -926,18 +928,36 @@ def test_renew_chamber_campaign_success_all_config(
     renew_chamber_campaign_config: dict,
     product_categories: list[ProductCategory],
     chamber_full_campaign_data_for_renew,
+    django_capture_on_commit_callbacks,
 ) -> None:
     """Ensure chamber with all done campaigns can renew successfully."""
     api_client.force_authenticate(super_admin)
-    response = api_client.post(
-        renew_chamber_campaign_url(kwargs={"pk": chamber.pk}),
-        data=renew_chamber_campaign_config,
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            renew_chamber_campaign_url(kwargs={"pk": chamber.pk}),
+            data=renew_chamber_campaign_config,
+        )
     campaign_renew_name_list = (
         completed_campaign.name,
         renew_chamber_campaign_config["name"],
     )
+    assert response.status_code == status.HTTP_202_ACCEPTED, response.data
+    response = api_client.get(
+        renewal_job_url(
+            kwargs={
+                "pk": chamber.pk,
+                "job_id": response.data["renewal_job_id"],
+            },
+        ),
+    )
     assert response.status_code == status.HTTP_200_OK, response.data
+    assert response.data["status"] == CampaignRenewalJob.RenewalStatus.RENEWED
+    assert response.data["progress"] == 100
+    assert response.data["result"]["level_instances"] == (
+        LevelInstance.objects.filter(
+            level__product__category__campaign_id=response.data["campaign"],
+        ).count()
+    )
     assert Campaign.objects.filter(
         name__in=campaign_renew_name_list,
         chamber=completed_campaign.chamber,
@@ -979,3 +999,31 @@ def test_renew_chamber_campaign_success_all_config(
         level__product__category__campaign=renew_campaign,
         contract__in=contracts,
     ).count() == 16
+
+
+def test_renewal_job_resumes_from_incomplete_step(
+    chamber: Chamber,
+    completed_campaign: Campaign,
+    renew_chamber_campaign_config: dict,
+    product_categories: list[ProductCategory],
+    chamber_full_campaign_data_for_renew,
+) -> None:
+    """Ensure restarted renewal job doesn't repeat completed steps."""
+    previous_campaign_id = completed_campaign.id
+    completed_campaign.renew(name="Renewed Campaign", year=2023)
+    job = CampaignRenewalJob.objects.create(
+        chamber=chamber,
+        previous_campaign_id=previous_campaign_id,
+        campaign=completed_campaign,
+        job_kwargs=renew_chamber_campaign_config,
+        completed_steps=[CampaignRenewalStep.INVENTORY],
+    )
+    job.renew_campaign()
+    job.refresh_from_db()
+    assert job.status == CampaignRenewalJob.RenewalStatus.RENEWED
+    assert job.completed_steps == list(CampaignRenewalStep.values)
+    assert not ProductCategory.objects.filter(
+        campaign=completed_campaign,
+    ).exists()
+    assert Incentive.objects.filter(campaign=completed_campaign).exists()
+    assert UserCampaign.objects.filter(campaign=completed_campaign).exists()
@@ -7,6 +7,7 @@ from rest_framework.test import APIClient
 
 import pytest
 
+from apps.chambers.factories import StoredMemberFactory
 from apps.chambers.models import Chamber, StoredMember, StoredMemberContact
 from apps.users.constants import UserRole
 from apps.users.factories import UserFactory
@@ -132,3 +133,33 @@ def test_cannot_create_stored_member_with_duplicate_contact_emails(
         error["attr"] for error in response.data["errors"]
     ]
     assert error_attrs == ["contacts.0.email", "contacts.2.email"]
+
+
+def test_search_stored_members(chamber: Chamber, api_client: APIClient):
+    """Ensure members are found by parts of words and ranked by similarity."""
+    api_client.force_authenticate(
+        UserFactory(role=UserRole.CHAMBER_ADMIN, chamber=chamber),
+    )
+    for name in (
+        "Bakeryland Supplies",
+        "Springfield Bakery",
+        "Shelbyville Hardware",
+    ):
+        StoredMemberFactory(chamber=chamber, name=name, address="")
+
+    response = api_client.get(list_stored_member_url, {"search": "bakery"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [member["name"] for member in response.data["results"]] == [
+        "Springfield Bakery",
+        "Bakeryland Supplies",
+    ]
+
+    response = api_client.get(
+        list_stored_member_url,
+        {"search": "ield bak"},
+    )
+
+    assert [member["name"] for member in response.data["results"]] == [
+        "Springfield Bakery",
+    ]
@@ -0,0 +1,104 @@
+import pytest
+import tablib
+
+from apps.chambers.factories import StoredMemberFactory
+from apps.chambers.models import Chamber, StoredMember, StoredMemberContact
+from apps.chambers.resources import StoredMemberImportResource
+
+HEADERS = (
+    "Company Name",
+    "Company Address",
+    "City",
+    "State",
+    "Zip",
+    "Company Phone Number",
+    "Contact First Name",
+    "Contact Last Name",
+    "Contact Email",
+    "Contact Work Phone",
+    "Contact Mobile Phone",
+)
+
+
+def _get_row(
+    name: str,
+    email: str,
+    first_name: str = "John",
+    zip_code: str = "12345",
+) -> tuple:
+    """Return row of stored members import file."""
+    return (
+        name,
+        "Main Street",
+        "Springfield",
+        "CA",
+        zip_code,
+        "",
+        first_name,
+        "Doe",
+        email,
+        "",
+        "",
+    )
+
+
+def test_stored_members_bulk_import(
+    chamber: Chamber,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure members and contacts are created and updated in batches."""
+    existing_member = StoredMemberFactory(chamber=chamber, name="Existing")
+    StoredMemberContact.objects.create(
+        stored_member=existing_member,
+        email="existing@example.com",
+        first_name="Old",
+    )
+    dataset = tablib.Dataset(
+        _get_row("Existing", "existing@example.com", first_name="New"),
+        _get_row("First", "first@example.com"),
+        _get_row("Second", "second@example.com"),
+        _get_row("First", "other@example.com"),
+        ("",) * len(HEADERS),
+        _get_row("Third", "third@example.com"),
+        headers=HEADERS,
+    )
+    monkeypatch.setattr(StoredMemberImportResource._meta, "batch_size", 2)
+    resource = StoredMemberImportResource(chamber_id=chamber.pk)
+
+    result = resource.import_data(dataset, use_transactions=True)
+
+    assert not result.has_errors()
+    members = StoredMember.objects.filter(chamber=chamber)
+    assert sorted(members.values_list("name", flat=True)) == [
+        "Existing",
+        "First",
+        "Second",
+        "Third",
+    ]
+    contacts = StoredMemberContact.objects.filter(
+        stored_member__chamber=chamber,
+    )
+    assert sorted(
+        contacts.values_list("stored_member__name", "email", "first_name"),
+    ) == [
+        ("Existing", "existing@example.com", "New"),
+        ("First", "first@example.com", "John"),
+        ("First", "other@example.com", "John"),
+        ("Second", "second@example.com", "John"),
+        ("Third", "third@example.com", "John"),
+    ]
+
+
+def test_stored_members_bulk_import_row_errors(chamber: Chamber) -> None:
+    """Ensure invalid rows are reported with their numbers."""
+    dataset = tablib.Dataset(
+        _get_row("First", "first@example.com"),
+        _get_row("Second", "second@example.com", zip_code="1234"),
+        headers=HEADERS,
+    )
+    resource = StoredMemberImportResource(chamber_id=chamber.pk)
+
+    result = resource.import_data(dataset, use_transactions=True)
+
+    assert [number for number, _ in result.row_errors()] == [2]
+    assert not StoredMember.objects.filter(chamber=chamber).exists()
@@ -0,0 +1,233 @@
+import pytest
+
+from apps.campaigns.constants import CampaignStatus
+from apps.campaigns.models import (
+    Campaign,
+    Level,
+    LevelInstance,
+    Product,
+    ProductAttachment,
+    ProductCategory,
+    Team,
+    UserCampaign,
+)
+from apps.chambers import services, sql_renewal
+from apps.chambers.constants import CampaignRenewalStep
+from apps.chambers.models import CampaignRenewalJob
+from apps.members.models import Contract, ContractCreditInfo
+
+RENEW_CONFIG = {
+    "inventory": True,
+    "incentives": True,
+    "users": True,
+    "contracts": True,
+}
+
+
+def _get_renewed_data(campaign: Campaign) -> dict[str, list[tuple]]:
+    """Return renewed campaign's data without ids, tokens and timestamps."""
+    querysets = {
+        "product_categories": ProductCategory.objects.filter(
+            campaign=campaign,
+        ).values_list("name", "order"),
+        "products": Product.objects.filter(
+            category__campaign=campaign,
+        ).values_list(
+            "category__name",
+            "name",
+            "order",
+            "is_included_in_renewal",
+        ),
+        "product_attachments": ProductAttachment.objects.filter(
+            product__category__campaign=campaign,
+        ).values_list("product__name", "name"),
+        "levels": Level.objects.filter(
+            product__category__campaign=campaign,
+        ).values_list("product__name", "name", "cost", "amount", "order"),
+        "level_instances": LevelInstance.objects.filter(
+            level__product__category__campaign=campaign,
+        ).values_list(
+            "level__product__name",
+            "level__name",
+            "cost",
+            "declined_at",
+            "contract__name",
+        ),
+        "teams": Team.objects.filter(campaign=campaign).values_list("name"),
+        "user_campaigns": UserCampaign.objects.filter(
+            campaign=campaign,
+        ).values_list("email", "role", "team__name"),
+        "contracts": Contract.all_objects.filter(
+            campaign=campaign,
+        ).values_list(
+            "name",
+            "status",
+            "type",
+            "created_by__email",
+            "member__name",
+            "is_renewed",
+            "signed_at",
+            "approved_at",
+            "signature",
+            "deleted_at__isnull",
+        ),
+        "contract_credits": ContractCreditInfo.objects.filter(
+            contract__campaign=campaign,
+        ).values_list(
+            "contract__name",
+            "user_campaign__email",
+            "portion",
+        ),
+    }
+    return {
+        name: sorted(queryset, key=repr)
+        for name, queryset in querysets.items()
+    }
+
+
+def test_sql_renewal_matches_python_renewal(
+    completed_campaign: Campaign,
+    chamber_full_campaign_data_for_renew,
+) -> None:
+    """Ensure set-based renewal copies the same data as Python renewal."""
+    ContractCreditInfo.objects.bulk_create(
+        ContractCreditInfo(
+            contract=contract,
+            user_campaign_id=contract.created_by_id,
+            portion=1,
+        )
+        for contract in Contract.objects.filter(campaign=completed_campaign)
+    )
+    python_campaign = Campaign.objects.get(pk=completed_campaign.pk)
+    python_campaign.renew(name="Python Renewal", year=2030)
+    instances_map = services.renew_campaign_inventory(
+        completed_campaign.pk,
+        python_campaign,
+        **RENEW_CONFIG,
+    )
+    services.renew_campaign_users_and_contracts(
+        completed_campaign.pk,
+        python_campaign,
+        instances_map,
+        **RENEW_CONFIG,
+    )
+    # Allow one more ongoing campaign
+    Campaign.objects.filter(pk=python_campaign.pk).update(
+        status=CampaignStatus.DONE,
+    )
+
+    sql_campaign = Campaign.objects.get(pk=completed_campaign.pk)
+    sql_campaign.renew(name="SQL Renewal", year=2030)
+    instances_map = sql_renewal.renew_campaign_inventory(
+        completed_campaign.pk,
+        sql_campaign.pk,
+        **RENEW_CONFIG,
+    )
+    sql_renewal.renew_campaign_users_and_contracts(
+        completed_campaign.pk,
+        sql_campaign.pk,
+        instances_map,
+        **RENEW_CONFIG,
+    )
+
+    python_data = _get_renewed_data(python_campaign)
+    assert python_data["level_instances"]
+    assert python_data["contract_credits"]
+    assert _get_renewed_data(sql_campaign) == python_data
+    assert not LevelInstance.objects.filter(
+        level__product__category__campaign=sql_campaign,
+    ).exclude(contract__campaign=sql_campaign).exclude(
+        contract__isnull=True,
+    ).exists()
+
+
+def _get_contracts_instances(campaign_id: int) -> set[tuple[int, int]]:
+    """Return pairs of ids of campaign's contracts and their instances."""
+    return set(
+        LevelInstance.objects.filter(
+            contract__campaign_id=campaign_id,
+        ).values_list("contract_id", "id"),
+    )
+
+
+def test_failed_renewal_keeps_previous_contracts(
+    completed_campaign: Campaign,
+    chamber_full_campaign_data_for_renew,
+    monkeypatch,
+) -> None:
+    """Ensure renewed instances aren't attached to previous contracts."""
+    contracts_instances = _get_contracts_instances(completed_campaign.pk)
+    assert contracts_instances
+    job = services.start_campaign_renewal(
+        chamber=completed_campaign.chamber,
+        validated_data={"name": "Renewal", "year": 2030, **RENEW_CONFIG},
+    )
+
+    def fail_users_step(job: CampaignRenewalJob) -> None:
+        raise RuntimeError("Users step failed")
+
+    monkeypatch.setitem(
+        services.RENEWAL_STEPS,
+        CampaignRenewalStep.USERS,
+        fail_users_step,
+    )
+    job.renew_campaign()
+
+    job.refresh_from_db()
+    assert job.status == CampaignRenewalJob.RenewalStatus.RENEWAL_ERROR
+    assert job.completed_steps == [
+        CampaignRenewalStep.INVENTORY,
+        CampaignRenewalStep.INCENTIVES,
+    ]
+    assert LevelInstance.objects.filter(
+        level__product__category__campaign_id=job.campaign_id,
+    ).exists()
+    assert _get_contracts_instances(completed_campaign.pk) == (
+        contracts_instances
+    )
+
+
+def test_failed_renewal_is_resumed(
+    completed_campaign: Campaign,
+    chamber_full_campaign_data_for_renew,
+    monkeypatch,
+) -> None:
+    """Ensure failed renewal is resumed from its incomplete step."""
+    job = services.start_campaign_renewal(
+        chamber=completed_campaign.chamber,
+        validated_data={"name": "Renewal", "year": 2030, **RENEW_CONFIG},
+    )
+    with pytest.raises(ValueError, match="incorrect status"):
+        job.resume_renewal()
+    renew_users = services.RENEWAL_STEPS[CampaignRenewalStep.USERS]
+
+    def fail_users_step(job: CampaignRenewalJob) -> None:
+        raise RuntimeError("Users step failed")
+
+    monkeypatch.setitem(
+        services.RENEWAL_STEPS,
+        CampaignRenewalStep.USERS,
+        fail_users_step,
+    )
+    job.renew_campaign()
+    monkeypatch.setitem(
+        services.RENEWAL_STEPS,
+        CampaignRenewalStep.USERS,
+        renew_users,
+    )
+    job.refresh_from_db()
+    task_id = job.task_id
+    job.resume_renewal()
+
+    job.refresh_from_db()
+    assert job.task_id != task_id
+    assert not job.error_message
+    job.renew_campaign()
+
+    job.refresh_from_db()
+    assert job.status == CampaignRenewalJob.RenewalStatus.RENEWED
+    assert job.progress == 100
+    assert job.result["product_categories"] == ProductCategory.objects.filter(
+        campaign_id=completed_campaign.pk,
+    ).count()
+    assert _get_contracts_instances(job.campaign_id)
@@ -1,6 +1,7 @@
 from rest_framework.permissions import BasePermission, IsAuthenticated
 
 from apps.campaigns.constants import CampaignStatus, UserCampaignRole
+from apps.campaigns.services import get_campaign_context
 from apps.users.constants import UserRole
 
 
@@ -27,23 +28,26 @@ class IsChamberChair(BasePermission):
     def has_permission(self, request, view):
         """Allow if user is campaign's chair."""
         campaign = getattr(request, "campaign", None)
-        if not self._is_chamber_chair(request.user, campaign):
+        if not self._is_chamber_chair(request, campaign):
             return False
         return super().has_permission(request, view)
 
     def has_object_permission(self, request, view, obj):
         """Allow if user is campaign's chair."""
         campaign = getattr(request, "campaign", None)
-        if not self._is_chamber_chair(request.user, campaign):
+        if not self._is_chamber_chair(request, campaign):
             return False
         return super().has_object_permission(request, view, obj)
 
     @staticmethod
-    def _is_chamber_chair(user, campaign) -> bool:
-        """Check if user has chair role in campaign."""
+    def _is_chamber_chair(request, campaign) -> bool:
+        """Check if request's user has chair role in campaign."""
         if not campaign:
             return False
-        user_campaign = user.user_campaigns.filter(campaign=campaign).first()
+        user_campaign = get_campaign_context(request).get_user_campaign_info(
+            request.user.id,
+            campaign.id,
+        )
         if not user_campaign:
             return False
         return user_campaign.role == UserCampaignRole.CHAMBER_CHAIR
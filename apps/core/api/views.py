@@ -9,9 +9,8 @@ from libs.open_api.extend_schema import (
 )
 
 from apps.campaigns import models as campaigns_models
-from apps.chambers.models import Chamber
 
-from ...campaigns.services import get_chamber_newest_campaign
+from ...campaigns.services import get_campaign_context
 from ...users.constants import UserRole
 from . import mixins as core_mixins
 from .permissions import (
@@ -98,12 +97,12 @@ class ChamberAPIViewMixin:
             return None
 
         campaign_id = self.get_selected_campaign_id(request)
-        if not campaign_id:
+        if not campaign_id.isdigit():
             return None
-        return campaigns_models.Campaign.objects.filter(
-            id=campaign_id,
-            chamber_id=request.user.chamber_id,
-        ).first()
+        campaign = get_campaign_context(request).get_campaign(int(campaign_id))
+        if not campaign or campaign.chamber_id != request.user.chamber_id:
+            return None
+        return campaign
 
     def get_selected_campaign_id(self, request):
         """Return the currently selected campaign's id."""
@@ -145,19 +144,21 @@ class VolunteerBaseViewSet(BaseViewSet):
             return None
 
         if not self.is_user_super_admin:
-            return get_chamber_newest_campaign(chamber=request.user.chamber)
-
-        chamber = self._get_current_accessed_chamber(request)
-        if not chamber:
+            chamber_id = request.user.chamber_id
+        else:
+            chamber_id = self._get_current_accessed_chamber_id(request)
+        if not chamber_id:
             return None
-        return get_chamber_newest_campaign(chamber=chamber)
+        return get_campaign_context(request).get_chamber_newest_campaign(
+            chamber_id,
+        )
 
-    def _get_current_accessed_chamber(self, request):
+    def _get_current_accessed_chamber_id(self, request) -> int | None:
         """Return the current accessed chamber's id."""
         chamber_id = str(request.query_params.get("chamber", ""))
-        if not chamber_id or not chamber_id.isdigit():
+        if not chamber_id.isdigit():
             return None
-        return Chamber.objects.filter(id=chamber_id).first()
+        return int(chamber_id)
 
     @property
     def is_user_super_admin(self) -> bool:
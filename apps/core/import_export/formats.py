@@ -1,16 +1,86 @@
+import csv
+import io
+import itertools
+import typing
+from collections import abc
+
 from import_export.formats import base_formats
-from tablib.core import Dataset
+from openpyxl import load_workbook
 
 
-class XLSX(base_formats.XLSX):
-    """Custom XLSX format."""
+class StreamingDataset:
+    """Represent rows of import file which are read while importing.
+
+    Unlike `tablib.Dataset`, rows are not kept in memory: file is read once
+    to find headers and number of rows, and then on each iteration. Empty
+    rows at the end of file are not counted and not iterated, spreadsheets
+    often contain thousands of them.
+
+    """
+
+    def __init__(
+        self,
+        read_rows: abc.Callable[[], abc.Iterator[abc.Sequence]],
+    ):
+        self.read_rows = read_rows
+        rows = self.read_rows()
+        self.headers = list(next(rows, ()))
+        self.height = 0
+        for index, row in enumerate(rows, 1):
+            if any(value not in (None, "") for value in row):
+                self.height = index
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> abc.Iterator[list]:
+        for row in itertools.islice(self.read_rows(), 1, self.height + 1):
+            yield self._pad_row(row)
+
+    @property
+    def width(self) -> int:
+        """Return number of columns."""
+        return len(self.headers)
+
+    def _pad_row(self, row: abc.Sequence) -> list:
+        """Fill missing trailing cells of a row with empty strings."""
+        return [*row, *[""] * (self.width - len(row))]
 
-    def create_dataset(self, in_stream):
-        """Use the provided logic from tablib to avoid errors.
 
-        See https://github.com/jazzband/tablib/issues/561
+class CSV(base_formats.CSV):
+    """CSV format read row by row."""
 
-        Might revert to use import_export's class if it's fixed in v4.
+    def create_dataset(self, in_stream, **kwargs) -> StreamingDataset:
+        """Return dataset which parses CSV rows on iteration."""
+        if isinstance(in_stream, bytes):
+            in_stream = in_stream.decode(self.encoding or "utf-8")
+
+        def read_rows() -> abc.Iterator[list[str]]:
+            yield from csv.reader(io.StringIO(in_stream))
+
+        return StreamingDataset(read_rows)
+
+
+class XLSX(base_formats.XLSX):
+    """XLSX format read row by row."""
+
+    def create_dataset(self, in_stream) -> StreamingDataset:
+        """Return dataset which reads rows of read-only workbook.
+
+        Workbook is opened in read-only mode, which parses sheet's rows on
+        iteration instead of loading all cells.
 
         """
-        return Dataset().load(in_stream=in_stream, format=self.get_extension())
+
+        def read_rows() -> abc.Iterator[tuple[typing.Any, ...]]:
+            workbook = load_workbook(
+                io.BytesIO(in_stream),
+                read_only=True,
+                data_only=True,
+            )
+            try:
+                yield from workbook.active.iter_rows(values_only=True)
+            finally:
+                workbook.close()
+
+        return StreamingDataset(read_rows)
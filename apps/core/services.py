@@ -1,4 +1,5 @@
 import re
+import typing
 
 from ordered_model.models import OrderedModel
 
@@ -12,3 +13,33 @@ def get_order_for_new_instance(instance: OrderedModel) -> int:
 def normalize_phone_number(phone_number: str) -> str:
     """Return normalized phone numbers."""
     return re.sub(r"\D", "", phone_number)
+
+
+class QueriesCounter:
+    """Count queries executed by database connection.
+
+    Use as `connection.execute_wrapper(counter)`.
+
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueriesRecorder:
+    """Record queries executed by database connection with their params.
+
+    Use as `connection.execute_wrapper(recorder)`.
+
+    """
+
+    def __init__(self):
+        self.queries: list[tuple[str, typing.Any]] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, params))
+        return execute(sql, params, many, context)
@@ -1,12 +1,15 @@
 from django.urls import reverse
 
-from rest_framework.test import APIClient
+from rest_framework import exceptions
+from rest_framework.test import APIClient, APIRequestFactory
 
 import pytest
 from knox.models import AuthToken
 
+from apps.campaigns.factories import UserCampaignFactory
 from apps.chambers import factories as chamber_factories
 from apps.chambers import models as chamber_models
+from apps.core.api.auth import TokenAuthentication
 from apps.users import factories as user_factories
 from apps.users import models as user_models
 from apps.users.constants import UserRole
@@ -185,3 +188,64 @@ def test_non_super_admin_impersonation(
     assert response.status_code == 200, response.data
     assert response.data["user_id"] == user.id
     assert response.data["auth_user_id"] == user.id
+
+
+def _authenticate(token: str, **headers) -> tuple:
+    """Authenticate request with token and headers."""
+    request = APIRequestFactory().get(
+        "/",
+        HTTP_AUTHORIZATION=f"Token {token}",
+        **{
+            f"HTTP_{header.upper()}": value
+            for header, value in headers.items()
+        },
+    )
+    return TokenAuthentication().authenticate(request)
+
+
+def test_cached_impersonation_without_queries(
+    super_admin_token: str,
+    super_admin: user_models.User,
+    chamber_admin: user_models.User,
+    django_assert_num_queries,
+):
+    """Ensure warm requests are authenticated without queries."""
+    user, auth_token = _authenticate(
+        super_admin_token,
+        chamber=str(chamber_admin.chamber_id),
+    )
+
+    with django_assert_num_queries(0):
+        cached_user, cached_auth_token = _authenticate(
+            super_admin_token,
+            chamber=str(chamber_admin.chamber_id),
+        )
+    assert cached_user == user == chamber_admin
+    assert cached_auth_token == auth_token
+    assert cached_auth_token.user == super_admin
+
+
+def test_cached_token_is_not_authenticated_after_logout(
+    super_admin_token: str,
+    super_admin: user_models.User,
+):
+    """Ensure deleted token is dropped from authentication cache."""
+    _, auth_token = _authenticate(super_admin_token)
+
+    auth_token.delete()
+
+    with pytest.raises(exceptions.AuthenticationFailed):
+        _authenticate(super_admin_token)
+
+
+def test_cached_token_is_not_authenticated_after_deactivation(
+    chamber_admin_token: str,
+    chamber_admin: user_models.User,
+):
+    """Ensure tokens expired by deactivation are dropped from cache."""
+    _authenticate(chamber_admin_token)
+
+    UserCampaignFactory(user=chamber_admin).deactivate()
+
+    with pytest.raises(exceptions.AuthenticationFailed):
+        _authenticate(chamber_admin_token)
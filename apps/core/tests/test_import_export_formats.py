@@ -0,0 +1,32 @@
+import pytest
+import tablib
+
+from apps.core.import_export import formats
+
+
+@pytest.mark.parametrize(
+    "file_format",
+    [formats.CSV(), formats.XLSX()],
+)
+def test_streaming_dataset_skips_trailing_empty_rows(file_format) -> None:
+    """Ensure streamed rows exclude empty rows at the end of file."""
+    dataset = tablib.Dataset(
+        ("Company 1", "12345"),
+        ("", ""),
+        ("Company 2", "54321"),
+        headers=("Company Name", "Zip"),
+    )
+    for _ in range(100):
+        dataset.append(("", ""))
+
+    streaming_dataset = file_format.create_dataset(
+        file_format.export_data(dataset),
+    )
+
+    assert streaming_dataset.headers == ["Company Name", "Zip"]
+    assert len(streaming_dataset) == 3
+    assert [row[0] for row in streaming_dataset] == [
+        "Company 1",
+        None if file_format.is_binary() else "",
+        "Company 2",
+    ]
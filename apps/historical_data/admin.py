@@ -25,6 +25,7 @@ class DataImportJobAdmin(BaseAdmin):
                     "status",
                     "traceback",
                     "error_message",
+                    "completed_stages",
                     "result",
                 ),
             },
@@ -35,8 +36,18 @@ class DataImportJobAdmin(BaseAdmin):
         "status",
         "traceback",
         "error_message",
+        "completed_stages",
         "result",
     )
+    actions = ("resume_import",)
+
+    @admin.action(description="Resume failed imports")
+    def resume_import(self, request, queryset):
+        """Resume failed imports from their incomplete stages."""
+        jobs = queryset.filter(status=DataImportJob.ImportStatus.IMPORT_ERROR)
+        for job in jobs:
+            job.resume_import()
+        self.message_user(request, f"Resumed {len(jobs)} import jobs")
 
     # pylint: disable=unused-argument
     def has_change_permission(self, request, *args, **kwargs):
@@ -0,0 +1,19 @@
+from django.db.models import TextChoices
+from django.utils.translation import gettext_lazy as _
+
+
+class DataImportStage(TextChoices):
+    """Represent stages of historical data import in order of execution."""
+
+    CHAMBERS = "chambers", _("Chambers")
+    USERS = "users", _("Users")
+    USER_CAMPAIGNS = "user_campaigns", _("User Campaigns")
+    INVENTORY = "inventory", _("Inventory")
+    INCENTIVES = "incentives", _("Incentives")
+    REWARDS = "rewards", _("Rewards")
+    RESOURCES = "resources", _("Resources")
+    STORED_MEMBERS = "stored_members", _("Stored Members")
+    STORED_MEMBER_CONTACTS = "stored_member_contacts", _(
+        "Stored Member Contacts",
+    )
+    CONTRACTS = "contracts", _("Contracts")
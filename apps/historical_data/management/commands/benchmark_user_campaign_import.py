@@ -0,0 +1,138 @@
+import sqlite3
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.campaigns.constants import CampaignStatus
+from apps.campaigns.models import Campaign, Team
+from apps.chambers.models import Chamber
+from apps.core.services import QueriesCounter
+from apps.users.constants import UserRole
+from apps.users.models import User
+
+from ...services import ConnectionWrapper
+from ...services.user_campaigns import import_chamber_user_campaigns
+
+# Start of generated external ids, so they don't clash with imported ones
+EXTERNAL_ID_OFFSET = 10**9
+TEAMS_PER_CAMPAIGN = 5
+
+
+class Command(BaseCommand):
+    """Measure import of user campaigns for generated users."""
+
+    help = (
+        "Import user campaigns of generated users and campaigns into "
+        "chamber for a quarter, a half and all of users, and report "
+        "timings and number of queries. Imported data is rolled back"
+    )
+
+    def add_arguments(self, parser):
+        """Add chamber and number of generated users and campaigns."""
+        parser.add_argument("chamber_id", type=int)
+        parser.add_argument("--users", type=int, default=2000)
+        parser.add_argument("--campaigns", type=int, default=10)
+
+    def handle(self, *args, chamber_id, users, campaigns, **options):
+        """Run import for growing number of users."""
+        chamber = Chamber.objects.get(id=chamber_id)
+        for users_count in (users // 4, users // 2, users):
+            with transaction.atomic():
+                self.benchmark(chamber, users_count, campaigns)
+                transaction.set_rollback(True)
+
+    def benchmark(self, chamber: Chamber, users: int, campaigns: int):
+        """Generate data, import user campaigns and report results."""
+        old_campaign_ids = self.generate_campaigns(chamber, campaigns)
+        legacy_connection = self.generate_users(chamber, users)
+        cursor = ConnectionWrapper(connect=lambda: legacy_connection).cursor()
+
+        counter = QueriesCounter()
+        started_at = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            user_campaign_ids = import_chamber_user_campaigns(
+                cursor,
+                old_campaign_ids,
+                chamber,
+            )
+        duration = time.perf_counter() - started_at
+
+        self.stdout.write(
+            f"Users: {users}, campaigns: {campaigns}, "
+            f"user campaigns: {len(user_campaign_ids)}, "
+            f"queries: {counter.count}, time: {duration:.2f}s, "
+            f"per user campaign: "
+            f"{duration * 10**6 / max(len(user_campaign_ids), 1):.0f}us",
+        )
+
+    @staticmethod
+    def generate_campaigns(chamber: Chamber, campaigns: int) -> list[int]:
+        """Create imported campaigns with teams, return their old ids."""
+        new_campaigns = Campaign.objects.bulk_create(
+            Campaign(
+                name=f"Campaign {index}",
+                year=2000 + index,
+                chamber=chamber,
+                status=CampaignStatus.DONE,
+                external_id=EXTERNAL_ID_OFFSET + index,
+            )
+            for index in range(campaigns)
+        )
+        Team.objects.bulk_create(
+            Team(
+                name=f"Team {team_id}",
+                campaign=campaign,
+                external_id=team_id,
+            )
+            for campaign in new_campaigns
+            for team_id in range(TEAMS_PER_CAMPAIGN)
+        )
+        return [campaign.external_id for campaign in new_campaigns]
+
+    @staticmethod
+    def generate_users(chamber: Chamber, users: int) -> sqlite3.Connection:
+        """Create imported users and return legacy database of them.
+
+        Every fiftieth user is a team captain.
+
+        """
+        User.objects.bulk_create(
+            User(
+                chamber=chamber,
+                email=f"benchmark-{chamber.id}-{index}@example.com",
+                first_name=f"First {index}",
+                last_name=f"Last {index}",
+                role=UserRole.VOLUNTEER,
+                external_id=EXTERNAL_ID_OFFSET + index,
+            )
+            for index in range(users)
+        )
+        legacy_connection = sqlite3.connect(":memory:")
+        legacy_connection.execute(
+            """
+            CREATE TABLE users (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                team INTEGER,
+                chamber INTEGER,
+                captain INTEGER,
+                vice_chair INTEGER
+            )
+            """,
+        )
+        legacy_connection.executemany(
+            "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    EXTERNAL_ID_OFFSET + index,
+                    f"First {index} Last {index}",
+                    index % TEAMS_PER_CAMPAIGN,
+                    EXTERNAL_ID_OFFSET,
+                    int(index % 50 == 0),
+                    0,
+                )
+                for index in range(users)
+            ],
+        )
+        return legacy_connection
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.10 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('historical_data', '0002_oldchamber_dataimportjob_target_chamber'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataimportjob',
+            name='completed_stages',
+            field=models.JSONField(default=list, help_text='Import stages which are already committed', verbose_name='Completed stages'),
+        ),
+    ]
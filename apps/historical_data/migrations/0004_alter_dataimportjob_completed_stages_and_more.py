@@ -0,0 +1,23 @@
+# Generated by Django 4.2.10 on 2026-10-17 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('historical_data', '0003_dataimportjob_completed_stages'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dataimportjob',
+            name='completed_stages',
+            field=models.JSONField(default=list, help_text='Import stages and their parts which are already committed', verbose_name='Completed stages'),
+        ),
+        migrations.AlterField(
+            model_name='dataimportjob',
+            name='result',
+            field=models.JSONField(default=dict, help_text='Number of imported objects per instance and durations of import stages in seconds.', verbose_name='Job result'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+import time
 import traceback
 import uuid
 
@@ -5,13 +6,28 @@ from django.conf import settings
 from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
+import celery
+
 from apps.core.models import BaseModel
-from apps.historical_data.services.importer import import_all_chamber_data
+from apps.historical_data.constants import DataImportStage
+from apps.historical_data.services.importer import (
+    IMPORT_STAGE_LAYERS,
+    get_import_stage_parts,
+    import_chamber_data_stage,
+)
 
 
 # pylint: disable=attribute-defined-outside-init,broad-exception-caught
 class DataImportJob(BaseModel):
-    """Store information on old data import job."""
+    """Store information on old data import job.
+
+    Import is split into stages, each of them is committed in a separate
+    transaction. If a stage fails, resumed job continues from it instead of
+    importing everything again. Stages of independent data are run in
+    parallel, and some of them are also split into parts by old chambers.
+    Result contains number of imported objects and duration of each part.
+
+    """
 
     class ImportStatus(models.TextChoices):
         """ImportJob possible statuses.
@@ -37,6 +53,10 @@ class DataImportJob(BaseModel):
             .import_data()
                |
             IMPORTING - IMPORT_ERROR
+               |              |
+               |          .resume_import()
+               |              |
+               |          IMPORT_CONFIRMED
                |
             IMPORTED
 
@@ -90,11 +110,19 @@ class DataImportJob(BaseModel):
         null=True,
         on_delete=models.SET_NULL,
     )
+    completed_stages = models.JSONField(
+        default=list,
+        verbose_name=_("Completed stages"),
+        help_text=_(
+            "Import stages and their parts which are already committed",
+        ),
+    )
     result = models.JSONField(
         default=dict,
         verbose_name=_("Job result"),
         help_text=_(
-            "Number of imported objects per instance.",
+            "Number of imported objects per instance and durations of "
+            "import stages in seconds.",
         ),
     )
     task_id = models.CharField(
@@ -128,29 +156,121 @@ class DataImportJob(BaseModel):
             task_id=self.task_id,
         )
 
+    @property
+    def chamber_ids(self) -> list[int]:
+        """Return ids of imported old chambers."""
+        return self.job_kwargs.get("chamber_ids", [])
+
+    def get_incomplete_stage_parts(
+        self,
+        stage: DataImportStage,
+    ) -> list[tuple[str, list[int]]]:
+        """Return parts of import stage which are not completed yet.
+
+        Whole stage is completed if it was imported before it was split into
+        parts by old chambers.
+
+        """
+        if stage in self.completed_stages:
+            return []
+        return [
+            (part, chamber_ids)
+            for part, chamber_ids in get_import_stage_parts(
+                stage,
+                self.chamber_ids,
+            )
+            if part not in self.completed_stages
+        ]
+
+    @property
+    def progress(self) -> int:
+        """Return percent of completed import stage parts."""
+        parts_count = 0
+        incomplete_parts_count = 0
+        for stage in DataImportStage:
+            parts_count += len(get_import_stage_parts(stage, self.chamber_ids))
+            incomplete_parts_count += len(
+                self.get_incomplete_stage_parts(stage),
+            )
+        return (parts_count - incomplete_parts_count) * 100 // parts_count
+
+    def resume_import(self):
+        """Restart failed import from the first incomplete stage."""
+        if self.status != self.ImportStatus.IMPORT_ERROR:
+            raise ValueError(
+                f"DataImportJob with id {self.id} has incorrect status: "
+                f"`{self.status}`. Expected status: "
+                f"`{self.ImportStatus.IMPORT_ERROR}`",
+            )
+        self.task_id = str(uuid.uuid4())
+        self.traceback = ""
+        self.error_message = ""
+        self.save(update_fields=["task_id", "traceback", "error_message"])
+        transaction.on_commit(self._start_import)
+
     def import_data(self):
-        """Import data base on kwargs."""
-        chamber_ids = self.job_kwargs.get("chamber_ids", [])
+        """Start import stages which are not completed yet.
+
+        Stages of each layer are run in parallel by celery workers, the next
+        layer is started when all of them are completed.
+
+        """
+        from ..tasks import finish_data_import, import_data_stage_part
         self.status = self.ImportStatus.IMPORTING
         self.save(update_fields=["status"])
-        if not chamber_ids:
+        if not self.chamber_ids:
             self.status = self.ImportStatus.IMPORTED
             self.save(update_fields=["status"])
             return
 
+        layers = []
+        for stages in IMPORT_STAGE_LAYERS:
+            layer = celery.group(
+                import_data_stage_part.si(
+                    job_id=self.pk,
+                    stage=stage,
+                    part=part,
+                    chamber_ids=chamber_ids,
+                )
+                for stage in stages
+                for part, chamber_ids in self.get_incomplete_stage_parts(
+                    stage,
+                )
+            )
+            if layer.tasks:
+                layers.append(layer)
+        celery.chain(*layers, finish_data_import.si(job_id=self.pk)).delay()
+
+    def import_stage_part(
+        self,
+        stage: DataImportStage,
+        part: str,
+        chamber_ids: list[int],
+    ):
+        """Import stage for old chambers and save result with duration."""
+        if self.status != self.ImportStatus.IMPORTING:
+            return
+        started_at = time.perf_counter()
         try:
             with transaction.atomic():
-                self.result = import_all_chamber_data(
+                result = import_chamber_data_stage(
+                    stage,
                     chamber_ids,
-                    target_chamber_id=self.target_chamber_id,
+                    target_chamber=self.target_chamber,
+                )
+                # Parts are completed concurrently, lock job to not lose
+                # results of other ones
+                job = DataImportJob.objects.select_for_update().get(
+                    pk=self.pk,
                 )
-                self.status = self.ImportStatus.IMPORTED
-                self.save(
-                    update_fields=[
-                        "result",
-                        "status",
-                    ],
+                for name, count in result.items():
+                    job.result[name] = job.result.get(name, 0) + count
+                job.result.setdefault("timings", {})[part] = round(
+                    time.perf_counter() - started_at,
+                    2,
                 )
+                job.completed_stages.append(part)
+                job.save(update_fields=["result", "completed_stages"])
         except Exception as error:
             self.traceback = traceback.format_exc()
             self.error_message = str(error)[:128]
@@ -162,3 +282,10 @@ class DataImportJob(BaseModel):
                     "status",
                 ],
             )
+
+    def finish_import(self):
+        """Mark import as completed unless any stage failed."""
+        if self.status != self.ImportStatus.IMPORTING:
+            return
+        self.status = self.ImportStatus.IMPORTED
+        self.save(update_fields=["status"])
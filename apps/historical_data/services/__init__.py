@@ -1,19 +1,51 @@
 import datetime
+import typing
+from collections import abc
 from dataclasses import dataclass, field
 from decimal import Decimal
 
 from django.conf import settings
 
 import MySQLdb
+import MySQLdb.cursors
 
 from apps.core.services import normalize_phone_number
 
+FETCH_BATCH_SIZE = 2000
+
+
+class QmarkCursor:
+    """Run legacy queries on DB-API cursor with `qmark` placeholders.
+
+    Legacy queries use MySQL's `%s` placeholders, so they are converted to
+    be run on a stand-in database, like SQLite.
+
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def execute(self, query: str, params: abc.Sequence = ()):
+        """Run query with converted placeholders."""
+        return self.cursor.execute(query.replace("%s", "?"), params)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self.cursor, name)
+
 
 class ConnectionWrapper:
-    """Wraps MySQLdb connection."""
+    """Wraps MySQLdb connection.
 
-    def __init__(self):
+    Cursors are server-side, so selected rows are sent by MySQL while they
+    are fetched instead of being loaded into memory at once. Such cursor
+    must fetch all rows of a query before running the next one.
+
+    """
+
+    def __init__(self, connect: abc.Callable[[], typing.Any] | None = None):
         self.connection = None
+        if connect:
+            self.connect = connect
 
     def get_connection(self) -> MySQLdb.Connection:
         """Get or create connection."""
@@ -35,13 +67,38 @@ class ConnectionWrapper:
         )
 
     def cursor(self):
-        """Get cursor."""
-        return self.get_connection().cursor()
+        """Get server-side cursor, or `qmark` one for stand-in database."""
+        connection = self.get_connection()
+        if isinstance(connection, MySQLdb.Connection):
+            return connection.cursor(MySQLdb.cursors.SSCursor)
+        return QmarkCursor(connection.cursor())
+
+    def close(self):
+        """Close connection if it's open."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
 
 
 connection = ConnectionWrapper()
 
 
+def fetch_in_batches(
+    cursor,
+    query: str,
+    params: abc.Sequence = (),
+    batch_size: int = FETCH_BATCH_SIZE,
+) -> abc.Iterator[list[tuple]]:
+    """Run query and yield selected rows in lists of `batch_size` rows.
+
+    Rows must be fetched completely before cursor runs another query.
+
+    """
+    cursor.execute(query, tuple(params))
+    while rows := cursor.fetchmany(batch_size):
+        yield rows
+
+
 @dataclass
 class ChamberSettingsData:
     """DTO for chamber settings."""
@@ -1,5 +1,6 @@
 from django.db.backends.mysql.base import CursorWrapper
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.constants import CampaignStatus
 from apps.campaigns.models import Campaign
 from apps.chambers.models import Chamber
@@ -83,4 +84,5 @@ def import_chamber_campaigns(
                 ],
             ),
         )
+    campaigns_services.invalidate_chamber_newest_campaign(target_chamber.id)
     return [campaign.id for campaign in new_campaigns]
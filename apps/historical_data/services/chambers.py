@@ -6,6 +6,7 @@ from django.db.backends.mysql.base import CursorWrapper
 
 import requests
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.constants import CampaignStatus
 from apps.campaigns.models import Campaign
 from apps.chambers.models import Chamber
@@ -63,6 +64,7 @@ def import_chambers(
             external_id=old_chamber.id,
         ) for old_chamber in old_chambers
     ])
+    campaigns_services.invalidate_chamber_newest_campaign(target_chamber.id)
     if old_chambers:
         newest_chamber = next(
             iter(
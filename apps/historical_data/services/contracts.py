@@ -1,15 +1,19 @@
 import re
+from collections import abc, defaultdict
 from decimal import Decimal
+from operator import attrgetter
 from typing import Iterable
 
 from django.db.backends.mysql.base import CursorWrapper
-from django.db.models import OuterRef, Q, Subquery
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.constants import UserCampaignRole
 from apps.campaigns.models import Campaign, Level, LevelInstance, UserCampaign
 from apps.chambers.models import Chamber, StoredMember, StoredMemberContact
-from apps.historical_data.services import ContractData
+from apps.historical_data.services import ContractData, fetch_in_batches
+from apps.members import services as members_services
 from apps.members.constants import ContractStatus, ContractType
 from apps.members.models import Contract, ContractCreditInfo, Member
 
@@ -73,44 +77,46 @@ contracts.chamber in ({second_list_of_ids})
 def fetch_contract_data(
     cursor: CursorWrapper,
     old_campaign_ids: Iterable[int],
-) -> list[ContractData]:
-    """Select contracts from old db."""
+) -> abc.Iterator[list[ContractData]]:
+    """Select contracts from old db in batches."""
     query = CONTRACT_FETCH_SQL_TEMPLATE.format(
         first_list_of_ids=", ".join(["%s" for _ in old_campaign_ids]),
         second_list_of_ids=", ".join(["%s" for _ in old_campaign_ids]),
     )
-    cursor.execute(query, tuple(old_campaign_ids) + tuple(old_campaign_ids))
-    raw_contracts = cursor.fetchall()
-    contracts: list[ContractData] = [
-        ContractData(
-            id=contract[0],
-            chamber=contract[1],
-            type=contract[2],
-            sponsorship=contract[3],
-            stored_member=contract[4],
-            member_name=contract[5],
-            member_address=contract[6],
-            member_city=contract[7],
-            member_state=contract[8],
-            member_zipcode=contract[9],
-            member_phone=contract[10],
-            contact=contract[11],
-            contact_first_name=contract[12],
-            contact_last_name=contract[13],
-            contact_work_phone=contract[14],
-            contact_mobile_phone=contract[15],
-            contact_email=contract[16],
-            cost=(
-                Decimal(re.sub(r"\D+", "", contract[17]) or 0)
-                if contract[17] else Decimal(0)
-            ),
-            created_date=contract[18],
-            note=contract[19],
-            signature=contract[20],
-            volunteer_name=contract[21],
-        ) for contract in raw_contracts
-    ]
-    return contracts
+    for raw_contracts in fetch_in_batches(
+        cursor,
+        query,
+        tuple(old_campaign_ids) + tuple(old_campaign_ids),
+    ):
+        yield [
+            ContractData(
+                id=contract[0],
+                chamber=contract[1],
+                type=contract[2],
+                sponsorship=contract[3],
+                stored_member=contract[4],
+                member_name=contract[5],
+                member_address=contract[6],
+                member_city=contract[7],
+                member_state=contract[8],
+                member_zipcode=contract[9],
+                member_phone=contract[10],
+                contact=contract[11],
+                contact_first_name=contract[12],
+                contact_last_name=contract[13],
+                contact_work_phone=contract[14],
+                contact_mobile_phone=contract[15],
+                contact_email=contract[16],
+                cost=(
+                    Decimal(re.sub(r"\D+", "", contract[17]) or 0)
+                    if contract[17] else Decimal(0)
+                ),
+                created_date=contract[18],
+                note=contract[19],
+                signature=contract[20],
+                volunteer_name=contract[21],
+            ) for contract in raw_contracts
+        ]
 
 
 def create_new_credit_instance(contract: ContractData) -> ContractCreditInfo:
@@ -123,15 +129,23 @@ def create_new_credit_instance(contract: ContractData) -> ContractCreditInfo:
 
 
 def create_new_contract_instance(
-    new_members_map: dict[int, int],
+    new_members_map: dict[int, Member],
     contract_type_map: dict[int, str],
     contract: ContractData,
     campaign_id: int,
-    user_campaign: int,
+    user_campaign: UserCampaign | None,
+    product_name: str,
 ) -> Contract:
     """Return new Contract instance."""
+    if user_campaign:
+        name = (
+            f"{product_name} - "
+            f"{user_campaign.first_name} {user_campaign.last_name}"
+        )
+    else:
+        name = f"{contract.member_name or 'Contract'} {contract.created_date}"
     return Contract(
-        name=f"{contract.member_name or 'Contract'} {contract.created_date}",
+        name=name,
         type=contract_type_map.get(contract.type),
         status=ContractStatus.APPROVED,
         note=contract.note or "",
@@ -196,32 +210,66 @@ def create_new_member_instance(
     )
 
 
-def get_user_campaign_id(
-    campaign_id,
-    volunteer_name,
-) -> int:
-    """Return user campaign id value for each campaign id key."""
-    try:
-        first_name, last_name = volunteer_name.split()
-        query = (
-            Q(first_name__iexact=first_name, last_name__iexact=last_name) |
-            Q(first_name__iexact=last_name, last_name__iexact=first_name)
-        )
-    except ValueError:
-        query = (
-            Q(first_name__iexact=volunteer_name) |
-            Q(last_name__iexact=volunteer_name)
-        )
-    user_campaign = UserCampaign.objects.filter(
-        query,
-        campaign_id=campaign_id,
-    ).first()
+class VolunteerNameIndex:
+    """Find campaign's volunteer by name written in legacy contract.
+
+    Two words match first and last names in either order, other names match
+    first or last name, both case-insensitively. Among matching volunteers
+    the earliest created one is returned, and if nobody matches - the one
+    with the lowest role.
 
-    if not user_campaign:
-        user_campaign = UserCampaign.objects.filter(
-            campaign_id=campaign_id,
-        ).order_by("role").first()
-    return user_campaign
+    """
+
+    def __init__(self, user_campaigns: Iterable[UserCampaign]):
+        self.full_names: dict[tuple[str, str], UserCampaign] = {}
+        self.names: dict[str, UserCampaign] = {}
+        self.default: UserCampaign | None = None
+        for user_campaign in sorted(user_campaigns, key=attrgetter("id")):
+            first_name = user_campaign.first_name.lower()
+            last_name = user_campaign.last_name.lower()
+            self.full_names.setdefault((first_name, last_name), user_campaign)
+            self.names.setdefault(first_name, user_campaign)
+            self.names.setdefault(last_name, user_campaign)
+            if self.default is None or user_campaign.role < self.default.role:
+                self.default = user_campaign
+
+    def get(self, volunteer_name: str | None) -> UserCampaign | None:
+        """Return volunteer matching the name."""
+        volunteer_name = (volunteer_name or "").lower()
+        try:
+            first_name, last_name = volunteer_name.split()
+        except ValueError:
+            user_campaign = self.names.get(volunteer_name)
+        else:
+            user_campaign = min(
+                filter(
+                    None,
+                    (
+                        self.full_names.get((first_name, last_name)),
+                        self.full_names.get((last_name, first_name)),
+                    ),
+                ),
+                key=attrgetter("id"),
+                default=None,
+            )
+        return user_campaign or self.default
+
+
+def get_volunteer_name_indexes(
+    campaign_ids: abc.Collection[int],
+) -> dict[int, VolunteerNameIndex]:
+    """Return volunteers' name index for each campaign id key."""
+    campaign_user_campaigns = defaultdict(list)
+    for user_campaign in UserCampaign.objects.filter(
+        campaign_id__in=campaign_ids,
+    ).only("id", "campaign_id", "first_name", "last_name", "role"):
+        campaign_user_campaigns[user_campaign.campaign_id].append(
+            user_campaign,
+        )
+    return {
+        campaign_id: VolunteerNameIndex(campaign_user_campaigns[campaign_id])
+        for campaign_id in campaign_ids
+    }
 
 
 def get_level_ids_map() -> dict[int, int]:
@@ -256,130 +304,106 @@ def get_chamber_campaign_ids_map() -> dict[int, int]:
     )
 
 
-# pylint: disable=too-many-locals,too-many-statements
-def import_contracts(  # noqa: C901
+# pylint: disable=too-many-locals
+def import_contracts(
     cursor: CursorWrapper,
     old_campaign_ids: Iterable[int],
     target_chamber: Chamber,
 ) -> Iterable[int]:
-    """Import old contracts data."""
-    old_contracts: list[ContractData] = fetch_contract_data(
-        cursor=cursor,
-        old_campaign_ids=old_campaign_ids,
-    )
-    new_credits = []
-    new_contacts = []
-    new_level_instances_map = {}
-    new_members_map: dict[int, Member] = {}
-    new_contracts_map = {}
-    sponsorship_to_campaign_map: dict[int, int] = dict(
-        Level.objects.filter(
-            product__category__campaign__chamber_id=target_chamber.id,
-            external_id__isnull=False,
-        ).values_list("external_id", "product__category__campaign_id"),
+    """Import old contracts data.
+
+    Related data of chamber is loaded into maps before import, so the number
+    of queries depends only on number of fetched batches of contracts.
+
+    """
+    contract_ids = []
+    sponsorship_to_campaign_map: dict[int, int] = {}
+    level_ids_map: dict[int, int] = {}
+    product_names_map: dict[int, str] = {}
+    levels = Level.objects.filter(
+        product__category__campaign__chamber_id=target_chamber.id,
+        external_id__isnull=False,
+    ).values_list(
+        "external_id",
+        "id",
+        "product__category__campaign_id",
+        "product__name",
     )
+    for external_id, level_id, campaign_id, product_name in levels:
+        sponsorship_to_campaign_map[external_id] = campaign_id
+        level_ids_map[external_id] = level_id
+        product_names_map[external_id] = product_name
     stored_member_ids_map = get_stored_member_ids_map(target_chamber)
-    level_ids_map = dict(
-        Level.objects.filter(
-            product__category__campaign__chamber_id=target_chamber.id,
-            external_id__isnull=False,
-        ).values_list("external_id", "id"),
-    )
-    old_stored_member_contacts = StoredMemberContact.objects.filter(
+    contact_ids_map: dict[int, int] = {}
+    contact_email_ids_map: dict[str, int] = {}
+    for external_id, email, contact_id in StoredMemberContact.objects.filter(
         stored_member__chamber_id=target_chamber.id,
         external_id__isnull=False,
-    )
-    contact_ids_map: dict[int, int] = dict(
-        old_stored_member_contacts.values_list("external_id", "id"),
-    )
-    contact_email_ids_map: dict[int, int] = dict(
-        old_stored_member_contacts.values_list("email", "id"),
+    ).values_list("external_id", "email", "id"):
+        contact_ids_map[external_id] = contact_id
+        contact_email_ids_map[email] = contact_id
+    volunteer_name_indexes = get_volunteer_name_indexes(
+        set(sponsorship_to_campaign_map.values()),
     )
     contract_type_map = {0: ContractType.TRADE, 1: ContractType.CASH}
-    for contract in old_contracts:
-        campaign_id = sponsorship_to_campaign_map.get(contract.sponsorship)
-        stored_member_id = stored_member_ids_map.get(contract.stored_member)
-        if not campaign_id:
-            continue
-        new_members_map[contract.id] = create_new_member_instance(
-            contract,
-            stored_member_id,
-        )
-        if contract.contact_email and stored_member_id and not (
-            contact_ids_map.get(contract.contact)
-            or contact_email_ids_map.get(contract.contact_email)
-        ):
-            new_contacts.append(
-                create_new_contact_instance(contract, stored_member_id),
+    for old_contracts in fetch_contract_data(
+        cursor=cursor,
+        old_campaign_ids=old_campaign_ids,
+    ):
+        new_credits = []
+        new_contacts = []
+        new_level_instances = []
+        new_members_map: dict[int, Member] = {}
+        new_contracts_map: dict[int, Contract] = {}
+        for contract in old_contracts:
+            campaign_id = sponsorship_to_campaign_map.get(contract.sponsorship)
+            stored_member_id = stored_member_ids_map.get(
+                contract.stored_member,
+            )
+            if not campaign_id:
+                continue
+            new_members_map[contract.id] = create_new_member_instance(
+                contract,
+                stored_member_id,
             )
-        new_level_instances_map[contract.id] = LevelInstance(
-            level_id=level_ids_map.get(contract.sponsorship),
-            cost=contract.cost,
+            if contract.contact_email and stored_member_id and not (
+                contact_ids_map.get(contract.contact)
+                or contact_email_ids_map.get(contract.contact_email)
+            ):
+                new_contacts.append(
+                    create_new_contact_instance(contract, stored_member_id),
+                )
+            volunteer_name_index = volunteer_name_indexes[campaign_id]
+            new_contract = create_new_contract_instance(
+                new_members_map,
+                contract_type_map,
+                contract,
+                campaign_id,
+                volunteer_name_index.get(contract.volunteer_name),
+                product_names_map[contract.sponsorship],
+            )
+            new_contracts_map[contract.id] = new_contract
+            new_credits.append(create_new_credit_instance(new_contract))
+            new_level_instances.append(
+                LevelInstance(
+                    level_id=level_ids_map[contract.sponsorship],
+                    contract=new_contract,
+                    cost=contract.cost,
+                ),
+            )
+        Member.objects.bulk_create(new_members_map.values())
+        StoredMemberContact.objects.bulk_create(new_contacts)
+        new_contracts = Contract.objects.bulk_create(
+            new_contracts_map.values(),
         )
-    Member.objects.bulk_create(new_members_map.values())
-    StoredMemberContact.objects.bulk_create(new_contacts)
-    for contract in old_contracts:
-        campaign_id = sponsorship_to_campaign_map.get(contract.sponsorship)
-        stored_member_id = stored_member_ids_map.get(contract.stored_member)
-        if not campaign_id:
-            continue
-        user_campaign = get_user_campaign_id(
-            campaign_id,
-            contract.volunteer_name,
+        ContractCreditInfo.objects.bulk_create(new_credits)
+        LevelInstance.objects.bulk_create(new_level_instances)
+        batch_contract_ids = [contract.id for contract in new_contracts]
+        members_services.sync_contracts_revenue_entries(
+            contract_ids=batch_contract_ids,
         )
-        new_contracts_map[contract.id] = create_new_contract_instance(
-            new_members_map,
-            contract_type_map,
-            contract,
-            campaign_id,
-            user_campaign,
+        campaigns_services.refresh_contracts_level_inventories(
+            contract_ids=batch_contract_ids,
         )
-    new_contracts = Contract.objects.bulk_create(new_contracts_map.values())
-    for old_contract_id, contract in new_contracts_map.items():
-        level_instance = new_level_instances_map[old_contract_id]
-        level_instance.contract = contract
-        new_credits.append(create_new_credit_instance(contract))
-    ContractCreditInfo.objects.bulk_create(new_credits)
-    LevelInstance.objects.bulk_create(new_level_instances_map.values())
-    contracts_to_update = []
-    # members_to_update = []
-    for new_contract in new_contracts:
-        level_instance = new_contract.levels.select_related(
-            "level__product",
-        ).first()
-        if level_instance:
-            new_contract.name = (
-                f"{level_instance.level.product.name} - "
-                f"{new_contract.created_by.first_name} "
-                f"{new_contract.created_by.last_name}"
-            )
-            contracts_to_update.append(new_contract)
-        # if new_contract.member.stored_member:
-        #     contact = new_contract.member.stored_member.contacts.filter(
-        #         email=new_contract.member.email,
-        #     ).first()
-    #         if contact:
-    #             new_contract.member.name = contact.stored_member.name
-    #             new_contract.member.address = contact.stored_member.address
-    #             new_contract.member.city = contact.stored_member.city
-    #             new_contract.member.state = contact.stored_member.state[:2]
-    #             new_contract.member.first_name = contact.first_name
-    #             new_contract.member.last_name = contact.last_name
-    #             new_contract.member.work_phone = contact.work_phone
-    #             new_contract.member.mobile_phone = contact.mobile_phone
-    #             members_to_update.append(new_contract.member)
-    Contract.objects.bulk_update(contracts_to_update, fields=["name"])
-    # Member.objects.bulk_update(
-    #     members_to_update,
-    #     fields=[
-    #         "name",
-    #         "address",
-    #         "city",
-    #         "state",
-    #         "work_phone",
-    #         "mobile_phone",
-    #         "first_name",
-    #         "last_name",
-    #     ],
-    # )
-    return [contract.id for contract in new_contracts_map.values()]
+        contract_ids.extend(batch_contract_ids)
+    return contract_ids
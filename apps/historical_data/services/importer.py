@@ -1,7 +1,10 @@
+import typing
+from collections import abc
 from typing import Iterable
 
 from apps.campaigns.models import Campaign
 from apps.chambers.models import Chamber, StoredMember
+from apps.historical_data.constants import DataImportStage
 from apps.historical_data.services import connection
 from apps.historical_data.services.chambers import import_chambers
 from apps.historical_data.services.contracts import import_contracts
@@ -15,7 +18,6 @@ from apps.historical_data.services.stored_member_contacts import (
 from apps.historical_data.services.stored_members import (
     import_chamber_stored_members,
 )
-# from apps.historical_data.services.team import import_chamber_teams
 from apps.historical_data.services.user_campaigns import (
     import_chamber_user_campaigns,
 )
@@ -23,61 +25,211 @@ from apps.historical_data.services.users import import_chamber_users
 from apps.members.models import Contract
 
 
-# pylint: disable=too-many-locals
-def import_all_chamber_data(
+def get_imported_campaign_ids(
     old_chamber_ids: Iterable[int],
-    target_chamber_id: int,
-) -> dict[str, int]:
-    """Call all import services for chamber import."""
-    cursor = connection.cursor()
-    target_chamber = Chamber.objects.get(id=target_chamber_id)
+    target_chamber: Chamber,
+) -> list[int]:
+    """Return ids of old chambers imported as target chamber's campaigns."""
+    return list(
+        Campaign.objects.filter(
+            chamber=target_chamber,
+            external_id__in=old_chamber_ids,
+        ).values_list("external_id", flat=True),
+    )
+
+
+def import_chambers_stage(cursor, old_chamber_ids, target_chamber):
+    """Import old chambers as campaigns."""
     campaign_ids = import_chambers(cursor, target_chamber, old_chamber_ids)
+    return {"chambers": len(campaign_ids), "campaigns": len(campaign_ids)}
+
+
+def import_users_stage(cursor, campaign_ids, target_chamber):
+    """Import users of old chambers."""
     user_ids = import_chamber_users(cursor, campaign_ids, target_chamber)
-    # team_ids = import_chamber_teams(cursor, target_chamber)
+    return {"users": len(user_ids)}
+
+
+def import_user_campaigns_stage(cursor, campaign_ids, target_chamber):
+    """Import users' participation in old chambers."""
     user_campaign_ids = import_chamber_user_campaigns(
         cursor,
         campaign_ids,
         target_chamber,
     )
+    return {"user_campaigns": len(user_campaign_ids)}
+
+
+def import_inventory_stage(cursor, campaign_ids, target_chamber):
+    """Import inventory of old chambers."""
     product_category_ids = import_chamber_inventory(
         cursor,
         target_chamber,
+        campaign_ids,
     )
+    return {
+        "product_categories": len(product_category_ids),
+        "products": len(product_category_ids),
+        "levels": len(product_category_ids),
+    }
+
+
+def import_incentives_stage(cursor, campaign_ids, target_chamber):
+    """Import incentives of old chambers."""
     incentive_ids = import_chamber_incentives(
         cursor,
         campaign_ids,
         target_chamber,
     )
+    return {"incentives": len(incentive_ids)}
+
+
+def import_rewards_stage(cursor, campaign_ids, target_chamber):
+    """Import paid rewards of old chambers."""
     reward_ids = import_chamber_rewards(cursor, campaign_ids, target_chamber)
+    return {"rewards": len(reward_ids)}
+
+
+def import_resources_stage(cursor, campaign_ids, target_chamber):
+    """Import resources of old chambers."""
     resource_ids = import_chamber_resources(cursor, target_chamber)
+    return {"resources": len(resource_ids)}
+
+
+def import_stored_members_stage(cursor, campaign_ids, target_chamber):
+    """Import stored members of old chambers."""
     stored_member_ids = import_chamber_stored_members(
         cursor,
         campaign_ids,
         target_chamber,
     )
+    return {"stored_members": len(stored_member_ids)}
+
+
+def import_stored_member_contacts_stage(cursor, campaign_ids, target_chamber):
+    """Import contacts of old chambers' stored members."""
     stored_member_contact_ids = import_chamber_stored_member_contacts(
         cursor,
         campaign_ids,
         target_chamber,
     )
+    return {"stored_member_contacts": len(stored_member_contact_ids)}
+
+
+def import_contracts_stage(cursor, campaign_ids, target_chamber):
+    """Import contracts of old chambers."""
     contract_ids = import_contracts(cursor, campaign_ids, target_chamber)
-    cursor.close()
-    return {
-        "chambers": len(campaign_ids),
-        "users": len(user_ids),
-        "campaigns": len(campaign_ids),
-        "user_campaigns": len(user_campaign_ids),
-        # "teams": len(team_ids),
-        "product_categories": len(product_category_ids),
-        "products": len(product_category_ids),
-        "levels": len(product_category_ids),
-        "incentives": len(incentive_ids),
-        "rewards": len(reward_ids),
-        "resources": len(resource_ids),
-        "stored_members": len(stored_member_ids),
-        "stored_member_contacts": len(stored_member_contact_ids),
-        "contracts": len(contract_ids),
-    }
+    return {"contracts": len(contract_ids)}
+
+
+IMPORT_STAGES: dict[
+    DataImportStage,
+    abc.Callable[[typing.Any, list[int], Chamber], dict[str, int]],
+] = {
+    DataImportStage.CHAMBERS: import_chambers_stage,
+    DataImportStage.USERS: import_users_stage,
+    DataImportStage.USER_CAMPAIGNS: import_user_campaigns_stage,
+    DataImportStage.INVENTORY: import_inventory_stage,
+    DataImportStage.INCENTIVES: import_incentives_stage,
+    DataImportStage.REWARDS: import_rewards_stage,
+    DataImportStage.RESOURCES: import_resources_stage,
+    DataImportStage.STORED_MEMBERS: import_stored_members_stage,
+    DataImportStage.STORED_MEMBER_CONTACTS: (
+        import_stored_member_contacts_stage
+    ),
+    DataImportStage.CONTRACTS: import_contracts_stage,
+}
+
+# Stages which import data of each old chamber separately, so they are run
+# for old chambers concurrently. Others deduplicate data of all old chambers
+# or import data of the whole target chamber.
+PER_CHAMBER_IMPORT_STAGES = frozenset(
+    (
+        DataImportStage.USERS,
+        DataImportStage.INVENTORY,
+        DataImportStage.INCENTIVES,
+        DataImportStage.REWARDS,
+        DataImportStage.CONTRACTS,
+    ),
+)
+
+# Stages of a layer depend only on stages of previous layers, so they are
+# run concurrently:
+# * user campaigns are created for imported users;
+# * rewards are paid to user campaigns for incentives;
+# * contacts belong to stored members;
+# * contracts refer to stored members, contacts, levels and volunteers.
+IMPORT_STAGE_LAYERS: tuple[tuple[DataImportStage, ...], ...] = (
+    (DataImportStage.CHAMBERS,),
+    (
+        DataImportStage.USERS,
+        DataImportStage.INVENTORY,
+        DataImportStage.INCENTIVES,
+        DataImportStage.RESOURCES,
+        DataImportStage.STORED_MEMBERS,
+    ),
+    (
+        DataImportStage.USER_CAMPAIGNS,
+        DataImportStage.STORED_MEMBER_CONTACTS,
+    ),
+    (
+        DataImportStage.REWARDS,
+        DataImportStage.CONTRACTS,
+    ),
+)
+
+
+def get_import_stage_parts(
+    stage: DataImportStage,
+    old_chamber_ids: Iterable[int],
+) -> list[tuple[str, list[int]]]:
+    """Return name and old chamber ids of each separately run stage part."""
+    if stage in PER_CHAMBER_IMPORT_STAGES:
+        return [
+            (f"{stage.value}:{old_chamber_id}", [old_chamber_id])
+            for old_chamber_id in old_chamber_ids
+        ]
+    return [(stage.value, list(old_chamber_ids))]
+
+
+def import_chamber_data_stage(
+    stage: DataImportStage,
+    old_chamber_ids: Iterable[int],
+    target_chamber: Chamber,
+) -> dict[str, int]:
+    """Run import stage, return number of imported objects.
+
+    Stages after chambers' one import data of old chambers which are
+    already imported as campaigns, so a stage can be run on its own when
+    import is resumed.
+
+    """
+    if stage != DataImportStage.CHAMBERS:
+        old_chamber_ids = get_imported_campaign_ids(
+            old_chamber_ids,
+            target_chamber,
+        )
+        if not old_chamber_ids:
+            return {}
+    cursor = connection.cursor()
+    try:
+        return IMPORT_STAGES[stage](cursor, old_chamber_ids, target_chamber)
+    finally:
+        cursor.close()
+
+
+def import_all_chamber_data(
+    old_chamber_ids: Iterable[int],
+    target_chamber_id: int,
+) -> dict[str, int]:
+    """Call all import services for chamber import."""
+    target_chamber = Chamber.objects.get(id=target_chamber_id)
+    result = {}
+    for stage in DataImportStage:
+        result.update(
+            import_chamber_data_stage(stage, old_chamber_ids, target_chamber),
+        )
+    return result
 
 
 def import_partial(
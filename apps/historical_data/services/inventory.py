@@ -146,12 +146,20 @@ def fetch_sponsorships(
 def import_chamber_inventory(
     cursor: CursorWrapper,
     target_chamber: Chamber,
+    old_campaign_ids: Iterable[int] | None = None,
 ) -> list[int]:
-    """Import inventory based on exiting Sponsorships."""
+    """Import inventory based on exiting Sponsorships.
+
+    If old campaign ids are passed, only inventory of these campaigns is
+    imported.
+
+    """
     campaigns = Campaign.objects.filter(
         chamber_id=target_chamber.id,
         external_id__isnull=False,
     )
+    if old_campaign_ids is not None:
+        campaigns = campaigns.filter(external_id__in=old_campaign_ids)
     product_categories = []
     products = []
     for campaign in campaigns:
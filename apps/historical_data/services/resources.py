@@ -1,9 +1,10 @@
+from collections import abc
 from typing import Iterable
 
 from django.db.backends.mysql.base import CursorWrapper
 
 from apps.chambers.models import Chamber
-from apps.historical_data.services import ResourceData
+from apps.historical_data.services import ResourceData, fetch_in_batches
 from apps.resources.models import Resource, ResourceCategory
 
 RESOURCE_FETCH_SQL = """
@@ -19,37 +20,32 @@ FROM medias
 
 def fetch_resource_data(
     cursor: CursorWrapper,
-) -> list[ResourceData]:
-    """Select resources from old db."""
-    cursor.execute(RESOURCE_FETCH_SQL)
-    raw_resources = cursor.fetchall()
-    resources: list[ResourceData] = [
-        ResourceData(
-            id=resource[0],
-            name=resource[1],
-            file=resource[2],
-            file_type=resource[3],
-            campaign_id=resource[4],
-        ) for resource in raw_resources
-    ]
-    return resources
+) -> abc.Iterator[list[ResourceData]]:
+    """Select resources from old db in batches."""
+    for raw_resources in fetch_in_batches(cursor, RESOURCE_FETCH_SQL):
+        yield [
+            ResourceData(
+                id=resource[0],
+                name=resource[1],
+                file=resource[2],
+                file_type=resource[3],
+                campaign_id=resource[4],
+            ) for resource in raw_resources
+        ]
 
 
 def import_chamber_resources(
     cursor: CursorWrapper,
     target_chamber: Chamber,
 ) -> Iterable[int]:
-    """Import old chamber resources."""
-    old_resources: list[ResourceData] = fetch_resource_data(
-        cursor=cursor,
-    )
+    """Import old chamber resources in batches."""
+    resource_ids = []
     default_resource_category, _ = ResourceCategory.objects.get_or_create(
         name="Trainings",
         chamber_id=target_chamber.id,
     )
-    new_resources = []
-    for resource in old_resources:
-        new_resources.append(
+    for old_resources in fetch_resource_data(cursor=cursor):
+        new_resources = Resource.objects.bulk_create(
             Resource(
                 name=resource.name,
                 file=resource.file,
@@ -57,7 +53,8 @@ def import_chamber_resources(
                 category_id=default_resource_category.id,
                 external_id=resource.id,
                 user_group=[],
-            ),
+            )
+            for resource in old_resources
         )
-    Resource.objects.bulk_create(new_resources)
-    return [resource.id for resource in new_resources]
+        resource_ids.extend(resource.id for resource in new_resources)
+    return resource_ids
@@ -1,3 +1,4 @@
+from collections import abc
 from typing import Iterable
 
 from django.db.backends.mysql.base import CursorWrapper
@@ -6,7 +7,7 @@ from django.utils import timezone
 
 from apps.campaigns.models import UserCampaign
 from apps.chambers.models import Chamber
-from apps.historical_data.services import RewardData
+from apps.historical_data.services import RewardData, fetch_in_batches
 from apps.incentives.models import Incentive, Reward
 from apps.users.models import User
 
@@ -24,22 +25,20 @@ WHERE user is not NULL and chamber in ({list_of_ids})
 def fetch_reward_data(
     cursor: CursorWrapper,
     old_campaign_ids: Iterable[int],
-) -> list[RewardData]:
-    """Select rewards from old db."""
+) -> abc.Iterator[list[RewardData]]:
+    """Select rewards from old db in batches."""
     query = REWARD_FETCH_SQL_TEMPLATE.format(
         list_of_ids=", ".join(["%s" for _ in old_campaign_ids]),
     )
-    cursor.execute(query, tuple(old_campaign_ids))
-    raw_rewards = cursor.fetchall()
-    rewards: list[RewardData] = [
-        RewardData(
-            id=reward[0],
-            user=reward[1],
-            chamber=reward[2],
-            reward=reward[3],
-        ) for reward in raw_rewards
-    ]
-    return rewards
+    for raw_rewards in fetch_in_batches(cursor, query, old_campaign_ids):
+        yield [
+            RewardData(
+                id=reward[0],
+                user=reward[1],
+                chamber=reward[2],
+                reward=reward[3],
+            ) for reward in raw_rewards
+        ]
 
 
 def import_chamber_rewards(
@@ -47,12 +46,8 @@ def import_chamber_rewards(
     old_campaign_ids: Iterable[int],
     target_chamber: Chamber,
 ) -> Iterable[int]:
-    """Import old chamber rewards."""
-    old_rewards: list[RewardData] = fetch_reward_data(
-        cursor=cursor,
-        old_campaign_ids=old_campaign_ids,
-    )
-    new_rewards = []
+    """Import old chamber rewards in batches."""
+    reward_ids = []
     incentive_ids_map: dict[int, int] = dict(
         Incentive.objects.filter(
             campaign__chamber_id=target_chamber.id,
@@ -72,16 +67,18 @@ def import_chamber_rewards(
         ).values_list("external_id", "latest_user_campaign_id"),
     )
     now = timezone.now()
-    for reward in old_rewards:
-        user_campaign_id = user_ids_map.get(reward.user)
-        incentive_id = incentive_ids_map.get(reward.reward)
-        new_rewards.append(
+    for old_rewards in fetch_reward_data(
+        cursor=cursor,
+        old_campaign_ids=old_campaign_ids,
+    ):
+        new_rewards = Reward.objects.bulk_create(
             Reward(
-                incentive_id=incentive_id,
-                user_campaign_id=user_campaign_id,
+                incentive_id=incentive_ids_map.get(reward.reward),
+                user_campaign_id=user_ids_map.get(reward.user),
                 paid_at=now,
                 external_id=reward.id,
-            ),
+            )
+            for reward in old_rewards
         )
-    Reward.objects.bulk_create(new_rewards)
-    return [reward.id for reward in new_rewards]
+        reward_ids.extend(reward.id for reward in new_rewards)
+    return reward_ids
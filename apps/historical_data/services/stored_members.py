@@ -1,9 +1,10 @@
+from collections import abc
 from typing import Iterable
 
 from django.db.backends.mysql.base import CursorWrapper
 
 from apps.chambers.models import Chamber, StoredMember
-from apps.historical_data.services import StoredMemberData
+from apps.historical_data.services import StoredMemberData, fetch_in_batches
 
 STORED_MEMBER_FETCH_SQL_TEMPLATE = """
 SELECT
@@ -32,27 +33,25 @@ GROUP BY
 def fetch_stored_member_data(
     cursor: CursorWrapper,
     old_chamber_ids: Iterable[int],
-) -> list[StoredMemberData]:
-    """Select stored members from old db."""
+) -> abc.Iterator[list[StoredMemberData]]:
+    """Select stored members from old db in batches."""
     query = STORED_MEMBER_FETCH_SQL_TEMPLATE.format(
         list_of_ids=", ".join(["%s" for _ in old_chamber_ids]),
     )
-    cursor.execute(query, tuple(old_chamber_ids))
-    raw_stored_members = cursor.fetchall()
-    stored_members: list[StoredMemberData] = [
-        StoredMemberData(
-            id=member[0],
-            name=member[1],
-            chamber=member[2],
-            address=member[3],
-            address2=member[4],
-            city=member[5],
-            state=member[6],
-            zip=member[7],
-            phone=member[8],
-        ) for member in raw_stored_members
-    ]
-    return stored_members
+    for raw_stored_members in fetch_in_batches(cursor, query, old_chamber_ids):
+        yield [
+            StoredMemberData(
+                id=member[0],
+                name=member[1],
+                chamber=member[2],
+                address=member[3],
+                address2=member[4],
+                city=member[5],
+                state=member[6],
+                zip=member[7],
+                phone=member[8],
+            ) for member in raw_stored_members
+        ]
 
 
 def import_chamber_stored_members(
@@ -60,24 +59,25 @@ def import_chamber_stored_members(
     old_chamber_ids: Iterable[int],
     target_chamber: Chamber,
 ) -> Iterable[int]:
-    """Import old chamber stored members."""
-    old_stored_members: list[StoredMemberData] = fetch_stored_member_data(
+    """Import old chamber stored members in batches."""
+    stored_member_ids = []
+    for old_stored_members in fetch_stored_member_data(
         cursor=cursor,
         old_chamber_ids=old_chamber_ids,
-    )
-    stored_members = [
-        StoredMember(
-            name=member.name or "",
-            chamber_id=target_chamber.id,
-            address=member.address or "",
-            address2=member.address2 or "",
-            city=member.city or "",
-            state=member.state or "",
-            zip=member.zip or "",
-            phone=member.phone or "",
-            external_id=member.id,
+    ):
+        stored_members = StoredMember.objects.bulk_create(
+            StoredMember(
+                name=member.name or "",
+                chamber_id=target_chamber.id,
+                address=member.address or "",
+                address2=member.address2 or "",
+                city=member.city or "",
+                state=member.state or "",
+                zip=member.zip or "",
+                phone=member.phone or "",
+                external_id=member.id,
+            )
+            for member in old_stored_members
         )
-        for member in old_stored_members
-    ]
-    StoredMember.objects.bulk_create(stored_members)
-    return [member.id for member in stored_members]
+        stored_member_ids.extend(member.id for member in stored_members)
+    return stored_member_ids
@@ -1,11 +1,16 @@
+from collections import abc
 from typing import Iterable
 
 from django.db.backends.mysql.base import CursorWrapper
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.constants import UserCampaignRole
 from apps.campaigns.models import Campaign, Team, UserCampaign
 from apps.chambers.models import Chamber
-from apps.historical_data.services import UserCampaignRelatedInformationData
+from apps.historical_data.services import (
+    UserCampaignRelatedInformationData,
+    fetch_in_batches,
+)
 from apps.users.models import User
 
 USER_CAMPAIGN_RELATED_INFORMATION_FETCH_SQL_TEMPLATE = """
@@ -24,24 +29,46 @@ USER_CAMPAIGN_RELATED_INFORMATION_FETCH_SQL_TEMPLATE = """
 def fetch_user_campaign_related_information(
     cursor: CursorWrapper,
     old_campaign_ids: Iterable[int],
-) -> list[UserCampaignRelatedInformationData]:
-    """Get campaign-related information of users."""
+) -> abc.Iterator[list[UserCampaignRelatedInformationData]]:
+    """Get campaign-related information of users in batches."""
     query = USER_CAMPAIGN_RELATED_INFORMATION_FETCH_SQL_TEMPLATE.format(
         list_of_ids=", ".join(["%s" for _ in old_campaign_ids]),
     )
-    cursor.execute(query, tuple(old_campaign_ids))
-    raw_information = cursor.fetchall()
-    user_information = [
-        UserCampaignRelatedInformationData(
-            id=information[0],
-            name=information[1],
-            team=information[2],
-            chamber=information[3],
-            captain=information[4],
-            vice_chair=information[5],
-        ) for information in raw_information
-    ]
-    return user_information
+    for raw_information in fetch_in_batches(cursor, query, old_campaign_ids):
+        yield [
+            UserCampaignRelatedInformationData(
+                id=information[0],
+                name=information[1],
+                team=information[2],
+                chamber=information[3],
+                captain=information[4],
+                vice_chair=information[5],
+            ) for information in raw_information
+        ]
+
+
+def get_role(
+    information: UserCampaignRelatedInformationData | None,
+) -> UserCampaignRole:
+    """Return user's role in campaign based on legacy information."""
+    if not information:
+        return UserCampaignRole.VOLUNTEER
+    if information.vice_chair:
+        return UserCampaignRole.VICE_CHAIR
+    if information.captain:
+        return UserCampaignRole.TEAM_CAPTAIN
+    return UserCampaignRole.VOLUNTEER
+
+
+def get_teams_map(target_chamber: Chamber) -> dict[tuple[int, int], Team]:
+    """Return the earliest team for each campaign id and external id key."""
+    teams_map: dict[tuple[int, int], Team] = {}
+    for team in Team.objects.filter(
+        campaign__chamber_id=target_chamber.id,
+        external_id__isnull=False,
+    ).order_by("id"):
+        teams_map.setdefault((team.campaign_id, team.external_id), team)
+    return teams_map
 
 
 def import_chamber_user_campaigns(
@@ -49,42 +76,46 @@ def import_chamber_user_campaigns(
     old_campaign_ids: Iterable[int],
     target_chamber: Chamber,
 ) -> list[int]:
-    """Import user campaign related information."""
-    user_campaign_related_information = (
-        fetch_user_campaign_related_information(
+    """Import user campaign related information.
+
+    Every imported user takes part in every campaign of target chamber.
+    Users, campaigns and teams are loaded once, so the number of queries
+    doesn't depend on number of users and campaigns.
+
+    """
+    user_campaign_related_information_dict = {
+        data.id: data
+        for batch in fetch_user_campaign_related_information(
             cursor,
             old_campaign_ids,
         )
-    )
-    user_campaign_related_information_dict = {
-        data.id: data
-        for data in user_campaign_related_information
+        for data in batch
     }
-    user_campaign_related_information.sort(key=lambda x: x.id)
+    campaigns = list(
+        Campaign.objects.filter(chamber_id=target_chamber.id).only(
+            "id",
+            "external_id",
+        ),
+    )
+    teams_map = get_teams_map(target_chamber)
+    managers: list[UserCampaign] = []
+    managed_teams_map: dict[int, Team] = {}
     user_campaigns: list[UserCampaign] = []
-    for user in User.objects.filter(chamber_id=target_chamber.id):
-        for campaign in Campaign.objects.filter(chamber_id=target_chamber.id):
-            if user.chamber_id != campaign.chamber_id:
-                continue
-            user_campaign_related_information_data = (
-                user_campaign_related_information_dict.get(
-                    user.external_id,
-                )
-            )
-            if not user_campaign_related_information_data:
-                role = UserCampaignRole.VOLUNTEER
-            elif user_campaign_related_information_data.vice_chair:
-                role = UserCampaignRole.VICE_CHAIR
-            elif user_campaign_related_information_data.captain:
-                role = UserCampaignRole.TEAM_CAPTAIN
-            else:
-                role = UserCampaignRole.VOLUNTEER
+    for user in User.objects.filter(chamber_id=target_chamber.id).only(
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "external_id",
+    ):
+        information = user_campaign_related_information_dict.get(
+            user.external_id,
+        )
+        role = get_role(information)
+        for campaign in campaigns:
             team = None
-            if user_campaign_related_information_data:
-                team = Team.objects.filter(
-                    campaign=campaign,
-                    external_id=user_campaign_related_information_data.team,
-                ).first()
+            if information:
+                team = teams_map.get((campaign.id, information.team))
             user_campaign = UserCampaign(
                 first_name=user.first_name,
                 last_name=user.last_name,
@@ -95,16 +126,23 @@ def import_chamber_user_campaigns(
                 role=role,
                 external_user_id=user.external_id,
                 external_campaign_id=campaign.external_id,
-                external_team_id=user_campaign_related_information_data.team if user_campaign_related_information_data else None,  # noqa: E501  pylint: disable=line-too-long
+                external_team_id=information.team if information else None,
             )
             if team and role != UserCampaignRole.VOLUNTEER:
-                user_campaign.save()
                 team.managed_by = user_campaign
-                team.save()
+                managed_teams_map[team.id] = team
+                managers.append(user_campaign)
             else:
                 user_campaigns.append(user_campaign)
+    managers = UserCampaign.objects.bulk_create(managers)
+    Team.objects.bulk_update(managed_teams_map.values(), ["managed_by"])
     user_campaigns = UserCampaign.objects.bulk_create(
         user_campaigns,
         ignore_conflicts=True,
     )
-    return [user_campaign.id for user_campaign in user_campaigns]
+    campaigns_services.invalidate_leaderboard_cache(
+        campaign_ids=[campaign.id for campaign in campaigns],
+    )
+    return [
+        user_campaign.id for user_campaign in [*managers, *user_campaigns]
+    ]
@@ -9,3 +9,21 @@ from .models import DataImportJob
 def import_historical_data(job_id):
     """Call import data on data import job instance."""
     DataImportJob.objects.get(id=job_id).import_data()
+
+
+@app.task(
+    track_started=True,
+)
+def import_data_stage_part(job_id, stage, part, chamber_ids):
+    """Import stage part of data import job."""
+    DataImportJob.objects.get(id=job_id).import_stage_part(
+        stage,
+        part,
+        chamber_ids,
+    )
+
+
+@app.task
+def finish_data_import(job_id):
+    """Mark data import job as imported after all stages."""
+    DataImportJob.objects.get(id=job_id).finish_import()
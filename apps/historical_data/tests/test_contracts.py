@@ -0,0 +1,138 @@
+import pytest
+
+from apps.campaigns.constants import UserCampaignRole
+from apps.campaigns.factories import CampaignFactory, UserCampaignFactory
+from apps.campaigns.models import Campaign, UserCampaign
+from apps.chambers.models import Chamber
+from apps.historical_data.services.contracts import (
+    VolunteerNameIndex,
+    get_volunteer_name_indexes,
+)
+
+
+@pytest.fixture
+def campaign(chamber: Chamber) -> Campaign:
+    """Return campaign volunteers are matched within."""
+    return CampaignFactory(chamber=chamber)
+
+
+def create_user_campaign(
+    campaign: Campaign,
+    first_name: str,
+    last_name: str,
+    role: str = UserCampaignRole.VOLUNTEER,
+) -> UserCampaign:
+    """Create campaign's volunteer with given name and role."""
+    return UserCampaignFactory(
+        campaign=campaign,
+        team=None,
+        first_name=first_name,
+        last_name=last_name,
+        role=role,
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="volunteer_name",
+    argvalues=["John Smith", "Smith John"],
+)
+def test_volunteer_name_index_matches_full_name(
+    campaign: Campaign,
+    volunteer_name: str,
+) -> None:
+    """Ensure two words match first and last names in either order."""
+    create_user_campaign(campaign, "Smith", "Adams")
+    volunteer = create_user_campaign(campaign, "John", "Smith")
+
+    index = VolunteerNameIndex(UserCampaign.objects.all())
+
+    assert index.get(volunteer_name) == volunteer
+
+
+@pytest.mark.parametrize(
+    argnames="volunteer_name",
+    argvalues=["John", "Smith"],
+)
+def test_volunteer_name_index_matches_single_name(
+    campaign: Campaign,
+    volunteer_name: str,
+) -> None:
+    """Ensure single word matches either first or last name."""
+    create_user_campaign(campaign, "Jane", "Adams")
+    volunteer = create_user_campaign(campaign, "John", "Smith")
+
+    index = VolunteerNameIndex(UserCampaign.objects.all())
+
+    assert index.get(volunteer_name) == volunteer
+
+
+def test_volunteer_name_index_ignores_case(campaign: Campaign) -> None:
+    """Ensure names are matched case-insensitively."""
+    volunteer = create_user_campaign(campaign, "John", "McSmith")
+
+    index = VolunteerNameIndex(UserCampaign.objects.all())
+
+    assert index.get("JOHN mcsmith") == volunteer
+    assert index.get("mcSMITH") == volunteer
+
+
+def test_volunteer_name_index_prefers_earliest_volunteer(
+    campaign: Campaign,
+) -> None:
+    """Ensure the earliest created volunteer wins among namesakes."""
+    volunteer = create_user_campaign(campaign, "John", "Smith")
+    namesake = create_user_campaign(campaign, "John", "Smith")
+    reversed_namesake = create_user_campaign(campaign, "Smith", "John")
+
+    index = VolunteerNameIndex(
+        [reversed_namesake, namesake, volunteer],
+    )
+
+    assert index.get("John Smith") == volunteer
+    assert index.get("Smith John") == volunteer
+    assert index.get("John") == volunteer
+
+
+def test_volunteer_name_index_falls_back_to_lowest_role(
+    campaign: Campaign,
+) -> None:
+    """Ensure volunteer with the lowest role is used if nobody matches."""
+    create_user_campaign(campaign, "John", "Smith")
+    chair = create_user_campaign(
+        campaign,
+        "Jane",
+        "Adams",
+        role=UserCampaignRole.CHAMBER_CHAIR,
+    )
+    create_user_campaign(
+        campaign,
+        "Jack",
+        "Brown",
+        role=UserCampaignRole.TEAM_CAPTAIN,
+    )
+
+    index = VolunteerNameIndex(UserCampaign.objects.all())
+
+    assert index.get("Somebody Else") == chair
+    assert index.get("Nobody") == chair
+    assert index.get(None) == chair
+    assert VolunteerNameIndex([]).get("John Smith") is None
+
+
+def test_get_volunteer_name_indexes(
+    chamber: Chamber,
+    campaign: Campaign,
+) -> None:
+    """Ensure volunteers are indexed within their campaigns only."""
+    other_campaign = CampaignFactory(chamber=chamber)
+    empty_campaign = CampaignFactory(chamber=chamber)
+    volunteer = create_user_campaign(campaign, "John", "Smith")
+    other_volunteer = create_user_campaign(other_campaign, "John", "Smith")
+
+    indexes = get_volunteer_name_indexes(
+        [campaign.id, other_campaign.id, empty_campaign.id],
+    )
+
+    assert indexes[campaign.id].get("John Smith") == volunteer
+    assert indexes[other_campaign.id].get("John Smith") == other_volunteer
+    assert indexes[empty_campaign.id].get("John Smith") is None
@@ -0,0 +1,232 @@
+import sqlite3
+
+import pytest
+
+from apps.campaigns.constants import UserCampaignRole
+from apps.campaigns.factories import CampaignFactory, TeamFactory
+from apps.campaigns.models import UserCampaign
+from apps.chambers.models import Chamber, StoredMember
+from apps.historical_data.constants import DataImportStage
+from apps.historical_data.models import DataImportJob
+from apps.historical_data.services import ConnectionWrapper, importer
+from apps.historical_data.services.user_campaigns import (
+    import_chamber_user_campaigns,
+)
+from apps.users.factories import VolunteerFactory
+
+OLD_CHAMBER_ID = 546
+LEGACY_CONTACTS_AND_CONTRACTS_SQL = """
+CREATE TABLE contact_infos (
+    id INTEGER PRIMARY KEY,
+    company INTEGER,
+    first_name TEXT,
+    last_name TEXT,
+    email TEXT,
+    phone TEXT,
+    cellphone TEXT
+);
+CREATE TABLE contracts (
+    id INTEGER PRIMARY KEY,
+    chamber INTEGER,
+    contract_type INTEGER,
+    sponsorship INTEGER,
+    company INTEGER,
+    company_name TEXT,
+    company_addr1 TEXT,
+    company_city TEXT,
+    company_state TEXT,
+    company_zip TEXT,
+    company_fax TEXT,
+    contact INTEGER,
+    contact_first TEXT,
+    contact_last TEXT,
+    contact_phone TEXT,
+    contact_cellphone TEXT,
+    contact_email TEXT,
+    sale_cost TEXT,
+    preference_date TEXT,
+    additional_desc TEXT,
+    e_signature TEXT,
+    volunteer_name TEXT
+);
+"""
+
+
+@pytest.fixture
+def legacy_db(monkeypatch: pytest.MonkeyPatch) -> sqlite3.Connection:
+    """Replace legacy MySQL database with SQLite one."""
+    legacy_connection = sqlite3.connect(":memory:")
+    legacy_connection.execute(
+        """
+        CREATE TABLE companies (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            chamber INTEGER,
+            addr1 TEXT,
+            addr2 TEXT,
+            city TEXT,
+            state TEXT,
+            zip TEXT,
+            fax TEXT
+        )
+        """,
+    )
+    legacy_connection.executemany(
+        "INSERT INTO companies VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                company_id,
+                f"Company {company_id}",
+                OLD_CHAMBER_ID,
+                f"{company_id} Main Street",
+                "",
+                "Springfield",
+                "CA",
+                "12345",
+                None,
+            )
+            for company_id in range(1, 6)
+        ],
+    )
+    monkeypatch.setattr(
+        importer,
+        "connection",
+        ConnectionWrapper(connect=lambda: legacy_connection),
+    )
+    return legacy_connection
+
+
+def test_import_resumes_from_incomplete_stage(
+    chamber: Chamber,
+    legacy_db: sqlite3.Connection,
+) -> None:
+    """Ensure failed import is resumed without repeating committed stages."""
+    CampaignFactory(chamber=chamber, external_id=OLD_CHAMBER_ID)
+    job = DataImportJob.objects.create(
+        job_kwargs={"chamber_ids": [OLD_CHAMBER_ID]},
+        target_chamber=chamber,
+        completed_stages=[
+            stage
+            for stage in DataImportStage
+            if stage not in (
+                DataImportStage.STORED_MEMBERS,
+                DataImportStage.STORED_MEMBER_CONTACTS,
+                DataImportStage.CONTRACTS,
+            )
+        ],
+    )
+
+    # Contacts stage fails as legacy database has no contacts table
+    job.import_data()
+
+    job.refresh_from_db()
+    assert job.status == DataImportJob.ImportStatus.IMPORT_ERROR
+    assert DataImportStage.STORED_MEMBERS in job.completed_stages
+    assert job.result["stored_members"] == 5
+    assert list(job.result["timings"]) == [DataImportStage.STORED_MEMBERS]
+    assert StoredMember.objects.filter(chamber=chamber).count() == 5
+
+    legacy_db.executescript(LEGACY_CONTACTS_AND_CONTRACTS_SQL)
+    job.import_data()
+
+    job.refresh_from_db()
+    assert job.status == DataImportJob.ImportStatus.IMPORTED
+    assert job.progress == 100
+    timings = job.result.pop("timings")
+    assert job.result == {
+        "stored_members": 5,
+        "stored_member_contacts": 0,
+        "contracts": 0,
+    }
+    assert sorted(timings) == [
+        f"contracts:{OLD_CHAMBER_ID}",
+        "stored_member_contacts",
+        "stored_members",
+    ]
+    assert StoredMember.objects.filter(chamber=chamber).count() == 5
+
+
+def test_import_stage_parts() -> None:
+    """Ensure only per chamber stages are split by old chambers."""
+    assert importer.get_import_stage_parts(
+        DataImportStage.USERS,
+        [OLD_CHAMBER_ID, 547],
+    ) == [
+        (f"users:{OLD_CHAMBER_ID}", [OLD_CHAMBER_ID]),
+        ("users:547", [547]),
+    ]
+    assert importer.get_import_stage_parts(
+        DataImportStage.STORED_MEMBERS,
+        [OLD_CHAMBER_ID, 547],
+    ) == [("stored_members", [OLD_CHAMBER_ID, 547])]
+
+
+def test_import_user_campaigns(
+    chamber: Chamber,
+    legacy_db: sqlite3.Connection,
+) -> None:
+    """Ensure users take part in all campaigns with their roles and teams."""
+    campaign = CampaignFactory(chamber=chamber, external_id=OLD_CHAMBER_ID)
+    other_campaign = CampaignFactory(chamber=chamber, external_id=547)
+    team = TeamFactory(campaign=campaign, external_id=7)
+    captain = VolunteerFactory(chamber=chamber, external_id=1)
+    volunteer = VolunteerFactory(chamber=chamber, external_id=2)
+    legacy_db.execute(
+        """
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            team INTEGER,
+            chamber INTEGER,
+            captain INTEGER,
+            vice_chair INTEGER
+        )
+        """,
+    )
+    legacy_db.executemany(
+        "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (1, "Captain", 7, OLD_CHAMBER_ID, 1, 0),
+            (2, "Volunteer", 7, OLD_CHAMBER_ID, 0, 0),
+        ],
+    )
+
+    import_chamber_user_campaigns(
+        importer.connection.cursor(),
+        [OLD_CHAMBER_ID, 547],
+        chamber,
+    )
+
+    user_campaigns = UserCampaign.objects.filter(
+        user__in=(captain, volunteer),
+    )
+    assert sorted(
+        user_campaigns.values_list(
+            "user_id",
+            "campaign_id",
+            "team_id",
+            "role",
+        ),
+    ) == sorted(
+        [
+            (captain.id, campaign.id, team.id, UserCampaignRole.TEAM_CAPTAIN),
+            (
+                captain.id,
+                other_campaign.id,
+                None,
+                UserCampaignRole.TEAM_CAPTAIN,
+            ),
+            (volunteer.id, campaign.id, team.id, UserCampaignRole.VOLUNTEER),
+            (
+                volunteer.id,
+                other_campaign.id,
+                None,
+                UserCampaignRole.VOLUNTEER,
+            ),
+        ],
+    )
+    team.refresh_from_db()
+    assert team.managed_by == user_campaigns.get(
+        user=captain,
+        campaign=campaign,
+    )
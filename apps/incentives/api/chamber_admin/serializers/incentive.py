@@ -9,7 +9,7 @@ from apps.core.api.serializers import (
 )
 from apps.incentives.models import Incentive
 
-from ....services.reward_services import create_new_rewards_for_volunteers
+from ....services.reward_services import requalify_campaign_rewards
 from .incentive_qualifier import IncentiveQualifierSerializer
 
 
@@ -44,14 +44,7 @@ class IncentiveWriteSerializer(ModelBaseSerializer):
 
         qualifier_serializer = self.fields["qualifiers"]
         qualifier_serializer.create(qualifiers)
-        campaign = validated_data["campaign"]
-        create_new_rewards_for_volunteers(
-            campaign_id=campaign.id,
-            volunteer_ids=campaign.usercampaign_set.values_list(
-                "id",
-                flat=True,
-            ),
-        )
+        requalify_campaign_rewards(campaign_id=validated_data["campaign"].id)
         return created_incentive
 
     def update(self, instance, validated_data):
@@ -65,6 +58,7 @@ class IncentiveWriteSerializer(ModelBaseSerializer):
 
         qualifier_serializer = self.fields["qualifiers"]
         qualifier_serializer.create(qualifiers)
+        requalify_campaign_rewards(campaign_id=updated_incentive.campaign_id)
         return updated_incentive
 
 
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.10 on 2026-10-17 23:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('incentives', '0006_incentive_external_id_reward_external_id'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='reward',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user_campaign', 'paid_at'], include=('incentive',), name='reward_user_campaign_paid_idx'),
+        ),
+    ]
@@ -33,6 +33,14 @@ class Reward(BaseModel):
     class Meta:
         verbose_name = _("Reward")
         verbose_name_plural = _("Rewards")
+        indexes = (
+            models.Index(
+                fields=("user_campaign", "paid_at"),
+                include=("incentive",),
+                condition=models.Q(deleted_at__isnull=True),
+                name="reward_user_campaign_paid_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return (
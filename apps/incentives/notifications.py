@@ -11,9 +11,14 @@ from apps.incentives.models import Reward
 class RewardEmailNotification(NoteEmailNotification):
     """Send invitation email to campaign's volunteer."""
 
-    def __init__(self, reward: Reward, **template_context):
+    def __init__(
+        self,
+        reward: Reward,
+        note: Note | None = None,
+        **template_context,
+    ):
         super().__init__(**template_context)
-        note = Note.objects.get(
+        note = note or Note.objects.get(
             campaign=reward.incentive.campaign,
             type=NoteType.REWARD_EMAIL,
         )
@@ -31,8 +36,6 @@ class RewardEmailNotification(NoteEmailNotification):
         """Return volunteer email."""
         return [self.reward.user_campaign.email]
 
-    def send(self) -> bool:
+    def is_sending_enabled(self) -> bool:
         """Temporarily disable on production env."""
-        if settings.ENVIRONMENT in ("production", "prod"):
-            return False
-        return super().send()
+        return settings.ENVIRONMENT not in ("production", "prod")
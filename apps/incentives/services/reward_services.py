@@ -1,7 +1,11 @@
+import bisect
 import datetime as dt
-from collections import abc
+import typing
+from collections import abc, defaultdict
+from decimal import Decimal
 
-from django.db.models import F, QuerySet
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import F, OuterRef, QuerySet
 from django.utils import timezone
 
 from dateutil import rrule
@@ -10,77 +14,198 @@ from apps.campaigns import models as campaigns_models
 from apps.incentives.tasks import send_reward_emails
 
 from .. import models
+from ..constants import IncentiveType
+
+if typing.TYPE_CHECKING:
+    from apps.members.models import RevenueEntry
+
+REVENUE_INCENTIVE_TYPES = (IncentiveType.CASH, IncentiveType.TRADE)
+
+
+REQUALIFY_BATCH_SIZE = 500
+
+
+class RewardQualifier:
+    """Find incentives reached by campaign's volunteers.
+
+    Thresholds of cash and trade incentives are loaded once and kept sorted
+    per type, so incentives reached by a revenue, or crossed by a revenue
+    change, are found with a binary search.
+
+    """
+
+    def __init__(self, campaign_id: int):
+        self.campaign_id = campaign_id
+        self.thresholds = {
+            incentive_type: ([], [])
+            for incentive_type in REVENUE_INCENTIVE_TYPES
+        }
+        incentives = models.Incentive.objects.filter(
+            campaign_id=campaign_id,
+            type__in=REVENUE_INCENTIVE_TYPES,
+        ).order_by("threshold").values_list("id", "type", "threshold")
+        for incentive_id, incentive_type, threshold in incentives:
+            thresholds, incentive_ids = self.thresholds[incentive_type]
+            thresholds.append(threshold)
+            incentive_ids.append(incentive_id)
+
+    def get_crossed_incentive_ids(
+        self,
+        incentive_type: str,
+        previous_revenue: Decimal,
+        revenue: Decimal,
+    ) -> list[int]:
+        """Return incentives reached by revenue, but not by previous one."""
+        thresholds, incentive_ids = self.thresholds[incentive_type]
+        return incentive_ids[
+            bisect.bisect_right(thresholds, previous_revenue):
+            bisect.bisect_right(thresholds, revenue)
+        ]
+
+    def get_reached_incentive_ids(
+        self,
+        incentive_type: str,
+        revenue: Decimal,
+    ) -> list[int]:
+        """Return incentives whose threshold is reached by revenue."""
+        thresholds, incentive_ids = self.thresholds[incentive_type]
+        return incentive_ids[:bisect.bisect_right(thresholds, revenue)]
 
 
 def create_new_rewards_for_volunteers(
     campaign_id: int,
     volunteer_ids: abc.Collection[int],
 ) -> list[models.Reward]:
-    """Create rewards for some specific volunteers."""
-    new_rewards = _get_new_rewards_for_volunteers(campaign_id, volunteer_ids)
-    rewards = models.Reward.objects.bulk_create(new_rewards)
-    if rewards:
-        new_reward_ids = [reward.id for reward in rewards]
-        send_reward_emails.delay(new_reward_ids)
-    return rewards
+    """Create rewards for some specific volunteers.
 
+    Volunteers are re-qualified against all campaign's incentives in
+    batches, with one query per batch.
 
-def _get_new_rewards_for_volunteers(
-    campaign_id: int,
-    volunteer_ids: abc.Collection[int],
-) -> list[models.Reward]:
-    """Return new rewards for specific volunteers."""
-    volunteers = (
-        campaigns_models.UserCampaign.objects.all().can_sell_contract()
-        .filter(
-            id__in=volunteer_ids,
-            campaign_id=campaign_id,
-        )
-        .prefetch_related(
-            "rewards",
+    """
+    qualifier = RewardQualifier(campaign_id)
+    volunteer_ids = list(volunteer_ids)
+    new_rewards = []
+    for batch_start in range(0, len(volunteer_ids), REQUALIFY_BATCH_SIZE):
+        volunteers = _get_qualifiable_volunteers(campaign_id).filter(
+            id__in=volunteer_ids[
+                batch_start:batch_start + REQUALIFY_BATCH_SIZE
+            ],
+        ).annotate(
+            rewarded_incentive_ids=ArraySubquery(
+                models.Reward.objects.filter(
+                    user_campaign_id=OuterRef("pk"),
+                ).values("incentive_id"),
+            ),
+        ).values_list(
+            "id",
+            "total_cash_revenue",
+            "total_trade_revenue",
+            "rewarded_incentive_ids",
         )
-        .with_total_revenue()
-        .with_total_cash_revenue()
-        .with_total_trade_revenue()
-    )
+        for volunteer_id, cash, trade, rewarded_ids in volunteers:
+            reached_incentive_ids = (
+                qualifier.get_reached_incentive_ids(IncentiveType.CASH, cash)
+                + qualifier.get_reached_incentive_ids(
+                    IncentiveType.TRADE,
+                    trade,
+                )
+            )
+            new_rewards.extend(
+                models.Reward(
+                    incentive_id=incentive_id,
+                    user_campaign_id=volunteer_id,
+                )
+                for incentive_id in reached_incentive_ids
+                if incentive_id not in rewarded_ids
+            )
+    return _create_rewards(new_rewards)
 
-    campaign_incentives = models.Incentive.objects.filter(
+
+def requalify_campaign_rewards(campaign_id: int) -> list[models.Reward]:
+    """Create rewards for all campaign's volunteers."""
+    return create_new_rewards_for_volunteers(
         campaign_id=campaign_id,
+        volunteer_ids=_get_qualifiable_volunteers(campaign_id).values_list(
+            "id",
+            flat=True,
+        ),
     )
-    new_rewards = []
-    for volunteer in volunteers:
-        new_rewards.extend(
-            _get_new_rewards_for_one_volunteer(
-                volunteer=volunteer,
-                incentives=campaign_incentives,
-            ),
-        )
-    return new_rewards
 
 
-def _get_new_rewards_for_one_volunteer(
-    volunteer: campaigns_models.UserCampaign,
-    incentives: QuerySet[models.Incentive],
+def create_new_rewards_for_revenue_entries(
+    campaign_id: int,
+    entries: abc.Iterable["RevenueEntry"],
 ) -> list[models.Reward]:
-    """Return new rewards for a volunteer."""
-    volunteer_rewarded_incentive_ids = volunteer.rewards.values_list(
-        "incentive_id",
-        flat=True,
+    """Create rewards for incentives crossed by new revenue ledger entries.
+
+    Entries' amounts are revenue deltas of their volunteers, so only
+    incentives between volunteer's previous and current revenue are
+    checked instead of all campaign's incentives.
+
+    """
+    deltas = defaultdict(Decimal)
+    for entry in entries:
+        deltas[entry.user_campaign_id, entry.contract_type] += entry.amount
+    if not deltas:
+        return []
+    qualifier = RewardQualifier(campaign_id)
+    volunteers = _get_qualifiable_volunteers(campaign_id).filter(
+        id__in={volunteer_id for volunteer_id, _ in deltas},
+    ).values_list("id", "total_cash_revenue", "total_trade_revenue")
+    crossed_incentives = set()
+    for volunteer_id, cash, trade in volunteers:
+        for incentive_type, revenue in (
+            (IncentiveType.CASH, cash),
+            (IncentiveType.TRADE, trade),
+        ):
+            crossed_incentives.update(
+                (volunteer_id, incentive_id)
+                for incentive_id in qualifier.get_crossed_incentive_ids(
+                    incentive_type=incentive_type,
+                    previous_revenue=(
+                        revenue - deltas[volunteer_id, incentive_type]
+                    ),
+                    revenue=revenue,
+                )
+            )
+    if not crossed_incentives:
+        return []
+    crossed_incentives -= set(
+        models.Reward.objects.filter(
+            user_campaign_id__in={
+                volunteer_id for volunteer_id, _ in crossed_incentives
+            },
+            incentive_id__in={
+                incentive_id for _, incentive_id in crossed_incentives
+            },
+        ).values_list("user_campaign_id", "incentive_id"),
     )
-    not_rewarded_incentives = [
-        incentive
-        for incentive in incentives
-        if incentive.id not in volunteer_rewarded_incentive_ids
-    ]
-    newly_qualified_incentives = [
-        incentive
-        for incentive in not_rewarded_incentives
-        if incentive.is_achieved_by(volunteer)
-    ]
-    return [
-        models.Reward(incentive=incentive, user_campaign=volunteer)
-        for incentive in newly_qualified_incentives
-    ]
+    return _create_rewards(
+        [
+            models.Reward(
+                incentive_id=incentive_id,
+                user_campaign_id=volunteer_id,
+            )
+            for volunteer_id, incentive_id in crossed_incentives
+        ],
+    )
+
+
+def _get_qualifiable_volunteers(campaign_id: int) -> QuerySet:
+    """Return campaign's volunteers who can be rewarded with revenue."""
+    return campaigns_models.UserCampaign.objects.all().can_sell_contract(
+    ).filter(
+        campaign_id=campaign_id,
+    ).with_revenue_summary()
+
+
+def _create_rewards(new_rewards: list[models.Reward]) -> list[models.Reward]:
+    """Save new rewards and notify volunteers about them."""
+    rewards = models.Reward.objects.bulk_create(new_rewards)
+    if rewards:
+        new_reward_ids = [reward.id for reward in rewards]
+        send_reward_emails.delay(new_reward_ids)
+    return rewards
 
 
 def mark_rewards_as_paid(campaign_id: int, reward_ids: abc.Collection[int]):
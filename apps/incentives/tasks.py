@@ -2,14 +2,46 @@ from collections.abc import Collection
 
 from config.celery import app
 
+from apps.campaigns.constants import NoteType
+from apps.campaigns.context_managers import RewardContextManager
+from apps.campaigns.models import Note
 from apps.incentives.models import Reward
 from apps.incentives.notifications import RewardEmailNotification
 
 
 @app.task
-def send_reward_emails(reward_ids: Collection[int]):
-    """Send reward email."""
-    rewards = Reward.objects.filter(id__in=reward_ids)
-    for reward in rewards:
-        email = RewardEmailNotification(reward=reward)
-        email.send()
+def send_reward_emails(reward_ids: Collection[int]) -> list[bool]:
+    """Send reward emails in one batch.
+
+    Notes are rendered for the whole batch, so each campaign's note is
+    compiled once. Return whether each reward's email was sent.
+
+    """
+    rewards = list(
+        RewardContextManager.with_context_relations(
+            Reward.objects.filter(id__in=reward_ids),
+        ),
+    )
+    notes = {
+        note.campaign_id: note
+        for note in Note.objects.filter(
+            campaign_id__in={
+                reward.incentive.campaign_id for reward in rewards
+            },
+            type=NoteType.REWARD_EMAIL,
+        ).select_related("campaign__chamber")
+    }
+    note_templates = RewardContextManager.render_many(
+        notes=notes.values(),
+        objects=rewards,
+    )
+    return RewardEmailNotification.send_many(
+        [
+            RewardEmailNotification(
+                reward=reward,
+                note=notes[reward.incentive.campaign_id],
+                note_template=note_template,
+            )
+            for reward, note_template in zip(rewards, note_templates)
+        ],
+    )
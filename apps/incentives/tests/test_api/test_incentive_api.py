@@ -7,10 +7,10 @@ from rest_framework import status, test
 import pytest
 
 from apps.campaigns.constants import CampaignStatus
-from apps.campaigns.factories import CampaignFactory
+from apps.campaigns.factories import CampaignFactory, ProductFactory
 from apps.campaigns.models import Campaign
 from apps.chambers.models import Chamber
-from apps.core.test_utils import CAAPIClient
+from apps.core.test_utils import CAAPIClient, TestLevelData
 from apps.incentives.constants import (
     IncentiveQualifierAmount,
     IncentiveQualifierName,
@@ -209,3 +209,29 @@ def test_incentive_reorder_api_fail(
         data={"order": len(_incentives)},
     )
     assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_incentive_update_api_requalifies_rewards(
+    chamber_admin: User,
+    incentive: Incentive,
+    incentive_data: dict,
+    setup_product,
+) -> None:
+    """Ensure that volunteers reaching updated threshold get rewards."""
+    product = ProductFactory(category__campaign=incentive.campaign)
+    setup_product(
+        product,
+        [TestLevelData(level_info={"cost": 50}, total_count=2, sold_count=2)],
+    )
+    url = get_incentive_detail_url(kwargs={"pk": incentive.id})
+    api_client = CAAPIClient()
+    api_client.select_campaign(incentive.campaign)
+    api_client.force_authenticate(user=chamber_admin)
+    incentive_data["threshold"] = 100
+    response = api_client.put(url, data=incentive_data)
+    assert response.status_code == status.HTTP_200_OK
+    assert incentive.rewards.count() == 1
+
+    response = api_client.put(url, data=incentive_data)
+    assert response.status_code == status.HTTP_200_OK
+    assert incentive.rewards.count() == 1
@@ -4,9 +4,11 @@ from django.contrib import admin
 from dal import autocomplete
 from import_export.forms import ExportForm
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.models import Campaign
 from apps.core.admin import BaseAdmin
 
+from .. import services
 from ..models import Contract
 
 
@@ -76,3 +78,11 @@ class ContractAdmin(BaseAdmin):
     readonly_fields = (
         "token",
     )
+
+    def save_model(self, request, obj, form, change):
+        """Keep revenue ledger and inventories in sync with contract."""
+        super().save_model(request, obj, form, change)
+        services.sync_contracts_revenue_entries(contract_ids=[obj.id])
+        campaigns_services.refresh_contracts_level_inventories(
+            contract_ids=[obj.id],
+        )
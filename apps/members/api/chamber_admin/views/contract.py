@@ -7,6 +7,7 @@ from rest_framework.decorators import action
 from drf_spectacular.utils import extend_schema
 
 from libs.api.filter_backends import CustomDjangoFilterBackend
+from libs.api.pagination import KeysetPagination
 from libs.open_api.filters import SearchFilterBackend
 
 from apps.campaigns.models import LevelInstance
@@ -47,6 +48,7 @@ class ContractViewSet(
     queryset = Contract.objects.all()
     serializer_class = ContractListSerializer
     filterset_class = ContractFilter
+    pagination_class = KeysetPagination
     filter_backends = (
         CustomDjangoFilterBackend,
         ContractOrderingFilterBackend,
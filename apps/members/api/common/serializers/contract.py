@@ -1,4 +1,5 @@
-from collections import OrderedDict
+import uuid
+from collections import Counter, OrderedDict, defaultdict
 
 from django.utils.translation import gettext_lazy as _
 
@@ -7,10 +8,16 @@ from rest_framework import serializers
 import safedelete
 from drf_spectacular.utils import extend_schema_field
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.api.chamber_admin.serializers import LevelSerializer
 from apps.campaigns.api.common.serializers import UserCampaignCompactSerializer
 from apps.campaigns.api.super_admin.serializers import CampaignSerializer
-from apps.campaigns.models import Level, LevelInstance
+from apps.campaigns.models import (
+    Level,
+    LevelHold,
+    LevelInstance,
+    LevelInventory,
+)
 from apps.chambers.api.serializers import ChamberCreateSASerializer
 from apps.core.api.serializers import ModelBaseSerializer
 from apps.members.models import Contract
@@ -142,6 +149,7 @@ class ContractLevelAttachMixin:
         self,
         contract: Contract,
         levels_data: list[dict],
+        hold_token: uuid.UUID | None = None,
     ):
         """Attach selected levels to the `contract`.
 
@@ -149,22 +157,45 @@ class ContractLevelAttachMixin:
         - `id` field in each item of `levels_data` is id of `LevelInstance`
         attached to the contract. That means item with null `id` field are new
         selected level.
-        - We acquire locks for all available `LevelInstance` of new selected
-        levels to handle concurrency, and create a pool from them.
-        - For each new selected level item in `levels_data`, we pop an instance
-        out of the pool. If there's no available instances left, we raise error
-        for that item.
+        - Instances held for the contract's form by `hold_token` within the
+        contract's campaign are returned to available ones first, so they are
+        taken by the contract.
         - Contract's instance is detached from contract if its `id`
-        is not present in `levels_data`. Otherwise, its info is updated.
+        is not present in `levels_data`, and its level's instance is released
+        to available ones. Otherwise, its info is updated.
+        - For each level, instances of new selected items are taken from
+        available ones of its inventory by a conditional update, so no locks
+        are held on instances. If there's not enough available instances
+        left, we raise error for items beyond available ones.
 
         """
         selected_levels_ids = {
             level_data["level_id"]: level_data
             for level_data in levels_data
         }
-        contract.levels.exclude(
+        is_sold = contract.is_approved
+        if hold_token:
+            campaigns_services.release_level_holds(
+                LevelHold.objects.filter(
+                    token=hold_token,
+                    level__product__category__campaign_id=contract.campaign_id,
+                ),
+            )
+        detached_instances = contract.levels.exclude(
             id__in=[level_data["id"] for level_data in levels_data],
-        ).delete(force_policy=safedelete.HARD_DELETE)
+        )
+        released_counts = Counter(
+            detached_instances.filter(
+                declined_at__isnull=True,
+            ).values_list("level_id", flat=True),
+        )
+        detached_instances.delete(force_policy=safedelete.HARD_DELETE)
+        for level_id, count in sorted(released_counts.items()):
+            campaigns_services.release_level_instances(
+                level_id=level_id,
+                count=count,
+                is_sold=is_sold,
+            )
 
         contract_levels = contract.levels.all()
         contract_levels_map = {
@@ -173,33 +204,41 @@ class ContractLevelAttachMixin:
         }
         new_instances = []
         updated_instances = []
+        new_items = defaultdict(list)
 
-        select_levels = Level.objects.filter(
+        selected_levels_map = Level.objects.filter(
             id__in=selected_levels_ids,
-        ).with_available_amount()
-        selected_levels_map = {
-            level.id: level
-            for level in select_levels
-        }
-        errors = OrderedDict()
+        ).in_bulk()
         for idx, level_data in enumerate(levels_data):
             level = selected_levels_map[level_data["level_id"]]
-            if level.available_amount == 0:
-                errors[f"levels.{idx}.level_id"] = _(
-                    "This product is out of stock",
-                )
-                continue
-            level.available_amount -= 1
             if level_data["id"]:
                 contract_level = contract_levels_map[level_data["id"]]
                 contract_level.trade_with = level_data["trade_with"]
                 updated_instances.append(contract_level)
                 continue
+            new_items[level.id].append(idx)
             new_instance = LevelInstance.from_level(level)
             new_instance.contract = contract
             new_instance.trade_with = level_data["trade_with"]
             new_instances.append(new_instance)
 
+        errors = OrderedDict()
+        for level_id, indexes in sorted(new_items.items()):
+            is_reserved = campaigns_services.reserve_level_instances(
+                level=selected_levels_map[level_id],
+                count=len(indexes),
+                is_sold=is_sold,
+            )
+            if is_reserved:
+                continue
+            available_amount = LevelInventory.objects.filter(
+                level_id=level_id,
+            ).values_list("available", flat=True).first() or 0
+            for idx in indexes[max(available_amount, 0):]:
+                errors[f"levels.{idx}.level_id"] = _(
+                    "This product is out of stock",
+                )
+
         if errors:
             raise serializers.ValidationError(errors)
 
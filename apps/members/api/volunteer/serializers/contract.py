@@ -158,10 +158,16 @@ class ContractCreateUpdateSerializer(
         input_formats=("%m/%d/%Y",),
         write_only=True,
     )
+    hold_token = serializers.UUIDField(
+        write_only=True,
+        required=False,
+        allow_null=True,
+    )
 
     class Meta(ContractDetailSerializer.Meta):
         fields = ContractDetailSerializer.Meta.fields + (
             "created_date",
+            "hold_token",
         )
         extra_kwargs = {
             "name": {"read_only": True},
@@ -196,6 +202,7 @@ class ContractCreateUpdateSerializer(
         """Create contract, member and attach selected levels."""
         member_data = validated_data.pop("member")
         levels_data = validated_data.pop("levels")
+        hold_token = validated_data.pop("hold_token", None)
         created_date = validated_data.pop("created_date")
         member_serializer = self.fields["member"]
         member = member_serializer.create(member_data)
@@ -210,17 +217,22 @@ class ContractCreateUpdateSerializer(
         validated_data["campaign"] = self._request.campaign
         validated_data["name"] = contract_name
         contract = super().create(validated_data)
-        self.attach_levels_to_contract(contract, levels_data)
+        self.attach_levels_to_contract(contract, levels_data, hold_token)
         return contract
 
     def update(self, instance, validated_data):
         """Update contract, member and selected levels."""
         member_data = validated_data.pop("member")
         levels_data = validated_data.pop("levels")
+        hold_token = validated_data.pop("hold_token", None)
         member_serializer = self.fields["member"]
         member_serializer.update(instance.member, member_data)
         updated_contract = super().update(instance, validated_data)
-        self.attach_levels_to_contract(updated_contract, levels_data)
+        self.attach_levels_to_contract(
+            updated_contract,
+            levels_data,
+            hold_token,
+        )
         return updated_contract
 
     def save(self, **kwargs):
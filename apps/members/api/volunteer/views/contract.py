@@ -1,10 +1,11 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import mixins, response
+from rest_framework import exceptions, mixins, response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.models import LevelInstance, UserCampaign
 from apps.core.api import mixins as core_mixins
 from apps.core.api import views
@@ -125,6 +126,14 @@ class ContractViewSet(
         serializer.is_valid(raise_exception=True)
         level = serializer.validated_data.get("level")
         contract = self.get_object()
+        is_reserved = campaigns_services.reserve_level_instances(
+            level=level,
+            count=1,
+        )
+        if not is_reserved:
+            raise exceptions.ValidationError(
+                _("This product is out of stock"),
+            )
         level_instance = LevelInstance.from_level(level=level)
         level_instance.contract = contract
         level_instance.save()
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.10 on 2026-10-17 09:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0054_usercampaign_mobile_phone_usercampaign_work_phone'),
+        ('members', '0027_alter_invoice_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevenueEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('contract_type', models.CharField(choices=[('cash', 'Cash'), ('trade', 'Trade')], max_length=20, verbose_name='Contract type')),
+                ('approved_at', models.DateTimeField(blank=True, null=True, verbose_name='Approved At')),
+                ('amount', models.DecimalField(decimal_places=16, max_digits=31, verbose_name='Amount')),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_entries', to='campaigns.campaign', verbose_name='Campaign')),
+                ('contract', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_entries', to='members.contract', verbose_name='Contract')),
+                ('level_instance', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_entries', to='campaigns.levelinstance', verbose_name='Level instance')),
+                ('user_campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_entries', to='campaigns.usercampaign', verbose_name='User campaign')),
+            ],
+            options={
+                'verbose_name': 'Revenue Entry',
+                'verbose_name_plural': 'Revenue Entries',
+                'indexes': [models.Index(fields=['campaign', 'user_campaign', 'approved_at'], name='revenue_entry_campaign_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.10 on 2026-10-17 09:14
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def populate_revenue_entries(apps, schema_editor):
+    """Record ledger entries for already approved contracts."""
+    LevelInstance = apps.get_model("campaigns.LevelInstance")
+    RevenueEntry = apps.get_model("members.RevenueEntry")
+    sold_instances = LevelInstance.objects.filter(
+        deleted_at__isnull=True,
+        declined_at__isnull=True,
+        contract__status="approved",
+        contract__deleted_at__isnull=True,
+        contract__credits_info__isnull=False,
+    ).values(
+        "id",
+        "contract_id",
+        "contract__campaign_id",
+        "contract__type",
+        "contract__approved_at",
+        "contract__credits_info__user_campaign_id",
+    ).annotate(
+        amount=(
+            models.F("cost") * models.F("contract__credits_info__portion")
+        ),
+    ).order_by("id")
+    entries = []
+    for sold_instance in sold_instances.iterator(chunk_size=BATCH_SIZE):
+        entries.append(
+            RevenueEntry(
+                campaign_id=sold_instance["contract__campaign_id"],
+                user_campaign_id=sold_instance[
+                    "contract__credits_info__user_campaign_id"
+                ],
+                contract_id=sold_instance["contract_id"],
+                level_instance_id=sold_instance["id"],
+                contract_type=sold_instance["contract__type"],
+                approved_at=sold_instance["contract__approved_at"],
+                amount=sold_instance["amount"],
+            ),
+        )
+        if len(entries) == BATCH_SIZE:
+            RevenueEntry.objects.bulk_create(entries)
+            entries = []
+    RevenueEntry.objects.bulk_create(entries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0028_revenueentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_revenue_entries,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
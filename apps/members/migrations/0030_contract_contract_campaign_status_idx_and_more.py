@@ -0,0 +1,32 @@
+# Generated by Django 4.2.10 on 2026-10-17 23:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('members', '0029_populate_revenue_entries'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='contract',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['campaign', 'status', 'approved_at'], name='contract_campaign_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='contract',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('status', 'approved')), fields=['campaign', 'approved_at'], name='contract_approved_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='contractcreditinfo',
+            index=models.Index(fields=['user_campaign', 'contract'], include=('portion',), name='credit_info_user_campaign_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='revenueentry',
+            index=models.Index(fields=['user_campaign', 'approved_at'], include=('campaign', 'amount', 'contract_type'), name='revenue_entry_user_idx'),
+        ),
+    ]
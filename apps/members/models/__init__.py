@@ -2,3 +2,4 @@ from .contract import Contract
 from .contract_credit_info import ContractCreditInfo
 from .invoice import Invoice
 from .member import Member
+from .revenue_entry import RevenueEntry
@@ -130,6 +130,21 @@ class Contract(BaseModel):
     class Meta:
         verbose_name = _("Contract")
         verbose_name_plural = _("Contracts")
+        indexes = (
+            models.Index(
+                fields=("campaign", "status", "approved_at"),
+                condition=models.Q(deleted_at__isnull=True),
+                name="contract_campaign_status_idx",
+            ),
+            models.Index(
+                fields=("campaign", "approved_at"),
+                condition=models.Q(
+                    deleted_at__isnull=True,
+                    status=ContractStatus.APPROVED,
+                ),
+                name="contract_approved_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return self.name
@@ -30,6 +30,13 @@ class ContractCreditInfo(TimeStampedModel):
     class Meta:
         verbose_name = _("Contract Credit Info")
         verbose_name_plural = _("Contract Credits Info")
+        indexes = (
+            models.Index(
+                fields=("user_campaign", "contract"),
+                include=("portion",),
+                name="credit_info_user_campaign_idx",
+            ),
+        )
 
     def __str__(self):
         return f"{self.contract} - {self.user_campaign}"
@@ -0,0 +1,85 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_extensions.db.models import TimeStampedModel
+
+from ..constants import ContractType
+
+
+class RevenueEntry(TimeStampedModel):
+    """Represent an append-only entry of volunteers' revenue ledger.
+
+    Each entry credits a volunteer with a portion of an approved level
+    instance's cost. Entries are never updated or deleted: when a contract
+    is declined or its credits change, reversing entries with negative
+    amounts are appended, so the sum of `amount` over any set of entries is
+    always the current revenue.
+
+    Attributes:
+        - campaign: campaign the contract belongs to
+        - user_campaign: credited volunteer
+        - contract: approved contract
+        - level_instance: sold level instance
+        - contract_type: contract's type when the entry was recorded
+        - approved_at: contract's approval time when the entry was recorded
+        - amount: instance's cost multiplied by volunteer's credited portion
+
+    """
+
+    campaign = models.ForeignKey(
+        to="campaigns.Campaign",
+        verbose_name=_("Campaign"),
+        on_delete=models.CASCADE,
+        related_name="revenue_entries",
+    )
+    user_campaign = models.ForeignKey(
+        to="campaigns.UserCampaign",
+        verbose_name=_("User campaign"),
+        on_delete=models.CASCADE,
+        related_name="revenue_entries",
+    )
+    contract = models.ForeignKey(
+        to="members.Contract",
+        verbose_name=_("Contract"),
+        on_delete=models.CASCADE,
+        related_name="revenue_entries",
+    )
+    level_instance = models.ForeignKey(
+        to="campaigns.LevelInstance",
+        verbose_name=_("Level instance"),
+        on_delete=models.CASCADE,
+        related_name="revenue_entries",
+    )
+    contract_type = models.CharField(
+        verbose_name=_("Contract type"),
+        max_length=20,
+        choices=ContractType.choices,
+    )
+    approved_at = models.DateTimeField(
+        verbose_name=_("Approved At"),
+        null=True,
+        blank=True,
+    )
+    amount = models.DecimalField(
+        verbose_name=_("Amount"),
+        max_digits=31,
+        decimal_places=16,
+    )
+
+    class Meta:
+        verbose_name = _("Revenue Entry")
+        verbose_name_plural = _("Revenue Entries")
+        indexes = (
+            models.Index(
+                fields=("campaign", "user_campaign", "approved_at"),
+                name="revenue_entry_campaign_idx",
+            ),
+            models.Index(
+                fields=("user_campaign", "approved_at"),
+                include=("campaign", "amount", "contract_type"),
+                name="revenue_entry_user_idx",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.contract} - {self.user_campaign}: {self.amount}"
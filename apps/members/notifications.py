@@ -21,9 +21,9 @@ from .models import Contract
 class InvoiceEmailNotification(NoteEmailNotification):
     """Used to send invoice email to charged member."""
 
-    def __init__(self, invoice, **template_context):
+    def __init__(self, invoice, note: Note | None = None, **template_context):
         super().__init__(**template_context)
-        note = Note.objects.get(
+        note = note or Note.objects.get(
             campaign=invoice.contract.campaign,
             type=NoteType.INVOICE_NOTE.value,
         )
@@ -1,6 +1,6 @@
 import dataclasses
 import decimal
-from collections import abc
+from collections import abc, defaultdict
 from decimal import Decimal
 
 from django.db import models, transaction
@@ -10,14 +10,15 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.campaigns import models as campaign_models
+from apps.campaigns import services as campaigns_services
 from apps.chambers import services as chambers_services
 from apps.chambers.models import StoredMember
 from apps.incentives.services.reward_services import (
-    create_new_rewards_for_volunteers,
+    create_new_rewards_for_revenue_entries,
 )
 
-from . import notifications
-from .models import Contract, ContractCreditInfo, Invoice, Member
+from . import notifications, signals
+from .models import Contract, ContractCreditInfo, Invoice, Member, RevenueEntry
 
 
 def decline_contract(contract: Contract) -> Contract:
@@ -37,6 +38,11 @@ def decline_contract(contract: Contract) -> Contract:
         contract.levels.filter(
             declined_at__isnull=True,
         ).update(declined_at=timezone.now())
+        campaigns_services.release_level_holds(contract.level_holds.all())
+        campaigns_services.refresh_contracts_level_inventories(
+            contract_ids=[contract.id],
+        )
+        sync_contracts_revenue_entries(contract_ids=[contract.id])
     return contract
 
 
@@ -44,6 +50,10 @@ def approve_contract(contract: Contract) -> Contract:
     """Approve contract and trigger additional logic."""
     with transaction.atomic():
         contract.approve()
+        campaigns_services.refresh_contracts_level_inventories(
+            contract_ids=[contract.id],
+        )
+        sync_contracts_revenue_entries(contract_ids=[contract.id])
         member: Member = contract.member
         stored_member_data = {
             "chamber": contract.campaign.chamber,
@@ -72,12 +82,6 @@ def approve_contract(contract: Contract) -> Contract:
             "contract": contract,
         }
         Invoice.objects.create(**invoice_data)
-        create_new_rewards_for_volunteers(
-            campaign_id=contract.campaign_id,
-            volunteer_ids=ContractCreditInfo.objects.filter(
-                contract_id=contract.id,
-            ).values_list("user_campaign_id", flat=True),
-        )
     return contract
 
 
@@ -105,6 +109,10 @@ def sign_contract(contract: Contract, data: dict, ip_address: str) -> Contract:
         contract.levels.exclude(
             id__in=level_ids,
         ).update(declined_at=timezone.now())
+        campaigns_services.refresh_contracts_level_inventories(
+            contract_ids=[contract.id],
+        )
+        sync_contracts_revenue_entries(contract_ids=[contract.id])
     return contract
 
 
@@ -117,8 +125,12 @@ def delete_contract(contract: Contract) -> Contract:
     """
     with transaction.atomic():
         member = contract.member
+        campaigns_services.release_level_holds(contract.level_holds.all())
         contract.delete()
         member.delete()
+        campaigns_services.refresh_contracts_level_inventories(
+            contract_ids=[contract.id],
+        )
     return contract
 
 
@@ -182,16 +194,25 @@ def calculate_total_earnings(campaign: campaign_models.Campaign) -> Decimal:
 def validate_available_levels(
     level_instances: models.QuerySet[campaign_models.LevelInstance],
 ) -> dict:
-    """Validate available levels in contract, return if errors occur."""
+    """Validate available levels in contract, return if errors occur.
+
+    Instances are already reserved for the contract, so level is out of
+    stock only when all of its instances are sold.
+
+    """
     errors = {}
     level_instances = level_instances.prefetch_related(
         Prefetch(
             "level",
-            queryset=campaign_models.Level.objects.all().with_is_available(),
+            queryset=(
+                campaign_models.Level.objects.all()
+                .with_remaining_instances_count()
+            ),
         ),
     )
     for instance in level_instances:
-        if not instance.level.is_available:
+        level = instance.level
+        if level.amount >= 0 and level.remaining_instances_count <= 0:
             errors[f"levels.{instance.index}.level_id"] = _(
                 "This product is out of stock",
             )
@@ -234,6 +255,9 @@ def reassign_contracts(reassign_data: list[dict]) -> None:
     ContractCreditInfo.objects.filter(
         id__in=[credit_info.id for credit_info in removed_credits_info],
     ).delete()
+    sync_contracts_revenue_entries(
+        contract_ids=[contract.id for contract in contract_list],
+    )
 
 
 @dataclasses.dataclass
@@ -311,6 +335,7 @@ def redistribute_contract_credits(contract: Contract):
     ContractCreditInfo.objects.bulk_update(
         contract_credits, fields=["portion"],
     )
+    sync_contracts_revenue_entries(contract_ids=[contract.id])
 
 
 def set_contract_credits(
@@ -325,7 +350,7 @@ def set_contract_credits(
         decimal.Decimal(1) / decimal.Decimal(len(credited_volunteers))
     )
     contract.shared_credits_with.clear()
-    return ContractCreditInfo.objects.bulk_create(
+    contract_credits = ContractCreditInfo.objects.bulk_create(
         ContractCreditInfo(
             user_campaign=volunteer,
             contract=contract,
@@ -333,6 +358,8 @@ def set_contract_credits(
         )
         for volunteer in credited_volunteers
     )
+    sync_contracts_revenue_entries(contract_ids=[contract.id])
+    return contract_credits
 
 
 def get_contract_invalid_shared_volunteers(
@@ -354,3 +381,126 @@ def get_contract_invalid_shared_volunteers(
             or shared_volunteer.member_id != contract_stored_member_id
         )
     ]
+
+
+def sync_contracts_revenue_entries(
+    contract_ids: abc.Collection[int],
+) -> list[RevenueEntry]:
+    """Append revenue ledger entries to match contracts' current state.
+
+    Expected revenue of a contract is the cost of each of its not declined
+    level instances multiplied by each credited volunteer's portion, or
+    nothing if the contract is not approved. Ledger entries are grouped by
+    the attributes they were recorded with, and for every group whose
+    balance differs from the expected value, an entry with the difference
+    is appended. That way an approved contract gets positive entries, a
+    declined one gets reversing entries and re-syncing an unchanged
+    contract appends nothing.
+
+    Volunteers are rewarded for incentives crossed by appended entries, so
+    every change of revenue qualifies rewards, not only approvals.
+
+    """
+    if not contract_ids:
+        return []
+    entry_key_fields = (
+        "contract_id",
+        "level_instance_id",
+        "user_campaign_id",
+        "contract_type",
+        "approved_at",
+    )
+    balances = {
+        tuple(entry[field] for field in entry_key_fields): entry["balance"]
+        for entry in RevenueEntry.objects.filter(
+            contract_id__in=contract_ids,
+        ).values(*entry_key_fields).annotate(balance=models.Sum("amount"))
+    }
+    contracts = Contract.objects.filter(
+        id__in=contract_ids,
+        status=Contract.STATUSES.APPROVED,
+    ).prefetch_related(
+        Prefetch(
+            "levels",
+            queryset=campaign_models.LevelInstance.objects.filter(
+                declined_at__isnull=True,
+            ),
+        ),
+        "credits_info",
+    )
+    expected_amounts = {}
+    campaign_ids = {}
+    for contract in contracts:
+        campaign_ids[contract.id] = contract.campaign_id
+        for level_instance in contract.levels.all():
+            for credit_info in contract.credits_info.all():
+                key = (
+                    contract.id,
+                    level_instance.id,
+                    credit_info.user_campaign_id,
+                    contract.type,
+                    contract.approved_at,
+                )
+                expected_amounts[key] = (
+                    level_instance.cost * credit_info.portion
+                )
+    if balances:
+        campaign_ids.update(
+            Contract.all_objects.filter(
+                id__in={key[0] for key in balances},
+            ).values_list("id", "campaign_id"),
+        )
+    new_entries = []
+    for key in expected_amounts.keys() | balances.keys():
+        amount = expected_amounts.get(key, Decimal(0)) - balances.get(
+            key,
+            Decimal(0),
+        )
+        if not amount:
+            continue
+        new_entries.append(
+            RevenueEntry(
+                campaign_id=campaign_ids[key[0]],
+                amount=amount,
+                **dict(zip(entry_key_fields, key)),
+            ),
+        )
+    if new_entries:
+        changed_campaign_ids = {entry.campaign_id for entry in new_entries}
+        transaction.on_commit(
+            lambda: signals.revenue_changed.send(
+                sender=RevenueEntry,
+                campaign_ids=changed_campaign_ids,
+                entries=new_entries,
+            ),
+        )
+    new_entries = RevenueEntry.objects.bulk_create(new_entries)
+    _create_rewards_for_revenue_entries(new_entries)
+    return new_entries
+
+
+def _create_rewards_for_revenue_entries(
+    entries: abc.Iterable[RevenueEntry],
+) -> None:
+    """Reward volunteers for incentives crossed by entries of campaigns."""
+    campaign_entries = defaultdict(list)
+    for entry in entries:
+        campaign_entries[entry.campaign_id].append(entry)
+    for campaign_id, campaign_revenue_entries in sorted(
+        campaign_entries.items(),
+    ):
+        create_new_rewards_for_revenue_entries(
+            campaign_id=campaign_id,
+            entries=campaign_revenue_entries,
+        )
+
+
+def sync_campaign_revenue_entries(campaign_id: int) -> list[RevenueEntry]:
+    """Bring revenue ledger of the whole campaign up to date."""
+    return sync_contracts_revenue_entries(
+        contract_ids=list(
+            Contract.all_objects.filter(
+                campaign_id=campaign_id,
+            ).values_list("id", flat=True),
+        ),
+    )
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent with `campaign_ids` and new `entries` once changes of volunteers'
+# revenue ledger are committed, i.e. a contract was approved, declined or had
+# its credits changed
+revenue_changed = Signal()
@@ -1,5 +1,10 @@
+from collections.abc import Collection
+
 from config.celery import app
 
+from apps.campaigns.constants import NoteType
+from apps.campaigns.context_managers import InvoiceContextManager
+from apps.campaigns.models import Note
 from apps.members.notifications import InvoiceEmailNotification
 
 from .models import Invoice
@@ -7,8 +12,43 @@ from .models import Invoice
 
 @app.task
 def send_invoice_email(invoice_id: int) -> None:
-    """Send welcome email to new chamber admin."""
-    invoice = Invoice.objects.filter(pk=invoice_id).first()
-    if not invoice:
-        return
-    InvoiceEmailNotification(invoice=invoice).send()
+    """Send invoice email to charged member."""
+    send_invoice_emails([invoice_id])
+
+
+@app.task
+def send_invoice_emails(invoice_ids: Collection[int]) -> list[bool]:
+    """Send invoice emails in one batch.
+
+    Notes are rendered for the whole batch, so each campaign's note is
+    compiled once. Return whether each invoice's email was sent.
+
+    """
+    invoices = list(
+        InvoiceContextManager.with_context_relations(
+            Invoice.objects.filter(pk__in=invoice_ids),
+        ),
+    )
+    notes = {
+        note.campaign_id: note
+        for note in Note.objects.filter(
+            campaign_id__in={
+                invoice.contract.campaign_id for invoice in invoices
+            },
+            type=NoteType.INVOICE_NOTE,
+        ).select_related("campaign__chamber")
+    }
+    note_templates = InvoiceContextManager.render_many(
+        notes=notes.values(),
+        objects=invoices,
+    )
+    return InvoiceEmailNotification.send_many(
+        [
+            InvoiceEmailNotification(
+                invoice=invoice,
+                note=notes[invoice.contract.campaign_id],
+                note_template=note_template,
+            )
+            for invoice, note_template in zip(invoices, note_templates)
+        ],
+    )
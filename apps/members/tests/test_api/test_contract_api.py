@@ -1,5 +1,8 @@
+from decimal import Decimal
 from functools import partial
 
+from django.core import mail
+from django.db.models import Case, Sum, When
 from django.urls import reverse_lazy
 from django.utils import timezone
 
@@ -19,8 +22,18 @@ from apps.campaigns.factories import (
 from apps.campaigns.models import Campaign, LevelInstance, UserCampaign
 from apps.chambers.models import StoredMember
 from apps.core.test_utils import CAAPIClient
+from apps.incentives.constants import IncentiveType
+from apps.incentives.factories import IncentiveFactory
+from apps.incentives.models import Reward
+from apps.members import services as members_services
+from apps.members.constants import ContractStatus, ContractType
 from apps.members.factories import ContractFactory
-from apps.members.models import Contract, ContractCreditInfo, Invoice
+from apps.members.models import (
+    Contract,
+    ContractCreditInfo,
+    Invoice,
+    RevenueEntry,
+)
 from apps.users.models import User
 
 
@@ -215,6 +228,55 @@ def test_contract_decline_api(
         assert contract.status == Contract.STATUSES.DECLINED
 
 
+def test_contract_revenue_entries_api(
+    chamber_admin_client: CAAPIClient,
+    active_campaign: Campaign,
+):
+    """Ensure approval and decline keep revenue ledger up to date."""
+    level = LevelFactory(
+        product__category__campaign=active_campaign,
+        amount=2,
+        cost=300,
+    )
+    contract = ContractFactory(
+        campaign=active_campaign,
+        status=Contract.STATUSES.SIGNED,
+    )
+    shared_volunteer = UserCampaignFactory(campaign=active_campaign)
+    ContractCreditInfo.objects.bulk_create(
+        ContractCreditInfo(
+            contract=contract,
+            user_campaign=user_campaign,
+            portion=Decimal("0.5"),
+        )
+        for user_campaign in (contract.created_by, shared_volunteer)
+    )
+    for _ in range(2):
+        level_instance = LevelInstance.from_level(level)
+        level_instance.contract = contract
+        level_instance.save()
+    chamber_admin_client.select_campaign(active_campaign)
+    response = chamber_admin_client.post(
+        get_approve_contract_url(kwargs={"pk": contract.pk}),
+        data={
+            "selected_level_ids": contract.levels.values_list("id", flat=True),
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    entries = RevenueEntry.objects.filter(contract=contract)
+    assert entries.count() == 4
+    assert entries.filter(
+        user_campaign=shared_volunteer,
+    ).aggregate(revenue=Sum("amount"))["revenue"] == 300
+
+    response = chamber_admin_client.post(
+        get_decline_contract_url(kwargs={"pk": contract.pk}),
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert entries.count() == 8
+    assert entries.aggregate(revenue=Sum("amount"))["revenue"] == 0
+
+
 @pytest.mark.parametrize(
     ["contract", "expected_status"],
     [
@@ -345,3 +407,219 @@ def test_reassign_contract_invalid_campaign_user(
         data=[{"contract": contract.id, "user": reassigned_user.id}],
     )
     assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_contract_approve_rewards_api(
+    chamber_admin_client: CAAPIClient,
+    active_campaign: Campaign,
+):
+    """Ensure approval rewards volunteers for crossed incentives only."""
+    level = LevelFactory(
+        product__category__campaign=active_campaign,
+        amount=1,
+        cost=600,
+    )
+    volunteers = UserCampaignFactory.create_batch(
+        2,
+        campaign=active_campaign,
+        role=UserCampaignRole.VOLUNTEER,
+    )
+    contract = ContractFactory(
+        campaign=active_campaign,
+        created_by=volunteers[0],
+        status=Contract.STATUSES.SIGNED,
+        type=ContractType.CASH,
+    )
+    ContractCreditInfo.objects.bulk_create(
+        ContractCreditInfo(
+            contract=contract,
+            user_campaign=volunteer,
+            portion=Decimal("0.5"),
+        )
+        for volunteer in volunteers
+    )
+    level_instance = LevelInstance.from_level(level)
+    level_instance.contract = contract
+    level_instance.save()
+    reached_incentive = IncentiveFactory(
+        campaign=active_campaign,
+        type=IncentiveType.CASH,
+        threshold=300,
+    )
+    IncentiveFactory(
+        campaign=active_campaign,
+        type=IncentiveType.CASH,
+        threshold=301,
+    )
+    IncentiveFactory(
+        campaign=active_campaign,
+        type=IncentiveType.TRADE,
+        threshold=100,
+    )
+    chamber_admin_client.select_campaign(active_campaign)
+    response = chamber_admin_client.post(
+        get_approve_contract_url(kwargs={"pk": contract.pk}),
+        data={
+            "selected_level_ids": contract.levels.values_list("id", flat=True),
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert set(
+        Reward.objects.filter(
+            incentive__campaign=active_campaign,
+        ).values_list("user_campaign_id", "incentive_id"),
+    ) == {(volunteer.id, reached_incentive.id) for volunteer in volunteers}
+    reward_emails = [
+        email for email in mail.outbox
+        if email.subject.endswith("Reward Update")
+    ]
+    assert sorted(email.to for email in reward_emails) == sorted(
+        [volunteer.email] for volunteer in volunteers
+    )
+
+
+def test_contract_credits_change_rewards_api(
+    chamber_admin_client: CAAPIClient,
+    active_campaign: Campaign,
+):
+    """Ensure revenue moved by credits change rewards volunteer once."""
+    volunteers = UserCampaignFactory.create_batch(
+        2,
+        campaign=active_campaign,
+        role=UserCampaignRole.VOLUNTEER,
+    )
+    contracts = []
+    for cost, credited_volunteers in (
+        (1100, volunteers),
+        (100, volunteers[:1]),
+    ):
+        contract = ContractFactory(
+            campaign=active_campaign,
+            created_by=volunteers[0],
+            status=Contract.STATUSES.SIGNED,
+            type=ContractType.CASH,
+        )
+        ContractCreditInfo.objects.bulk_create(
+            ContractCreditInfo(
+                contract=contract,
+                user_campaign=volunteer,
+                portion=Decimal(1) / len(credited_volunteers),
+            )
+            for volunteer in credited_volunteers
+        )
+        level_instance = LevelInstance.from_level(
+            LevelFactory(
+                product__category__campaign=active_campaign,
+                amount=1,
+                cost=cost,
+            ),
+        )
+        level_instance.contract = contract
+        level_instance.save()
+        contracts.append(contract)
+    incentive = IncentiveFactory(
+        campaign=active_campaign,
+        type=IncentiveType.CASH,
+        threshold=1000,
+    )
+    chamber_admin_client.select_campaign(active_campaign)
+
+    def approve(contract: Contract) -> None:
+        """Approve contract with all its levels."""
+        response = chamber_admin_client.post(
+            get_approve_contract_url(kwargs={"pk": contract.pk}),
+            data={
+                "selected_level_ids": contract.levels.values_list(
+                    "id",
+                    flat=True,
+                ),
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK, response.data
+
+    rewards = Reward.objects.filter(incentive=incentive)
+    approve(contracts[0])
+    assert not rewards.exists()
+
+    members_services.set_contract_credits(contracts[0], [])
+    assert list(rewards.values_list("user_campaign_id", flat=True)) == [
+        volunteers[0].id,
+    ]
+
+    approve(contracts[1])
+    assert list(rewards.values_list("user_campaign_id", flat=True)) == [
+        volunteers[0].id,
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames=["ordering", "order_by"],
+    argvalues=[
+        ["-total_cost", ["-total_cost", "pk"]],
+        ["signed_at", ["signed_at", "pk"]],
+        [
+            "approval_priority",
+            ["-status_priority_for_approval", "signed_at", "pk"],
+        ],
+    ],
+)
+def test_contract_list_keyset_pagination_api(
+    chamber_admin_client: CAAPIClient,
+    contracts: list[Contract],
+    ordering: str,
+    order_by: list[str],
+) -> None:
+    """Ensure contracts are listed page by page with cursors."""
+    chamber_admin_client.select_campaign(contracts[0].campaign)
+    expected_ids = list(
+        Contract.objects.filter(
+            id__in=[contract.id for contract in contracts],
+        ).annotate(
+            status_priority_for_approval=Case(
+                *[
+                    When(status=contract_status, then=order)
+                    for order, contract_status in enumerate(
+                        ContractStatus.get_order_by_approval_priority(),
+                    )
+                ],
+            ),
+        ).with_total_cost().order_by(*order_by).values_list("id", flat=True),
+    )
+
+    ids = []
+    pages = []
+    url = f"{get_list_contract_url}?ordering={ordering}&limit=3&cursor="
+    while url:
+        response = chamber_admin_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == len(contracts)
+        ids += [contract["id"] for contract in response.data["results"]]
+        pages.append(response.data)
+        url = response.data["next"]
+
+    assert ids == expected_ids
+    assert len(pages) == 4
+    assert pages[0]["previous"] is None
+    response = chamber_admin_client.get(pages[-1]["previous"])
+    assert response.data["results"] == pages[-2]["results"]
+
+
+def test_contract_list_keyset_pagination_count_api(
+    chamber_admin_client: CAAPIClient,
+    contracts: list[Contract],
+) -> None:
+    """Ensure count may be skipped and invalid cursors are rejected."""
+    chamber_admin_client.select_campaign(contracts[0].campaign)
+    response = chamber_admin_client.get(
+        get_list_contract_url,
+        {"cursor": "", "count": "none"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] is None
+    assert len(response.data["results"]) == len(contracts)
+
+    response = chamber_admin_client.get(
+        get_list_contract_url,
+        {"cursor": "invalid"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
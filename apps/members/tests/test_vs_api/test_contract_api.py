@@ -1,3 +1,4 @@
+import uuid
 from functools import partial
 
 from django.urls import reverse_lazy
@@ -8,14 +9,22 @@ from rest_framework.test import APIClient
 
 import pytest
 
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.constants import UserCampaignRole
 from apps.campaigns.factories import (
     CampaignFactory,
+    LevelFactory,
     ProductCategoryFactory,
     ProductFactory,
     UserCampaignFactory,
 )
-from apps.campaigns.models import Campaign, Level, LevelInstance
+from apps.campaigns.models import (
+    Campaign,
+    Level,
+    LevelHold,
+    LevelInstance,
+    LevelInventory,
+)
 from apps.chambers.factories import StoredMemberFactory
 from apps.core.test_utils import TestLevelData
 from apps.users.factories import VolunteerFactory
@@ -136,6 +145,50 @@ def test_create_contract_successfully(
     )
 
 
+def test_create_contract_releases_own_campaign_holds(
+    api_client: APIClient,
+    active_campaign: Campaign,
+    contract_creation_data,
+):
+    """Ensure contract releases only its campaign's holds of the form."""
+    level = LevelFactory(
+        amount=1,
+        product=ProductFactory(
+            category=ProductCategoryFactory(campaign=active_campaign),
+        ),
+    )
+    other_level = LevelFactory(
+        amount=1,
+        product=ProductFactory(
+            category=ProductCategoryFactory(campaign=CampaignFactory()),
+        ),
+    )
+    volunteer = create_volunteer(active_campaign)
+    hold_token = uuid.uuid4()
+    for held_level in (level, other_level):
+        campaigns_services.hold_level_instances(
+            level=held_level,
+            token=hold_token,
+        )
+    api_client.force_authenticate(volunteer.user)
+    data = contract_creation_data(
+        levels=[{"level_id": level.id, "trade_with": "", "id": None}],
+        hold_token=str(hold_token),
+    )
+
+    response = api_client.post(get_contract_create_url(), data=data)
+
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    assert LevelInstance.objects.filter(
+        contract_id=response.data["id"],
+        level=level,
+    ).exists()
+    assert list(
+        LevelHold.objects.values_list("level_id", flat=True),
+    ) == [other_level.id]
+    assert LevelInventory.objects.get(level=other_level).available == 0
+
+
 def test_chamber_admin_cannot_create_contract(
     chamber_admin: User,
     api_client: APIClient,
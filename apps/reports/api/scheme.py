@@ -0,0 +1,21 @@
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiTypes,
+    extend_schema,
+    extend_schema_view,
+)
+
+from . import views
+
+as_of_param = OpenApiParameter(
+    name="as_of",
+    description="Return report of the last rally week closed before",
+    required=False,
+    type=OpenApiTypes.DATETIME,
+    location=OpenApiParameter.QUERY,
+)
+
+extend_schema_view(
+    list=extend_schema(parameters=[as_of_param]),
+    get_statistics=extend_schema(parameters=[as_of_param]),
+)(views.SaleReportViewSet)
@@ -1,4 +1,5 @@
 from .sale import (
     ProductCategorySaleReportSerializer,
+    SaleReportFilterSerializer,
     SaleStatisticsReportSerializer,
 )
@@ -1,14 +1,29 @@
-from decimal import Decimal
-
 from rest_framework import serializers
 
-from apps.campaigns import models as campaigns_models
-from apps.core.api.serializers import BaseSerializer, ModelBaseSerializer
+from libs.open_api.serializers import OpenApiSerializer
+
+from apps.core.api.serializers import BaseSerializer
+
+
+class SaleReportFilterSerializer(OpenApiSerializer):
+    """Provide validation for sale report APIs' query params."""
+
+    as_of = serializers.DateTimeField(required=False)
+
+    class Meta:
+        fields = ("as_of",)
 
 
-class LevelSaleReportSerializer(ModelBaseSerializer):
+class LevelSaleReportSerializer(BaseSerializer):
     """Represent Level's sale report info."""
 
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    cost = serializers.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        coerce_to_string=False,
+    )
     sold_instances_count = serializers.IntegerField()
     total_instances_count = serializers.IntegerField()
     sold_value = serializers.DecimalField(
@@ -23,7 +38,6 @@ class LevelSaleReportSerializer(ModelBaseSerializer):
     )
 
     class Meta:
-        model = campaigns_models.Level
         fields = (
             "id",
             "name",
@@ -33,21 +47,33 @@ class LevelSaleReportSerializer(ModelBaseSerializer):
             "sold_value",
             "remaining_value",
         )
-        extra_kwargs = {
-            "cost": {"coerce_to_string": False},
-        }
 
+    def create(self, validated_data):
+        """Bypass check."""
 
-class ProductSaleReportSerializer(ModelBaseSerializer):
+    def update(self, instance, validated_data):
+        """Bypass check."""
+
+
+class ProductSaleReportSerializer(BaseSerializer):
     """Represent Product's sale report info."""
 
-    levels = LevelSaleReportSerializer(many=True, source="prefetched_levels")
-    sold_value = serializers.SerializerMethodField()
-    remaining_value = serializers.SerializerMethodField()
-    unlimited_levels_count = serializers.SerializerMethodField()
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    sold_value = serializers.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        coerce_to_string=False,
+    )
+    remaining_value = serializers.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        coerce_to_string=False,
+    )
+    levels = LevelSaleReportSerializer(many=True)
+    unlimited_levels_count = serializers.IntegerField()
 
     class Meta:
-        model = campaigns_models.Product
         fields = (
             "id",
             "name",
@@ -57,44 +83,32 @@ class ProductSaleReportSerializer(ModelBaseSerializer):
             "unlimited_levels_count",
         )
 
-    def get_sold_value(self, obj: campaigns_models.Product) -> Decimal:
-        """Calculate product's sold value from its levels."""
-        return sum((level.sold_value for level in obj.prefetched_levels))
-
-    def get_remaining_value(self, obj: campaigns_models.Product) -> Decimal:
-        """Calculate product's remaining value from its levels."""
-        return sum(
-            (
-                level.remaining_value
-                for level in obj.prefetched_levels
-                if level.remaining_value > 0
-            )
-        )
+    def create(self, validated_data):
+        """Bypass check."""
 
-    def get_unlimited_levels_count(self, obj: campaigns_models.Product) -> int:
-        """Calculate the number of unlimited levels in the product."""
-        return len(
-            [
-                level
-                for level in obj.prefetched_levels
-                if level.amount < 0
-            ],
-        )
+    def update(self, instance, validated_data):
+        """Bypass check."""
 
 
-class ProductCategorySaleReportSerializer(ModelBaseSerializer):
+class ProductCategorySaleReportSerializer(BaseSerializer):
     """Represent ProductCategory's sale report info."""
 
-    products = ProductSaleReportSerializer(
-        many=True,
-        source="prefetched_products",
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    sold_value = serializers.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        coerce_to_string=False,
     )
-    sold_value = serializers.SerializerMethodField()
-    remaining_value = serializers.SerializerMethodField()
-    unlimited_levels_count = serializers.SerializerMethodField()
+    remaining_value = serializers.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        coerce_to_string=False,
+    )
+    products = ProductSaleReportSerializer(many=True)
+    unlimited_levels_count = serializers.IntegerField()
 
     class Meta:
-        model = campaigns_models.ProductCategory
         fields = (
             "id",
             "name",
@@ -104,53 +118,11 @@ class ProductCategorySaleReportSerializer(ModelBaseSerializer):
             "unlimited_levels_count",
         )
 
-    def get_sold_value(self, obj: campaigns_models.ProductCategory) -> Decimal:
-        """Calculate category's sold value from its products."""
-        return sum(
-            (
-                sum(
-                    (
-                        level.sold_value
-                        for level in product.prefetched_levels
-                    ),
-                )
-                for product in obj.prefetched_products
-            ),
-        )
-
-    def get_remaining_value(
-        self,
-        obj: campaigns_models.ProductCategory,
-    ) -> Decimal:
-        """Calculate category's remaining value from its products."""
-        return sum(
-            (
-                sum(
-                    (
-                        level.remaining_value
-                        for level in product.prefetched_levels
-                        if level.remaining_value > 0
-                    ),
-                )
-                for product in obj.prefetched_products
-            ),
-        )
+    def create(self, validated_data):
+        """Bypass check."""
 
-    def get_unlimited_levels_count(
-        self,
-        obj: campaigns_models.ProductCategory,
-    ) -> int:
-        """Calculate the number of unlimited levels in the category."""
-        return sum(
-            len(
-                [
-                    level
-                    for level in product.prefetched_levels
-                    if level.amount < 0
-                ],
-            )
-            for product in obj.prefetched_products
-        )
+    def update(self, instance, validated_data):
+        """Bypass check."""
 
 
 class SaleStatisticsReportSerializer(BaseSerializer):
@@ -1,4 +1,6 @@
-from rest_framework import mixins, response
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions, mixins, response
 from rest_framework.decorators import action
 
 from apps.campaigns import models as campaigns_models
@@ -21,7 +23,7 @@ class SaleReportViewSet(mixins.ListModelMixin, ChamberBaseViewSet):
     search_fields = ()
 
     def get_queryset(self):
-        """Return product categories with sale report of current campaign."""
+        """Return product categories of current campaign."""
         qs = super().get_queryset()
         if getattr(self, "swagger_fake_view", False):
             return qs.none()
@@ -30,7 +32,22 @@ class SaleReportViewSet(mixins.ListModelMixin, ChamberBaseViewSet):
         if not campaign:
             return qs.none()
 
-        return qs.filter(campaign_id=campaign.id).with_sale_report_data()
+        return qs.filter(campaign_id=campaign.id)
+
+    def list(self, request, *args, **kwargs):
+        """Return product categories with sale report of current campaign.
+
+        Report is calculated by a single query, so categories are paginated
+        after it.
+
+        """
+        campaign = getattr(request, "campaign", None)
+        if getattr(self, "swagger_fake_view", False) or not campaign:
+            return super().list(request, *args, **kwargs)
+        categories = self.get_sale_report(campaign.id).categories
+        page = self.paginate_queryset(categories)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(
         methods=("get",),
@@ -45,5 +62,28 @@ class SaleReportViewSet(mixins.ListModelMixin, ChamberBaseViewSet):
             return response.Response(data={})
 
         return response.Response(
-            data=services.get_sale_statistics_data(campaign.id),
+            data=self.get_sale_report(campaign.id).statistics,
+        )
+
+    def get_sale_report(self, campaign_id: int) -> services.SaleReport:
+        """Return current sale report or its snapshot if `as_of` is passed.
+
+        Snapshot of the last rally week closed before `as_of` is served.
+
+        """
+        filter_serializer = serializers.SaleReportFilterSerializer(
+            data=self.request.query_params,
+        )
+        filter_serializer.is_valid(raise_exception=True)
+        as_of = filter_serializer.validated_data.get("as_of")
+        if not as_of:
+            return services.get_sale_report(campaign_id)
+        report = services.get_sale_report_snapshot(
+            campaign_id=campaign_id,
+            as_of=as_of,
         )
+        if not report:
+            raise exceptions.NotFound(
+                _("Sale report isn't found for this date"),
+            )
+        return report
@@ -7,3 +7,7 @@ class ReportsAppConfig(AppConfig):
 
     name = "apps.reports"
     verbose_name = _("Reports")
+
+    def ready(self) -> None:
+        #  pylint: disable=unused-import
+        from .api import scheme  # noqa
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.10 on 2026-10-18 00:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ('campaigns', '0059_levelinventory_held_levelhold'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SaleReportSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('closed_at', models.DateTimeField(verbose_name='Closed at')),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sale_report_snapshots', to='campaigns.campaign', verbose_name='Campaign')),
+            ],
+            options={
+                'verbose_name': 'Sale Report Snapshot',
+                'verbose_name_plural': 'Sale Report Snapshots',
+            },
+        ),
+        migrations.CreateModel(
+            name='LevelSaleSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category_id', models.IntegerField(verbose_name='Category ID')),
+                ('category_name', models.CharField(max_length=255, verbose_name='Category name')),
+                ('product_id', models.IntegerField(verbose_name='Product ID')),
+                ('product_name', models.CharField(max_length=255, verbose_name='Product name')),
+                ('level_id', models.IntegerField(verbose_name='Level ID')),
+                ('level_name', models.CharField(max_length=255, verbose_name='Level name')),
+                ('cost', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Unit Cost')),
+                ('total_instances_count', models.IntegerField(verbose_name='Total instances count')),
+                ('sold_instances_count', models.IntegerField(verbose_name='Sold instances count')),
+                ('sold_value', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Sold value')),
+                ('remaining_value', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Remaining value')),
+                ('snapshot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='levels', to='reports.salereportsnapshot', verbose_name='Snapshot')),
+            ],
+            options={
+                'verbose_name': 'Level Sale Snapshot',
+                'verbose_name_plural': 'Level Sale Snapshots',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='salereportsnapshot',
+            constraint=models.UniqueConstraint(fields=('campaign', 'closed_at'), name='unique_sale_report_snapshot_closed_at'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.10 on 2026-10-18 01:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='levelsalesnapshot',
+            name='level_id',
+            field=models.IntegerField(blank=True, null=True, verbose_name='Level ID'),
+        ),
+        migrations.AlterField(
+            model_name='levelsalesnapshot',
+            name='level_name',
+            field=models.CharField(blank=True, max_length=255, verbose_name='Level name'),
+        ),
+        migrations.AlterField(
+            model_name='levelsalesnapshot',
+            name='product_id',
+            field=models.IntegerField(blank=True, null=True, verbose_name='Product ID'),
+        ),
+        migrations.AlterField(
+            model_name='levelsalesnapshot',
+            name='product_name',
+            field=models.CharField(blank=True, max_length=255, verbose_name='Product name'),
+        ),
+    ]
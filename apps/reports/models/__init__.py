@@ -0,0 +1 @@
+from .sale_report_snapshot import LevelSaleSnapshot, SaleReportSnapshot
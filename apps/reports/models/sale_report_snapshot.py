@@ -0,0 +1,124 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_extensions.db.models import TimeStampedModel
+
+
+class SaleReportSnapshot(TimeStampedModel):
+    """Represent campaign's sale report at close of a rally week.
+
+    Attributes:
+        - campaign: campaign of the report
+        - closed_at: end of the rally week
+
+    """
+
+    campaign = models.ForeignKey(
+        to="campaigns.Campaign",
+        verbose_name=_("Campaign"),
+        on_delete=models.CASCADE,
+        related_name="sale_report_snapshots",
+    )
+    closed_at = models.DateTimeField(
+        verbose_name=_("Closed at"),
+    )
+
+    class Meta:
+        verbose_name = _("Sale Report Snapshot")
+        verbose_name_plural = _("Sale Report Snapshots")
+        constraints = (
+            models.UniqueConstraint(
+                fields=("campaign", "closed_at"),
+                name="unique_sale_report_snapshot_closed_at",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.campaign}: {self.closed_at}"
+
+
+class LevelSaleSnapshot(models.Model):
+    """Represent level's row of sale report snapshot.
+
+    Rows keep ids and names of level, its product and category, so snapshot
+    isn't changed when inventory is edited or deleted later. Categories and
+    products without levels are kept as rows with empty level (and product)
+    fields and zero values.
+
+    Attributes:
+        - snapshot: snapshot of the row
+        - category_id: id of level's category
+        - category_name: name of level's category
+        - product_id: id of level's product
+        - product_name: name of level's product
+        - level_id: id of level
+        - level_name: name of level
+        - cost: cost of level
+        - total_instances_count: amount of level, negative for unlimited
+        - sold_instances_count: number of sold instances
+        - sold_value: value of sold instances
+        - remaining_value: value of not sold instances
+
+    """
+
+    snapshot = models.ForeignKey(
+        to="reports.SaleReportSnapshot",
+        verbose_name=_("Snapshot"),
+        on_delete=models.CASCADE,
+        related_name="levels",
+    )
+    category_id = models.IntegerField(
+        verbose_name=_("Category ID"),
+    )
+    category_name = models.CharField(
+        verbose_name=_("Category name"),
+        max_length=255,
+    )
+    product_id = models.IntegerField(
+        verbose_name=_("Product ID"),
+        null=True,
+        blank=True,
+    )
+    product_name = models.CharField(
+        verbose_name=_("Product name"),
+        max_length=255,
+        blank=True,
+    )
+    level_id = models.IntegerField(
+        verbose_name=_("Level ID"),
+        null=True,
+        blank=True,
+    )
+    level_name = models.CharField(
+        verbose_name=_("Level name"),
+        max_length=255,
+        blank=True,
+    )
+    cost = models.DecimalField(
+        verbose_name=_("Unit Cost"),
+        max_digits=15,
+        decimal_places=2,
+    )
+    total_instances_count = models.IntegerField(
+        verbose_name=_("Total instances count"),
+    )
+    sold_instances_count = models.IntegerField(
+        verbose_name=_("Sold instances count"),
+    )
+    sold_value = models.DecimalField(
+        verbose_name=_("Sold value"),
+        max_digits=15,
+        decimal_places=2,
+    )
+    remaining_value = models.DecimalField(
+        verbose_name=_("Remaining value"),
+        max_digits=15,
+        decimal_places=2,
+    )
+
+    class Meta:
+        verbose_name = _("Level Sale Snapshot")
+        verbose_name_plural = _("Level Sale Snapshots")
+
+    def __str__(self) -> str:
+        return f"{self.level_name}: {self.sold_instances_count}"
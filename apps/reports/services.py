@@ -1,7 +1,25 @@
+import dataclasses
+import datetime as dt
+import itertools
 import typing
 from decimal import Decimal
 
+from django.db import connection, transaction
+from django.db.models import Model
+from django.utils import timezone
+
 from apps.campaigns import models as campaigns_models
+from apps.incentives.services.reward_services import get_rally_session_weeks
+from apps.members import models as members_models
+from apps.members.constants import ContractStatus
+
+from .models import LevelSaleSnapshot, SaleReportSnapshot
+
+# Values of `GROUPING(category, product, level)` for rows of rollup
+LEVEL_ROW = 0
+PRODUCT_ROW = 1
+CATEGORY_ROW = 3
+TOTAL_ROW = 7
 
 
 class SaleStatisticsData(typing.TypedDict):
@@ -13,29 +31,452 @@ class SaleStatisticsData(typing.TypedDict):
     total_available_count: int
 
 
+@dataclasses.dataclass
+class SaleReportLevel:
+    """Represent level's row of sale report."""
+
+    id: int
+    name: str
+    cost: Decimal
+    sold_instances_count: int
+    total_instances_count: int
+    sold_value: Decimal
+    remaining_value: Decimal
+
+
+@dataclasses.dataclass
+class SaleReportProduct:
+    """Represent product's row of sale report with its levels."""
+
+    id: int
+    name: str
+    sold_value: Decimal
+    remaining_value: Decimal
+    unlimited_levels_count: int
+    levels: list[SaleReportLevel]
+
+
+@dataclasses.dataclass
+class SaleReportCategory:
+    """Represent category's row of sale report with its products."""
+
+    id: int
+    name: str
+    sold_value: Decimal
+    remaining_value: Decimal
+    unlimited_levels_count: int
+    products: list[SaleReportProduct]
+
+
+@dataclasses.dataclass
+class SaleReport:
+    """Represent sale report of a campaign."""
+
+    categories: list[SaleReportCategory]
+    statistics: SaleStatisticsData
+
+
+def get_sale_report(
+    campaign_id: int,
+    as_of: dt.datetime | None = None,
+) -> SaleReport:
+    """Return sale report of a campaign.
+
+    Rows of levels, subtotals of products and categories and campaign's
+    totals are calculated by a single query grouped by rollup of category,
+    product and level. Rows are ordered, so subtotal goes after rows it
+    sums up.
+
+    Remaining instances are instances of limited levels not attached to
+    approved contracts, so unlimited and oversold levels have no remaining
+    value. If `as_of` is passed, only contracts approved by then are
+    counted as sold.
+
+    """
+    levels: dict[int, list[SaleReportLevel]] = {}
+    products: dict[int, list[SaleReportProduct]] = {}
+    categories: list[SaleReportCategory] = []
+    statistics = SaleStatisticsData(
+        total_sold_value=Decimal(0),
+        total_available_value=Decimal(0),
+        total_sold_count=0,
+        total_available_count=0,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _get_sale_report_sql(is_as_of=as_of is not None),
+            {
+                "campaign_id": campaign_id,
+                "approved": ContractStatus.APPROVED,
+                "as_of": as_of,
+            },
+        )
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    for row in rows:
+        grouping = row["grouping"]
+        if grouping == LEVEL_ROW and row["level_id"] is not None:
+            levels.setdefault(row["product_id"], []).append(
+                SaleReportLevel(
+                    id=row["level_id"],
+                    name=row["level_name"],
+                    cost=row["level_cost"],
+                    sold_instances_count=row["sold_count"],
+                    total_instances_count=row["total_count"],
+                    sold_value=row["sold_value"],
+                    remaining_value=row["remaining_value"],
+                ),
+            )
+        elif grouping == PRODUCT_ROW and row["product_id"] is not None:
+            products.setdefault(row["category_id"], []).append(
+                SaleReportProduct(
+                    id=row["product_id"],
+                    name=row["product_name"],
+                    sold_value=row["sold_value"],
+                    remaining_value=row["remaining_value"],
+                    unlimited_levels_count=row["unlimited_levels_count"],
+                    levels=levels.pop(row["product_id"], []),
+                ),
+            )
+        elif grouping == CATEGORY_ROW:
+            categories.append(
+                SaleReportCategory(
+                    id=row["category_id"],
+                    name=row["category_name"],
+                    sold_value=row["sold_value"],
+                    remaining_value=row["remaining_value"],
+                    unlimited_levels_count=row["unlimited_levels_count"],
+                    products=products.pop(row["category_id"], []),
+                ),
+            )
+        elif grouping == TOTAL_ROW:
+            statistics = SaleStatisticsData(
+                total_sold_value=row["sold_value"],
+                total_available_value=row["remaining_value"],
+                total_sold_count=row["sold_count"],
+                total_available_count=row["remaining_count"],
+            )
+    return SaleReport(categories=categories, statistics=statistics)
+
+
 def get_sale_statistics_data(campaign_id: int) -> SaleStatisticsData:
     """Return sale statistics for a campaign."""
-    total_sold_value = Decimal(0)
-    total_available_value = Decimal(0)
-    total_sold_count = 0
-    total_available_count = 0
-    campaign_levels = campaigns_models.Level.objects.filter(
-        product__category__campaign_id=campaign_id,
-    ).with_sale_report_data()
-
-    for level in campaign_levels:
-        total_sold_value += level.sold_value
-        total_sold_count += level.sold_instances_count
-        if level.amount < 0:
+    return get_sale_report(campaign_id).statistics
+
+
+def get_sale_report_snapshot(
+    campaign_id: int,
+    as_of: dt.datetime,
+) -> SaleReport | None:
+    """Return sale report of a campaign at the last rally week's close.
+
+    Report is restored from the latest snapshot taken before `as_of`, if
+    any.
+
+    """
+    snapshot = SaleReportSnapshot.objects.filter(
+        campaign_id=campaign_id,
+        closed_at__lte=as_of,
+    ).order_by("-closed_at").first()
+    if not snapshot:
+        return None
+    return _get_snapshot_report(
+        snapshot.levels.order_by("id"),
+    )
+
+
+def take_sale_report_snapshot(
+    campaign_id: int,
+    closed_at: dt.datetime,
+) -> SaleReportSnapshot:
+    """Store sale report of a campaign at `closed_at` as a snapshot.
+
+    Contracts approved after `closed_at` aren't counted, so late snapshot
+    doesn't include sales of the next week. Snapshot keeps rows of levels
+    only, subtotals and statistics are summed up from them when snapshot is
+    served.
+
+    """
+    report = get_sale_report(campaign_id, as_of=closed_at)
+    with transaction.atomic():
+        snapshot, is_created = SaleReportSnapshot.objects.get_or_create(
+            campaign_id=campaign_id,
+            closed_at=closed_at,
+        )
+        if not is_created:
+            return snapshot
+        LevelSaleSnapshot.objects.bulk_create(
+            _get_snapshot_rows(snapshot, report),
+        )
+    return snapshot
+
+
+def take_closed_weeks_sale_report_snapshots() -> list[SaleReportSnapshot]:
+    """Store sale reports of campaigns whose rally week has just closed.
+
+    Report is taken once for the last closed week of a campaign, which isn't
+    done yet. Reports of earlier weeks can't be restored from current data,
+    so weeks missed by the task are skipped.
+
+    """
+    now = timezone.now()
+    snapshots = []
+    campaigns = campaigns_models.Campaign.objects.exclude(
+        status=campaigns_models.Campaign.STATUSES.DONE,
+    ).filter(start_date__isnull=False)
+    for campaign in campaigns:
+        closed_weeks = [
+            week
+            for week in get_rally_session_weeks(campaign, now.date())
+            if week[1] <= now
+        ]
+        if not closed_weeks:
+            continue
+        closed_at = closed_weeks[-1][1]
+        if SaleReportSnapshot.objects.filter(
+            campaign_id=campaign.id,
+            closed_at__gte=closed_at,
+        ).exists():
             continue
-        total_available_value += level.remaining_value
-        total_available_count += (
-            level.total_instances_count - level.sold_instances_count
+        snapshots.append(
+            take_sale_report_snapshot(
+                campaign_id=campaign.id,
+                closed_at=closed_at,
+            ),
         )
+    return snapshots
+
+
+def _get_snapshot_rows(
+    snapshot: SaleReportSnapshot,
+    report: SaleReport,
+) -> list[LevelSaleSnapshot]:
+    """Return rows of snapshot's levels in order of the report.
+
+    Categories and products without levels get a row with empty level, so
+    they are restored with the report.
 
-    return SaleStatisticsData(
-        total_sold_value=total_sold_value,
-        total_available_value=total_available_value,
-        total_sold_count=total_sold_count,
-        total_available_count=total_available_count,
+    """
+    rows = []
+    for category in report.categories:
+        if not category.products:
+            rows.append(
+                LevelSaleSnapshot(
+                    snapshot=snapshot,
+                    category_id=category.id,
+                    category_name=category.name,
+                    cost=Decimal(0),
+                    total_instances_count=0,
+                    sold_instances_count=0,
+                    sold_value=Decimal(0),
+                    remaining_value=Decimal(0),
+                ),
+            )
+        for product in category.products:
+            if not product.levels:
+                rows.append(
+                    LevelSaleSnapshot(
+                        snapshot=snapshot,
+                        category_id=category.id,
+                        category_name=category.name,
+                        product_id=product.id,
+                        product_name=product.name,
+                        cost=Decimal(0),
+                        total_instances_count=0,
+                        sold_instances_count=0,
+                        sold_value=Decimal(0),
+                        remaining_value=Decimal(0),
+                    ),
+                )
+            rows.extend(
+                LevelSaleSnapshot(
+                    snapshot=snapshot,
+                    category_id=category.id,
+                    category_name=category.name,
+                    product_id=product.id,
+                    product_name=product.name,
+                    level_id=level.id,
+                    level_name=level.name,
+                    cost=level.cost,
+                    total_instances_count=level.total_instances_count,
+                    sold_instances_count=level.sold_instances_count,
+                    sold_value=level.sold_value,
+                    remaining_value=level.remaining_value,
+                )
+                for level in product.levels
+            )
+    return rows
+
+
+def _get_snapshot_report(
+    rows: typing.Iterable[LevelSaleSnapshot],
+) -> SaleReport:
+    """Return sale report summed up from rows of snapshot's levels.
+
+    Rows with empty product or level only keep their category or product
+    in the report.
+
+    """
+    categories = []
+    for (category_id, category_name), category_rows in itertools.groupby(
+        rows,
+        key=lambda row: (row.category_id, row.category_name),
+    ):
+        products = []
+        for (product_id, product_name), product_rows in itertools.groupby(
+            category_rows,
+            key=lambda row: (row.product_id, row.product_name),
+        ):
+            levels = [
+                SaleReportLevel(
+                    id=row.level_id,
+                    name=row.level_name,
+                    cost=row.cost,
+                    sold_instances_count=row.sold_instances_count,
+                    total_instances_count=row.total_instances_count,
+                    sold_value=row.sold_value,
+                    remaining_value=row.remaining_value,
+                )
+                for row in product_rows
+                if row.level_id is not None
+            ]
+            if product_id is None:
+                continue
+            products.append(
+                SaleReportProduct(
+                    id=product_id,
+                    name=product_name,
+                    sold_value=sum(
+                        (level.sold_value for level in levels),
+                        Decimal(0),
+                    ),
+                    remaining_value=sum(
+                        (level.remaining_value for level in levels),
+                        Decimal(0),
+                    ),
+                    unlimited_levels_count=sum(
+                        level.total_instances_count < 0 for level in levels
+                    ),
+                    levels=levels,
+                ),
+            )
+        categories.append(
+            SaleReportCategory(
+                id=category_id,
+                name=category_name,
+                sold_value=sum(
+                    (product.sold_value for product in products),
+                    Decimal(0),
+                ),
+                remaining_value=sum(
+                    (product.remaining_value for product in products),
+                    Decimal(0),
+                ),
+                unlimited_levels_count=sum(
+                    product.unlimited_levels_count for product in products
+                ),
+                products=products,
+            ),
+        )
+    levels = [
+        level
+        for category in categories
+        for product in category.products
+        for level in product.levels
+    ]
+    return SaleReport(
+        categories=categories,
+        statistics=SaleStatisticsData(
+            total_sold_value=sum(
+                (category.sold_value for category in categories),
+                Decimal(0),
+            ),
+            total_available_value=sum(
+                (category.remaining_value for category in categories),
+                Decimal(0),
+            ),
+            total_sold_count=sum(
+                level.sold_instances_count for level in levels
+            ),
+            total_available_count=sum(
+                max(
+                    level.total_instances_count - level.sold_instances_count,
+                    0,
+                )
+                for level in levels
+            ),
+        ),
     )
+
+
+def _get_sale_report_sql(is_as_of: bool = False) -> str:
+    """Return query of sale report grouped by rollup of its rows.
+
+    Sold instances are instances attached to approved contracts, which
+    aren't declined or deleted. They are counted per level before joining,
+    so level's row isn't multiplied by its instances. If `is_as_of` is set,
+    contracts approved after `as_of` param aren't counted.
+
+    """
+    category = _table(campaigns_models.ProductCategory)
+    product = _table(campaigns_models.Product)
+    level = _table(campaigns_models.Level)
+    instance = _table(campaigns_models.LevelInstance)
+    contract = _table(members_models.Contract)
+    remaining = "GREATEST(level.amount - COALESCE(sold.count, 0), 0)"
+    approved_as_of = (
+        "AND contract.approved_at <= %(as_of)s " if is_as_of else ""
+    )
+    return (
+        "SELECT "
+        "GROUPING(category.id, product.id, level.id) AS grouping, "
+        "category.id AS category_id, "
+        "category.name AS category_name, "
+        "product.id AS product_id, "
+        "product.name AS product_name, "
+        "level.id AS level_id, "
+        "level.name AS level_name, "
+        "level.cost AS level_cost, "
+        "COALESCE(SUM(level.amount), 0) AS total_count, "
+        "COALESCE(SUM(sold.count), 0) AS sold_count, "
+        "COALESCE(SUM(sold.value), 0) AS sold_value, "
+        f"COALESCE(SUM({remaining}), 0) AS remaining_count, "
+        f"COALESCE(SUM({remaining} * level.cost), 0) AS remaining_value, "
+        "COUNT(level.id) FILTER (WHERE level.amount < 0) "
+        "AS unlimited_levels_count "
+        f"FROM {category} category "
+        f"LEFT JOIN {product} product "
+        "ON product.category_id = category.id "
+        "AND product.deleted_at IS NULL "
+        f"LEFT JOIN {level} level "
+        "ON level.product_id = product.id "
+        "AND level.deleted_at IS NULL "
+        "LEFT JOIN ("
+        "SELECT instance.level_id, "
+        "COUNT(*) AS count, "
+        "SUM(instance.cost) AS value "
+        f"FROM {instance} instance "
+        f"JOIN {contract} contract ON contract.id = instance.contract_id "
+        "WHERE instance.deleted_at IS NULL "
+        "AND instance.declined_at IS NULL "
+        "AND contract.deleted_at IS NULL "
+        "AND contract.status = %(approved)s "
+        f"{approved_as_of}"
+        "GROUP BY instance.level_id"
+        ") sold ON sold.level_id = level.id "
+        "WHERE category.campaign_id = %(campaign_id)s "
+        "AND category.deleted_at IS NULL "
+        "GROUP BY ROLLUP ("
+        '(category.id, category.name, category."order"), '
+        '(product.id, product.name, product."order"), '
+        '(level.id, level.name, level.cost, level."order")'
+        ") "
+        'ORDER BY category."order", category.id, '
+        'product."order", product.id, '
+        'level."order", level.id'
+    )
+
+
+def _table(model: type[Model]) -> str:
+    """Return quoted name of model's table."""
+    return connection.ops.quote_name(model._meta.db_table)
@@ -0,0 +1,9 @@
+from config.celery import app
+
+from . import services
+
+
+@app.task
+def take_sale_report_snapshots() -> None:
+    """Store sale reports of campaigns at close of rally weeks."""
+    services.take_closed_weeks_sale_report_snapshots()
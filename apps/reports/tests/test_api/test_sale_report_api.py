@@ -1,4 +1,7 @@
+import datetime as dt
+
 from django.urls import reverse_lazy
+from django.utils import timezone
 
 from rest_framework.test import APIClient
 
@@ -9,6 +12,7 @@ from apps.campaigns import models as campaigns_models
 from apps.campaigns.constants import DEFAULT_PRODUCT_CATEGORIES
 from apps.chambers import models as chambers_models
 from apps.core.test_utils import TestLevelData
+from apps.reports import services
 from apps.users import factories as users_factories
 from apps.users import models as users_models
 
@@ -140,3 +144,115 @@ def test_product_category_sale_report_api(
     )
     assert sum(category["sold_value"] for category in results) == 5650
     assert sum(category["remaining_value"] for category in results) == 1450
+
+
+def test_sale_report_sums_up_levels(
+    campaign_inventory: list[campaigns_models.ProductCategory],
+    chamber_admin: users_models.User,
+):
+    """Ensure subtotals and statistics sum up levels of sale report."""
+    client = APIClient()
+    client.force_login(chamber_admin)
+    results = client.get(sale_report_list_url).data["results"]
+    statistics = client.get(sale_report_statistics_url).data
+
+    for category in results:
+        for product in category["products"]:
+            levels = product["levels"]
+            assert product["sold_value"] == sum(
+                level["sold_value"] for level in levels
+            )
+            assert product["remaining_value"] == sum(
+                level["remaining_value"] for level in levels
+            )
+        assert category["sold_value"] == sum(
+            product["sold_value"] for product in category["products"]
+        )
+    assert statistics["total_sold_value"] == sum(
+        category["sold_value"] for category in results
+    )
+    assert statistics["total_available_value"] == sum(
+        category["remaining_value"] for category in results
+    )
+    assert statistics["total_sold_count"] == sum(
+        level["sold_instances_count"]
+        for category in results
+        for product in category["products"]
+        for level in product["levels"]
+    )
+
+
+def test_sale_statistics_as_of_snapshot(
+    campaign_inventory: list[campaigns_models.ProductCategory],
+    open_campaign: campaigns_models.Campaign,
+    chamber_admin: users_models.User,
+):
+    """Ensure report as of closed rally week is served from its snapshot."""
+    closed_at = timezone.now()
+    services.take_sale_report_snapshot(
+        campaign_id=open_campaign.id,
+        closed_at=closed_at,
+    )
+    client = APIClient()
+    client.force_login(chamber_admin)
+    statistics = client.get(sale_report_statistics_url).data
+    campaign_inventory[0].delete()
+
+    response = client.get(
+        sale_report_statistics_url,
+        {"as_of": (closed_at + dt.timedelta(days=1)).isoformat()},
+    )
+    assert response.status_code == 200, response.data
+    assert response.data == statistics
+    assert client.get(sale_report_statistics_url).data != statistics
+
+    response = client.get(
+        sale_report_statistics_url,
+        {"as_of": (closed_at - dt.timedelta(days=1)).isoformat()},
+    )
+    assert response.status_code == 404
+
+
+def test_sale_report_snapshot_keeps_report(
+    campaign_inventory: list[campaigns_models.ProductCategory],
+    open_campaign: campaigns_models.Campaign,
+):
+    """Ensure snapshot restores report with categories and products."""
+    empty_category = campaigns_factories.ProductCategoryFactory(
+        campaign=open_campaign,
+    )
+    campaigns_factories.ProductFactory(
+        category=campaigns_factories.ProductCategoryFactory(
+            campaign=open_campaign,
+        ),
+    )
+    closed_at = timezone.now()
+    services.take_sale_report_snapshot(
+        campaign_id=open_campaign.id,
+        closed_at=closed_at,
+    )
+
+    report = services.get_sale_report_snapshot(open_campaign.id, closed_at)
+    assert report == services.get_sale_report(open_campaign.id)
+    assert empty_category.id in [category.id for category in report.categories]
+
+
+def test_sale_report_snapshot_skips_later_approvals(
+    campaign_inventory: list[campaigns_models.ProductCategory],
+    open_campaign: campaigns_models.Campaign,
+):
+    """Ensure contracts approved after week's close aren't in snapshot."""
+    closed_at = timezone.now() - dt.timedelta(days=1)
+    services.take_sale_report_snapshot(
+        campaign_id=open_campaign.id,
+        closed_at=closed_at,
+    )
+
+    statistics = services.get_sale_report_snapshot(
+        open_campaign.id,
+        closed_at,
+    ).statistics
+    assert statistics["total_sold_count"] == 0
+    assert services.get_sale_statistics_data(
+        open_campaign.id,
+    )["total_sold_count"] > 0
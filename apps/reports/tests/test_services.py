@@ -0,0 +1,84 @@
+import datetime as dt
+
+from django.utils import timezone
+
+import pytest
+
+from apps.campaigns import factories as campaigns_factories
+from apps.campaigns import models as campaigns_models
+from apps.incentives.services.reward_services import get_rally_session_weeks
+from apps.reports import services
+from apps.reports.models import SaleReportSnapshot
+
+
+def create_campaign(**kwargs) -> campaigns_models.Campaign:
+    """Return campaign whose first rally week has closed a few days ago."""
+    start_date = timezone.localdate() - dt.timedelta(days=10)
+    return campaigns_factories.CampaignFactory(
+        **{
+            "status": campaigns_models.Campaign.STATUSES.LIVE,
+            "start_date": start_date,
+            "end_date": None,
+            "report_close_weekday": start_date.weekday(),
+            "report_close_time": dt.time(12),
+            **kwargs,
+        },
+    )
+
+
+def get_first_week_close(
+    campaign: campaigns_models.Campaign,
+) -> dt.datetime:
+    """Return end of campaign's first rally week."""
+    return get_rally_session_weeks(campaign, timezone.localdate())[0][1]
+
+
+def take_campaign_snapshots(
+    campaign: campaigns_models.Campaign,
+) -> list[SaleReportSnapshot]:
+    """Take snapshots of closed weeks and return ones of the campaign."""
+    return [
+        snapshot
+        for snapshot in services.take_closed_weeks_sale_report_snapshots()
+        if snapshot.campaign_id == campaign.id
+    ]
+
+
+def test_take_first_closed_week_snapshot() -> None:
+    """Ensure snapshot is taken at close of the last closed week."""
+    campaign = create_campaign()
+
+    snapshots = take_campaign_snapshots(campaign)
+
+    assert [snapshot.closed_at for snapshot in snapshots] == [
+        get_first_week_close(campaign),
+    ]
+
+
+def test_take_closed_week_snapshot_once() -> None:
+    """Ensure already snapshotted week isn't taken again."""
+    campaign = create_campaign()
+    snapshot = services.take_sale_report_snapshot(
+        campaign_id=campaign.id,
+        closed_at=get_first_week_close(campaign),
+    )
+
+    assert not take_campaign_snapshots(campaign)
+    assert list(campaign.sale_report_snapshots.all()) == [snapshot]
+
+
+@pytest.mark.parametrize(
+    argnames="campaign_data",
+    argvalues=[
+        {"status": campaigns_models.Campaign.STATUSES.DONE},
+        {"start_date": None},
+    ],
+)
+def test_take_closed_week_snapshot_skips_campaign(
+    campaign_data: dict,
+) -> None:
+    """Ensure done campaigns and ones without rally weeks are skipped."""
+    campaign = create_campaign(**campaign_data)
+
+    assert not take_campaign_snapshots(campaign)
+    assert not campaign.sale_report_snapshots.exists()
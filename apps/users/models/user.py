@@ -212,13 +212,18 @@ class User(
     @property
     def campaign_role(self):
         """Return campaign role for user."""
+        from apps.campaigns import services as campaigns_services
         if self.role in (UserRole.SUPER_ADMIN, UserRole.CHAMBER_ADMIN):
             return self.role
-        # pylint: disable=no-member
-        campaign = self.chamber.campaigns.last()
-        user_campaign = self.user_campaigns.filter(
-            campaign=campaign,
-        ).first()
+        campaign_id = campaigns_services.get_chamber_newest_campaign_id(
+            self.chamber_id,
+        )
+        if not campaign_id:
+            return self.role
+        user_campaign = campaigns_services.get_user_campaign_info(
+            self.id,
+            campaign_id,
+        )
         return user_campaign.role if user_campaign else self.role
 
     @property
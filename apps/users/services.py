@@ -1,8 +1,19 @@
+import hashlib
+from collections import abc
+
+from django.conf import settings
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from knox.models import AuthToken
+
 from . import models, notifications
+from .constants import UserRole
+
+AUTH_CACHE_TIMEOUT = 60 * 5
 
 
 def reset_user_password(
@@ -19,3 +30,108 @@ def reset_user_password(
         uid=urlsafe_base64_encode(force_bytes(user.pk)),
         token=PasswordResetTokenGenerator().make_token(user),
     ).send()
+
+
+def get_auth_token_cache_key(token: str) -> str:
+    """Return cache key of auth token.
+
+    Key is a keyed BLAKE2b digest of the token, it's much cheaper to compute
+    than knox's SHA-512 digest and doesn't expose the token in cache.
+
+    """
+    digest = hashlib.blake2b(
+        token.encode(),
+        key=settings.SECRET_KEY.encode()[:hashlib.blake2b.MAX_KEY_SIZE],
+        digest_size=16,
+    ).hexdigest()
+    return f"auth:token:{digest}"
+
+
+def get_cached_auth_token(token: str) -> AuthToken | None:
+    """Return cached auth token of token string."""
+    values = cache.get(get_auth_token_cache_key(token))
+    if values is None:
+        return None
+    return AuthToken.from_db(
+        DEFAULT_DB_ALIAS,
+        list(values),
+        list(values.values()),
+    )
+
+
+def cache_auth_token(token: str, auth_token: AuthToken) -> None:
+    """Cache auth token of token string.
+
+    Key of token string is also stored by knox's digest, so it can be found
+    when auth token is deleted or expired.
+
+    """
+    key = get_auth_token_cache_key(token)
+    cache.set_many(
+        {
+            key: {
+                field.attname: getattr(auth_token, field.attname)
+                for field in AuthToken._meta.concrete_fields
+            },
+            f"auth:digest:{auth_token.digest}": key,
+        },
+        timeout=AUTH_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_auth_tokens_cache(digests: abc.Iterable[str]) -> None:
+    """Drop cached auth tokens with knox's digests."""
+    digest_keys = [f"auth:digest:{digest}" for digest in digests]
+    token_keys = cache.get_many(digest_keys).values()
+    _delete_cached([*token_keys, *digest_keys])
+
+
+def get_cached_user(user_id: int) -> models.User | None:
+    """Return user by id, cached until it's changed."""
+    user = cache.get(f"auth:user:{user_id}")
+    if user is None:
+        user = models.User.objects.filter(id=user_id).first()
+        if user:
+            cache_user(user)
+    return user
+
+
+def cache_user(user: models.User) -> None:
+    """Cache user for authentication."""
+    cache.set(f"auth:user:{user.id}", user, timeout=AUTH_CACHE_TIMEOUT)
+
+
+def get_chamber_admin(chamber_id: int) -> models.User | None:
+    """Return chamber admin which is impersonated by super admin."""
+    key = f"auth:chamber:{chamber_id}:admin"
+    admin_id = cache.get(key)
+    admin = get_cached_user(admin_id) if admin_id else None
+    # Cached admin may have been moved to another chamber or role
+    if (
+        admin
+        and admin.role == UserRole.CHAMBER_ADMIN
+        and admin.chamber_id == chamber_id
+    ):
+        return admin
+    admin = models.User.objects.filter(
+        role=UserRole.CHAMBER_ADMIN,
+        chamber_id=chamber_id,
+    ).first()
+    if admin:
+        cache.set(key, admin.id, timeout=AUTH_CACHE_TIMEOUT)
+        cache_user(admin)
+    return admin
+
+
+def invalidate_user_cache(user: models.User) -> None:
+    """Drop cached user and impersonated admin of user's chamber."""
+    _delete_cached([
+        f"auth:user:{user.id}",
+        f"auth:chamber:{user.chamber_id}:admin",
+    ])
+
+
+def _delete_cached(keys: list[str]) -> None:
+    """Delete cached values now and once more after commit."""
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
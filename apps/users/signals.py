@@ -1,6 +1,9 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from knox.models import AuthToken
+
+from . import services
 from .models import User, UserPreference
 
 
@@ -11,3 +14,16 @@ def add_preference_after_user_creation(instance: User, created, **kwargs):
         return
 
     UserPreference.objects.create(user=instance)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(instance: User, **kwargs):
+    """Drop cached authentication data of changed user."""
+    services.invalidate_user_cache(user=instance)
+
+
+@receiver(post_delete, sender=AuthToken)
+def auth_token_deleted(instance: AuthToken, **kwargs):
+    """Drop cached deleted auth token, e.g. on logout."""
+    services.invalidate_auth_tokens_cache(digests=[instance.digest])
@@ -15,3 +15,16 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {
     "socket_timeout": 5,
     "global_keyprefix": "ygm:",
 }
+
+CELERY_BEAT_SCHEDULE = {
+    # return instances of abandoned contract forms to available ones
+    "release-expired-level-holds": {
+        "task": "apps.campaigns.tasks.release_expired_level_holds",
+        "schedule": 60,
+    },
+    # store sale reports of closed rally weeks
+    "take-sale-report-snapshots": {
+        "task": "apps.reports.tasks.take_sale_report_snapshots",
+        "schedule": 300,
+    },
+}
@@ -45,6 +45,7 @@ LOCAL_APPS = (
     "apps.timelines",
     "apps.incentives",
     "apps.historical_data",
+    "apps.reports",
 )
 
 INSTALLED_APPS += DRF_PACKAGES + THIRD_PARTY + HEALTH_CHECKS_APPS + LOCAL_APPS
@@ -3,6 +3,7 @@ import typing
 from functools import partial
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
 from django.utils.module_loading import import_string
@@ -15,12 +16,14 @@ from safedelete.config import HARD_DELETE
 
 from apps.campaigns import factories as campaigns_factories
 from apps.campaigns import models as campaigns_models
+from apps.campaigns import services as campaigns_services
 from apps.campaigns.constants import UserCampaignRole
 from apps.chambers.factories import ChamberFactory
 from apps.chambers.models import Chamber
 from apps.core.test_utils import TestLevelData, create_volunteer
 from apps.members import factories as members_factories
 from apps.members import models as members_models
+from apps.members import services as members_services
 from apps.users.constants import UserRole
 from apps.users.factories import UserFactory
 from apps.users.models import User
@@ -48,6 +51,14 @@ def pytest_configure():
     # To disable celery in tests
     settings.CELERY_TASK_ALWAYS_EAGER = True
 
+    # To isolate cache of parallel test runs
+    settings.REDIS_CACHES = settings.CACHES
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
 
 @pytest.fixture(scope="session", autouse=True)
 def django_db_setup(django_db_setup):
@@ -60,6 +71,26 @@ def enable_db_access_for_all_tests(django_db_setup, db):
     """Enable access to DB for all tests."""
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear cache before each test."""
+    cache.clear()
+
+
+@pytest.fixture
+def redis_cache(settings, worker_id: str):
+    """Use redis cache with keys isolated by test worker."""
+    settings.CACHES = {
+        "default": {
+            **settings.REDIS_CACHES["default"],
+            "KEY_PREFIX": f"ygm-test-{worker_id}",
+        },
+    }
+    cache.delete_pattern("*")
+    yield
+    cache.delete_pattern("*")
+
+
 @pytest.fixture(scope="session", autouse=True)
 def temp_directory_for_media(tmp_path_factory):
     """Fixture that set temp directory for all media files.
@@ -215,6 +246,12 @@ def setup_product() -> typing.Callable:
             members_models.ContractCreditInfo.objects.bulk_create(
                 contract_credits,
             )
+        members_services.sync_campaign_revenue_entries(
+            campaign_id=product.category.campaign_id,
+        )
+        campaigns_services.refresh_level_inventories(
+            level_ids=[level.id for level in levels],
+        )
         return levels
 
     return _setup
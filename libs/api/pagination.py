@@ -1,9 +1,321 @@
+import base64
+import datetime
+import decimal
+import functools
+import json
+import operator
+import typing
+import uuid
+
 from django.conf import settings
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured
+from django.db import connections, models
 
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class CustomLimitOffsetPagination(LimitOffsetPagination):
     """Customized paginator class to limit max objects in list APIs."""
 
     max_limit = settings.MAX_PAGINATION_SIZE
+
+
+class Cursor(typing.NamedTuple):
+    """Represent position in ordered list."""
+
+    values: list
+    reverse: bool
+
+
+class KeysetPagination(CustomLimitOffsetPagination):
+    """Paginate by values of ordering fields instead of offset.
+
+    Keyset pagination is used when request has `cursor` query param (empty
+    for the first page), otherwise it's limit/offset pagination. Page is
+    selected by condition on values of the last row of previous page, so
+    deep pages are as fast as the first one and rows aren't skipped or
+    repeated when list is changed between requests.
+
+    Rows are ordered by view's ordering, including annotated fields, with
+    `id` as a tiebreaker. Nulls are placed last in ascending order and first
+    in descending, as PostgreSQL does by default.
+
+    Total count is calculated as `count` query param says: `exact` (default),
+    `estimate` (planner's estimation on PostgreSQL) or `none`.
+
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = (
+        "The pagination cursor value. Pass empty value to get first page."
+    )
+    count_query_param = "count"
+    count_query_description = (
+        "How to calculate total count: `exact`, `estimate` or `none`."
+    )
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return page of queryset by offset or cursor."""
+        self.is_keyset = self.cursor_query_param in request.query_params
+        if not self.is_keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.ordering = self.get_ordering(queryset)
+        self.cursor = self.decode_cursor(request)
+        self.count = self.get_keyset_count(queryset, request)
+
+        reverse = bool(self.cursor and self.cursor.reverse)
+        ordering = [
+            (field, descending != reverse)
+            for field, descending in self.ordering
+        ]
+        queryset = queryset.order_by(*[
+            models.F(field).desc(nulls_first=True)
+            if descending else models.F(field).asc(nulls_last=True)
+            for field, descending in ordering
+        ]).annotate(**{
+            f"keyset_{index}": models.F(field)
+            for index, (field, _) in enumerate(ordering)
+        })
+        if self.cursor:
+            queryset = queryset.filter(
+                self.get_keyset_filter(ordering, self.cursor.values),
+            )
+        rows = list(queryset[:self.limit + 1])
+        has_more = len(rows) > self.limit
+        rows = rows[:self.limit]
+        if reverse:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, self.cursor is not None
+
+        self.next_cursor = self.previous_cursor = None
+        if rows and has_next:
+            self.next_cursor = self.get_row_cursor(rows[-1], reverse=False)
+        if rows and has_previous:
+            self.previous_cursor = self.get_row_cursor(rows[0], reverse=True)
+        return rows
+
+    def get_paginated_response(self, data):
+        """Return page with links to next and previous pages."""
+        if not self.is_keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            "count": self.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        """Mark count as nullable, since it may be skipped."""
+        paginated_schema = super().get_paginated_response_schema(schema)
+        paginated_schema["properties"]["count"]["nullable"] = True
+        return paginated_schema
+
+    def get_schema_operation_parameters(self, view):
+        """Add cursor and count query params."""
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.count_query_description,
+                "schema": {
+                    "type": "string",
+                    "enum": ["exact", "estimate", "none"],
+                },
+            },
+        ]
+
+    def get_next_link(self):
+        """Return link to next page."""
+        if not self.is_keyset:
+            return super().get_next_link()
+        return self.get_cursor_link(self.next_cursor)
+
+    def get_previous_link(self):
+        """Return link to previous page."""
+        if not self.is_keyset:
+            return super().get_previous_link()
+        return self.get_cursor_link(self.previous_cursor)
+
+    def get_ordering(self, queryset) -> list[tuple[str, bool]]:
+        """Return fields and directions of queryset's ordering.
+
+        Primary key is added as a tiebreaker, so ordering is unique.
+
+        """
+        query = queryset.query
+        order_by = query.order_by or (
+            query.get_meta().ordering if query.default_ordering else ()
+        )
+        ordering = []
+        for field in order_by:
+            if isinstance(field, str) and field != "?":
+                ordering.append((field.removeprefix("-"), field[0] == "-"))
+            elif (
+                isinstance(field, models.OrderBy)
+                and isinstance(field.expression, models.F)
+            ):
+                ordering.append((field.expression.name, field.descending))
+            else:
+                raise ImproperlyConfigured(
+                    f"Keyset pagination doesn't support ordering by {field}",
+                )
+        if not any(field in ("pk", "id") for field, _ in ordering):
+            ordering.append(("pk", False))
+        return ordering
+
+    def get_keyset_count(self, queryset, request) -> int | None:
+        """Return total count as requested."""
+        mode = request.query_params.get(self.count_query_param)
+        if mode == "none":
+            return None
+        is_postgres = connections[queryset.db].vendor == "postgresql"
+        if mode == "estimate" and is_postgres:
+            return self.get_estimated_count(queryset)
+        return self.get_count(queryset)
+
+    def get_estimated_count(self, queryset) -> int:
+        """Return number of rows estimated by PostgreSQL's planner."""
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]["Plan"]["Plan Rows"]
+
+    def get_keyset_filter(
+        self,
+        ordering: list[tuple[str, bool]],
+        values: list,
+    ) -> models.Q:
+        """Return condition selecting rows after values in ordering.
+
+        Rows are after values when they are equal by first fields and are
+        after by the next one.
+
+        """
+        conditions = []
+        equal = models.Q()
+        for (field, descending), value in zip(ordering, values):
+            after = self._get_after_condition(field, descending, value)
+            if after is not None:
+                conditions.append(equal & after)
+            equal &= (
+                models.Q(**{f"{field}__isnull": True})
+                if value is None
+                else models.Q(**{field: value})
+            )
+        return functools.reduce(operator.or_, conditions)
+
+    def get_row_cursor(self, row: models.Model, reverse: bool) -> Cursor:
+        """Return cursor pointing at row."""
+        return Cursor(
+            values=[
+                getattr(row, f"keyset_{index}")
+                for index in range(len(self.ordering))
+            ],
+            reverse=reverse,
+        )
+
+    def get_cursor_link(self, cursor: Cursor | None) -> str | None:
+        """Return link to page after cursor."""
+        if cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(cursor),
+        )
+
+    def encode_cursor(self, cursor: Cursor) -> str:
+        """Return opaque representation of cursor."""
+        data = json.dumps(
+            {
+                "o": self._get_ordering_signature(),
+                "v": cursor.values,
+                "r": cursor.reverse,
+            },
+            default=_encode_value,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, request) -> Cursor | None:
+        """Return cursor from request, raise `NotFound` if it's invalid."""
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            cursor = Cursor(values=data["v"], reverse=bool(data["r"]))
+            ordering = data["o"]
+        except (ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        is_valid = (
+            ordering == self._get_ordering_signature()
+            and isinstance(cursor.values, list)
+            and len(cursor.values) == len(self.ordering)
+        )
+        if not is_valid:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def _get_after_condition(
+        self,
+        field: str,
+        descending: bool,
+        value: typing.Any,
+    ) -> models.Q | None:
+        """Return condition for field's values after value.
+
+        Return `None` when no value can be after it.
+
+        """
+        if value is None:
+            if descending:
+                return models.Q(**{f"{field}__isnull": False})
+            return None
+        if descending:
+            return models.Q(**{f"{field}__lt": value})
+        return (
+            models.Q(**{f"{field}__gt": value})
+            | models.Q(**{f"{field}__isnull": True})
+        )
+
+    def _get_ordering_signature(self) -> list[str]:
+        """Return ordering which cursor is valid for."""
+        return [
+            f"-{field}" if descending else field
+            for field, descending in self.ordering
+        ]
+
+
+def _encode_value(value: typing.Any) -> str:
+    """Encode value of ordering field to JSON without losing precision."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Can't encode {type(value)} in cursor")
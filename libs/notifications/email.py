@@ -2,11 +2,12 @@
 import logging
 import typing
 from collections import namedtuple
+from smtplib import SMTPException
 from urllib.error import HTTPError
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template import loader
 
 from html_sanitizer import Sanitizer
 
@@ -59,6 +60,7 @@ class EmailNotification:
         self.plain_template = plain_template or self.plain_template
         self.files = files
         self.template_context = template_context or {}
+        self.loaded_templates = {}
 
     def get_subject(self):
         """Get email's subject."""
@@ -96,9 +98,17 @@ class EmailNotification:
         """Get email's files attachments."""
         return self.files
 
+    def render_template(self, template_name: str, context: dict) -> str:
+        """Render template, loading it once per notification or batch."""
+        if template_name not in self.loaded_templates:
+            self.loaded_templates[template_name] = loader.get_template(
+                template_name,
+            )
+        return self.loaded_templates[template_name].render(context)
+
     def prepare_html_text(self):
         """Prepare html message for email."""
-        html_message = render_to_string(
+        html_message = self.render_template(
             self.get_template(), self.get_template_context(),
         )
         return html_message
@@ -111,7 +121,7 @@ class EmailNotification:
 
         """
         if message_template := self.get_plain_template():
-            plain_message = render_to_string(
+            plain_message = self.render_template(
                 message_template, self.get_template_context(),
             )
             return plain_message
@@ -143,19 +153,13 @@ class EmailNotification:
             "files": files,
         }
 
-    def send(self) -> bool:
-        """Send email.
-
-        Returns:
-            True: if it succeeded
-            False: if it failed
-
-        """
+    def prepare_mail(self, connection=None) -> EmailMultiAlternatives:
+        """Prepare email message with alternatives and attachments."""
         email_args = self.prepare_mail_args()
         html_message = email_args.pop("html_message")
         files = email_args.pop("files")
 
-        mail = EmailMultiAlternatives(**email_args)
+        mail = EmailMultiAlternatives(connection=connection, **email_args)
         mail.attach_alternative(html_message, "text/html")
 
         # Attach files
@@ -165,6 +169,23 @@ class EmailNotification:
                 content=file.content,
                 mimetype=file.mimetype,
             )
+        return mail
+
+    def is_sending_enabled(self) -> bool:
+        """Check if email should be sent."""
+        return True
+
+    def send(self) -> bool:
+        """Send email.
+
+        Returns:
+            True: if it succeeded
+            False: if it failed
+
+        """
+        if not self.is_sending_enabled():
+            return False
+        mail = self.prepare_mail()
 
         # Send email
         try:
@@ -173,15 +194,63 @@ class EmailNotification:
             return True
         except HTTPError as error:
             logger.error(
-                f"Error while sending email to {email_args['to']}: {error}",
+                f"Error while sending email to {mail.to}: {error}",
             )
             self.on_email_send_failed(error)
             return False
 
+    @classmethod
+    def send_many(
+        cls,
+        notifications: typing.Sequence["EmailNotification"],
+    ) -> list[bool]:
+        """Send emails in a batch.
+
+        All emails are sent over one mail connection and templates are
+        loaded once for the whole batch. Failure to render or send one email
+        doesn't stop sending the rest.
+
+        Returns:
+            list of flags, whether each notification's email was sent
+
+        """
+        loaded_templates = {}
+        results = [
+            notification.is_sending_enabled() for notification in notifications
+        ]
+        if not any(results):
+            return results
+        with get_connection() as connection:
+            for index, notification in enumerate(notifications):
+                if not results[index]:
+                    continue
+                notification.loaded_templates = loaded_templates
+                try:
+                    mail = notification.prepare_mail(connection=connection)
+                # pylint: disable=broad-exception-caught
+                except Exception as error:
+                    logger.exception(
+                        f"Error while rendering email of {notification}",
+                    )
+                    notification.on_email_send_failed(error)
+                    results[index] = False
+                    continue
+                try:
+                    mail.send()
+                except (HTTPError, SMTPException) as error:
+                    logger.error(
+                        f"Error while sending email to {mail.to}: {error}",
+                    )
+                    notification.on_email_send_failed(error)
+                    results[index] = False
+                    continue
+                notification.on_email_send_succeed()
+        return results
+
     def on_email_send_succeed(self):
         """Perform action, when email sending succeed."""
 
-    def on_email_send_failed(self, error: HTTPError):
+    def on_email_send_failed(self, error: Exception):
         """Perform action, when email sending failed."""
 
 
@@ -204,14 +273,23 @@ class NoteEmailNotification(DefaultEmailNotification):
 
     template = "notes/email.html"
 
-    def __init__(self, **template_context):
+    def __init__(self, note_template: str | None = None, **template_context):
+        """Initialize NoteEmailNotification.
+
+        Arguments:
+            note_template(str): Note rendered in advance, for example by
+            context manager's `render_many` for a batch of emails
+            template_context: Context of email html template
+
+        """
         super().__init__(**template_context)
         self.context_manager = None
+        self.note_template = note_template
 
     def get_template_context(self) -> dict:
         """Provide additional context about current volunteer."""
         ctx = super().get_template_context()
-        ctx.update(
-            note_template=self.context_manager.render_template(),
-        )
+        if self.note_template is None:
+            self.note_template = self.context_manager.render_template()
+        ctx.update(note_template=self.note_template)
         return ctx
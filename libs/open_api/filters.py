@@ -1,9 +1,12 @@
 from django.core.exceptions import FieldError
 
 from rest_framework import filters
+from rest_framework.settings import api_settings
 
 from drf_spectacular import drainage
 
+from libs.search import search_by_trigrams
+
 
 class OrderingFilterBackend(filters.OrderingFilter):
     """Custom OrderingFilter for better support of openapi."""
@@ -111,3 +114,25 @@ class SearchFilterBackend(filters.SearchFilter):
                 "`search_fields` contains non-existent or non-related fields."
                 f" {error}",
             )
+
+
+class TrigramSearchFilterBackend(SearchFilterBackend):
+    """SearchFilter which finds `search_fields` resembling search terms.
+
+    Fields should have trigram GIN indexes. Results are ranked by
+    similarity unless ordering is requested.
+
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """Filter queryset by trigram search of each term."""
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+        return search_by_trigrams(
+            queryset,
+            fields=search_fields,
+            terms=search_terms,
+            rank=api_settings.ORDERING_PARAM not in request.query_params,
+        )
@@ -0,0 +1,89 @@
+import functools
+import operator
+from collections import abc
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections, models
+from django.db.models import functions, lookups
+
+
+class ILikeContains(lookups.IContains):
+    """Match values containing pattern case-insensitively with `ILIKE`.
+
+    Unlike `icontains`, which compares `UPPER` of values, it's served by
+    trigram indexes of the field.
+
+    """
+
+    lookup_name = "ilike_contains"
+
+    def as_sql(self, compiler, connection):
+        """Compile lookup to `ILIKE` of escaped pattern."""
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", [*lhs_params, *rhs_params]
+
+
+@functools.cache
+def is_trigram_search_available(using: str) -> bool:
+    """Check if database has `pg_trgm` extension installed."""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def search_by_trigrams(
+    queryset: models.QuerySet,
+    fields: abc.Sequence[str],
+    terms: abc.Sequence[str],
+    rank: bool = True,
+) -> models.QuerySet:
+    """Filter queryset by fields containing or resembling each of terms.
+
+    Values resembling term are found by trigram word similarity, so typos
+    are tolerated, and results are ranked by it. Both conditions are served
+    by trigram GIN indexes of fields. Without `pg_trgm` extension fields are
+    searched by `icontains`.
+
+    """
+    if not is_trigram_search_available(queryset.db):
+        for term in terms:
+            queryset = queryset.filter(
+                functools.reduce(
+                    operator.or_,
+                    (
+                        models.Q(**{f"{field}__icontains": term})
+                        for field in fields
+                    ),
+                ),
+            )
+        return queryset
+
+    for term in terms:
+        queryset = queryset.filter(
+            functools.reduce(
+                operator.or_,
+                (
+                    models.Q(ILikeContains(models.F(field), term))
+                    | models.Q(**{f"{field}__trigram_word_similar": term})
+                    for field in fields
+                ),
+            ),
+        )
+    if not rank:
+        return queryset
+    search = " ".join(terms)
+    similarities = [TrigramWordSimilarity(search, field) for field in fields]
+    return queryset.annotate(
+        search_rank=(
+            functions.Greatest(*similarities)
+            if len(similarities) > 1
+            else similarities[0]
+        ),
+    ).order_by(
+        "-search_rank",
+        *(queryset.query.order_by or queryset.model._meta.ordering),
+    )